@@ -13,21 +13,38 @@ Eleven Guards + Audit Trail + Integrations:
 - BondGuard: YTM, Duration, Convexity verification
 - FXGuard: Forward rates, Cross rates, NDF settlement
 - RiskGuard: VaR, Beta, Sharpe, Sortino, Max Drawdown
-- ISOGuard: ISO 20022 JSON schema validation
+- ISOGuard: ISO 20022 JSON schema validation (pacs.008/009, pain.001, camt.053)
 - TradingGuard: Prediction market & order book verification (Decimal)
 - VerificationReceipt: Cryptographic audit trail
 - OpenResponsesIntegration: Agentic tool call verification
 - UCPIntegration: Payment token verification
 """
 
-from .finance_verifier import FinanceVerifier, VerificationResult
+from .finance_verifier import FinanceVerifier, VerificationResult, BatchVerificationResult
 from .compliance_guard import ComplianceGuard, ComplianceResult, RiskLevel, Jurisdiction
-from .calendar_guard import CalendarGuard, CalendarResult, DayCountConvention
-from .derivatives_guard import DerivativesGuard, DerivativesResult, OptionType
-from .message_guard import MessageGuard, MessageResult, MessageType, SwiftMtType
+from .calendar_guard import (
+    CalendarGuard, CalendarResult, DayCountConvention, DayCountBatchResult,
+    CouponSchedule, RollConvention, StubType,
+)
+from .holiday_rules import HolidayCalendar, JointCalendar, Observance, get_holiday_calendar
+from .derivatives_guard import DerivativesGuard, DerivativesResult, OptionType, BlackScholesTerms, ChainResult, ImpliedVolResult
+from .message_guard import (
+    MessageGuard, MessageResult, MessageType, SwiftMtType, StatementBalanceResult, BatchControlResult,
+    ISODocument,
+)
 from .query_guard import QueryGuard, QueryResult, QueryRisk
 from .cross_guard import CrossGuard, CrossGuardResult
-from .bond_guard import BondGuard, BondResult
+from .sanctions import (
+    SanctionsAutomaton, SanctionsMatch, compile_sanctions_list,
+    FuzzyNameIndex, FuzzyMatch, MatchAlgorithm,
+)
+from .sanctions_store import SanctionsStore
+from .xsd_registry import XSDRegistry, SchemaValidationResult
+from .bank_identifiers import (
+    IdentifierVerdict, IdentifierBatchResult, IBAN_REGISTRY,
+    validate_ibans, validate_bics, stream_iban_verdicts, stream_bic_verdicts,
+)
+from .bond_guard import BondGuard, BondResult, PortfolioResult
 from .fx_guard import FXGuard, FXResult, QuoteConvention
 from .risk_guard import RiskGuard, RiskResult, VaRMethod, ConfidenceLevel
 from .guards.iso_guard import ISOGuard, ISOResult
@@ -55,6 +72,7 @@ __all__ = [
     # Core Verifier
     "FinanceVerifier",
     "VerificationResult",
+    "BatchVerificationResult",
     
     # Compliance Guard
     "ComplianceGuard",
@@ -66,17 +84,33 @@ __all__ = [
     "CalendarGuard",
     "CalendarResult",
     "DayCountConvention",
+    "DayCountBatchResult",
+    "CouponSchedule",
+    "RollConvention",
+    "StubType",
+    "HolidayCalendar",
+    "JointCalendar",
+    "Observance",
+    "get_holiday_calendar",
     
     # Derivatives Guard
     "DerivativesGuard",
     "DerivativesResult",
     "OptionType",
+    "BlackScholesTerms",
+    "ChainResult",
+    "ImpliedVolResult",
     
     # Message Guard
     "MessageGuard",
     "MessageResult",
     "MessageType",
     "SwiftMtType",
+    "StatementBalanceResult",
+    "BatchControlResult",
+    "ISODocument",
+    "XSDRegistry",
+    "SchemaValidationResult",
     
     # Query Guard
     "QueryGuard",
@@ -87,9 +121,28 @@ __all__ = [
     "CrossGuard",
     "CrossGuardResult",
     
+    # Sanctions Screening
+    "SanctionsAutomaton",
+    "SanctionsMatch",
+    "compile_sanctions_list",
+    "FuzzyNameIndex",
+    "FuzzyMatch",
+    "MatchAlgorithm",
+    "SanctionsStore",
+    
+    # Bank Identifiers
+    "IdentifierVerdict",
+    "IdentifierBatchResult",
+    "IBAN_REGISTRY",
+    "validate_ibans",
+    "validate_bics",
+    "stream_iban_verdicts",
+    "stream_bic_verdicts",
+    
     # Bond Guard (NEW in v2.0)
     "BondGuard",
     "BondResult",
+    "PortfolioResult",
     
     # FX Guard (NEW in v2.0)
     "FXGuard",
@@ -5,10 +5,20 @@ Deterministic verification for YTM, Duration, Convexity calculations
 All financial math uses Decimal for exact arithmetic.
 """
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
 from decimal import Decimal, ROUND_HALF_UP, getcontext
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple, Union
 from enum import Enum
+import time
+
+import numpy as np
+
+from .calendar_guard import (
+    CouponSchedule, RollConvention, StubType, coupon_schedule, thirty_360_days,
+)
+from .holiday_rules import AnyHolidayCalendar, get_holiday_calendar
 
 # Set precision high enough for Newton-Raphson convergence
 getcontext().prec = 50
@@ -34,6 +44,44 @@ class BondResult:
     details: Optional[dict] = None
 
 
+@dataclass
+class PortfolioResult:
+    """
+    Columnar result of a portfolio verification (one entry per bond).
+    
+    Verdict arrays are None when no claim of that kind was supplied.
+    """
+    verified: np.ndarray                          # bool, all supplied claims hold
+    price: np.ndarray
+    ytm: np.ndarray
+    macaulay_duration: np.ndarray
+    modified_duration: np.ndarray
+    convexity: np.ndarray
+    ytm_verified: Optional[np.ndarray] = None
+    duration_verified: Optional[np.ndarray] = None
+    convexity_verified: Optional[np.ndarray] = None
+    rechecked: Optional[np.ndarray] = None        # bool, decided by the Decimal path
+    stats: dict = field(default_factory=dict)
+    
+    def __len__(self) -> int:
+        return len(self.verified)
+    
+    @property
+    def failed_bonds(self) -> np.ndarray:
+        """Indices of bonds with at least one failed claim"""
+        return np.flatnonzero(~self.verified)
+
+
+@dataclass(frozen=True)
+class _DiscountTable:
+    """Discounted cash-flow aggregates for one bond at one yield."""
+    price: Decimal
+    pv_face: Decimal
+    coupon_pv_t: Decimal      # Σ t × PV(Ct)
+    coupon_pv_tt: Decimal     # Σ t(t+1) × PV(Ct)
+    periodic_rate: Decimal
+
+
 class BondGuard:
     """
     Deterministic verification for bond calculations.
@@ -43,16 +91,28 @@ class BondGuard:
     following the TradingGuard gold standard.
     """
     
-    def __init__(self, tolerance_pct: float = 0.5, max_iterations: int = 100):
+    def __init__(
+        self,
+        tolerance_pct: float = 0.5,
+        max_iterations: int = 100,
+        cache_size: int = 1024
+    ):
         """
         Initialize the Bond Guard.
         
         Args:
             tolerance_pct: Acceptable % difference for verification
             max_iterations: Max iterations for YTM solver
+            cache_size: Max discount tables kept in the LRU cache (0 disables it)
         """
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be >= 0, got {cache_size}")
         self.tolerance_pct = Decimal(str(tolerance_pct))
         self.max_iterations = max_iterations
+        self.cache_size = cache_size
+        self._tables: "OrderedDict[tuple, _DiscountTable]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
     
     def verify_ytm(
         self,
@@ -69,7 +129,8 @@ class BondGuard:
         YTM is the rate r where:
         Price = Σ (C / (1+r/n)^t) + (FV / (1+r/n)^n)
         
-        Uses Newton-Raphson iteration for solving.
+        Uses Newton-Raphson iteration for solving. Each trial yield is priced
+        with the closed form, not through the discount-table cache.
         
         Args:
             face_value: Par value of bond (e.g., 1000)
@@ -95,8 +156,8 @@ class BondGuard:
         n_periods = int(years_to_maturity * frequency)
         coupon_payment = (fv * cr) / freq
         
-        # Newton-Raphson to find YTM
-        computed_ytm = self._solve_ytm(
+        # Safeguarded Newton-Raphson to find YTM
+        computed_ytm, iterations, residual = self._solve_ytm_with_stats(
             fv, coupon_payment, p, n_periods, frequency
         )
         
@@ -116,13 +177,15 @@ class BondGuard:
             llm_value=f"{llm_pct}%",
             computed_value=f"{computed_pct}%",
             difference=f"{diff_pct.quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP)}%" if not verified else None,
-            formula_used="Newton-Raphson YTM Solver",
+            formula_used="Newton-Raphson YTM Solver (closed-form price, bisection safeguard)",
             details={
                 "face_value": str(fv),
                 "coupon_rate": f"{cr * 100}%",
                 "price": str(p),
                 "periods": n_periods,
-                "frequency": frequency
+                "frequency": frequency,
+                "iterations": iterations,
+                "residual": f"{float(residual):.2E}"
             }
         )
     
@@ -134,40 +197,98 @@ class BondGuard:
         n_periods: int,
         frequency: int
     ) -> Decimal:
-        """Newton-Raphson YTM solver using Decimal arithmetic."""
+        """Safeguarded Newton-Raphson YTM solver using Decimal arithmetic."""
+        ytm, _, _ = self._solve_ytm_with_stats(
+            face_value, coupon, price, n_periods, frequency
+        )
+        return ytm
+    
+    def _solve_ytm_with_stats(
+        self,
+        face_value: Decimal,
+        coupon: Decimal,
+        price: Decimal,
+        n_periods: int,
+        frequency: int
+    ) -> Tuple[Decimal, int, Decimal]:
+        """
+        Solve for YTM, returning (ytm, iterations, residual).
+        
+        Each iteration prices the bond with the annuity closed form
+        
+            P(i) = C·(1 - v^n)/i + FV·v^n,   v = 1/(1+i), i = y/freq
+        
+        and its analytic derivative, so the cost is a few Decimal operations
+        regardless of the number of periods. Newton steps that leave the
+        current bracket [lo, hi] (where P - price changes sign) are replaced
+        by bisection, which guarantees convergence.
+        """
         freq = Decimal(str(frequency))
         
-        # Initial guess (current yield)
+        # Search range: 0.01% to 1000% (distressed debt)
+        lo, hi = Decimal("0.0001"), Decimal("10")
+        f_lo = self._price_at_yield(face_value, coupon, n_periods, freq, lo)[0] - price
+        f_hi = self._price_at_yield(face_value, coupon, n_periods, freq, hi)[0] - price
+        if f_lo <= 0:
+            return lo, 0, abs(f_lo)  # Price at or above the bracket: clamp
+        if f_hi >= 0:
+            return hi, 0, abs(f_hi)
+        
+        # Initial guess (current yield), kept inside the bracket
         ytm = (coupon * freq) / price
+        if not lo < ytm < hi:
+            ytm = (lo + hi) / 2
         
-        for _ in range(self.max_iterations):
-            # Bond price at current ytm
-            pv_coupons = Decimal("0")
-            for t in range(1, n_periods + 1):
-                pv_coupons += coupon / ((1 + ytm / freq) ** t)
-            
-            pv_face = face_value / ((1 + ytm / freq) ** n_periods)
-            bond_price = pv_coupons + pv_face
-            
-            # Derivative (duration-based approximation)
-            dpv = Decimal("0")
-            for t in range(1, n_periods + 1):
-                dpv -= Decimal(str(t)) * coupon / ((1 + ytm / freq) ** (t + 1)) / freq
-            dpv -= Decimal(str(n_periods)) * face_value / ((1 + ytm / freq) ** (n_periods + 1)) / freq
-            
-            # Newton step
+        # The reported residual always belongs to the returned (last evaluated) yield
+        solved, residual = lo, abs(f_lo)
+        iterations = 0
+        for iterations in range(1, self.max_iterations + 1):
+            bond_price, dprice = self._price_at_yield(
+                face_value, coupon, n_periods, freq, ytm
+            )
             diff = bond_price - price
-            if abs(diff) < Decimal("1E-10"):
+            solved, residual = ytm, abs(diff)
+            if residual < Decimal("1E-10"):
                 break
             
-            if abs(dpv) > Decimal("1E-10"):
-                ytm = ytm - diff / dpv
+            # Price falls as yield rises: shrink the bracket around the root
+            if diff > 0:
+                lo = ytm
+            else:
+                hi = ytm
             
-            # Keep YTM in a reasonable range for convergence
-            # Upper bound 10.0 (1000%) supports distressed debt scenarios
-            ytm = max(Decimal("0.0001"), min(ytm, Decimal("10")))
+            candidate = ytm - diff / dprice if dprice != 0 else lo
+            if not lo < candidate < hi:
+                candidate = (lo + hi) / 2
+            if hi - lo < Decimal("1E-40"):
+                break
+            ytm = candidate
         
-        return ytm
+        return solved, iterations, residual
+    
+    def _price_at_yield(
+        self,
+        face_value: Decimal,
+        coupon: Decimal,
+        n_periods: int,
+        freq: Decimal,
+        ytm: Decimal
+    ) -> Tuple[Decimal, Decimal]:
+        """Closed-form bond price and dPrice/dYield at an annual yield."""
+        i = ytm / freq
+        n = Decimal(n_periods)
+        if i == 0:
+            return coupon * n + face_value, -(coupon * n * (n + 1) / 2 + n * face_value) / freq
+        
+        v_n = (1 + i) ** -n_periods
+        v_n1 = v_n / (1 + i)
+        annuity = (1 - v_n) / i
+        price = coupon * annuity + face_value * v_n
+        
+        # d/di of the annuity factor and of the discounted face value
+        dannuity = n * v_n1 / i - annuity / i
+        dprice = (coupon * dannuity - n * face_value * v_n1) / freq
+        return price, dprice
     
     def verify_duration(
         self,
@@ -199,30 +320,13 @@ class BondGuard:
         # Parse LLM's duration
         llm_dur = Decimal(llm_duration.replace("years", "").replace("yrs", "").strip())
         
-        # Convert to Decimal
-        fv = Decimal(str(face_value))
-        cr = Decimal(str(coupon_rate))
-        y = Decimal(str(ytm))
+        table = self._discount_table(face_value, coupon_rate, ytm, years_to_maturity, frequency)
         freq = Decimal(str(frequency))
+        price = table.price
+        periodic_rate = table.periodic_rate
         
-        # Calculate duration
-        n_periods = int(years_to_maturity * frequency)
-        coupon_payment = (fv * cr) / freq
-        periodic_rate = y / freq
-        
-        # Calculate price and weighted time
-        weighted_time = Decimal("0")
-        price = Decimal("0")
-        
-        for t in range(1, n_periods + 1):
-            pv = coupon_payment / ((1 + periodic_rate) ** t)
-            price += pv
-            weighted_time += (Decimal(str(t)) / freq) * pv
-        
-        # Add face value
-        pv_face = fv / ((1 + periodic_rate) ** n_periods)
-        price += pv_face
-        weighted_time += Decimal(str(years_to_maturity)) * pv_face
+        # Coupons weighted by t / freq years, face value by years to maturity
+        weighted_time = table.coupon_pv_t / freq + Decimal(str(years_to_maturity)) * table.pv_face
         
         # Macaulay duration
         computed_duration = weighted_time / price
@@ -278,31 +382,14 @@ class BondGuard:
         # Parse LLM's convexity
         llm_conv = Decimal(llm_convexity.replace("years²", "").strip())
         
-        # Convert to Decimal
-        fv = Decimal(str(face_value))
-        cr = Decimal(str(coupon_rate))
-        y = Decimal(str(ytm))
+        table = self._discount_table(face_value, coupon_rate, ytm, years_to_maturity, frequency)
         freq = Decimal(str(frequency))
+        price = table.price
+        periodic_rate = table.periodic_rate
         
-        # Calculate convexity
         n_periods = int(years_to_maturity * frequency)
-        coupon_payment = (fv * cr) / freq
-        periodic_rate = y / freq
-        
-        # Calculate weighted sum and price
-        weighted_sum = Decimal("0")
-        price = Decimal("0")
-        
-        for t in range(1, n_periods + 1):
-            td = Decimal(str(t))
-            pv = coupon_payment / ((1 + periodic_rate) ** t)
-            price += pv
-            weighted_sum += td * (td + 1) * pv
-        
-        pv_face = fv / ((1 + periodic_rate) ** n_periods)
-        price += pv_face
-        nd = Decimal(str(n_periods))
-        weighted_sum += nd * (nd + 1) * pv_face
+        nd = Decimal(n_periods)
+        weighted_sum = table.coupon_pv_tt + nd * (nd + 1) * table.pv_face
         
         # Convexity in years
         computed_convexity = weighted_sum / (price * ((1 + periodic_rate) ** 2) * (freq ** 2))
@@ -323,13 +410,55 @@ class BondGuard:
             formula_used="Convexity = Σ(t(t+1) × PV(CFt)) / (P × (1+y)²)"
         )
     
+    def verify_price(
+        self,
+        face_value: float,
+        coupon_rate: float,
+        ytm: float,
+        years_to_maturity: float,
+        llm_price: str,
+        frequency: int = 2
+    ) -> BondResult:
+        """
+        Verify a clean bond price at a given yield.
+        
+        Price = Σ (C / (1+y/n)^t) + (FV / (1+y/n)^N)
+        
+        Args:
+            face_value: Par value of bond
+            coupon_rate: Annual coupon rate
+            ytm: Yield to maturity (annual)
+            years_to_maturity: Years until maturity
+            llm_price: LLM's price answer (e.g., "$1,043.76")
+            frequency: Coupon payments per year
+            
+        Returns:
+            BondResult with verification status
+        """
+        llm_p = self._parse_money(llm_price)
+        
+        table = self._discount_table(face_value, coupon_rate, ytm, years_to_maturity, frequency)
+        computed_q = table.price.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        
+        diff = abs(computed_q - llm_p)
+        verified = diff <= Decimal("0.01")  # Within 1 cent
+        
+        return BondResult(
+            verified=verified,
+            llm_value=f"${llm_p}",
+            computed_value=f"${computed_q}",
+            difference=f"${diff}" if not verified else None,
+            formula_used="Price = Σ C/(1+y/n)^t + FV/(1+y/n)^N"
+        )
+    
     def verify_accrued_interest(
         self,
         face_value: float,
         coupon_rate: float,
         days_since_last_coupon: int,
         days_in_period: int,
-        llm_accrued: str
+        llm_accrued: str,
+        frequency: int = 2
     ) -> BondResult:
         """
         Verify Accrued Interest calculation.
@@ -342,6 +471,7 @@ class BondGuard:
             days_since_last_coupon: Days elapsed since last coupon
             days_in_period: Total days in coupon period
             llm_accrued: LLM's accrued interest answer
+            frequency: Coupon payments per year (2 = semi-annual)
             
         Returns:
             BondResult with verification status
@@ -349,8 +479,8 @@ class BondGuard:
         # Parse LLM's value
         llm_val = self._parse_money(llm_accrued)
         
-        # Semi-annual coupon
-        coupon = (face_value * coupon_rate) / 2
+        # Periodic coupon
+        coupon = (face_value * coupon_rate) / frequency
         
         # Accrued interest
         accrued = Decimal(str(days_since_last_coupon)) / Decimal(str(days_in_period)) * Decimal(str(coupon))
@@ -402,6 +532,501 @@ class BondGuard:
             formula_used="Dirty Price = Clean Price + Accrued Interest"
         )
     
+    # ==================== Schedule-Based Accrual ====================
+    
+    def verify_accrued_interest_on_date(
+        self,
+        face_value: float,
+        coupon_rate: float,
+        issue_date: date,
+        maturity_date: date,
+        settlement_date: date,
+        llm_accrued: str,
+        frequency: int = 2,
+        day_count: DayCountConvention = DayCountConvention.ACTUAL_ACTUAL,
+        stub: StubType = StubType.SHORT_FRONT,
+        roll: RollConvention = RollConvention.FOLLOWING,
+        markets: Sequence[Union[str, AnyHolidayCalendar]] = ("US",)
+    ) -> BondResult:
+        """
+        Verify accrued interest at a settlement date from the bond's coupon schedule.
+        
+        The schedule is generated from the bond's terms (memoized, so repeated
+        checks on the same bond reuse it). Stub periods accrue against their
+        notional regular periods.
+        
+        Args:
+            face_value: Par value
+            coupon_rate: Annual coupon rate
+            issue_date: Accrual start date
+            maturity_date: Maturity date
+            settlement_date: Trade settlement date
+            llm_accrued: LLM's accrued interest answer
+            frequency: Coupon payments per year
+            day_count: Accrual day count convention
+            stub: Placement of an irregular coupon period
+            roll: Business-day convention for payment dates
+            markets: Holiday calendars for payment dates
+            
+        Returns:
+            BondResult with verification status
+        """
+        llm_val = self._parse_money(llm_accrued)
+        schedule, fraction = self._schedule_accrual(
+            issue_date, maturity_date, settlement_date, frequency, day_count, stub, roll, markets
+        )
+        computed = (Decimal(str(face_value)) * Decimal(str(coupon_rate)) * fraction).quantize(
+            Decimal("0.01"), rounding=ROUND_HALF_UP
+        )
+        diff = abs(computed - llm_val)
+        verified = diff <= Decimal("0.01")
+        
+        return BondResult(
+            verified=verified,
+            llm_value=f"${llm_val.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)}",
+            computed_value=f"${computed}",
+            difference=f"${diff.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)}" if not verified else None,
+            formula_used=f"Accrued = Face × Rate × Accrual Fraction ({day_count.value})",
+            details=self._schedule_details(schedule, settlement_date, fraction)
+        )
+    
+    def verify_dirty_price_on_date(
+        self,
+        face_value: float,
+        coupon_rate: float,
+        issue_date: date,
+        maturity_date: date,
+        settlement_date: date,
+        clean_price: float,
+        llm_dirty: str,
+        frequency: int = 2,
+        day_count: DayCountConvention = DayCountConvention.ACTUAL_ACTUAL,
+        stub: StubType = StubType.SHORT_FRONT,
+        roll: RollConvention = RollConvention.FOLLOWING,
+        markets: Sequence[Union[str, AnyHolidayCalendar]] = ("US",)
+    ) -> BondResult:
+        """
+        Verify a dirty price with accrued interest taken from the coupon schedule.
+        
+        Dirty Price = Clean Price + Accrued Interest (at settlement)
+        
+        Args:
+            face_value: Par value
+            coupon_rate: Annual coupon rate
+            issue_date: Accrual start date
+            maturity_date: Maturity date
+            settlement_date: Trade settlement date
+            clean_price: Quoted clean price (in currency)
+            llm_dirty: LLM's dirty price answer
+            frequency: Coupon payments per year
+            day_count: Accrual day count convention
+            stub: Placement of an irregular coupon period
+            roll: Business-day convention for payment dates
+            markets: Holiday calendars for payment dates
+            
+        Returns:
+            BondResult with verification status
+        """
+        llm_val = self._parse_money(llm_dirty)
+        schedule, fraction = self._schedule_accrual(
+            issue_date, maturity_date, settlement_date, frequency, day_count, stub, roll, markets
+        )
+        accrued = (Decimal(str(face_value)) * Decimal(str(coupon_rate)) * fraction).quantize(
+            Decimal("0.01"), rounding=ROUND_HALF_UP
+        )
+        computed = (Decimal(str(clean_price)) + accrued).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        diff = abs(computed - llm_val)
+        verified = diff <= Decimal("0.01")
+        
+        details = self._schedule_details(schedule, settlement_date, fraction)
+        details["accrued_interest"] = f"${accrued}"
+        return BondResult(
+            verified=verified,
+            llm_value=f"${llm_val.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)}",
+            computed_value=f"${computed}",
+            difference=f"${diff.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)}" if not verified else None,
+            formula_used="Dirty Price = Clean Price + Accrued Interest",
+            details=details
+        )
+    
+    def _schedule_accrual(
+        self,
+        issue_date: date,
+        maturity_date: date,
+        settlement_date: date,
+        frequency: int,
+        day_count: DayCountConvention,
+        stub: StubType,
+        roll: RollConvention,
+        markets: Sequence[Union[str, AnyHolidayCalendar]]
+    ) -> Tuple[CouponSchedule, Decimal]:
+        """Memoized schedule for the bond and the accrual fraction (in years) at settlement."""
+        schedule = coupon_schedule(
+            issue_date, maturity_date, frequency, stub, roll,
+            rules=get_holiday_calendar(*markets)
+        )
+        fraction = Decimal(0)
+        for start, end, notional_start, notional_end in schedule.accrual_segments(settlement_date):
+            if day_count == DayCountConvention.THIRTY_360:
+                days, basis = thirty_360_days(start, end), 360
+            elif day_count == DayCountConvention.ACTUAL_360:
+                days, basis = (end - start).days, 360
+            elif day_count == DayCountConvention.ACTUAL_365:
+                days, basis = (end - start).days, 365
+            else:
+                # ACT/ACT (ICMA): actual days over the notional period, per coupon
+                days, basis = (end - start).days, frequency * (notional_end - notional_start).days
+            fraction += Decimal(days) / Decimal(basis)
+        return schedule, fraction
+    
+    def _schedule_details(self, schedule: CouponSchedule, settlement_date: date, fraction: Decimal) -> dict:
+        i = schedule.period_index(settlement_date)
+        return {
+            "previous_coupon": schedule.accrual_dates[i].isoformat(),
+            "next_coupon": schedule.accrual_dates[i + 1].isoformat(),
+            "next_payment": schedule.payment_dates[i].isoformat(),
+            "accrual_fraction": str(fraction.quantize(Decimal("1e-10"))),
+            "periods": len(schedule),
+            "stub": schedule.stub.value if schedule.has_stub else None,
+        }
+    
+    # ==================== Discount Table Cache ====================
+    
+    def cache_info(self) -> dict:
+        """Hit/miss counters and occupancy of the discount-table cache."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._tables),
+            "maxsize": self.cache_size,
+        }
+    
+    def clear_cache(self) -> None:
+        """Drop all cached discount tables and reset the counters."""
+        self._tables.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+    
+    def _discount_table(
+        self,
+        face_value: float,
+        coupon_rate: float,
+        ytm: float,
+        years_to_maturity: float,
+        frequency: int
+    ) -> _DiscountTable:
+        """
+        Discounted cash-flow aggregates for a bond, memoized in a bounded LRU.
+        
+        Keyed by (face, coupon, frequency, periods, yield), so price, duration
+        and convexity of the same bond share one pass over its cash flows.
+        The YTM solvers stay off this cache: every Newton step prices a new
+        trial yield with the O(1) closed form, and caching those O(n) tables
+        would only evict the tables callers reuse.
+        """
+        fv = Decimal(str(face_value))
+        cr = Decimal(str(coupon_rate))
+        y = Decimal(str(ytm))
+        freq = Decimal(str(frequency))
+        n_periods = int(years_to_maturity * frequency)
+        
+        key = (fv, cr, freq, n_periods, y)
+        table = self._tables.get(key)
+        if table is not None:
+            self._cache_hits += 1
+            self._tables.move_to_end(key)
+            return table
+        self._cache_misses += 1
+        
+        coupon_payment = (fv * cr) / freq
+        periodic_rate = y / freq
+        
+        price = Decimal("0")
+        coupon_pv_t = Decimal("0")
+        coupon_pv_tt = Decimal("0")
+        for t in range(1, n_periods + 1):
+            td = Decimal(t)
+            pv = coupon_payment / ((1 + periodic_rate) ** t)
+            price += pv
+            coupon_pv_t += td * pv
+            coupon_pv_tt += td * (td + 1) * pv
+        
+        pv_face = fv / ((1 + periodic_rate) ** n_periods)
+        table = _DiscountTable(
+            price=price + pv_face,
+            pv_face=pv_face,
+            coupon_pv_t=coupon_pv_t,
+            coupon_pv_tt=coupon_pv_tt,
+            periodic_rate=periodic_rate,
+        )
+        
+        if self.cache_size:
+            self._tables[key] = table
+            if len(self._tables) > self.cache_size:
+                self._tables.popitem(last=False)
+        return table
+    
+    # ==================== Portfolio Analytics ====================
+    
+    def verify_portfolio(
+        self,
+        face_values: Union[np.ndarray, Sequence[float]],
+        coupon_rates: Union[np.ndarray, Sequence[float]],
+        years_to_maturity: Union[np.ndarray, Sequence[float]],
+        prices: Optional[Union[np.ndarray, Sequence[float]]] = None,
+        ytms: Optional[Union[np.ndarray, Sequence[float]]] = None,
+        frequency: Union[int, np.ndarray, Sequence[int]] = 2,
+        llm_ytm: Optional[Union[np.ndarray, Sequence[float]]] = None,
+        llm_duration: Optional[Union[np.ndarray, Sequence[float]]] = None,
+        llm_convexity: Optional[Union[np.ndarray, Sequence[float]]] = None,
+        chunk_size: int = 4096
+    ) -> PortfolioResult:
+        """
+        Verify YTM, duration and convexity claims for a whole book at once.
+        
+        YTMs are solved from prices with the vectorized closed-form Newton
+        solver. Price, Macaulay/modified duration and convexity are then
+        computed in one pass per chunk of bonds that shares a single
+        discount-factor matrix. Verdicts follow the per-bond verify_ytm,
+        verify_duration and verify_convexity rules; bonds whose float64
+        result lands on a tolerance or rounding edge are re-run through
+        those Decimal methods, so only those rechecks touch the shared
+        discount-table cache; the float64 matrices are built per chunk.
+        
+        Args:
+            face_values: Par value per bond
+            coupon_rates: Annual coupon rate per bond
+            years_to_maturity: Years until maturity per bond
+            prices: Market price per bond (needed to solve or verify YTM)
+            ytms: Annual yield per bond for the analytics; defaults to the
+                YTM solved from prices
+            frequency: Coupon payments per year (one for all bonds, or per bond)
+            llm_ytm: LLM's YTM per bond as a decimal fraction (0.0525)
+            llm_duration: LLM's Macaulay duration per bond (years)
+            llm_convexity: LLM's convexity per bond
+            chunk_size: Bonds per discount-factor matrix (bounds memory)
+            
+        Returns:
+            PortfolioResult with per-bond verdicts and timing stats
+        """
+        start = time.perf_counter()
+        face = np.asarray(face_values, dtype=np.float64)
+        size = len(face)
+        coupon_rate = self._portfolio_column(coupon_rates, size, "coupon_rates")
+        years = self._portfolio_column(years_to_maturity, size, "years_to_maturity")
+        freq = np.broadcast_to(np.asarray(frequency, dtype=np.float64), (size,))
+        if prices is None and ytms is None:
+            raise ValueError("verify_portfolio needs prices or ytms")
+        if llm_ytm is not None and prices is None:
+            raise ValueError("llm_ytm can only be verified against market prices")
+        
+        # Same period count and coupon as the per-bond methods
+        n_periods = (years * freq).astype(np.int64)
+        coupon = face * coupon_rate / freq
+        
+        solved = None
+        iterations = 0
+        if prices is not None:
+            price_col = self._portfolio_column(prices, size, "prices")
+            solved, iterations = self._solve_ytm_vectorized(face, coupon, price_col, n_periods, freq)
+        yields = self._portfolio_column(ytms, size, "ytms") if ytms is not None else solved
+        solve_done = time.perf_counter()
+        
+        price = np.empty(size)
+        macaulay = np.empty(size)
+        convexity = np.empty(size)
+        # Sort by maturity so each chunk's discount-factor matrix is barely padded
+        order = np.argsort(n_periods, kind="stable")
+        for begin in range(0, size, chunk_size):
+            rows = order[begin:begin + chunk_size]
+            price[rows], macaulay[rows], convexity[rows] = self._analytics_chunk(
+                face[rows], coupon[rows], yields[rows], years[rows], n_periods[rows], freq[rows]
+            )
+        modified = macaulay / (1 + yields / freq)
+        analytics_done = time.perf_counter()
+        
+        verified = np.ones(size, dtype=bool)
+        rechecked = np.zeros(size, dtype=bool)
+        ytm_ok = duration_ok = convexity_ok = None
+        
+        if llm_ytm is not None:
+            claim = self._portfolio_column(llm_ytm, size, "llm_ytm")
+            ytm_ok, edge = self._pct_verdict(solved, claim)
+            for i in np.flatnonzero(edge):
+                ytm_ok[i] = self.verify_ytm(
+                    face[i], coupon_rate[i], price_col[i], years[i], str(claim[i]), int(freq[i])
+                ).verified
+            verified &= ytm_ok
+            rechecked |= edge
+        
+        if llm_duration is not None:
+            claim = self._portfolio_column(llm_duration, size, "llm_duration")
+            # Quantize to 0.0001 years (half-up), then allow 0.05 years
+            scaled = macaulay * 10000
+            quantized = np.floor(scaled + 0.5) / 10000
+            diff = np.abs(quantized - claim)
+            duration_ok = diff <= 0.05
+            slack = 1e-9 * np.maximum(1.0, np.abs(macaulay))
+            edge = (np.abs(scaled - np.floor(scaled) - 0.5) / 10000 <= slack) | (np.abs(diff - 0.05) <= slack)
+            edge |= ~np.isfinite(macaulay)
+            for i in np.flatnonzero(edge):
+                duration_ok[i] = self.verify_duration(
+                    face[i], coupon_rate[i], float(yields[i]), years[i], str(claim[i]), int(freq[i])
+                ).verified
+            verified &= duration_ok
+            rechecked |= edge
+        
+        if llm_convexity is not None:
+            claim = self._portfolio_column(llm_convexity, size, "llm_convexity")
+            convexity_ok, edge = self._pct_verdict(convexity, claim)
+            for i in np.flatnonzero(edge):
+                convexity_ok[i] = self.verify_convexity(
+                    face[i], coupon_rate[i], float(yields[i]), years[i], str(claim[i]), int(freq[i])
+                ).verified
+            verified &= convexity_ok
+            rechecked |= edge
+        
+        end = time.perf_counter()
+        elapsed = end - start
+        return PortfolioResult(
+            verified=verified,
+            price=price,
+            ytm=yields,
+            macaulay_duration=macaulay,
+            modified_duration=modified,
+            convexity=convexity,
+            ytm_verified=ytm_ok,
+            duration_verified=duration_ok,
+            convexity_verified=convexity_ok,
+            rechecked=rechecked,
+            stats={
+                "bonds": size,
+                "failed": int(size - verified.sum()),
+                "rechecked": int(rechecked.sum()),
+                "ytm_iterations": iterations,
+                "solve_ms": round((solve_done - start) * 1000, 3),
+                "analytics_ms": round((analytics_done - solve_done) * 1000, 3),
+                "verify_ms": round((end - analytics_done) * 1000, 3),
+                "elapsed_ms": round(elapsed * 1000, 3),
+                "bonds_per_second": round(size / elapsed) if elapsed > 0 else None
+            }
+        )
+    
+    def _portfolio_column(self, values, size: int, name: str) -> np.ndarray:
+        """One per-bond input column as float64, checked against the book size"""
+        column = np.asarray(values, dtype=np.float64)
+        if column.shape != (size,):
+            raise ValueError(f"{name} must have one value per bond ({size})")
+        return column
+    
+    def _pct_verdict(self, computed: np.ndarray, claim: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Percentage-difference verdict (as in verify_ytm/verify_convexity),
+        plus the mask of bonds too close to the tolerance to decide in float64.
+        """
+        tolerance = float(self.tolerance_pct)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            diff_pct = np.where(computed > 0, np.abs(computed - claim) / computed * 100, 0.0)
+        verdict = diff_pct <= tolerance
+        edge = (np.abs(diff_pct - tolerance) <= 1e-9 * max(1.0, tolerance)) | ~np.isfinite(diff_pct)
+        return verdict, edge
+    
+    def _solve_ytm_vectorized(
+        self,
+        face: np.ndarray,
+        coupon: np.ndarray,
+        price: np.ndarray,
+        n_periods: np.ndarray,
+        freq: np.ndarray
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Float64 version of _solve_ytm_with_stats over a whole book: closed-form
+        Newton steps, replaced by bisection wherever they leave the bracket.
+        """
+        lo = np.full(len(face), 0.0001)
+        hi = np.full(len(face), 10.0)
+        f_lo = self._price_at_yield_vectorized(face, coupon, n_periods, freq, lo)[0] - price
+        f_hi = self._price_at_yield_vectorized(face, coupon, n_periods, freq, hi)[0] - price
+        
+        ytm = coupon * freq / price
+        ytm = np.where((ytm > lo) & (ytm < hi), ytm, (lo + hi) / 2)
+        # Clamped bonds (price outside the bracket) are already done
+        ytm = np.where(f_lo <= 0, lo, np.where(f_hi >= 0, hi, ytm))
+        active = (f_lo > 0) & (f_hi < 0)
+        
+        iterations = 0
+        while active.any() and iterations < self.max_iterations:
+            iterations += 1
+            idx = np.flatnonzero(active)
+            y = ytm[idx]
+            bond_price, dprice = self._price_at_yield_vectorized(
+                face[idx], coupon[idx], n_periods[idx], freq[idx], y
+            )
+            diff = bond_price - price[idx]
+            done = np.abs(diff) <= 1e-10 * np.maximum(1.0, price[idx])
+            
+            new_lo = np.where(diff > 0, y, lo[idx])
+            new_hi = np.where(diff > 0, hi[idx], y)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                candidate = y - diff / dprice
+            inside = (candidate > new_lo) & (candidate < new_hi)
+            candidate = np.where(inside, candidate, (new_lo + new_hi) / 2)
+            collapsed = new_hi - new_lo <= 4 * np.finfo(np.float64).eps * new_hi
+            
+            lo[idx], hi[idx] = new_lo, new_hi
+            ytm[idx] = np.where(done | collapsed, y, candidate)
+            active[idx] = ~(done | collapsed)
+        return ytm, iterations
+    
+    def _price_at_yield_vectorized(
+        self,
+        face: np.ndarray,
+        coupon: np.ndarray,
+        n_periods: np.ndarray,
+        freq: np.ndarray,
+        ytm: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Float64 version of _price_at_yield (closed-form price and dP/dy)."""
+        i = ytm / freq
+        v_n = (1 + i) ** -n_periods.astype(np.float64)
+        v_n1 = v_n / (1 + i)
+        annuity = (1 - v_n) / i
+        price = coupon * annuity + face * v_n
+        dannuity = n_periods * v_n1 / i - annuity / i
+        dprice = (coupon * dannuity - n_periods * face * v_n1) / freq
+        return price, dprice
+    
+    def _analytics_chunk(
+        self,
+        face: np.ndarray,
+        coupon: np.ndarray,
+        ytm: np.ndarray,
+        years: np.ndarray,
+        n_periods: np.ndarray,
+        freq: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Price, Macaulay duration and convexity for a chunk of bonds from one
+        shared discount-factor matrix (bonds × periods, zero past maturity).
+        """
+        width = int(n_periods.max()) if len(n_periods) else 0
+        t = np.arange(1, width + 1, dtype=np.float64)
+        growth = 1 + ytm / freq
+        discount = growth[:, None] ** -t[None, :]
+        discount[t[None, :] > n_periods[:, None]] = 0.0
+        
+        pv_coupons = coupon[:, None] * discount
+        pv_face = face * growth ** -n_periods.astype(np.float64)
+        n = n_periods.astype(np.float64)
+        
+        price = pv_coupons.sum(axis=1) + pv_face
+        weighted_time = (pv_coupons @ t) / freq + years * pv_face
+        weighted_curve = pv_coupons @ (t * (t + 1)) + n * (n + 1) * pv_face
+        
+        macaulay = weighted_time / price
+        convexity = weighted_curve / (price * growth ** 2 * freq ** 2)
+        return price, macaulay, convexity
+    
     def _parse_rate(self, rate_str: str) -> Decimal:
         """Parse rate string to Decimal — fail-closed, no silent guessing.
 
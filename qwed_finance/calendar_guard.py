@@ -3,11 +3,19 @@ Calendar Guard - Deterministic day count conventions for interest accrual
 Handles 30/360, Actual/360, Actual/365, Actual/Actual conventions
 """
 
+from bisect import bisect_right
+from calendar import monthrange
 from dataclasses import dataclass
-from datetime import date, timedelta
-from typing import Optional, List, Tuple
+from datetime import date
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Optional, List, Sequence, Tuple, Union
 from decimal import Decimal, ROUND_HALF_UP
 from enum import Enum
+import threading
+
+import numpy as np
+
+from .holiday_rules import AnyHolidayCalendar, US_FEDERAL, get_holiday_calendar
 
 
 class DayCountConvention(Enum):
@@ -19,6 +27,22 @@ class DayCountConvention(Enum):
     THIRTY_360_EU = "30E/360"      # Eurobonds
 
 
+class RollConvention(Enum):
+    """Business-day adjustment of scheduled dates falling on non-business days"""
+    UNADJUSTED = "Unadjusted"
+    FOLLOWING = "Following"
+    MODIFIED_FOLLOWING = "Modified Following"   # Following, unless that crosses into the next month
+    PRECEDING = "Preceding"
+
+
+class StubType(Enum):
+    """Where an irregular first or last coupon period goes"""
+    SHORT_FRONT = "Short front"    # Dates rolled back from maturity (bond default)
+    LONG_FRONT = "Long front"
+    SHORT_BACK = "Short back"      # Dates rolled forward from the effective date
+    LONG_BACK = "Long back"
+
+
 @dataclass
 class CalendarResult:
     """Result of a calendar/day count verification"""
@@ -31,33 +55,448 @@ class CalendarResult:
     proof: Optional[str] = None
 
 
+@dataclass
+class DayCountBatchResult:
+    """Columnar result of verifying many day count fractions at once"""
+    verified: np.ndarray            # bool, one per accrual period
+    computed_days: np.ndarray       # int64
+    fractions: np.ndarray           # float64
+    differences: np.ndarray         # float64, |llm - computed|
+    convention_used: str
+    
+    def __len__(self) -> int:
+        return len(self.verified)
+    
+    @property
+    def all_verified(self) -> bool:
+        return bool(self.verified.all())
+    
+    @property
+    def failed_rows(self) -> np.ndarray:
+        """Indices of periods whose LLM fraction is outside tolerance"""
+        return np.flatnonzero(~self.verified)
+
+
+@dataclass(frozen=True)
+class _CompiledRange:
+    """Immutable snapshot of the compiled years of a BusinessDayCalendar."""
+    first_year: int
+    last_year: int
+    origin: int                 # ordinal of Jan 1 of first_year
+    bits: np.ndarray            # bool, business day flag per day
+    cumulative: np.ndarray      # int64, business days strictly before each day (+1 sentinel)
+    business_days: np.ndarray   # int64, day index of each business day
+    
+    def covers(self, year: int) -> bool:
+        return self.first_year <= year <= self.last_year
+
+
+class BusinessDayCalendar:
+    """
+    Compiled business-day calendar for a holiday set (Saturday/Sunday weekends).
+    
+    Holidays come from explicit dates, from a rule-based market calendar
+    (see holiday_rules), or both.
+    
+    Each calendar year is compiled once into a bitmap of business days. The
+    compiled years are kept as one contiguous day array with a cumulative
+    business-day count and the index of every business day, so membership,
+    rolling, offsetting and counting are all O(1) lookups. The covered year
+    range grows on demand; readers always see a consistent snapshot.
+    
+    Use compiled_calendar() to obtain instances: calendars are shared by
+    every guard that uses the same holiday set.
+    """
+    
+    def __init__(
+        self,
+        holidays: Iterable[date] = (),
+        rules: Optional[AnyHolidayCalendar] = None
+    ):
+        self.holidays: FrozenSet[date] = frozenset(holidays)
+        self.rules = rules
+        self._lock = threading.Lock()
+        self._year_bits: dict = {}
+        self._range: Optional[_CompiledRange] = None
+    
+    # ---------- compilation ----------
+    
+    def _compile_year(self, year: int) -> np.ndarray:
+        """Business-day bitmap for one calendar year."""
+        first = date(year, 1, 1)
+        n_days = (date(year + 1, 1, 1) - first).days
+        bits = (np.arange(n_days) + first.weekday()) % 7 < 5
+        holidays = [h for h in self.holidays if h.year == year]
+        if self.rules is not None:
+            holidays.extend(self.rules.holidays_in(year))
+        for holiday in holidays:
+            bits[holiday.timetuple().tm_yday - 1] = False
+        return bits
+    
+    def _extend(self, first_year: int, last_year: int) -> _CompiledRange:
+        """Compile [first_year, last_year] into the range and return the new snapshot."""
+        with self._lock:
+            current = self._range
+            if current is not None:
+                first_year = min(first_year, current.first_year)
+                last_year = max(last_year, current.last_year)
+                if (first_year, last_year) == (current.first_year, current.last_year):
+                    return current
+            for year in range(first_year, last_year + 1):
+                if year not in self._year_bits:
+                    self._year_bits[year] = self._compile_year(year)
+            
+            bits = np.concatenate([self._year_bits[y] for y in range(first_year, last_year + 1)])
+            cumulative = np.zeros(len(bits) + 1, dtype=np.int64)
+            np.cumsum(bits, out=cumulative[1:])
+            self._range = _CompiledRange(
+                first_year=first_year,
+                last_year=last_year,
+                origin=date(first_year, 1, 1).toordinal(),
+                bits=bits,
+                cumulative=cumulative,
+                business_days=np.flatnonzero(bits),
+            )
+            return self._range
+    
+    def _covering(self, *days: date) -> _CompiledRange:
+        """A snapshot covering every given date (plus a year either side)."""
+        compiled = self._range
+        if compiled is None or not all(compiled.covers(d.year) for d in days):
+            years = [d.year for d in days]
+            compiled = self._extend(min(years) - 1, max(years) + 1)
+        return compiled
+    
+    def _nth_business_day(self, day: date, offset_from: str, n: int) -> date:
+        """Business day n steps from the day's position in the cumulative count."""
+        compiled = self._covering(day)
+        while True:
+            i = day.toordinal() - compiled.origin
+            k = int(compiled.cumulative[i + 1 if offset_from == "after" else i]) + n
+            if 0 <= k < len(compiled.business_days):
+                return date.fromordinal(compiled.origin + int(compiled.business_days[k]))
+            # Roughly 250 business days per year
+            if k < 0:
+                compiled = self._extend(compiled.first_year - 1 - (-k) // 250, compiled.last_year)
+            else:
+                extra = (k - len(compiled.business_days)) // 250
+                compiled = self._extend(compiled.first_year, compiled.last_year + 1 + extra)
+    
+    # ---------- queries ----------
+    
+    @property
+    def compiled_years(self) -> Optional[Tuple[int, int]]:
+        """(first, last) calendar year currently compiled"""
+        compiled = self._range
+        return None if compiled is None else (compiled.first_year, compiled.last_year)
+    
+    def is_holiday(self, day: date) -> bool:
+        """True if the date is an explicit or rule-based holiday."""
+        return day in self.holidays or (self.rules is not None and self.rules.is_holiday(day))
+    
+    def is_business_day(self, day: date) -> bool:
+        """True if the date is neither a weekend nor a holiday."""
+        compiled = self._covering(day)
+        return bool(compiled.bits[day.toordinal() - compiled.origin])
+    
+    def following(self, day: date) -> date:
+        """The date itself if it is a business day, else the next business day."""
+        return self._nth_business_day(day, "before", 0)
+    
+    def preceding(self, day: date) -> date:
+        """The date itself if it is a business day, else the previous business day."""
+        return self._nth_business_day(day, "after", -1)
+    
+    def adjust(self, day: date, roll: RollConvention) -> date:
+        """Roll a date onto a business day under the given convention."""
+        if roll == RollConvention.UNADJUSTED:
+            return day
+        if roll == RollConvention.PRECEDING:
+            return self.preceding(day)
+        rolled = self.following(day)
+        if roll == RollConvention.MODIFIED_FOLLOWING and rolled.month != day.month:
+            return self.preceding(day)
+        return rolled
+    
+    def add_business_days(self, day: date, n: int) -> date:
+        """
+        Move by n business days.
+        
+        n > 0 gives the n-th business day after the date, n < 0 the |n|-th
+        business day before it; n = 0 rolls the date forward to a business day.
+        """
+        if n > 0:
+            return self._nth_business_day(day, "after", n - 1)
+        return self._nth_business_day(day, "before", n)
+    
+    def count_business_days(self, start: date, end: date) -> int:
+        """
+        Business days in [start, end); when end precedes start the result is
+        -count_business_days(end, start).
+        """
+        compiled = self._covering(start, end)
+        i = start.toordinal() - compiled.origin
+        j = end.toordinal() - compiled.origin
+        return int(compiled.cumulative[j] - compiled.cumulative[i])
+
+
+@lru_cache(maxsize=32)
+def _compiled_calendar(
+    holidays: FrozenSet[date],
+    rules: Optional[AnyHolidayCalendar]
+) -> BusinessDayCalendar:
+    return BusinessDayCalendar(holidays, rules)
+
+
+def compiled_calendar(
+    holidays: Iterable[date] = (),
+    rules: Optional[AnyHolidayCalendar] = None
+) -> BusinessDayCalendar:
+    """
+    Shared compiled calendar for a holiday set and/or market rules.
+    
+    Guards using the same holidays get the same instance, so each year is
+    compiled once per process rather than once per guard.
+    """
+    return _compiled_calendar(frozenset(holidays), rules)
+
+
+# ==================== Coupon Schedules ====================
+
+@dataclass(frozen=True)
+class CouponSchedule:
+    """
+    Coupon schedule of a fixed-rate instrument.
+    
+    accrual_dates are the unadjusted period boundaries (effective date,
+    coupon dates, maturity); payment_dates are the coupon dates rolled onto
+    business days, one per period. notional_dates is the regular grid the
+    schedule was rolled on, extended past any stub, so irregular periods can
+    be accrued against their notional regular periods (ICMA).
+    """
+    effective_date: date
+    maturity_date: date
+    frequency: int
+    stub: StubType
+    roll: RollConvention
+    accrual_dates: Tuple[date, ...]
+    payment_dates: Tuple[date, ...]
+    notional_dates: Tuple[date, ...]
+    
+    def __len__(self) -> int:
+        return len(self.payment_dates)
+    
+    @property
+    def has_stub(self) -> bool:
+        return self.accrual_dates != self.notional_dates
+    
+    def period_index(self, settlement: date) -> int:
+        """Index of the accrual period containing the settlement date"""
+        if not self.effective_date <= settlement < self.maturity_date:
+            raise ValueError(
+                f"Settlement {settlement} outside schedule "
+                f"[{self.effective_date}, {self.maturity_date})"
+            )
+        return bisect_right(self.accrual_dates, settlement) - 1
+    
+    def previous_coupon_date(self, settlement: date) -> date:
+        """Start of the accrual period containing the settlement date"""
+        return self.accrual_dates[self.period_index(settlement)]
+    
+    def next_coupon_date(self, settlement: date) -> date:
+        """Unadjusted end of the accrual period containing the settlement date"""
+        return self.accrual_dates[self.period_index(settlement) + 1]
+    
+    def accrual_segments(self, settlement: date) -> List[Tuple[date, date, date, date]]:
+        """
+        Pieces of [period start, settlement) cut at notional coupon dates.
+        
+        Returns:
+            (start, end, notional_start, notional_end) per piece; a regular
+            period gives a single piece whose notional period is itself
+        """
+        start = self.previous_coupon_date(settlement)
+        grid = self.notional_dates
+        segments = []
+        for k in range(max(bisect_right(grid, start) - 1, 0), len(grid) - 1):
+            lo, hi = max(start, grid[k]), min(settlement, grid[k + 1])
+            if lo >= hi:
+                break
+            segments.append((lo, hi, grid[k], grid[k + 1]))
+        return segments
+
+
+def _add_months(anchor: date, months: int, end_of_month: bool) -> date:
+    """Anchor date shifted by whole months, clamped to month length (no drift)."""
+    years, month = divmod(anchor.month - 1 + months, 12)
+    year = anchor.year + years
+    last_day = monthrange(year, month + 1)[1]
+    return date(year, month + 1, last_day if end_of_month else min(anchor.day, last_day))
+
+
+@lru_cache(maxsize=1024)
+def _coupon_schedule(
+    effective_date: date,
+    maturity_date: date,
+    frequency: int,
+    stub: StubType,
+    roll: RollConvention,
+    end_of_month: bool,
+    holidays: FrozenSet[date],
+    rules: Optional[AnyHolidayCalendar]
+) -> CouponSchedule:
+    step = 12 // frequency
+    backward = stub in (StubType.SHORT_FRONT, StubType.LONG_FRONT)
+    anchor = maturity_date if backward else effective_date
+    eom = end_of_month and anchor.day == monthrange(anchor.year, anchor.month)[1]
+    
+    grid = [anchor]
+    if backward:
+        while grid[-1] > effective_date:
+            grid.append(_add_months(anchor, -step * len(grid), eom))
+        grid.reverse()
+        # grid[0] <= effective < grid[1] < ... < grid[-1] = maturity
+        coupons = grid[1:]
+        if grid[0] != effective_date and stub == StubType.LONG_FRONT and len(coupons) > 1:
+            coupons = coupons[1:]
+        accrual = [effective_date] + coupons
+    else:
+        while grid[-1] < maturity_date:
+            grid.append(_add_months(anchor, step * len(grid), eom))
+        # effective = grid[0] < ... < grid[-2] < maturity <= grid[-1]
+        coupons = grid[:-1]
+        if grid[-1] != maturity_date and stub == StubType.LONG_BACK and len(coupons) > 1:
+            coupons = coupons[:-1]
+        accrual = coupons + [maturity_date]
+    
+    business = compiled_calendar(holidays, rules)
+    return CouponSchedule(
+        effective_date=effective_date,
+        maturity_date=maturity_date,
+        frequency=frequency,
+        stub=stub,
+        roll=roll,
+        accrual_dates=tuple(accrual),
+        payment_dates=tuple(business.adjust(d, roll) for d in accrual[1:]),
+        notional_dates=tuple(grid),
+    )
+
+
+def coupon_schedule(
+    effective_date: date,
+    maturity_date: date,
+    frequency: int = 2,
+    stub: StubType = StubType.SHORT_FRONT,
+    roll: RollConvention = RollConvention.FOLLOWING,
+    end_of_month: bool = False,
+    holidays: Iterable[date] = (),
+    rules: Optional[AnyHolidayCalendar] = None
+) -> CouponSchedule:
+    """
+    Generate (or fetch the memoized) coupon schedule for an instrument's terms.
+    
+    Args:
+        effective_date: Issue / accrual start date
+        maturity_date: Final coupon and redemption date
+        frequency: Coupons per year (1, 2, 3, 4, 6 or 12)
+        stub: Placement of an irregular period
+        roll: Business-day convention for payment dates
+        end_of_month: Keep coupons on month ends when the anchor date is one
+        holidays: Explicit holiday dates for payment adjustment
+        rules: Market holiday calendar for payment adjustment
+        
+    Returns:
+        CouponSchedule, shared by every caller asking for the same terms
+    """
+    if frequency <= 0 or 12 % frequency != 0:
+        raise ValueError(f"frequency must divide 12, got {frequency}")
+    if maturity_date <= effective_date:
+        raise ValueError(
+            f"maturity_date {maturity_date} must be after effective_date {effective_date}"
+        )
+    return _coupon_schedule(
+        effective_date, maturity_date, frequency, stub, roll, end_of_month,
+        frozenset(holidays), rules
+    )
+
+
+def thirty_360_days(start: date, end: date, european: bool = False) -> int:
+    """
+    Calculate days using 30/360 convention.
+    
+    US 30/360:
+    - If start day is 31, change to 30
+    - If end day is 31 AND start day is 30 or 31, change end to 30
+    
+    European 30E/360:
+    - If either day is 31, change to 30
+    """
+    d1 = start.day
+    m1 = start.month
+    y1 = start.year
+    
+    d2 = end.day
+    m2 = end.month
+    y2 = end.year
+    
+    if european:
+        # 30E/360 (Eurobond)
+        if d1 == 31:
+            d1 = 30
+        if d2 == 31:
+            d2 = 30
+    else:
+        # US 30/360
+        if d1 == 31:
+            d1 = 30
+        if d2 == 31 and d1 >= 30:
+            d2 = 30
+    
+    return 360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)
+
+
 class CalendarGuard:
     """
     Deterministic day count verification for interest calculations.
     Prevents LLM hallucinations in date-based financial calculations.
     """
     
-    def __init__(self, holiday_calendar: Optional[List[date]] = None):
+    def __init__(
+        self,
+        holiday_calendar: Optional[List[date]] = None,
+        markets: Sequence[Union[str, AnyHolidayCalendar]] = ("US",)
+    ):
         """
         Initialize the Calendar Guard.
         
         Args:
             holiday_calendar: List of holiday dates to exclude from business days
+                (kept in self.holidays; later changes to it are picked up)
+            markets: Market holiday calendars applied when use_us_holidays=True
+                ("US", "NYFED", "TARGET2", "UK"); several give a joint calendar
         """
         self.holidays = set(holiday_calendar or [])
+        self.market_calendar = get_holiday_calendar(*markets)
         
-        # Default US federal holidays (approximate - should be fetched from calendar library)
+        # US federal holidays, kept for callers that read the set directly
         self.default_us_holidays = self._generate_us_holidays(2024, 2030)
+        
+        # Compiled business-day calendars, shared with other guards on the same holidays
+        self._compile_calendars()
+    
+    def _compile_calendars(self) -> None:
+        """(Re)compile the business-day calendars from the current holidays."""
+        self._compiled_holidays = frozenset(self.holidays)
+        self._calendars = {
+            False: compiled_calendar(self._compiled_holidays),
+            True: compiled_calendar(self._compiled_holidays, self.market_calendar),
+        }
     
     def _generate_us_holidays(self, start_year: int, end_year: int) -> set:
-        """Generate approximate US federal holiday dates"""
+        """Observed US federal holiday dates (rule-based, incl. floating holidays)"""
         holidays = set()
         for year in range(start_year, end_year + 1):
-            # Fixed holidays (approximate)
-            holidays.add(date(year, 1, 1))    # New Year's Day
-            holidays.add(date(year, 7, 4))    # Independence Day
-            holidays.add(date(year, 12, 25))  # Christmas
-            # Note: In production, use `holidays` library for accurate dates
+            holidays.update(US_FEDERAL.holidays_in(year))
         return holidays
     
     # ==================== Day Count Calculations ====================
@@ -117,38 +556,8 @@ class CalendarGuard:
         return (end - start).days
     
     def _thirty_360_days(self, start: date, end: date, european: bool = False) -> int:
-        """
-        Calculate days using 30/360 convention.
-        
-        US 30/360:
-        - If start day is 31, change to 30
-        - If end day is 31 AND start day is 30 or 31, change end to 30
-        
-        European 30E/360:
-        - If either day is 31, change to 30
-        """
-        d1 = start.day
-        m1 = start.month
-        y1 = start.year
-        
-        d2 = end.day
-        m2 = end.month
-        y2 = end.year
-        
-        if european:
-            # 30E/360 (Eurobond)
-            if d1 == 31:
-                d1 = 30
-            if d2 == 31:
-                d2 = 30
-        else:
-            # US 30/360
-            if d1 == 31:
-                d1 = 30
-            if d2 == 31 and d1 >= 30:
-                d2 = 30
-        
-        return 360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)
+        """Calculate days using 30/360 convention (see thirty_360_days)."""
+        return thirty_360_days(start, end, european)
     
     # ==================== Day Count Fraction ====================
     
@@ -174,19 +583,14 @@ class CalendarGuard:
             CalendarResult
         """
         days = self._calculate_days(start_date, end_date, convention)
+        computed_fraction = self._year_fraction(start_date, end_date, convention)
+        denominator = self._denominator(convention, start_date.year)
         
-        # Calculate denominator based on convention
-        if convention in [DayCountConvention.ACTUAL_360, DayCountConvention.THIRTY_360]:
-            denominator = 360
-        elif convention == DayCountConvention.ACTUAL_365:
-            denominator = 365
-        else:  # ACTUAL_ACTUAL
-            # Check if leap year
-            year = start_date.year
-            is_leap = (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
-            denominator = 366 if is_leap else 365
-        
-        computed_fraction = days / denominator
+        if convention == DayCountConvention.ACTUAL_ACTUAL and start_date.year != end_date.year:
+            # ISDA: each calendar year's days over that year's length
+            fraction_text = f"ISDA split {start_date} to {end_date} = {computed_fraction:.6f}"
+        else:
+            fraction_text = f"{days}/{denominator} = {computed_fraction:.6f}"
         difference = abs(llm_fraction - computed_fraction)
         
         return CalendarResult(
@@ -194,10 +598,187 @@ class CalendarGuard:
             llm_days=int(llm_fraction * denominator),
             computed_days=days,
             convention_used=convention.value,
-            day_count_fraction=f"{days}/{denominator} = {computed_fraction:.6f}",
+            day_count_fraction=fraction_text,
             proof=f"Computed: {computed_fraction:.6f}, LLM: {llm_fraction:.6f}, Diff: {difference:.6f}"
         )
     
+    @staticmethod
+    def _days_in_year(year: int) -> int:
+        return 366 if (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0) else 365
+    
+    def _denominator(self, convention: DayCountConvention, year: int) -> int:
+        """Year basis of a convention (ACT/ACT uses the length of the given year)"""
+        if convention in (DayCountConvention.ACTUAL_360, DayCountConvention.THIRTY_360,
+                          DayCountConvention.THIRTY_360_EU):
+            return 360
+        if convention == DayCountConvention.ACTUAL_365:
+            return 365
+        return self._days_in_year(year)
+    
+    def _year_fraction(self, start: date, end: date, convention: DayCountConvention) -> float:
+        """
+        Year fraction of an accrual period.
+        
+        ACT/ACT follows ISDA: days in each calendar year are divided by that
+        year's length (365 or 366), whole years in between count as 1.
+        Reversed periods give the negated fraction.
+        """
+        if convention != DayCountConvention.ACTUAL_ACTUAL:
+            return self._calculate_days(start, end, convention) / self._denominator(convention, start.year)
+        if end < start:
+            return -self._year_fraction(end, start, convention)
+        y1, y2 = start.year, end.year
+        if y1 == y2:
+            return (end - start).days / self._days_in_year(y1)
+        first = (date(y1 + 1, 1, 1) - start).days / self._days_in_year(y1)
+        last = (end - date(y2, 1, 1)).days / self._days_in_year(y2)
+        return first + (y2 - y1 - 1) + last
+    
+    # ==================== Vectorized Day Counts ====================
+    
+    def day_counts(
+        self,
+        start_dates: Union[np.ndarray, Sequence[date]],
+        end_dates: Union[np.ndarray, Sequence[date], date],
+        convention: DayCountConvention = DayCountConvention.ACTUAL_360
+    ) -> np.ndarray:
+        """
+        Day counts for many accrual periods at once.
+        
+        Args:
+            start_dates: datetime64 array (or sequence of dates)
+            end_dates: datetime64 array, sequence of dates, or one date for all
+            convention: Day count convention to use
+            
+        Returns:
+            int64 array, element-wise identical to verify_day_count
+        """
+        starts, ends = self._date_arrays(start_dates, end_dates)
+        return self._day_counts_vectorized(starts, ends, convention)
+    
+    def year_fractions(
+        self,
+        start_dates: Union[np.ndarray, Sequence[date]],
+        end_dates: Union[np.ndarray, Sequence[date], date],
+        convention: DayCountConvention = DayCountConvention.ACTUAL_360
+    ) -> np.ndarray:
+        """
+        Year fractions for many accrual periods at once (ACT/ACT per ISDA).
+        
+        Args:
+            start_dates: datetime64 array (or sequence of dates)
+            end_dates: datetime64 array, sequence of dates, or one date for all
+            convention: Day count convention to use
+            
+        Returns:
+            float64 array, bit-identical to the scalar fraction per period
+        """
+        starts, ends = self._date_arrays(start_dates, end_dates)
+        return self._year_fractions_vectorized(starts, ends, convention)
+    
+    def verify_day_count_fraction_batch(
+        self,
+        start_dates: Union[np.ndarray, Sequence[date]],
+        end_dates: Union[np.ndarray, Sequence[date], date],
+        llm_fractions: Union[np.ndarray, Sequence[float]],
+        convention: DayCountConvention = DayCountConvention.ACTUAL_360,
+        tolerance: float = 0.0001
+    ) -> DayCountBatchResult:
+        """
+        Verify LLM day count fractions over a whole book of accrual periods.
+        
+        Args:
+            start_dates: datetime64 array (or sequence of dates)
+            end_dates: datetime64 array, sequence of dates, or one date for all
+            llm_fractions: Fractions claimed by the LLM, one per period
+            convention: Day count convention
+            tolerance: Acceptable difference
+            
+        Returns:
+            DayCountBatchResult with the same verdicts as verify_day_count_fraction
+        """
+        starts, ends = self._date_arrays(start_dates, end_dates)
+        llm = np.asarray(llm_fractions, dtype=np.float64)
+        if llm.shape != starts.shape:
+            raise ValueError(
+                f"Expected {starts.size} LLM fractions, got {llm.size}"
+            )
+        days = self._day_counts_vectorized(starts, ends, convention)
+        fractions = self._year_fractions_vectorized(starts, ends, convention)
+        differences = np.abs(llm - fractions)
+        return DayCountBatchResult(
+            verified=differences <= tolerance,
+            computed_days=days,
+            fractions=fractions,
+            differences=differences,
+            convention_used=convention.value,
+        )
+    
+    @staticmethod
+    def _date_arrays(start_dates, end_dates) -> Tuple[np.ndarray, np.ndarray]:
+        starts = np.asarray(start_dates, dtype="datetime64[D]")
+        ends = np.asarray(end_dates, dtype="datetime64[D]")
+        if starts.ndim != 1:
+            raise ValueError("start_dates must be one-dimensional")
+        if ends.ndim == 0:
+            ends = np.broadcast_to(ends, starts.shape)
+        if ends.shape != starts.shape:
+            raise ValueError(
+                f"start_dates and end_dates differ in length: {starts.size} vs {ends.size}"
+            )
+        if np.isnat(starts).any() or np.isnat(ends).any():
+            raise ValueError("Dates must not be NaT")
+        return starts, ends
+    
+    @staticmethod
+    def _year_month_day(days: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        months = days.astype("datetime64[M]")
+        years = months.astype("datetime64[Y]").astype(np.int64) + 1970
+        month = months.astype(np.int64) % 12 + 1
+        day = (days - months.astype("datetime64[D]")).astype(np.int64) + 1
+        return years, month, day
+    
+    def _day_counts_vectorized(
+        self, starts: np.ndarray, ends: np.ndarray, convention: DayCountConvention
+    ) -> np.ndarray:
+        if convention not in (DayCountConvention.THIRTY_360, DayCountConvention.THIRTY_360_EU):
+            return (ends - starts).astype(np.int64)
+        y1, m1, d1 = self._year_month_day(starts)
+        y2, m2, d2 = self._year_month_day(ends)
+        d1 = np.where(d1 == 31, 30, d1)
+        if convention == DayCountConvention.THIRTY_360_EU:
+            d2 = np.where(d2 == 31, 30, d2)
+        else:
+            d2 = np.where((d2 == 31) & (d1 >= 30), 30, d2)
+        return 360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)
+    
+    def _year_fractions_vectorized(
+        self, starts: np.ndarray, ends: np.ndarray, convention: DayCountConvention
+    ) -> np.ndarray:
+        # Same float operations in the same order as _year_fraction, so results match bit for bit
+        if convention != DayCountConvention.ACTUAL_ACTUAL:
+            days = self._day_counts_vectorized(starts, ends, convention)
+            return days / float(self._denominator(convention, 2001))
+        reversed_ = ends < starts
+        lo = np.where(reversed_, ends, starts)
+        hi = np.where(reversed_, starts, ends)
+        lo_year = lo.astype("datetime64[Y]")
+        hi_year = hi.astype("datetime64[Y]")
+        y1 = lo_year.astype(np.int64)
+        y2 = hi_year.astype(np.int64)
+        jan1_lo = lo_year.astype("datetime64[D]")
+        jan1_after_lo = (lo_year + 1).astype("datetime64[D]")
+        jan1_hi = hi_year.astype("datetime64[D]")
+        basis_lo = (jan1_after_lo - jan1_lo).astype(np.int64)
+        basis_hi = ((hi_year + 1).astype("datetime64[D]") - jan1_hi).astype(np.int64)
+        
+        same_year = (hi - lo).astype(np.int64) / basis_lo
+        first = (jan1_after_lo - lo).astype(np.int64) / basis_lo
+        last = (hi - jan1_hi).astype(np.int64) / basis_hi
+        split = first + (y2 - y1 - 1) + last
+        fractions = np.where(y1 == y2, same_year, split)
+        return np.where(reversed_, -fractions, fractions)
+    
     # ==================== Interest Accrual ====================
     
     def verify_accrued_interest(
@@ -259,8 +840,48 @@ class CalendarGuard:
             proof=f"Interest = ${principal} × {annual_rate} × ({days}/{denominator}) = ${computed_interest}"
         )
     
+    # ==================== Coupon Schedules ====================
+    
+    def coupon_schedule(
+        self,
+        effective_date: date,
+        maturity_date: date,
+        frequency: int = 2,
+        stub: StubType = StubType.SHORT_FRONT,
+        roll: RollConvention = RollConvention.FOLLOWING,
+        end_of_month: bool = False,
+        use_us_holidays: bool = True
+    ) -> CouponSchedule:
+        """
+        Coupon schedule with payment dates rolled against this guard's calendar.
+        
+        Args:
+            effective_date: Issue / accrual start date
+            maturity_date: Final coupon and redemption date
+            frequency: Coupons per year
+            stub: Placement of an irregular period
+            roll: Business-day convention for payment dates
+            end_of_month: Keep coupons on month ends when the anchor date is one
+            use_us_holidays: Include the guard's market holidays (US federal by default)
+            
+        Returns:
+            Memoized CouponSchedule
+        """
+        return coupon_schedule(
+            effective_date, maturity_date, frequency, stub, roll, end_of_month,
+            holidays=self.holidays,
+            rules=self.market_calendar if use_us_holidays else None,
+        )
+    
     # ==================== Business Day Verification ====================
     
+    def business_calendar(self, use_us_holidays: bool = True) -> BusinessDayCalendar:
+        """The compiled calendar used for business-day checks."""
+        # self.holidays is public and mutable: recompile if it has changed
+        if self.holidays != self._compiled_holidays:
+            self._compile_calendars()
+        return self._calendars[bool(use_us_holidays)]
+    
     def verify_business_day(
         self,
         proposed_date: date,
@@ -273,22 +894,20 @@ class CalendarGuard:
         Args:
             proposed_date: Date to check
             llm_says_business_day: LLM's claim (True = business day)
-            use_us_holidays: Include US federal holidays
+            use_us_holidays: Include the guard's market holidays (US federal by default)
             
         Returns:
             CalendarResult
         """
-        holidays = self.holidays
-        if use_us_holidays:
-            holidays = holidays.union(self.default_us_holidays)
+        calendar = self.business_calendar(use_us_holidays)
         
         # Check if weekend
         is_weekend = proposed_date.weekday() >= 5  # Saturday=5, Sunday=6
         
         # Check if holiday
-        is_holiday = proposed_date in holidays
+        is_holiday = calendar.is_holiday(proposed_date)
         
-        is_business_day = not (is_weekend or is_holiday)
+        is_business_day = calendar.is_business_day(proposed_date)
         
         verified = (llm_says_business_day == is_business_day)
         
@@ -307,6 +926,34 @@ class CalendarGuard:
                   (f" ({', '.join(reason)})" if reason else "")
         )
     
+    def verify_business_day_count(
+        self,
+        start_date: date,
+        end_date: date,
+        llm_days: int,
+        use_us_holidays: bool = True
+    ) -> CalendarResult:
+        """
+        Verify a count of business days in [start_date, end_date).
+        
+        Args:
+            start_date: First date of the period (included)
+            end_date: End of the period (excluded)
+            llm_days: Number of business days claimed by LLM
+            use_us_holidays: Include the guard's market holidays (US federal by default)
+            
+        Returns:
+            CalendarResult
+        """
+        computed_days = self.count_business_days(start_date, end_date, use_us_holidays)
+        return CalendarResult(
+            verified=(llm_days == computed_days),
+            llm_days=llm_days,
+            computed_days=computed_days,
+            convention_used="Business Days",
+            proof=f"Business days in [{start_date}, {end_date}) = {computed_days}"
+        )
+    
     def get_next_business_day(
         self,
         from_date: date,
@@ -317,21 +964,65 @@ class CalendarGuard:
         
         Args:
             from_date: Starting date
-            use_us_holidays: Include US federal holidays
+            use_us_holidays: Include the guard's market holidays (US federal by default)
             
         Returns:
-            Next business day
+            Next business day (from_date itself if it is one)
         """
-        holidays = self.holidays
-        if use_us_holidays:
-            holidays = holidays.union(self.default_us_holidays)
+        return self.business_calendar(use_us_holidays).following(from_date)
+    
+    def get_previous_business_day(
+        self,
+        from_date: date,
+        use_us_holidays: bool = True
+    ) -> date:
+        """
+        Get the most recent valid business day.
         
-        current = from_date
-        while True:
-            is_weekend = current.weekday() >= 5
-            is_holiday = current in holidays
+        Args:
+            from_date: Starting date
+            use_us_holidays: Include the guard's market holidays (US federal by default)
             
-            if not is_weekend and not is_holiday:
-                return current
+        Returns:
+            Previous business day (from_date itself if it is one)
+        """
+        return self.business_calendar(use_us_holidays).preceding(from_date)
+    
+    def add_business_days(
+        self,
+        from_date: date,
+        days: int,
+        use_us_holidays: bool = True
+    ) -> date:
+        """
+        Move a date by a number of business days (negative moves backwards).
+        
+        Args:
+            from_date: Starting date
+            days: Business days to move (e.g., 2 for T+2 settlement)
+            use_us_holidays: Include the guard's market holidays (US federal by default)
             
-            current += timedelta(days=1)
+        Returns:
+            Resulting business day
+        """
+        return self.business_calendar(use_us_holidays).add_business_days(from_date, days)
+    
+    def count_business_days(
+        self,
+        start_date: date,
+        end_date: date,
+        use_us_holidays: bool = True
+    ) -> int:
+        """
+        Count business days in [start_date, end_date).
+        
+        Args:
+            start_date: First date (included)
+            end_date: End date (excluded)
+            use_us_holidays: Include the guard's market holidays (US federal by default)
+            
+        Returns:
+            Number of business days (negated count of [end_date, start_date)
+            if end_date < start_date)
+        """
+        return self.business_calendar(use_us_holidays).count_business_days(start_date, end_date)
@@ -4,8 +4,10 @@ Handles KYC/AML rules with formal boolean logic proofs
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from enum import Enum
+from .sanctions import FuzzyNameIndex
+from .sanctions_store import SanctionsStore
 
 
 class RiskLevel(Enum):
@@ -32,6 +34,7 @@ class ComplianceResult:
     llm_action: Optional[str] = None
     proof: Optional[str] = None
     confidence: str = "SYMBOLIC_PROOF"
+    details: Optional[dict] = None
 
 
 class ComplianceGuard:
@@ -352,3 +355,34 @@ class ComplianceGuard:
                 llm_action="APPROVE" if llm_approved else "REJECT",
                 proof="Entity not on sanctions list"
             )
+    
+    def verify_sanctions_screening(
+        self,
+        entity_name: str,
+        sanctions_index: Union[FuzzyNameIndex, SanctionsStore],
+        llm_approved: bool
+    ) -> ComplianceResult:
+        """
+        Verify a sanctions decision against a fuzzy name index.
+        
+        Rule: If the entity matches a listed name at or above the index
+        threshold (typos, transliterations), MUST block.
+        
+        Args:
+            entity_name: Name of entity
+            sanctions_index: FuzzyNameIndex or SanctionsStore over the sanctions list
+            llm_approved: LLM approved the transaction
+            
+        Returns:
+            ComplianceResult with the matched name, score and algorithm in details
+        """
+        match = sanctions_index.best_match(entity_name)
+        result = self.verify_sanctions_check(entity_name, match is not None, llm_approved)
+        result.details = {
+            "matched_name": match.name if match else None,
+            "score": match.score if match else None,
+            "algorithm": sanctions_index.algorithm.value,
+            "threshold": sanctions_index.threshold,
+            "sanctions_list_version": sanctions_index.version,
+        }
+        return result
@@ -4,10 +4,12 @@ Enables multi-layer verification (e.g., scan SWIFT message for sanctioned entiti
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from .compliance_guard import ComplianceGuard
-from .message_guard import MessageGuard, MessageType
+from .message_guard import ISODocument, MessageGuard, MessageType
 from .query_guard import QueryGuard
+from .sanctions import FuzzyNameIndex, SanctionsList, compile_sanctions_list
+from .sanctions_store import SanctionsStore
 from .models.receipt import VerificationReceipt, ReceiptGenerator, VerificationEngine, AuditLog
 import re
 
@@ -42,7 +44,8 @@ class CrossGuard:
     def verify_swift_with_sanctions(
         self,
         mt_string: str,
-        sanctions_list: List[str]
+        sanctions_list: SanctionsList,
+        fuzzy_index: Optional[Union[FuzzyNameIndex, SanctionsStore]] = None
     ) -> CrossGuardResult:
         """
         Verify SWIFT MT message AND scan for sanctioned entities.
@@ -53,7 +56,10 @@ class CrossGuard:
         
         Args:
             mt_string: SWIFT MT message
-            sanctions_list: List of sanctioned entity names
+            sanctions_list: Sanctioned entity names, a compiled SanctionsAutomaton,
+                or a SanctionsStore (which then also serves as the fuzzy index)
+            fuzzy_index: Optional FuzzyNameIndex screening entities without an
+                exact hit for typos and transliterations
             
         Returns:
             CrossGuardResult with combined verification
@@ -83,11 +89,32 @@ class CrossGuard:
         # Step 2: Extract entity names from MT message
         entities = self._extract_entities_from_mt(mt_string)
         
-        # Step 3: Check each entity against sanctions list
+        # Step 3: Check each entity against the compiled sanctions list
+        automaton = compile_sanctions_list(sanctions_list)
+        if fuzzy_index is None and isinstance(sanctions_list, SanctionsStore):
+            fuzzy_index = sanctions_list
         for entity in entities:
-            is_sanctioned = self._check_sanctions(entity, sanctions_list)
+            hits = automaton.screen(entity, bidirectional=True)
+            metadata = {
+                "sanctions_list_size": len(automaton),
+                "sanctions_list_version": automaton.version,
+                "algorithm": "aho_corasick",
+                "matched_names": hits,
+            }
+            if not hits and fuzzy_index is not None:
+                match = fuzzy_index.best_match(entity)
+                if match is not None:
+                    hits = [match.name]
+                    metadata = {
+                        "sanctions_list_size": len(fuzzy_index),
+                        "sanctions_list_version": fuzzy_index.version,
+                        "algorithm": match.algorithm,
+                        "threshold": fuzzy_index.threshold,
+                        "matched_name": match.name,
+                        "score": match.score,
+                    }
             
-            if is_sanctioned:
+            if hits:
                 violations.append(f"SANCTIONS HIT: '{entity}' found in sanctions list")
                 guard_results["ComplianceGuard.sanctions"] = False
                 
@@ -97,7 +124,7 @@ class CrossGuard:
                     llm_output=entity,
                     verified=False,
                     violations=[f"Entity '{entity}' is sanctioned"],
-                    metadata={"sanctions_list_size": len(sanctions_list)}
+                    metadata=metadata
                 )
                 receipts.append(receipt2)
                 self.audit_log.log(receipt2)
@@ -105,6 +132,23 @@ class CrossGuard:
         if "ComplianceGuard.sanctions" not in guard_results:
             guard_results["ComplianceGuard.sanctions"] = True
         
+        if entities and guard_results["ComplianceGuard.sanctions"]:
+            # A clear screening is receipted too, against the list version it used;
+            # with no entities extracted nothing was screened, so nothing is receipted
+            receipt2 = ReceiptGenerator.create_receipt(
+                guard_name="ComplianceGuard.sanctions_check",
+                engine=VerificationEngine.REGEX,
+                llm_output=", ".join(entities),
+                verified=True,
+                metadata={
+                    "sanctions_list_size": len(automaton),
+                    "sanctions_list_version": automaton.version,
+                    "entities_screened": len(entities),
+                }
+            )
+            receipts.append(receipt2)
+            self.audit_log.log(receipt2)
+        
         passed = all(guard_results.values())
         
         return CrossGuardResult(
@@ -135,19 +179,15 @@ class CrossGuard:
         
         return entities
     
-    def _check_sanctions(self, entity: str, sanctions_list: List[str]) -> bool:
-        """Check if entity matches any sanctioned name (fuzzy match)"""
-        entity_lower = entity.lower()
-        for sanctioned in sanctions_list:
-            if sanctioned.lower() in entity_lower or entity_lower in sanctioned.lower():
-                return True
-        return False
+    def _check_sanctions(self, entity: str, sanctions_list: SanctionsList) -> bool:
+        """Check if entity contains, or is contained in, any sanctioned name"""
+        return bool(compile_sanctions_list(sanctions_list).screen(entity, bidirectional=True))
     
     # ==================== ISO 20022 + Business Rules ====================
     
     def verify_iso20022_with_rules(
         self,
-        xml_string: str,
+        xml_string: Union[str, ISODocument],
         business_rules: Dict[str, Any]
     ) -> CrossGuardResult:
         """
@@ -162,7 +202,8 @@ class CrossGuard:
         }
         
         Args:
-            xml_string: ISO 20022 XML message
+            xml_string: ISO 20022 XML message, or an ISODocument parsed from it
+                (the message is parsed once and shared by every check)
             business_rules: Dictionary of business rule constraints
             
         Returns:
@@ -171,15 +212,16 @@ class CrossGuard:
         violations = []
         guard_results = {}
         receipts = []
+        document = xml_string if isinstance(xml_string, ISODocument) else ISODocument.parse(xml_string)
         
         # Step 1: Validate XML structure
-        msg_result = self.message.verify_iso20022_xml(xml_string, MessageType.PACS_008)
+        msg_result = self.message.verify_iso20022_xml(document, MessageType.PACS_008)
         guard_results["MessageGuard"] = msg_result.valid
         
         receipt1 = ReceiptGenerator.create_receipt(
             guard_name="MessageGuard.verify_iso20022_xml",
             engine=VerificationEngine.XML_SCHEMA,
-            llm_output=xml_string[:200],
+            llm_output=document.xml[:200],
             verified=msg_result.valid,
             violations=msg_result.errors
         )
@@ -189,8 +231,8 @@ class CrossGuard:
             violations.extend(msg_result.errors)
         
         # Step 2: Extract values and check business rules
-        amount = self._extract_xml_value(xml_string, "IntrBkSttlmAmt")
-        currency = self._extract_xml_attribute(xml_string, "IntrBkSttlmAmt", "Ccy")
+        amount = self._extract_xml_value(document, "IntrBkSttlmAmt")
+        currency = document.attribute("IntrBkSttlmAmt", "Ccy")
         
         # Check amount constraints
         if amount is not None:
@@ -223,23 +265,16 @@ class CrossGuard:
             receipts=receipts
         )
     
-    def _extract_xml_value(self, xml: str, element: str) -> Optional[float]:
+    def _extract_xml_value(self, document: ISODocument, element: str) -> Optional[float]:
         """Extract numeric value from XML element"""
-        pattern = rf'<{element}[^>]*>([^<]+)</{element}>'
-        match = re.search(pattern, xml)
-        if match:
+        text = document.text(element)
+        if text:
             try:
-                return float(match.group(1).replace(",", ""))
+                return float(text.replace(",", ""))
             except ValueError:
                 return None
         return None
     
-    def _extract_xml_attribute(self, xml: str, element: str, attr: str) -> Optional[str]:
-        """Extract attribute value from XML element"""
-        pattern = rf'<{element}[^>]*{attr}="([^"]+)"'
-        match = re.search(pattern, xml)
-        return match.group(1) if match else None
-    
     # ==================== SQL + Table Access + Compliance ====================
     
     def verify_query_with_pii_protection(
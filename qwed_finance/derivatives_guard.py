@@ -3,25 +3,210 @@ Derivatives Guard - Black-Scholes options pricing and margin verification
 Deterministic verification for derivatives trading
 
 Uses mpmath for arbitrary-precision transcendental functions (log, exp, sqrt, erf).
+Black-Scholes prices are screened in float64 under an a-priori error bound and
+only escalated to mpmath when the bound cannot settle the verdict.
 All monetary outputs use Decimal for exact representation.
 """
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from decimal import Decimal, ROUND_HALF_UP, getcontext
-from typing import Optional, Tuple
+from functools import cached_property
+from typing import Callable, Iterator, Optional, Sequence, Tuple, Union
 from enum import Enum
+import math
+import re
+import time
+
 import mpmath
+import numpy as np
 
 # Set precision for both Decimal and mpmath
 getcontext().prec = 50
 mpmath.mp.dps = 30  # 30 decimal places for mpmath
 
+# Unit roundoff of IEEE-754 binary64
+_U = 2.0 ** -53
+# Safety factor applied on top of the first-order float64 error analysis
+_BOUND_SAFETY = 16.0
+
+_MONEY_CHARS = re.compile(r'[$,\s]')
+
+# Rational erfc/erf approximations (Cephes ndtr.c), evaluated as numpy arrays
+_ERFC_P = np.array([
+    2.46196981473530512524e-10, 5.64189564831068821977e-1, 7.46321056442269912687e0,
+    4.86371970985681366614e1, 1.96520832956077098242e2, 5.26445194995477358631e2,
+    9.34528527171957607540e2, 1.02755188689515710272e3, 5.57535335369399327526e2,
+])
+_ERFC_Q = np.array([
+    1.0, 1.32281951154744992508e1, 8.67072140885989742329e1, 3.54937778887819891062e2,
+    9.75708501743205489753e2, 1.82390916687909736289e3, 2.24633760818710981792e3,
+    1.65666309194161350182e3, 5.57535340817727675546e2,
+])
+_ERFC_R = np.array([
+    5.64189583547755073984e-1, 1.27536670759978104416e0, 5.01905042251180477414e0,
+    6.16021097993053585195e0, 7.40974269950448939160e0, 2.97886665372100240670e0,
+])
+_ERFC_S = np.array([
+    1.0, 2.26052863220117276590e0, 9.39603524938001434673e0, 1.20489539808096656605e1,
+    1.70814450747565897222e1, 9.60896809063285878198e0, 3.36907645100081516050e0,
+])
+_ERF_T = np.array([
+    9.60497373987051638749e0, 9.00260197203842689217e1, 2.23200534594684319226e3,
+    7.00332514112805075473e3, 5.55923013010394962768e4,
+])
+_ERF_U = np.array([
+    1.0, 3.35617141647503099647e1, 5.21357949780152679795e2, 4.59432382970980127987e3,
+    2.26290000613890934246e4, 4.92673942608635921086e4,
+])
+# Relative error bound of _erfc: 15 ulps measured against mpmath on [-6, 27], doubled
+_ERFC_REL_ERR = 32 * _U
+
+
+def _horner(coefficients: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Polynomial (highest degree first) at every element of x, in place."""
+    result = np.full_like(x, coefficients[0])
+    for c in coefficients[1:]:
+        result *= x
+        result += c
+    return result
+
+
+def _erfc(a: np.ndarray) -> np.ndarray:
+    """
+    Complementary error function over a float64 array, fully vectorized.
+    
+    1 - erf(a) for |a| < 1; otherwise exp(-a²)·P(|a|)/Q(|a|), reflected as
+    2 - erfc(|a|) for negative a. exp(-a²) is split as exp(-m²)·exp(-(a²-m²))
+    with m = |a| rounded to 1/128, so m² is exact and large |a| keep full
+    relative accuracy in the tail. Relative error is within _ERFC_REL_ERR.
+    """
+    x = np.abs(a)
+    result = np.empty_like(x)
+    with np.errstate(over="ignore", under="ignore", invalid="ignore"):
+        small = x < 1.0
+        s = a[small]
+        z = s * s
+        result[small] = 1.0 - s * _horner(_ERF_T, z) / _horner(_ERF_U, z)
+        
+        large = ~small
+        t = x[large]
+        m = np.round(t * 128.0) / 128.0
+        f = t - m
+        y = np.exp(-m * m) * np.exp(-(2.0 * m * f + f * f))
+        far = t >= 8.0
+        if far.any():
+            near = ~far
+            y[near] *= _horner(_ERFC_P, t[near]) / _horner(_ERFC_Q, t[near])
+            y[far] *= _horner(_ERFC_R, t[far]) / _horner(_ERFC_S, t[far])
+        else:
+            y *= _horner(_ERFC_P, t) / _horner(_ERFC_Q, t)
+        y[t > 27.0] = 0.0                   # underflows to zero (and erfc(inf) = 0)
+        result[large] = np.where(a[large] < 0, 2.0 - y, y)
+    return result
+
+
+class PrecisionTier(Enum):
+    """Arithmetic tier that decided a verdict"""
+    FLOAT64 = "FLOAT64"
+    MPMATH = "MPMATH"
+
 
 class OptionType(Enum):
     CALL = "call"
     PUT = "put"
 
 
+def _norm_cdf_mp(x) -> mpmath.mpf:
+    """Standard normal cumulative distribution function using mpmath."""
+    return mpmath.mpf("0.5") * (1 + mpmath.erf(x / mpmath.sqrt(2)))
+
+
+def _norm_pdf_mp(x) -> mpmath.mpf:
+    """Standard normal probability density function using mpmath."""
+    return mpmath.exp(mpmath.mpf("-0.5") * x ** 2) / mpmath.sqrt(2 * mpmath.pi)
+
+
+@dataclass
+class BlackScholesTerms:
+    """
+    Shared Black-Scholes intermediates for one contract (mpmath values).
+    
+    N(±d1), N(±d2), n(d1) and the discount factor are evaluated on first
+    use and then reused by the price, every Greek and verify_delta.
+    """
+    spot: mpmath.mpf
+    strike: mpmath.mpf
+    time: mpmath.mpf
+    rate: mpmath.mpf
+    sigma: mpmath.mpf
+    sqrt_time: mpmath.mpf
+    d1: mpmath.mpf
+    d2: mpmath.mpf
+    
+    @cached_property
+    def discount(self) -> mpmath.mpf:
+        """e^(-rT)"""
+        return mpmath.exp(-self.rate * self.time)
+    
+    @cached_property
+    def cdf_d1(self) -> mpmath.mpf:
+        """N(d1)"""
+        return _norm_cdf_mp(self.d1)
+    
+    @cached_property
+    def cdf_d2(self) -> mpmath.mpf:
+        """N(d2)"""
+        return _norm_cdf_mp(self.d2)
+    
+    @cached_property
+    def cdf_minus_d1(self) -> mpmath.mpf:
+        """N(-d1)"""
+        return _norm_cdf_mp(-self.d1)
+    
+    @cached_property
+    def cdf_minus_d2(self) -> mpmath.mpf:
+        """N(-d2)"""
+        return _norm_cdf_mp(-self.d2)
+    
+    @cached_property
+    def pdf_d1(self) -> mpmath.mpf:
+        """n(d1)"""
+        return _norm_pdf_mp(self.d1)
+
+
+class LazyGreeks(Mapping):
+    """Read-only Greeks mapping that is only computed on first access."""
+    
+    def __init__(self, compute: Callable[[], dict]):
+        self._compute = compute
+        self._values: Optional[dict] = None
+    
+    @property
+    def computed(self) -> bool:
+        """Whether the Greeks have been evaluated yet"""
+        return self._values is not None
+    
+    def _resolve(self) -> dict:
+        if self._values is None:
+            self._values = self._compute()
+            self._compute = None
+        return self._values
+    
+    def __getitem__(self, key: str) -> str:
+        return self._resolve()[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._resolve())
+    
+    def __len__(self) -> int:
+        return len(self._resolve())
+    
+    def __repr__(self) -> str:
+        return repr(self._resolve())
+
+
 @dataclass
 class DerivativesResult:
     """Result of a derivatives verification"""
@@ -29,9 +214,80 @@ class DerivativesResult:
     llm_price: Optional[str]
     computed_price: str
     difference: Optional[str] = None
-    greeks: Optional[dict] = None
+    greeks: Optional[Mapping] = None
     formula_used: Optional[str] = None
     margin_status: Optional[str] = None
+    precision_tier: Optional[str] = None
+    details: Optional[dict] = None
+    terms: Optional[BlackScholesTerms] = field(default=None, repr=False, compare=False)
+
+
+@dataclass
+class ChainResult:
+    """
+    Columnar result of an option-chain verification (one entry per contract).
+    
+    Prices are screened in float64 under the same error bound as the scalar
+    fast path; contracts whose verdict the bound cannot settle are re-decided
+    by verify_black_scholes and flagged in `rechecked`. Put-call parity is
+    checked on the LLM's own prices for every strike/expiry that has both a
+    call and a put.
+    """
+    verified: np.ndarray              # bool, price within tolerance
+    computed_prices: np.ndarray       # float64, model price
+    difference_pct: np.ndarray        # float64, |LLM - model| / model × 100
+    rechecked: np.ndarray             # bool, decided by the scalar path
+    parity_pairs: np.ndarray          # int, (call index, put index) per pair
+    parity_verified: np.ndarray       # bool, per pair
+    parity_differences: np.ndarray    # float64, |(C - P) - (S - K·e^(-rT))|
+    stats: dict = field(default_factory=dict)
+    
+    def __len__(self) -> int:
+        return len(self.verified)
+    
+    @property
+    def all_verified(self) -> bool:
+        return bool(self.verified.all() and self.parity_verified.all())
+    
+    @property
+    def failed_contracts(self) -> np.ndarray:
+        """Indices of contracts whose price failed verification"""
+        return np.flatnonzero(~self.verified)
+    
+    @property
+    def failed_pairs(self) -> np.ndarray:
+        """(call index, put index) rows of pairs that violate parity"""
+        return self.parity_pairs[~self.parity_verified]
+
+
+@dataclass
+class ImpliedVolResult:
+    """
+    Columnar result of an implied-volatility batch (one entry per quote).
+    
+    Quotes whose solved vol lands within the solver's error estimate of the
+    tolerance are re-decided by verify_implied_vol and flagged in `rechecked`.
+    implied_vols is NaN where the price violates no-arbitrage bounds.
+    """
+    verified: np.ndarray              # bool
+    implied_vols: np.ndarray          # float64, solved σ
+    differences: np.ndarray           # float64, |LLM σ - solved σ|
+    error_bounds: np.ndarray          # float64, certified |solved σ - true σ|
+    rechecked: np.ndarray             # bool, decided by the scalar path
+    iterations: int = 0
+    stats: dict = field(default_factory=dict)
+    
+    def __len__(self) -> int:
+        return len(self.verified)
+    
+    @property
+    def all_verified(self) -> bool:
+        return bool(self.verified.all())
+    
+    @property
+    def failed_rows(self) -> np.ndarray:
+        """Indices of quotes that failed verification"""
+        return np.flatnonzero(~self.verified)
 
 
 class DerivativesGuard:
@@ -43,14 +299,30 @@ class DerivativesGuard:
     All monetary outputs are quantized via Decimal for exact representation.
     """
     
-    def __init__(self, tolerance_pct: float = 1.0):
+    def __init__(
+        self,
+        tolerance_pct: float = 1.0,
+        fast_path: bool = True,
+        cache_size: int = 256
+    ):
         """
         Initialize the Derivatives Guard.
         
         Args:
             tolerance_pct: Acceptable % difference for price verification
+            fast_path: Screen Black-Scholes prices in float64 first and only
+                escalate to mpmath when the error bound straddles the verdict
+            cache_size: Max contracts whose Black-Scholes terms are kept in the
+                LRU cache (0 disables it)
         """
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be >= 0, got {cache_size}")
         self.tolerance_pct = Decimal(str(tolerance_pct))
+        self.fast_path = fast_path
+        self.cache_size = cache_size
+        self._terms: "OrderedDict[tuple, BlackScholesTerms]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
         self._sympy_available = self._check_sympy()
     
     def _check_sympy(self) -> bool:
@@ -97,100 +369,315 @@ class DerivativesGuard:
         Returns:
             DerivativesResult with verification
         """
-        # Use mpmath for high-precision transcendental math
-        S = mpmath.mpf(str(spot_price))
-        K = mpmath.mpf(str(strike_price))
-        T = mpmath.mpf(str(time_to_expiry))
-        r = mpmath.mpf(str(risk_free_rate))
-        sigma = mpmath.mpf(str(volatility))
-        
-        # Calculate d1 and d2
-        d1 = (mpmath.log(S / K) + (r + (sigma ** 2) / 2) * T) / (sigma * mpmath.sqrt(T))
-        d2 = d1 - sigma * mpmath.sqrt(T)
-        
-        # Calculate option price
-        if option_type == OptionType.CALL:
-            price = S * self._norm_cdf(d1) - K * mpmath.exp(-r * T) * self._norm_cdf(d2)
-        else:  # PUT
-            price = K * mpmath.exp(-r * T) * self._norm_cdf(-d2) - S * self._norm_cdf(-d1)
-        
-        # Calculate Greeks
-        greeks = self._calculate_greeks(S, K, T, r, sigma, option_type, d1, d2)
-        
         # Parse LLM price
-        import re
-        llm_clean = re.sub(r'[$,\s]', '', llm_price)
+        llm_clean = _MONEY_CHARS.sub('', llm_price)
         llm_decimal = Decimal(llm_clean)
         
+        # Tier 1: float64 price with an error bound, accepted only when every
+        # price inside the bound yields the same verdict and display strings
+        fast = None
+        if self.fast_path:
+            fast = self._black_scholes_float(
+                spot_price, strike_price, time_to_expiry,
+                risk_free_rate, volatility, option_type
+            )
+        if fast is not None:
+            price_f, bound = fast
+            if self._float_verdict_is_decisive(llm_decimal, price_f, bound):
+                price_d = Decimal(f"{price_f:.15g}")
+                return self._price_result(
+                    llm_price, llm_decimal, price_d,
+                    spot_price, strike_price, time_to_expiry,
+                    risk_free_rate, volatility, option_type,
+                    tier=PrecisionTier.FLOAT64,
+                    details={"error_bound": f"{bound:.2E}"}
+                )
+        
+        # Tier 2: mpmath at 30 digits
+        terms = self.contract_terms(
+            spot_price, strike_price, time_to_expiry, risk_free_rate, volatility
+        )
+        price = self._price_from_terms(terms, option_type)
+        
         # Convert price to Decimal for comparison
         price_d = Decimal(str(mpmath.nstr(price, 15)))
+        
+        details = None
+        if fast is not None:
+            details = {"escalated": True, "error_bound": f"{fast[1]:.2E}"}
+        return self._price_result(
+            llm_price, llm_decimal, price_d,
+            spot_price, strike_price, time_to_expiry,
+            risk_free_rate, volatility, option_type,
+            tier=PrecisionTier.MPMATH,
+            details=details,
+            terms=terms
+        )
+    
+    def _price_result(
+        self,
+        llm_price: str,
+        llm_decimal: Decimal,
+        price_d: Decimal,
+        spot_price: float,
+        strike_price: float,
+        time_to_expiry: float,
+        risk_free_rate: float,
+        volatility: float,
+        option_type: OptionType,
+        tier: PrecisionTier,
+        details: Optional[dict] = None,
+        terms: Optional[BlackScholesTerms] = None
+    ) -> DerivativesResult:
+        """Compare a computed Black-Scholes price against the LLM claim."""
         price_q = price_d.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
         
         # Compare
+        verified, difference, difference_pct = self._price_verdict(llm_decimal, price_d)
+        
+        result = DerivativesResult(
+            verified=verified,
+            llm_price=llm_price,
+            computed_price=f"${price_q}",
+            difference=f"${difference.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)} ({difference_pct.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)}%)" if not verified else None,
+            formula_used="Black-Scholes: C = S·N(d₁) - K·e^(-rT)·N(d₂)",
+            precision_tier=tier.value,
+            details=details,
+            terms=terms
+        )
+        
+        # Greeks are only evaluated when the caller reads them
+        def compute_greeks() -> dict:
+            if result.terms is None:
+                result.terms = self.contract_terms(
+                    spot_price, strike_price, time_to_expiry, risk_free_rate, volatility
+                )
+            return self._greeks_from_terms(result.terms, option_type)
+        
+        result.greeks = LazyGreeks(compute_greeks)
+        return result
+    
+    def _price_from_terms(self, terms: BlackScholesTerms, option_type: OptionType) -> mpmath.mpf:
+        """Black-Scholes price from cached contract terms."""
+        S, K = terms.spot, terms.strike
+        if option_type == OptionType.CALL:
+            return S * terms.cdf_d1 - K * terms.discount * terms.cdf_d2
+        # PUT
+        return K * terms.discount * terms.cdf_minus_d2 - S * terms.cdf_minus_d1
+    
+    def _price_verdict(self, llm_decimal: Decimal, price_d: Decimal) -> Tuple[bool, Decimal, Decimal]:
+        """Tolerance check shared by both precision tiers."""
         difference = abs(llm_decimal - price_d)
         if price_d > 0:
             difference_pct = (difference / price_d) * 100
         else:
             difference_pct = Decimal("0")
+        return difference_pct <= self.tolerance_pct, difference, difference_pct
+    
+    # ==================== Contract Terms Cache ====================
+    
+    def contract_terms(
+        self,
+        spot_price: float,
+        strike_price: float,
+        time_to_expiry: float,
+        risk_free_rate: float,
+        volatility: float
+    ) -> BlackScholesTerms:
+        """
+        Black-Scholes intermediates for a contract, memoized in a bounded LRU.
         
-        verified = difference_pct <= self.tolerance_pct
+        Calls and puts on the same contract share one entry, so a price check
+        followed by Greek or delta checks evaluates each transcendental once.
+        """
+        key = tuple(str(v) for v in (spot_price, strike_price, time_to_expiry, risk_free_rate, volatility))
+        terms = self._terms.get(key)
+        if terms is not None:
+            self._cache_hits += 1
+            self._terms.move_to_end(key)
+            return terms
+        self._cache_misses += 1
         
-        return DerivativesResult(
-            verified=verified,
-            llm_price=llm_price,
-            computed_price=f"${price_q}",
-            difference=f"${difference.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)} ({difference_pct.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)}%)" if not verified else None,
-            greeks=greeks,
-            formula_used="Black-Scholes: C = S·N(d₁) - K·e^(-rT)·N(d₂)"
+        S, K, T, r, sigma = (mpmath.mpf(v) for v in key)
+        sqrt_time = mpmath.sqrt(T)
+        d1 = (mpmath.log(S / K) + (r + (sigma ** 2) / 2) * T) / (sigma * sqrt_time)
+        d2 = d1 - sigma * sqrt_time
+        terms = BlackScholesTerms(
+            spot=S, strike=K, time=T, rate=r, sigma=sigma,
+            sqrt_time=sqrt_time, d1=d1, d2=d2
         )
+        
+        if self.cache_size:
+            self._terms[key] = terms
+            if len(self._terms) > self.cache_size:
+                self._terms.popitem(last=False)
+        return terms
+    
+    def cache_info(self) -> dict:
+        """Hit/miss counters and occupancy of the contract-terms cache."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._terms),
+            "maxsize": self.cache_size,
+        }
+    
+    def clear_cache(self) -> None:
+        """Drop all cached contract terms and reset the counters."""
+        self._terms.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+    
+    # ==================== Float64 Fast Path ====================
+    
+    def _black_scholes_float(
+        self,
+        spot_price: float,
+        strike_price: float,
+        time_to_expiry: float,
+        risk_free_rate: float,
+        volatility: float,
+        option_type: OptionType
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Black-Scholes price in float64 with an absolute error bound.
+        
+        The bound is a first-order propagation of unit roundoff through
+        log, sqrt, exp and erfc (each taken as accurate to a few ulps),
+        multiplied by a safety factor. Returns None when the inputs are
+        outside the fast path's domain, so the caller falls back to mpmath.
+        """
+        try:
+            S = float(spot_price)
+            K = float(strike_price)
+            T = float(time_to_expiry)
+            r = float(risk_free_rate)
+            sigma = float(volatility)
+        except (TypeError, ValueError):
+            return None
+        if not all(math.isfinite(v) for v in (S, K, T, r, sigma)):
+            return None
+        if S <= 0 or K <= 0 or T <= 0 or sigma <= 0:
+            return None
+        
+        u = _U
+        x = math.log(S / K)
+        vol_sqrt_t = sigma * math.sqrt(T)
+        drift = (r + sigma * sigma / 2) * T
+        d1 = (x + drift) / vol_sqrt_t
+        d2 = d1 - vol_sqrt_t
+        discount = math.exp(-r * T)
+        
+        # Absolute error in d1 and d2
+        err_num = u * (abs(x) + 2) + 4 * u * (abs(r) + sigma * sigma) * T + u * abs(x + drift)
+        err_d1 = err_num / vol_sqrt_t + 5 * u * abs(d1)
+        err_d2 = err_d1 + 3 * u * vol_sqrt_t + u * abs(d2)
+        
+        if option_type == OptionType.CALL:
+            n1, n2 = self._norm_cdf_float(d1), self._norm_cdf_float(d2)
+        else:
+            n1, n2 = self._norm_cdf_float(-d1), self._norm_cdf_float(-d2)
+        term_s = S * n1
+        term_k = K * discount * n2
+        price = term_s - term_k if option_type == OptionType.CALL else term_k - term_s
+        
+        # |N'(d)| <= 1/sqrt(2π) < 0.4
+        err_s = S * (0.4 * err_d1 + 8 * u * n1)
+        err_k = K * discount * (0.4 * err_d2 + 12 * u * n2 + 4 * u * abs(r * T) * n2)
+        bound = _BOUND_SAFETY * (err_s + err_k + u * abs(price))
+        
+        if not math.isfinite(price) or not math.isfinite(bound):
+            return None
+        return price, bound
+    
+    @staticmethod
+    def _norm_cdf_float(x: float) -> float:
+        """Standard normal CDF in float64 (erfc keeps the lower tail accurate)."""
+        return 0.5 * math.erfc(-x / math.sqrt(2.0))
+    
+    def _float_verdict_is_decisive(self, llm_decimal: Decimal, price_f: float, bound: float) -> bool:
+        """
+        True when every price in [price - bound, price + bound] gives the
+        same verdict and the same rounded output strings as the float price.
+        """
+        # Cover the 15-significant-digit rounding of the reported price too
+        slack = Decimal(repr(bound)) + Decimal(repr(abs(price_f))) * Decimal("1e-14")
+        price_d = Decimal(repr(price_f))
+        lo, hi = price_d - slack, price_d + slack
+        if lo <= 0:
+            return False
+        
+        verdicts = {self._price_verdict(llm_decimal, p)[0] for p in (lo, hi)}
+        if len(verdicts) != 1:
+            return False
+        verified = verdicts.pop()
+        if not verified and lo <= llm_decimal <= hi:
+            return False
+        
+        cent = Decimal("0.01")
+        if self._straddles_rounding_edge(lo, hi, cent):
+            return False
+        if not verified:
+            # The rejection message reports the difference in $ and %
+            diffs = sorted(abs(llm_decimal - p) for p in (lo, hi))
+            if self._straddles_rounding_edge(diffs[0], diffs[1], cent):
+                return False
+            pcts = sorted(self._price_verdict(llm_decimal, p)[2] for p in (lo, hi))
+            if self._straddles_rounding_edge(pcts[0], pcts[1], cent):
+                return False
+        return True
+    
+    @staticmethod
+    def _straddles_rounding_edge(lo: Decimal, hi: Decimal, quantum: Decimal) -> bool:
+        """True when lo and hi round to different multiples of quantum."""
+        return (lo.quantize(quantum, rounding=ROUND_HALF_UP)
+                != hi.quantize(quantum, rounding=ROUND_HALF_UP))
     
     def _norm_cdf(self, x) -> mpmath.mpf:
         """Standard normal cumulative distribution function using mpmath."""
-        return mpmath.mpf("0.5") * (1 + mpmath.erf(x / mpmath.sqrt(2)))
+        return _norm_cdf_mp(x)
     
     def _norm_pdf(self, x) -> mpmath.mpf:
         """Standard normal probability density function using mpmath."""
-        return mpmath.exp(mpmath.mpf("-0.5") * x ** 2) / mpmath.sqrt(2 * mpmath.pi)
+        return _norm_pdf_mp(x)
     
-    def _calculate_greeks(
-        self,
-        spot, strike, time_exp, rate, sigma,
-        option_type: OptionType,
-        d1, d2
-    ) -> dict:
+    def _greeks_from_terms(self, terms: BlackScholesTerms, option_type: OptionType) -> dict:
         """
         Calculate option Greeks (risk sensitivities).
         
         All computed using mpmath for precision, then quantized to Decimal for output.
+        N(d), n(d1) and e^(-rT) come from the shared contract terms.
         """
-        sqrt_time = mpmath.sqrt(time_exp)
+        spot, strike, time_exp, rate, sigma = terms.spot, terms.strike, terms.time, terms.rate, terms.sigma
+        sqrt_time = terms.sqrt_time
+        pdf_d1 = terms.pdf_d1
         
         # Delta: ∂V/∂S
         if option_type == OptionType.CALL:
-            delta = self._norm_cdf(d1)
+            delta = terms.cdf_d1
         else:
-            delta = self._norm_cdf(d1) - 1
+            delta = terms.cdf_d1 - 1
         
         # Gamma: ∂²V/∂S²
-        gamma = self._norm_pdf(d1) / (spot * sigma * sqrt_time)
+        gamma = pdf_d1 / (spot * sigma * sqrt_time)
         
         # Theta: ∂V/∂T (per day, so divide by 365)
-        theta_base = -(spot * self._norm_pdf(d1) * sigma) / (2 * sqrt_time)
+        theta_base = -(spot * pdf_d1 * sigma) / (2 * sqrt_time)
         if option_type == OptionType.CALL:
-            theta = theta_base - rate * strike * mpmath.exp(-rate * time_exp) * self._norm_cdf(d2)
+            theta = theta_base - rate * strike * terms.discount * terms.cdf_d2
         else:
-            theta = theta_base + rate * strike * mpmath.exp(-rate * time_exp) * self._norm_cdf(-d2)
+            theta = theta_base + rate * strike * terms.discount * terms.cdf_minus_d2
         theta_daily = theta / 365
         
         # Vega: ∂V/∂σ (per 1% move, so divide by 100)
-        vega = spot * sqrt_time * self._norm_pdf(d1)
+        vega = spot * sqrt_time * pdf_d1
         vega_pct = vega / 100
         
         # Rho: ∂V/∂r (per 1% move, so divide by 100)
         if option_type == OptionType.CALL:
-            rho = strike * time_exp * mpmath.exp(-rate * time_exp) * self._norm_cdf(d2)
+            rho = strike * time_exp * terms.discount * terms.cdf_d2
         else:
-            rho = -strike * time_exp * mpmath.exp(-rate * time_exp) * self._norm_cdf(-d2)
+            rho = -strike * time_exp * terms.discount * terms.cdf_minus_d2
         rho_pct = rho / 100
         
         # Quantize output via Decimal for exact representation
@@ -220,19 +707,18 @@ class DerivativesGuard:
         Verify option Delta calculation.
         
         Delta = ∂V/∂S = N(d₁) for calls, N(d₁)-1 for puts
-        """
-        S = mpmath.mpf(str(spot_price))
-        K = mpmath.mpf(str(strike_price))
-        T = mpmath.mpf(str(time_to_expiry))
-        r = mpmath.mpf(str(risk_free_rate))
-        sigma = mpmath.mpf(str(volatility))
         
-        d1 = (mpmath.log(S / K) + (r + (sigma ** 2) / 2) * T) / (sigma * mpmath.sqrt(T))
+        Reuses cached contract terms, so checking the delta of a contract
+        that was just priced costs no further transcendental evaluations.
+        """
+        terms = self.contract_terms(
+            spot_price, strike_price, time_to_expiry, risk_free_rate, volatility
+        )
         
         if option_type == OptionType.CALL:
-            computed_delta = self._norm_cdf(d1)
+            computed_delta = terms.cdf_d1
         else:
-            computed_delta = self._norm_cdf(d1) - 1
+            computed_delta = terms.cdf_d1 - 1
         
         # Convert to Decimal for comparison
         computed_d = Decimal(str(mpmath.nstr(computed_delta, 15)))
@@ -247,9 +733,525 @@ class DerivativesGuard:
             llm_price=str(llm_delta),
             computed_price=f"{computed_d.quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP)}",
             difference=f"{difference.quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP)}" if not verified else None,
-            formula_used="Delta = N(d₁) for calls"
+            formula_used="Delta = N(d₁) for calls",
+            terms=terms
         )
     
+    # ==================== Option Chains ====================
+    
+    def verify_chain(
+        self,
+        spot_price: float,
+        curve: Union[float, Mapping, Callable[[float], float]],
+        strikes: Union[np.ndarray, Sequence[float]],
+        expiries: Union[np.ndarray, Sequence[float]],
+        volatilities: Union[np.ndarray, Sequence[float]],
+        option_types: Sequence[Union[OptionType, str]],
+        llm_prices: Union[np.ndarray, Sequence],
+        parity_tolerance: float = 0.05
+    ) -> ChainResult:
+        """
+        Verify a full option chain in one vectorized pass.
+        
+        Per-expiry terms (rate, √T, e^(-rT)) are computed once per distinct
+        expiry and shared by every strike on it. Each price is decided by the
+        same rule as verify_black_scholes, and put-call parity is checked on
+        every matched call/put pair in the same pass.
+        
+        Args:
+            spot_price: Current price of underlying (S)
+            curve: Risk-free rate as a flat float, a mapping expiry → rate,
+                or a callable expiry → rate
+            strikes: Strike per contract (K)
+            expiries: Time to expiry in years per contract (T)
+            volatilities: Volatility per contract (σ)
+            option_types: OptionType (or "call"/"put") per contract
+            llm_prices: LLM's price per contract (numbers or "$1,234.56" strings)
+            parity_tolerance: Acceptable parity deviation, as in verify_put_call_parity
+            
+        Returns:
+            ChainResult with per-contract and per-pair verdicts
+        """
+        started = time.perf_counter()
+        K = self._chain_column(strikes, None, "strikes")
+        n = len(K)
+        T = self._chain_column(expiries, n, "expiries")
+        sigma = self._chain_column(volatilities, n, "volatilities")
+        llm = self._chain_prices(llm_prices, n)
+        if len(option_types) != n:
+            raise ValueError(f"option_types has {len(option_types)} rows, expected {n}")
+        is_call = np.array([OptionType(t) == OptionType.CALL for t in option_types], dtype=bool)
+        
+        S = float(spot_price)
+        if S <= 0 or (K <= 0).any() or (T <= 0).any() or (sigma <= 0).any():
+            raise ValueError("spot, strikes, expiries and volatilities must be > 0")
+        
+        # Per-expiry terms, gathered back onto the contracts
+        unique_t, expiry_index = np.unique(T, return_inverse=True)
+        unique_r = np.array([self._curve_rate(curve, float(t)) for t in unique_t])
+        sqrt_t = np.sqrt(unique_t)[expiry_index]
+        discount = np.exp(-unique_r * unique_t)[expiry_index]
+        r = unique_r[expiry_index]
+        
+        price, bound = self._black_scholes_float_vectorized(S, K, T, r, sigma, is_call, sqrt_t, discount)
+        
+        # Verdict: |LLM - P| <= tol × P, decided where the bound allows it
+        tol = float(self.tolerance_pct) / 100
+        difference = np.abs(llm - price)
+        margin = tol * price - difference
+        slack = (1 + tol) * bound + 8 * _U * (np.abs(llm) + price) + 1e-14 * price
+        # An unparseable or non-finite LLM price is never verified, nor rechecked
+        claimed = np.isfinite(llm)
+        verified = (margin >= 0) & claimed
+        rechecked = ((np.abs(margin) <= slack) | (price - bound <= 0)) & claimed
+        
+        for i in np.flatnonzero(rechecked):
+            result = self.verify_black_scholes(
+                S, float(K[i]), float(T[i]), float(r[i]), float(sigma[i]),
+                OptionType.CALL if is_call[i] else OptionType.PUT,
+                str(llm_prices[i])
+            )
+            verified[i] = result.verified
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            difference_pct = np.where(price > 0, difference / price * 100, 0.0)
+        
+        pairs, parity_verified, parity_diff = self._chain_parity(
+            S, K, T, r, discount, is_call, llm, parity_tolerance
+        )
+        
+        elapsed = time.perf_counter() - started
+        return ChainResult(
+            verified=verified,
+            computed_prices=price,
+            difference_pct=difference_pct,
+            rechecked=rechecked,
+            parity_pairs=pairs,
+            parity_verified=parity_verified,
+            parity_differences=parity_diff,
+            stats={
+                "contracts": n,
+                "expiries": len(unique_t),
+                "parity_pairs": len(pairs),
+                "rechecked": int(rechecked.sum()),
+                "failed": int((~verified).sum()),
+                "parity_failed": int((~parity_verified).sum()),
+                "elapsed_ms": round(elapsed * 1000, 3),
+            }
+        )
+    
+    def _chain_column(self, values, size: Optional[int], name: str) -> np.ndarray:
+        """One numeric chain column as float64, checked against the contract count"""
+        column = np.asarray(values, dtype=np.float64)
+        if column.ndim != 1:
+            raise ValueError(f"{name} must be one-dimensional")
+        if size is not None and len(column) != size:
+            raise ValueError(f"{name} has {len(column)} rows, expected {size}")
+        return column
+    
+    def _chain_prices(self, values, size: int) -> np.ndarray:
+        """LLM prices as float64; NaN where a price is missing or does not parse"""
+        if len(values) != size:
+            raise ValueError(f"llm_prices has {len(values)} rows, expected {size}")
+        column = np.empty(size)
+        for i, value in enumerate(values):
+            try:
+                column[i] = float(_MONEY_CHARS.sub('', value) if isinstance(value, str) else value)
+            except (TypeError, ValueError):
+                column[i] = np.nan
+        return column
+    
+    def _curve_rate(self, curve, expiry: float) -> float:
+        """Risk-free rate for one expiry from a flat rate, mapping or callable"""
+        if isinstance(curve, Mapping):
+            if expiry not in curve:
+                raise ValueError(f"curve has no rate for expiry {expiry}")
+            return float(curve[expiry])
+        if callable(curve):
+            return float(curve(expiry))
+        return float(curve)
+    
+    def _black_scholes_float_vectorized(
+        self,
+        S: float,
+        K: np.ndarray,
+        T: np.ndarray,
+        r: np.ndarray,
+        sigma: np.ndarray,
+        is_call: np.ndarray,
+        sqrt_t: np.ndarray,
+        discount: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Array form of _black_scholes_float.
+        
+        Uses the vectorized _erfc, so prices can differ from the scalar path
+        by a few ulps; the bound carries _ERFC_REL_ERR for it.
+        """
+        u = _U
+        x = np.log(S / K)
+        vol_sqrt_t = sigma * sqrt_t
+        drift = (r + sigma * sigma / 2) * T
+        d1 = (x + drift) / vol_sqrt_t
+        d2 = d1 - vol_sqrt_t
+        
+        err_num = u * (np.abs(x) + 2) + 4 * u * (np.abs(r) + sigma * sigma) * T + u * np.abs(x + drift)
+        err_d1 = err_num / vol_sqrt_t + 5 * u * np.abs(d1)
+        err_d2 = err_d1 + 3 * u * vol_sqrt_t + u * np.abs(d2)
+        
+        # N(±d) = erfc(∓d/√2)/2, signed so that puts use the reflected tails
+        sign = np.where(is_call, 1.0, -1.0)
+        n1 = 0.5 * _erfc(-sign * d1 / math.sqrt(2.0))
+        n2 = 0.5 * _erfc(-sign * d2 / math.sqrt(2.0))
+        term_s = S * n1
+        term_k = K * discount * n2
+        price = sign * (term_s - term_k)
+        
+        err_s = S * (0.4 * err_d1 + (8 * u + _ERFC_REL_ERR) * n1)
+        err_k = K * discount * (0.4 * err_d2 + (12 * u + _ERFC_REL_ERR) * n2 + 4 * u * np.abs(r * T) * n2)
+        bound = _BOUND_SAFETY * (err_s + err_k + u * np.abs(price))
+        return price, bound
+    
+    def _chain_parity(
+        self,
+        S: float,
+        K: np.ndarray,
+        T: np.ndarray,
+        r: np.ndarray,
+        discount: np.ndarray,
+        is_call: np.ndarray,
+        llm: np.ndarray,
+        tolerance: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Put-call parity on the LLM prices of every matched strike/expiry pair."""
+        calls, puts = {}, {}
+        for i in range(len(K)):
+            side = calls if is_call[i] else puts
+            side.setdefault((K[i], T[i]), i)
+        pairs = np.array(
+            [(c, puts[key]) for key, c in calls.items() if key in puts],
+            dtype=np.intp
+        ).reshape(-1, 2)
+        if not len(pairs):
+            return pairs, np.ones(0, dtype=bool), np.zeros(0)
+        
+        c, p = pairs[:, 0], pairs[:, 1]
+        lhs = llm[c] - llm[p]
+        rhs = S - K[c] * discount[c]
+        difference = np.abs(lhs - rhs)
+        # A pair with a non-finite LLM price fails (NaN compares False)
+        verified = difference <= tolerance
+        
+        # Near the tolerance the scalar mpmath check decides
+        slack = 16 * _U * (np.abs(llm[c]) + np.abs(llm[p]) + S + K[c]) + 1e-14 * (S + K[c])
+        uncertain = (np.abs(difference - tolerance) <= slack) & np.isfinite(difference)
+        for j in np.flatnonzero(uncertain):
+            result = self.verify_put_call_parity(
+                float(llm[c[j]]), float(llm[p[j]]), S,
+                float(K[c[j]]), float(T[c[j]]), float(r[c[j]]), tolerance
+            )
+            verified[j] = result.verified
+        return pairs, verified, difference
+    
+    # ==================== Implied Volatility ====================
+    
+    def verify_implied_vol(
+        self,
+        spot_price: float,
+        strike_price: float,
+        time_to_expiry: float,
+        risk_free_rate: float,
+        option_type: OptionType,
+        market_price: float,
+        llm_vol: Union[str, float],
+        tolerance: float = 0.001
+    ) -> DerivativesResult:
+        """
+        Verify an implied-volatility claim for one quote.
+        
+        The Black-Scholes price is strictly increasing in σ, so the claim holds
+        exactly when BS(σ - tol) <= market price <= BS(σ + tol). Only those two
+        prices are evaluated (float64 with error bound, mpmath on a tie); the
+        vol is solved only to report the correct value on failure.
+        
+        Args:
+            spot_price: Current price of underlying (S)
+            strike_price: Strike price (K)
+            time_to_expiry: Time to expiry in years (T)
+            risk_free_rate: Risk-free interest rate (r)
+            option_type: CALL or PUT
+            market_price: Observed option price
+            llm_vol: LLM's implied vol ("25%" or "0.25")
+            tolerance: Acceptable absolute vol difference (0.001 = 0.1 vol point)
+            
+        Returns:
+            DerivativesResult with verification
+        """
+        vol = self._parse_vol(llm_vol)
+        price = float(market_price)
+        S, K, T, r = float(spot_price), float(strike_price), float(time_to_expiry), float(risk_free_rate)
+        if S <= 0 or K <= 0 or T <= 0:
+            raise ValueError("spot, strike and time to expiry must be > 0")
+        
+        lower, upper = self._no_arbitrage_bounds(S, K, T, r, option_type)
+        if not lower < price < upper:
+            return DerivativesResult(
+                verified=False,
+                llm_price=f"{vol * 100:.2f}%",
+                computed_price="No implied vol",
+                difference=f"Price {price} outside no-arbitrage bounds ({lower:.4f}, {upper:.4f})",
+                formula_used="BS(σ_LLM ± tol) brackets market price"
+            )
+        
+        low_vol = float(vol) - tolerance
+        high_vol = float(vol) + tolerance
+        tiers = set()
+        above_low = low_vol <= 0 or self._price_at_vol_cmp(S, K, T, r, low_vol, option_type, price, tiers) <= 0
+        below_high = self._price_at_vol_cmp(S, K, T, r, high_vol, option_type, price, tiers) >= 0
+        verified = above_low and below_high
+        tier = PrecisionTier.MPMATH if PrecisionTier.MPMATH in tiers else PrecisionTier.FLOAT64
+        
+        if verified:
+            return DerivativesResult(
+                verified=True,
+                llm_price=f"{vol * 100:.2f}%",
+                computed_price=f"IV in [{max(low_vol, 0) * 100:.2f}%, {high_vol * 100:.2f}%]",
+                formula_used="BS(σ_LLM ± tol) brackets market price",
+                precision_tier=tier.value
+            )
+        
+        solved, _, _ = self._implied_vol_vectorized(
+            S, np.array([K]), np.array([T]), np.array([r]),
+            np.array([option_type == OptionType.CALL]), np.array([price])
+        )
+        return DerivativesResult(
+            verified=False,
+            llm_price=f"{vol * 100:.2f}%",
+            computed_price=f"{solved[0] * 100:.2f}%",
+            difference=f"{abs(solved[0] - float(vol)) * 100:.2f} vol points",
+            formula_used="BS(σ_LLM ± tol) brackets market price",
+            precision_tier=tier.value
+        )
+    
+    def verify_implied_vol_batch(
+        self,
+        spot_price: float,
+        curve: Union[float, Mapping, Callable[[float], float]],
+        strikes: Union[np.ndarray, Sequence[float]],
+        expiries: Union[np.ndarray, Sequence[float]],
+        option_types: Sequence[Union[OptionType, str]],
+        market_prices: Union[np.ndarray, Sequence[float]],
+        llm_vols: Union[np.ndarray, Sequence],
+        tolerance: float = 0.001
+    ) -> ImpliedVolResult:
+        """
+        Solve and verify implied vols for a whole surface in one vectorized pass.
+        
+        Uses a rational (Corrado-Miller) initial guess refined by Halley steps
+        inside a per-quote bisection bracket, so every quote converges even
+        where vega vanishes. Quotes near the tolerance edge fall back to the
+        scalar bracket check.
+        
+        Args:
+            spot_price: Current price of underlying (S)
+            curve: Risk-free rate as a flat float, a mapping expiry → rate,
+                or a callable expiry → rate
+            strikes: Strike per quote (K)
+            expiries: Time to expiry in years per quote (T)
+            option_types: OptionType (or "call"/"put") per quote
+            market_prices: Observed option price per quote
+            llm_vols: LLM's implied vol per quote ("25%" strings or decimals)
+            tolerance: Acceptable absolute vol difference
+            
+        Returns:
+            ImpliedVolResult with per-quote verdicts
+        """
+        started = time.perf_counter()
+        K = self._chain_column(strikes, None, "strikes")
+        n = len(K)
+        T = self._chain_column(expiries, n, "expiries")
+        prices = self._chain_column(market_prices, n, "market_prices")
+        if isinstance(llm_vols, np.ndarray) and llm_vols.dtype.kind in "iuf":
+            claims = self._chain_column(llm_vols, n, "llm_vols")
+        else:
+            claims = self._chain_column([float(self._parse_vol(v)) for v in llm_vols], n, "llm_vols")
+        if len(option_types) != n:
+            raise ValueError(f"option_types has {len(option_types)} rows, expected {n}")
+        is_call = np.array([OptionType(t) == OptionType.CALL for t in option_types], dtype=bool)
+        S = float(spot_price)
+        if S <= 0 or (K <= 0).any() or (T <= 0).any():
+            raise ValueError("spot, strikes and expiries must be > 0")
+        
+        unique_t, expiry_index = np.unique(T, return_inverse=True)
+        r = np.array([self._curve_rate(curve, float(t)) for t in unique_t])[expiry_index]
+        
+        solved, error, iterations = self._implied_vol_vectorized(S, K, T, r, is_call, prices)
+        differences = np.abs(claims - solved)
+        verified = differences <= tolerance
+        
+        # Near the tolerance, or where no vol was found, the scalar check decides
+        slack = error + 8 * _U * (np.abs(claims) + 1)
+        rechecked = ~np.isfinite(solved) | (np.abs(differences - tolerance) <= slack)
+        for i in np.flatnonzero(rechecked):
+            result = self.verify_implied_vol(
+                S, float(K[i]), float(T[i]), float(r[i]),
+                OptionType.CALL if is_call[i] else OptionType.PUT,
+                float(prices[i]), float(claims[i]), tolerance
+            )
+            verified[i] = result.verified
+        
+        elapsed = time.perf_counter() - started
+        return ImpliedVolResult(
+            verified=verified,
+            implied_vols=solved,
+            differences=differences,
+            error_bounds=error,
+            rechecked=rechecked,
+            iterations=iterations,
+            stats={
+                "quotes": n,
+                "no_solution": int((~np.isfinite(solved)).sum()),
+                "rechecked": int(rechecked.sum()),
+                "failed": int((~verified).sum()),
+                "elapsed_ms": round(elapsed * 1000, 3),
+            }
+        )
+    
+    def _parse_vol(self, value: Union[str, float]) -> Decimal:
+        """Parse a vol claim — "25%" → 0.25, bare numbers are decimal fractions."""
+        if isinstance(value, str):
+            value = value.strip()
+            if "%" in value:
+                return Decimal(value.replace("%", "").strip()) / Decimal("100")
+            return Decimal(value)
+        return Decimal(str(value))
+    
+    def _no_arbitrage_bounds(self, S: float, K: float, T: float, r: float, option_type: OptionType) -> Tuple[float, float]:
+        """Open interval of prices for which an implied vol exists."""
+        discounted_strike = K * math.exp(-r * T)
+        if option_type == OptionType.CALL:
+            return max(S - discounted_strike, 0.0), S
+        return max(discounted_strike - S, 0.0), discounted_strike
+    
+    def _price_at_vol_cmp(
+        self,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        vol: float,
+        option_type: OptionType,
+        price: float,
+        tiers: set
+    ) -> int:
+        """Sign of BS(vol) - price, in float64 when the error bound settles it."""
+        fast = self._black_scholes_float(S, K, T, r, vol, option_type)
+        if fast is not None:
+            model, bound = fast
+            if abs(model - price) > bound:
+                tiers.add(PrecisionTier.FLOAT64)
+                return 1 if model > price else -1
+        tiers.add(PrecisionTier.MPMATH)
+        terms = self.contract_terms(S, K, T, r, vol)
+        model_mp = self._price_from_terms(terms, option_type)
+        target = mpmath.mpf(str(price))
+        return (model_mp > target) - (model_mp < target)
+    
+    def _implied_vol_vectorized(
+        self,
+        S: float,
+        K: np.ndarray,
+        T: np.ndarray,
+        r: np.ndarray,
+        is_call: np.ndarray,
+        prices: np.ndarray,
+        max_iterations: int = 64
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Implied vols by bracketed Halley iteration.
+        
+        Returns (vols, error bounds, iterations used). Each error bound is
+        certified: the price is evaluated at vol ± error and, since price is
+        monotone in σ, the true implied vol provably lies between them. Where
+        that fails the bound falls back to the width of the solver bracket.
+        Vols are NaN where the price violates no-arbitrage bounds.
+        """
+        discount = np.exp(-r * T)
+        discounted_strike = K * discount
+        sqrt_t = np.sqrt(T)
+        lower = np.where(is_call, np.maximum(S - discounted_strike, 0.0), np.maximum(discounted_strike - S, 0.0))
+        upper = np.where(is_call, S, discounted_strike)
+        valid = (prices > lower) & (prices < upper) & np.isfinite(prices)
+        
+        # Corrado-Miller rational guess on the call-equivalent price
+        call_price = np.where(is_call, prices, prices + S - discounted_strike)
+        half_gap = (S - discounted_strike) / 2
+        with np.errstate(invalid="ignore"):
+            inner = np.maximum((call_price - half_gap) ** 2 - (S - discounted_strike) ** 2 / math.pi, 0.0)
+            guess = math.sqrt(2 * math.pi) / (sqrt_t * (S + discounted_strike)) * (call_price - half_gap + np.sqrt(inner))
+        lo = np.full_like(prices, 1e-8)
+        hi = np.full_like(prices, 10.0)
+        vol = np.where(np.isfinite(guess) & (guess > lo) & (guess < hi), guess, 0.3)
+        
+        active = valid.copy()
+        error = np.full_like(prices, np.inf)
+        iterations = 0
+        while active.any() and iterations < max_iterations:
+            iterations += 1
+            idx = np.flatnonzero(active)
+            v, st = vol[idx], sqrt_t[idx]
+            model, bound = self._black_scholes_float_vectorized(
+                S, K[idx], T[idx], r[idx], v, is_call[idx], st, discount[idx]
+            )
+            f = model - prices[idx]
+            d1 = (np.log(S / K[idx]) + (r[idx] + v * v / 2) * T[idx]) / (v * st)
+            d2 = d1 - v * st
+            vega = S * st * np.exp(-d1 * d1 / 2) / math.sqrt(2 * math.pi)
+            
+            # Tighten the bracket where the residual sign is certain
+            lo[idx] = np.where(f < -bound, v, lo[idx])
+            hi[idx] = np.where(f > bound, v, hi[idx])
+            
+            # Halley step: Newton corrected by volga = vega·d1·d2/σ
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                newton = f / vega
+                volga = vega * d1 * d2 / v
+                candidate = v - newton / (1 - 0.5 * newton * volga / vega)
+                error[idx] = 2 * (np.abs(f) + bound) / vega + 1e-15 * v
+            outside = ~np.isfinite(candidate) | (candidate <= lo[idx]) | (candidate >= hi[idx])
+            candidate = np.where(outside, (lo[idx] + hi[idx]) / 2, candidate)
+            
+            # Stop once the residual is inside the pricing noise or the bracket is closed
+            resolved = np.abs(f) <= bound
+            done = resolved | (np.abs(candidate - v) <= 1e-15 * v) | (hi[idx] - lo[idx] <= 1e-15)
+            vol[idx] = np.where(resolved, v, candidate)
+            active[idx[done]] = False
+        
+        # Certify vol ± error by pricing both ends
+        idx = np.flatnonzero(valid)
+        v, e = vol[idx], error[idx]
+        with np.errstate(invalid="ignore"):
+            down = np.maximum(v - e, 1e-300)
+            up = v + e
+        price_down, bound_down = self._black_scholes_float_vectorized(
+            S, K[idx], T[idx], r[idx], down, is_call[idx], sqrt_t[idx], discount[idx]
+        )
+        price_up, bound_up = self._black_scholes_float_vectorized(
+            S, K[idx], T[idx], r[idx], up, is_call[idx], sqrt_t[idx], discount[idx]
+        )
+        target = prices[idx]
+        certified = (
+            np.isfinite(e)
+            & ((v - e <= 0) | (price_down + bound_down < target))
+            & (price_up - bound_up > target)
+        )
+        bracket = np.maximum(v - lo[idx], hi[idx] - v)
+        error[idx] = np.where(certified, e, bracket)
+        
+        vol[~valid] = np.nan
+        error[~valid] = np.nan
+        return vol, error, iterations
+    
     # ==================== Margin Verification ====================
     
     def verify_margin_call(
@@ -4,10 +4,18 @@ Uses QWED's Math Engine (SymPy) for deterministic verification
 """
 
 from dataclasses import dataclass
-from decimal import Decimal, ROUND_HALF_UP
-from typing import List, Optional, Union
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from fractions import Fraction
+from typing import Callable, List, Optional, Sequence, Union
 import re
 
+import numpy as np
+
+from .irr_engine import IRRSolver
+
+_MONEY_CHARS = re.compile(r'[$€£¥,\s]')
+_EPS = float(np.finfo(np.float64).eps)
+
 
 @dataclass
 class VerificationResult:
@@ -19,6 +27,35 @@ class VerificationResult:
     formula_used: Optional[str] = None
     verification_mode: str = "SYMBOLIC"  # SYMBOLIC = deterministic, HEURISTIC = fallback
     confidence: str = "SYMBOLIC_PROOF"
+    details: Optional[dict] = None
+
+
+@dataclass
+class BatchVerificationResult:
+    """
+    Columnar result of a batch verification (one entry per row).
+    
+    Rows are screened in float64 with a rounding-error bound; only rows whose
+    result lands within that bound of the tolerance (or of a rounding
+    boundary) are re-verified in exact Decimal, flagged in `rechecked`.
+    """
+    verified: np.ndarray          # bool
+    computed_values: np.ndarray   # float64, rounded to money precision
+    differences: np.ndarray       # float64, |LLM - computed|
+    rechecked: np.ndarray         # bool, decided by the exact Decimal path
+    formula_used: Optional[str] = None
+    
+    def __len__(self) -> int:
+        return len(self.verified)
+    
+    @property
+    def all_verified(self) -> bool:
+        return bool(self.verified.all())
+    
+    @property
+    def failed_rows(self) -> np.ndarray:
+        """Indices of rows that failed verification"""
+        return np.flatnonzero(~self.verified)
 
 
 class FinanceVerifier:
@@ -27,15 +64,26 @@ class FinanceVerifier:
     Uses SymPy for symbolic math - no floating-point errors.
     """
     
-    def __init__(self, precision: int = 2):
+    def __init__(
+        self,
+        precision: int = 2,
+        irr_max_degree: int = 720,
+        irr_max_work: int = 120_000_000
+    ):
         """
         Initialize the finance verifier.
         
         Args:
             precision: Decimal places for money calculations (default: 2)
+            irr_max_degree: Largest cash-flow polynomial solved exactly for IRR
+            irr_max_work: Word operations allowed for exact IRR root isolation
         """
         self.precision = precision
         self._sympy_available = self._check_sympy()
+        self._irr_solver = IRRSolver(
+            max_degree=irr_max_degree,
+            max_work=irr_max_work
+        )
     
     def _check_sympy(self) -> bool:
         """Check if SymPy is available for symbolic computation"""
@@ -57,6 +105,24 @@ class FinanceVerifier:
         cleaned = re.sub(r'[$€£¥,\s]', '', str(value))
         return Decimal(cleaned)
     
+    def _parse_rate(self, value: str) -> Decimal:
+        """
+        Parse a rate string to Decimal — fail-closed, no guessing.
+        "14.49%" → 0.1449; a bare number is a decimal fraction (0.1449).
+        """
+        cleaned = value.strip()
+        try:
+            if "%" in cleaned:
+                rate = Decimal(re.sub(r'[%\s]', '', cleaned)) / 100
+            else:
+                rate = Decimal(re.sub(r'\s', '', cleaned))
+        except InvalidOperation:
+            raise ValueError(f"Cannot parse rate: {value!r}") from None
+        # "nan" and "Infinity" parse as Decimal but are not rates
+        if not rate.is_finite():
+            raise ValueError(f"Cannot parse rate: {value!r}")
+        return rate
+    
     def _format_money(self, value: Decimal, symbol: str = "$") -> str:
         """Format Decimal as money string"""
         quantized = value.quantize(Decimal(10) ** -self.precision, rounding=ROUND_HALF_UP)
@@ -84,11 +150,7 @@ class FinanceVerifier:
             VerificationResult with verification status
         """
         # Compute NPV deterministically
-        npv = Decimal('0')
-        for t, cf in enumerate(cashflows):
-            cf_decimal = Decimal(str(cf))
-            discount_factor = Decimal(str(1 + rate)) ** t
-            npv += cf_decimal / discount_factor
+        npv = self._npv_decimal(cashflows, rate)
         
         computed = self._format_money(npv)
         llm_value = self._parse_money(llm_output)
@@ -106,70 +168,120 @@ class FinanceVerifier:
             formula_used="NPV = Σ(CFt / (1+r)^t)"
         )
     
+    def _npv_decimal(self, cashflows: List[float], rate: float) -> Decimal:
+        """Exact NPV in Decimal"""
+        npv = Decimal('0')
+        for t, cf in enumerate(cashflows):
+            cf_decimal = Decimal(str(cf))
+            discount_factor = Decimal(str(1 + rate)) ** t
+            npv += cf_decimal / discount_factor
+        return npv
+    
     def verify_irr(
         self,
         cashflows: List[float],
         llm_output: str,
-        tolerance: float = 0.0001
+        tolerance: float = 0.0001,
+        mode: str = "solve"
     ) -> VerificationResult:
         """
         Verify Internal Rate of Return calculation.
         
-        IRR is the rate r where NPV = 0
+        IRR is the rate r where NPV = 0. The cash flows are solved as a
+        polynomial in the discount factor x = 1/(1+r); every root above -100%
+        is reported in `details`, along with which one was compared and why.
+        
+        With mode="certificate" the claim is checked without solving: an exact
+        sign change of NPV between r−tolerance and r+tolerance proves a root
+        in that bracket, at the cost of one NPV evaluation. The full solver
+        only runs when Descartes' rule of signs allows multiple IRRs.
         
         Args:
             cashflows: List of cash flows
             llm_output: LLM's IRR answer (e.g., "15.23%" or "0.1523")
             tolerance: Acceptable error in IRR calculation
+            mode: "solve" (find every root) or "certificate" (bracket check)
             
         Returns:
-            VerificationResult
+            VerificationResult (verification_mode is HEURISTIC when the degree
+            or work budget forced the numeric companion-matrix path)
         """
-        used_fallback = False
+        if mode not in ("solve", "certificate"):
+            raise ValueError(
+                f"Unknown IRR verification mode: '{mode}'. "
+                "Accepted values: certificate, solve"
+            )
         
-        if self._sympy_available:
-            from sympy import symbols, solve, Rational
-            
-            r = symbols('r')
-            npv_expr = sum(
-                Rational(str(cf)) / (1 + r) ** t 
-                for t, cf in enumerate(cashflows)
+        # Parse LLM output — fail-closed, no guessing
+        llm_rate = self._parse_rate(llm_output)
+        
+        if mode == "certificate":
+            certificate = self._irr_solver.certify(
+                cashflows, Fraction(llm_rate), Fraction(str(tolerance))
             )
-            
-            solutions = solve(npv_expr, r)
-            # Filter for real, positive solutions
-            real_solutions = [float(s) for s in solutions if s.is_real and s > -1]
-            
-            if real_solutions:
-                computed_irr = real_solutions[0]
-            else:
-                # Fallback to numeric if SymPy fails to find real roots
-                computed_irr = self._compute_irr_numeric(cashflows)
-                used_fallback = True
-        else:
-            # Fallback: Newton-Raphson method
-            computed_irr = self._compute_irr_numeric(cashflows)
-            used_fallback = True
+            cert_details = {
+                "mode": "certificate",
+                "bracket": [
+                    f"{float(certificate.lower) * 100:.4f}%",
+                    f"{float(certificate.upper) * 100:.4f}%"
+                ],
+                "npv_signs": list(certificate.npv_signs),
+                "sign_changes": certificate.sign_changes
+            }
+            if not certificate.ambiguous:
+                bracket = f"[{cert_details['bracket'][0]}, {cert_details['bracket'][1]}]"
+                return VerificationResult(
+                    verified=certificate.proven,
+                    llm_value=llm_output,
+                    computed_value=(
+                        f"IRR in {bracket}" if certificate.proven
+                        else f"No IRR in {bracket}"
+                    ),
+                    difference=None if certificate.proven else f"> {tolerance * 100:.4f}%",
+                    formula_used="IRR certificate: NPV(r−tol) · NPV(r+tol) ≤ 0",
+                    details=cert_details
+                )
+            # Several IRRs are possible: the bracket alone cannot settle the claim
+            cert_details["ambiguous"] = True
+        
+        solution = self._irr_solver.solve(cashflows)
+        verification_mode = "SYMBOLIC" if solution.exact else "HEURISTIC"
+        details = {
+            "irr_roots": [f"{root * 100:.4f}%" for root in solution.roots],
+            "method": solution.method,
+            "degree": solution.degree,
+            "budget_exceeded": solution.budget_exceeded,
+            "work": solution.work,
+            "elapsed_ms": round(solution.elapsed_ms, 3)
+        }
+        if mode == "certificate":
+            details.update(cert_details)
         
-        if computed_irr is None:
+        if not solution.roots:
             return VerificationResult(
                 verified=False,
                 llm_value=llm_output,
                 computed_value="No valid IRR exists",
-                verification_mode="HEURISTIC",
-                confidence="COMPUTATION_FAILED"
+                verification_mode=verification_mode,
+                confidence="COMPUTATION_FAILED",
+                details=details
             )
         
-        # Parse LLM output — fail-closed, no guessing
-        llm_clean = llm_output.strip()
-        if "%" in llm_clean:
-            # Explicit percentage: "14.49%" → 0.1449
-            llm_rate = float(re.sub(r'[%\s]', '', llm_clean)) / 100
+        claimed = float(llm_rate)
+        
+        # Multiple IRRs: compare against the one nearest the claim
+        computed_irr = min(solution.roots, key=lambda root: abs(root - claimed))
+        if len(solution.roots) == 1:
+            reason = "unique IRR above -100%"
         else:
-            # No % symbol: treat as decimal fraction (0.1449 means 14.49%)
-            llm_rate = float(re.sub(r'\s', '', llm_clean))
+            reason = (
+                f"closest to claimed rate among {len(solution.roots)} IRRs "
+                "(cash flows change sign more than once)"
+            )
+        details["selected_root"] = f"{computed_irr * 100:.4f}%"
+        details["selection_reason"] = reason
         
-        difference = abs(llm_rate - computed_irr)
+        difference = abs(claimed - computed_irr)
         
         return VerificationResult(
             verified=difference <= tolerance,
@@ -177,32 +289,10 @@ class FinanceVerifier:
             computed_value=f"{computed_irr * 100:.2f}%",
             difference=f"{difference * 100:.4f}%" if difference > 0 else None,
             formula_used="IRR: NPV(r) = 0",
-            verification_mode="HEURISTIC" if used_fallback else "SYMBOLIC"
+            verification_mode=verification_mode,
+            details=details
         )
     
-    def _compute_irr_numeric(self, cashflows: List[float], max_iter: int = 100) -> Optional[float]:
-        """Newton-Raphson IRR calculation (fallback)"""
-        rate = 0.1  # Initial guess
-        
-        for _ in range(max_iter):
-            npv = sum(cf / (1 + rate) ** t for t, cf in enumerate(cashflows))
-            npv_derivative = sum(
-                -t * cf / (1 + rate) ** (t + 1) 
-                for t, cf in enumerate(cashflows)
-            )
-            
-            if abs(npv_derivative) < 1e-10:
-                break
-                
-            rate_new = rate - npv / npv_derivative
-            
-            if abs(rate_new - rate) < 1e-7:
-                return rate_new
-                
-            rate = rate_new
-        
-        return rate if abs(npv) < 0.01 else None
-    
     # ==================== Loan Calculations ====================
     
     def verify_monthly_payment(
@@ -226,17 +316,7 @@ class FinanceVerifier:
         Returns:
             VerificationResult
         """
-        P = Decimal(str(principal))
-        monthly_rate = Decimal(str(annual_rate)) / 12
-        n = months
-        
-        if monthly_rate == 0:
-            payment = P / n
-        else:
-            # PMT = P * [r(1+r)^n] / [(1+r)^n - 1]
-            one_plus_r = 1 + monthly_rate
-            one_plus_r_n = one_plus_r ** n
-            payment = P * (monthly_rate * one_plus_r_n) / (one_plus_r_n - 1)
+        payment = self._monthly_payment_decimal(principal, annual_rate, months)
         
         computed = self._format_money(payment)
         llm_value = self._parse_money(llm_output)
@@ -253,6 +333,24 @@ class FinanceVerifier:
             formula_used="PMT = P × [r(1+r)^n] / [(1+r)^n - 1]"
         )
     
+    def _monthly_payment_decimal(
+        self,
+        principal: float,
+        annual_rate: float,
+        months: int
+    ) -> Decimal:
+        """Exact monthly payment in Decimal"""
+        P = Decimal(str(principal))
+        monthly_rate = Decimal(str(annual_rate)) / 12
+        n = months
+        
+        if monthly_rate == 0:
+            return P / n
+        # PMT = P * [r(1+r)^n] / [(1+r)^n - 1]
+        one_plus_r = 1 + monthly_rate
+        one_plus_r_n = one_plus_r ** n
+        return P * (monthly_rate * one_plus_r_n) / (one_plus_r_n - 1)
+    
     def verify_total_interest(
         self,
         principal: float,
@@ -318,11 +416,26 @@ class FinanceVerifier:
         Returns:
             VerificationResult
         """
-        P = Decimal(str(principal))
-        r = Decimal(str(rate))
-        t = periods
+        n = self._compounding_frequency(compounding)
+        final_amount = self._compound_amount_decimal(principal, rate, periods, n)
         
-        # Compounding frequency — fail-closed: reject unknown frequencies
+        computed = self._format_money(final_amount)
+        llm_value = self._parse_money(llm_output)
+        computed_value = self._parse_money(computed)
+        
+        difference = abs(llm_value - computed_value)
+        tolerance = Decimal('0.01')
+        
+        return VerificationResult(
+            verified=difference <= tolerance,
+            llm_value=llm_output,
+            computed_value=computed,
+            difference=str(difference) if difference > 0 else None,
+            formula_used=f"A = P(1 + r/{n})^({n}t)"
+        )
+    
+    def _compounding_frequency(self, compounding: str) -> int:
+        """Compounding periods per year — fail-closed: reject unknown frequencies"""
         n_map = {
             "annual": 1,
             "semi-annual": 2,
@@ -335,27 +448,254 @@ class FinanceVerifier:
                 f"Unknown compounding frequency: '{compounding}'. "
                 f"Accepted values: {', '.join(sorted(n_map.keys()))}"
             )
-        n = n_map[compounding]
+        return n_map[compounding]
+    
+    def _compound_amount_decimal(
+        self,
+        principal: float,
+        rate: float,
+        periods: Union[int, float],
+        n: int
+    ) -> Decimal:
+        """
+        Compounded amount A = P(1 + r/n)^(nt) in Decimal: exact for whole
+        periods, to Decimal context precision for fractional ones.
+        """
+        P = Decimal(str(principal))
+        r = Decimal(str(rate))
+        if periods == int(periods):
+            exponent = n * int(periods)
+        else:
+            exponent = n * Decimal(str(periods))
+        compound_factor = (1 + r / n) ** exponent
+        return P * compound_factor
+    
+    # ==================== Batch Verification ====================
+    
+    def verify_npv_batch(
+        self,
+        cashflows: Union[np.ndarray, Sequence[Sequence[float]]],
+        rates: Union[np.ndarray, Sequence[float]],
+        llm_outputs: Union[np.ndarray, Sequence]
+    ) -> BatchVerificationResult:
+        """
+        Verify many NPV calculations in one vectorized pass.
         
-        # A = P(1 + r/n)^(nt)
-        compound_factor = (1 + r / n) ** (n * t)
-        final_amount = P * compound_factor
+        Same rule as verify_npv (1 cent tolerance), decided per row.
         
-        computed = self._format_money(final_amount)
-        llm_value = self._parse_money(llm_output)
-        computed_value = self._parse_money(computed)
+        Args:
+            cashflows: 2-D array (rows × periods) or a sequence of cash-flow
+                rows; shorter rows are zero-padded
+            rates: Discount rate per row
+            llm_outputs: LLM's NPV per row (numbers or money strings)
+            
+        Returns:
+            BatchVerificationResult
+        """
+        matrix = self._cashflow_matrix(cashflows)
+        rate_col = self._float_column(rates, len(matrix), "rates")
+        llm_col = self._llm_column(llm_outputs, len(matrix))
+        
+        # Horner's rule in v = 1/(1+r), carrying Σ|CFt|·v^t for the error bound
+        v = 1.0 / (1.0 + rate_col)
+        npv = np.zeros(len(matrix))
+        magnitude = np.zeros(len(matrix))
+        for t in range(matrix.shape[1] - 1, -1, -1):
+            npv = npv * v + matrix[:, t]
+            magnitude = magnitude * v + np.abs(matrix[:, t])
+        error_bound = 2 * (3 * matrix.shape[1] + 4) * _EPS * magnitude
+        
+        return self._screen_money(
+            npv,
+            error_bound,
+            llm_col,
+            llm_outputs,
+            lambda i: self._npv_decimal(list(cashflows[i]), rates[i]),
+            "NPV = Σ(CFt / (1+r)^t)"
+        )
+    
+    def verify_monthly_payment_batch(
+        self,
+        principals: Union[np.ndarray, Sequence[float]],
+        annual_rates: Union[np.ndarray, Sequence[float]],
+        months: Union[np.ndarray, Sequence[int]],
+        llm_outputs: Union[np.ndarray, Sequence]
+    ) -> BatchVerificationResult:
+        """
+        Verify many monthly loan payments in one vectorized pass.
         
-        difference = abs(llm_value - computed_value)
-        tolerance = Decimal('0.01')
+        Same rule as verify_monthly_payment (1 cent tolerance), decided per row.
         
-        return VerificationResult(
-            verified=difference <= tolerance,
-            llm_value=llm_output,
-            computed_value=computed,
-            difference=str(difference) if difference > 0 else None,
-            formula_used=f"A = P(1 + r/{n})^({n}t)"
+        Args:
+            principals: Loan amount per row
+            annual_rates: Annual interest rate per row
+            months: Number of monthly payments per row
+            llm_outputs: LLM's payment per row (numbers or money strings)
+            
+        Returns:
+            BatchVerificationResult
+        """
+        principal_col = self._float_column(principals, None, "principals")
+        size = len(principal_col)
+        rate_col = self._float_column(annual_rates, size, "annual_rates")
+        month_col = self._float_column(months, size, "months")
+        llm_col = self._llm_column(llm_outputs, size)
+        
+        monthly = rate_col / 12
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            growth = (1.0 + monthly) ** month_col
+            amortizing = principal_col * monthly * growth / (growth - 1.0)
+            payment = np.where(monthly == 0, principal_col / month_col, amortizing)
+            # (1+r)^n carries n·eps relative error; g/(g-1) amplifies it
+            amplification = np.where(monthly == 0, 0.0, np.abs(growth / (growth - 1.0)))
+        error_bound = np.abs(payment) * _EPS * 8 * (month_col + 4) * (1 + amplification)
+        
+        return self._screen_money(
+            payment,
+            error_bound,
+            llm_col,
+            llm_outputs,
+            lambda i: self._monthly_payment_decimal(
+                principals[i], annual_rates[i], int(months[i])
+            ),
+            "PMT = P × [r(1+r)^n] / [(1+r)^n - 1]"
         )
     
+    def verify_compound_interest_batch(
+        self,
+        principals: Union[np.ndarray, Sequence[float]],
+        rates: Union[np.ndarray, Sequence[float]],
+        periods: Union[np.ndarray, Sequence[int]],
+        llm_outputs: Union[np.ndarray, Sequence],
+        compounding: Union[str, Sequence[str]] = "annual"
+    ) -> BatchVerificationResult:
+        """
+        Verify many compound interest calculations in one vectorized pass.
+        
+        Same rule as verify_compound_interest (1 cent tolerance), decided per row.
+        
+        Args:
+            principals: Initial investment per row
+            rates: Annual interest rate per row
+            periods: Number of years per row
+            llm_outputs: LLM's final amount per row (numbers or money strings)
+            compounding: One frequency for all rows, or one per row
+            
+        Returns:
+            BatchVerificationResult
+        """
+        principal_col = self._float_column(principals, None, "principals")
+        size = len(principal_col)
+        rate_col = self._float_column(rates, size, "rates")
+        period_col = self._float_column(periods, size, "periods")
+        llm_col = self._llm_column(llm_outputs, size)
+        
+        if isinstance(compounding, str):
+            frequency = np.full(size, self._compounding_frequency(compounding), dtype=np.int64)
+        else:
+            frequency = np.array(
+                [self._compounding_frequency(c) for c in compounding], dtype=np.int64
+            )
+            if len(frequency) != size:
+                raise ValueError(f"compounding has {len(frequency)} rows, expected {size}")
+        
+        exponent = frequency * period_col
+        with np.errstate(over="ignore", invalid="ignore"):
+            amount = principal_col * (1.0 + rate_col / frequency) ** exponent
+        error_bound = np.abs(amount) * _EPS * 8 * (exponent + 4)
+        
+        return self._screen_money(
+            amount,
+            error_bound,
+            llm_col,
+            llm_outputs,
+            lambda i: self._compound_amount_decimal(
+                principals[i], rates[i], float(period_col[i]), int(frequency[i])
+            ),
+            "A = P(1 + r/n)^(nt)"
+        )
+    
+    def _screen_money(
+        self,
+        computed: np.ndarray,
+        error_bound: np.ndarray,
+        llm_col: np.ndarray,
+        llm_outputs: Sequence,
+        exact_value: Callable[[int], Decimal],
+        formula: str
+    ) -> BatchVerificationResult:
+        """
+        Decide each row in float64 where the error bound allows it, and in
+        exact Decimal (the scalar verify_* arithmetic) everywhere else.
+        """
+        tolerance = 0.01  # 1 cent, as in the scalar methods
+        scale = 10.0 ** self.precision
+        
+        # ROUND_HALF_UP: halves round away from zero
+        scaled = np.abs(computed) * scale
+        rounded = np.sign(computed) * np.floor(scaled + 0.5) / scale
+        differences = np.abs(llm_col - rounded)
+        verified = differences <= tolerance
+        
+        # Uncertain rows: a rounding boundary or the tolerance lies within
+        # the float error of the result
+        slack = error_bound + 4 * _EPS * (np.abs(computed) + np.abs(llm_col))
+        near_half = np.abs(scaled - np.floor(scaled) - 0.5) / scale <= slack
+        near_tolerance = np.abs(differences - tolerance) <= slack
+        # A non-finite LLM answer (e.g. "nan") is unverified without parsing it
+        claimed = np.isfinite(llm_col)
+        verified &= claimed
+        rechecked = (near_half | near_tolerance | ~np.isfinite(computed)) & claimed
+        
+        quantum = Decimal(10) ** -self.precision
+        for i in np.flatnonzero(rechecked):
+            value = exact_value(int(i)).quantize(quantum, rounding=ROUND_HALF_UP)
+            difference = abs(self._parse_money(llm_outputs[i]) - value)
+            verified[i] = difference <= Decimal('0.01')
+            rounded[i] = float(value)
+            differences[i] = float(difference)
+        
+        return BatchVerificationResult(
+            verified=verified,
+            computed_values=rounded,
+            differences=differences,
+            rechecked=rechecked,
+            formula_used=formula
+        )
+    
+    def _cashflow_matrix(self, cashflows) -> np.ndarray:
+        """Cash-flow rows as a float64 matrix, zero-padding ragged rows"""
+        if isinstance(cashflows, np.ndarray):
+            matrix = np.asarray(cashflows, dtype=np.float64)
+            if matrix.ndim != 2:
+                raise ValueError("cashflows must be a 2-D array (rows × periods)")
+            return matrix
+        rows = [np.asarray(row, dtype=np.float64) for row in cashflows]
+        width = max((len(row) for row in rows), default=0)
+        matrix = np.zeros((len(rows), width))
+        for i, row in enumerate(rows):
+            matrix[i, :len(row)] = row
+        return matrix
+    
+    def _float_column(self, values, size: Optional[int], name: str) -> np.ndarray:
+        """One numeric input column as float64, checked against the row count"""
+        column = np.asarray(values, dtype=np.float64)
+        if column.ndim != 1:
+            raise ValueError(f"{name} must be one-dimensional")
+        if size is not None and len(column) != size:
+            raise ValueError(f"{name} has {len(column)} rows, expected {size}")
+        return column
+    
+    def _llm_column(self, llm_outputs, size: int) -> np.ndarray:
+        """LLM answers as float64; money strings are stripped of symbols first"""
+        if isinstance(llm_outputs, np.ndarray) and llm_outputs.dtype.kind in "iuf":
+            return self._float_column(llm_outputs, size, "llm_outputs")
+        cleaned = [
+            _MONEY_CHARS.sub('', value) if isinstance(value, str) else value
+            for value in llm_outputs
+        ]
+        return self._float_column(cleaned, size, "llm_outputs")
+    
     # ==================== Money Arithmetic ====================
     
     def add_money(self, *amounts: str) -> str:
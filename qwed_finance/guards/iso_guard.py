@@ -1,9 +1,33 @@
 import json
+import os
+import re
+from datetime import datetime
 import jsonschema
-from typing import Dict, Any, List
+from jsonschema.exceptions import best_match
+from typing import Dict, Any, Iterable, List, Optional
 from dataclasses import dataclass, field
 
 
+# Message-type schemas shipped with the package (pacs.009, pain.001, camt.053)
+DEFAULT_SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "iso_schemas")
+
+# ISODateTime: local time, UTC ("Z") or an offset; fractional seconds allowed
+_ISO_DATE_TIME = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})?$")
+
+_format_checker = jsonschema.FormatChecker()
+
+
+@_format_checker.checks("date-time", raises=ValueError)
+def _is_iso_date_time(value: Any) -> bool:
+    """date-time checked without optional jsonschema extras, so it is always enforced"""
+    if not isinstance(value, str):
+        return True
+    if not _ISO_DATE_TIME.match(value):
+        return False
+    datetime.fromisoformat(value[:19])     # rejects impossible dates and times
+    return True
+
+
 @dataclass
 class ISOResult:
     """Result of ISO 20022 schema validation."""
@@ -13,6 +37,7 @@ class ISOResult:
     error: str = ""
     path: List[str] = field(default_factory=list)
     verification_mode: str = "SCHEMA"
+    errors: List[str] = field(default_factory=list)     # every violation, "path: message"
 
 
 class ISOGuard:
@@ -20,7 +45,12 @@ class ISOGuard:
     Verifies that financial messages conform to ISO 20022 standards.
     Prevents 'Schema Violations' in banking interoperability.
     """
-    def __init__(self):
+    def __init__(self, schema_dir: Optional[str] = None):
+        """
+        Args:
+            schema_dir: Optional directory of extra message-type schemas
+                (<msg_type>.json), searched before the bundled ones
+        """
         # Simplified schema for ISO 20022 pacs.008 (Customer Credit Transfer)
         # In production, this would load full XSD/JSON schemas.
         self.pacs_008_schema = {
@@ -40,26 +70,95 @@ class ISOGuard:
             },
             "required": ["MsgId", "CreDtTm", "NbOfTxs"]
         }
+        self.schema_dirs = [d for d in (schema_dir, DEFAULT_SCHEMA_DIR) if d]
+        self._schemas: Dict[str, Dict[str, Any]] = {"pacs.008": self.pacs_008_schema}
+        # One validator per message type, built on first use
+        self._validators: Dict[str, Any] = {}
+
+    @property
+    def supported_types(self) -> List[str]:
+        """Message types with a schema in memory or in a schema directory"""
+        types = set(self._schemas)
+        for directory in self.schema_dirs:
+            if os.path.isdir(directory):
+                types.update(f[:-5] for f in os.listdir(directory) if f.endswith(".json"))
+        return sorted(types)
+
+    def _validator(self, msg_type: str):
+        """Compiled validator for a message type, or None if there is no schema"""
+        validator = self._validators.get(msg_type)
+        if validator is not None:
+            return validator
+        schema = self._schemas.get(msg_type) or self._load_schema(msg_type)
+        if schema is None:
+            return None
+        cls = jsonschema.validators.validator_for(schema)
+        try:
+            cls.check_schema(schema)
+        except jsonschema.SchemaError as e:
+            raise ValueError(f"Invalid schema for {msg_type}: {e.message}") from None
+        validator = cls(schema, format_checker=_format_checker)
+        self._validators[msg_type] = validator
+        return validator
+
+    def _load_schema(self, msg_type: str) -> Optional[Dict[str, Any]]:
+        if not re.match(r"^[a-z]{4}\.\d{3}$", msg_type):
+            return None
+        for directory in self.schema_dirs:
+            path = os.path.join(directory, f"{msg_type}.json")
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    schema = json.load(f)
+                self._schemas[msg_type] = schema
+                return schema
+        return None
 
     def verify_payment_message(self, message: Dict[str, Any], msg_type: str = "pacs.008") -> ISOResult:
         """
         Validates AI-generated payment instructions against ISO 20022 standards.
         """
-        if msg_type != "pacs.008":
-            return ISOResult(
-                verified=False,
-                msg_type=msg_type,
-                error=f"Unsupported message type: {msg_type}"
-            )
+        validator = self._validator(msg_type)
+        if validator is None:
+            return self._unsupported(msg_type)
+        return self._check(validator, message, msg_type)
 
-        try:
-            jsonschema.validate(instance=message, schema=self.pacs_008_schema)
-            return ISOResult(verified=True, msg_type=msg_type)
-        except jsonschema.ValidationError as e:
-            return ISOResult(
-                verified=False,
-                msg_type=msg_type,
-                error=f"Schema Violation: {e.message}",
-                path=[str(p) for p in e.path]
-            )
+    def verify_payment_messages(
+        self,
+        messages: Iterable[Dict[str, Any]],
+        msg_type: str = "pacs.008"
+    ) -> List[ISOResult]:
+        """
+        Validate a batch of messages of one type with a single validator.
+
+        Unlike a first-error check, every violation of every message is
+        collected in its result's errors.
 
+        Args:
+            messages: Message payloads
+            msg_type: ISO 20022 message type shared by the batch
+
+        Returns:
+            ISOResult per message, in input order
+        """
+        validator = self._validator(msg_type)
+        if validator is None:
+            return [self._unsupported(msg_type) for _ in messages]
+        return [self._check(validator, message, msg_type) for message in messages]
+
+    def _unsupported(self, msg_type: str) -> ISOResult:
+        error = f"Unsupported message type: {msg_type}"
+        return ISOResult(verified=False, msg_type=msg_type, error=error, errors=[error])
+
+    def _check(self, validator, message: Dict[str, Any], msg_type: str) -> ISOResult:
+        violations = list(validator.iter_errors(message))
+        if not violations:
+            return ISOResult(verified=True, msg_type=msg_type)
+        # The headline error is the one jsonschema.validate would have raised
+        first = best_match(violations)
+        return ISOResult(
+            verified=False,
+            msg_type=msg_type,
+            error=f"Schema Violation: {first.message}",
+            path=[str(p) for p in first.path],
+            errors=[f"{'/'.join(str(p) for p in v.path) or '(root)'}: {v.message}" for v in violations]
+        )
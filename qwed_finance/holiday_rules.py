@@ -0,0 +1,303 @@
+"""
+Holiday Rules - Declarative market holiday calendars
+Fixed-date, nth-weekday and Easter-relative rules with observance shifting
+
+Each calendar year is compiled from the rules on first use and kept in a
+bounded cache; joint calendars take the union of several markets. Compiled
+years feed the business-day index in calendar_guard.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date, timedelta
+from enum import Enum
+from typing import Dict, FrozenSet, Optional, Tuple, Union
+
+
+class Observance(Enum):
+    """How a holiday falling on a weekend is shifted"""
+    NONE = "none"                      # Not shifted (TARGET2)
+    NEAREST_WEEKDAY = "nearest"        # Sat → Fri, Sun → Mon (US federal)
+    SUNDAY_TO_MONDAY = "sunday"        # Sun → Mon, Sat not observed (Federal Reserve)
+    NEXT_WEEKDAY = "next"              # Sat/Sun → next free weekday (UK substitute days)
+
+
+def easter_sunday(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian / Meeus-Jones-Butcher algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    weekday_offset = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * weekday_offset) // 451
+    month, day = divmod(h + weekday_offset - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+@dataclass(frozen=True)
+class HolidayRule(ABC):
+    """Base holiday rule: a named date per year, optionally limited to a year range."""
+    name: str
+    observance: Observance = Observance.NONE
+    start_year: Optional[int] = None
+    end_year: Optional[int] = None
+    except_years: Tuple[int, ...] = ()
+
+    def applies(self, year: int) -> bool:
+        if self.start_year is not None and year < self.start_year:
+            return False
+        if self.end_year is not None and year > self.end_year:
+            return False
+        return year not in self.except_years
+
+    @abstractmethod
+    def actual_date(self, year: int) -> Optional[date]:
+        """Unshifted date of the holiday in a year (None if it does not occur)"""
+
+
+@dataclass(frozen=True)
+class FixedDate(HolidayRule):
+    """Same month/day every year (e.g., Independence Day, Jul 4)"""
+    month: int = 1
+    day: int = 1
+
+    def actual_date(self, year: int) -> Optional[date]:
+        return date(year, self.month, self.day) if self.applies(year) else None
+
+
+@dataclass(frozen=True)
+class NthWeekday(HolidayRule):
+    """n-th weekday of a month; n = -1 for the last (e.g., Memorial Day)"""
+    month: int = 1
+    weekday: int = 0        # Monday=0 … Sunday=6
+    n: int = 1
+
+    def actual_date(self, year: int) -> Optional[date]:
+        if not self.applies(year):
+            return None
+        if self.n > 0:
+            first = date(year, self.month, 1)
+            shift = (self.weekday - first.weekday()) % 7
+            return first + timedelta(days=shift + 7 * (self.n - 1))
+        next_month = date(year + self.month // 12, self.month % 12 + 1, 1)
+        last = next_month - timedelta(days=1)
+        shift = (last.weekday() - self.weekday) % 7
+        return last - timedelta(days=shift + 7 * (-self.n - 1))
+
+
+@dataclass(frozen=True)
+class EasterOffset(HolidayRule):
+    """Fixed offset from Easter Sunday (Good Friday = -2, Easter Monday = +1)"""
+    days: int = 0
+
+    def actual_date(self, year: int) -> Optional[date]:
+        return easter_sunday(year) + timedelta(days=self.days) if self.applies(year) else None
+
+
+@dataclass(frozen=True)
+class OneOff(HolidayRule):
+    """A single proclaimed holiday (e.g., a state funeral)"""
+    on: date = date(1970, 1, 1)
+
+    def actual_date(self, year: int) -> Optional[date]:
+        return self.on if year == self.on.year else None
+
+
+@dataclass(frozen=True)
+class HolidayCalendar:
+    """
+    Holiday calendar for one market, defined by rules.
+
+    Observed dates are resolved per year (a Saturday New Year's Day may be
+    observed on Dec 31 of the previous year). NEXT_WEEKDAY substitutes are
+    placed after all holidays that fall on their own date and skip days
+    already taken, so a Sunday Christmas before a Monday Boxing Day is
+    observed on the Tuesday.
+    """
+    name: str
+    rules: Tuple[HolidayRule, ...]
+
+    def __post_init__(self):
+        # Per-calendar compiled years, keyed on the year alone
+        object.__setattr__(self, "_years", {})
+
+    def holidays_in(self, year: int) -> FrozenSet[date]:
+        """Observed holiday dates falling in a calendar year"""
+        return frozenset(self._compile_year(year))
+
+    def holiday_names(self, year: int) -> Dict[date, str]:
+        """Observed holiday dates in a year, with the rule that produced each"""
+        return dict(self._compile_year(year))
+
+    def is_holiday(self, day: date) -> bool:
+        return day in self._compile_year(day.year)
+
+    def __or__(self, other: "AnyHolidayCalendar") -> "JointCalendar":
+        return JointCalendar.of(self, other)
+
+    def _compile_year(self, year: int) -> Dict[date, str]:
+        """Observed holidays in one year; compiled once per calendar."""
+        observed = self._years.get(year)
+        if observed is None:
+            observed = self._years.setdefault(year, self._resolve_year(year))
+        return observed
+
+    def _resolve_year(self, year: int) -> Dict[date, str]:
+        observed: Dict[date, str] = {}
+        # Shifts can cross year ends, so resolve the neighbouring years too
+        for rule_year in (year - 1, year, year + 1):
+            taken: Dict[date, str] = {}
+            substitutes = []
+            for rule in self.rules:
+                actual = rule.actual_date(rule_year)
+                if actual is None:
+                    continue
+                if actual.weekday() >= 5 and rule.observance == Observance.NEXT_WEEKDAY:
+                    # Substitutes are placed after every holiday that falls on its own date
+                    substitutes.append((actual, rule.name))
+                    continue
+                day = self._observe(actual, rule.observance, taken)
+                if day is not None:
+                    taken[day] = rule.name
+            for actual, name in substitutes:
+                taken[self._observe(actual, Observance.NEXT_WEEKDAY, taken)] = name
+            observed.update((d, name) for d, name in taken.items() if d.year == year)
+        return observed
+
+    @staticmethod
+    def _observe(actual: date, observance: Observance, taken: Dict[date, str]) -> Optional[date]:
+        weekday = actual.weekday()
+        if weekday < 5 or observance == Observance.NONE:
+            return actual
+        if observance == Observance.NEAREST_WEEKDAY:
+            return actual - timedelta(days=1) if weekday == 5 else actual + timedelta(days=1)
+        if observance == Observance.SUNDAY_TO_MONDAY:
+            return actual + timedelta(days=1) if weekday == 6 else None
+        # NEXT_WEEKDAY: first weekday on or after the holiday not already taken
+        day = actual
+        while day.weekday() >= 5 or day in taken:
+            day += timedelta(days=1)
+        return day
+
+
+@dataclass(frozen=True)
+class JointCalendar:
+    """Union of several market calendars (a day is a holiday if any market closes)."""
+    calendars: Tuple[HolidayCalendar, ...]
+
+    @classmethod
+    def of(cls, *calendars: "AnyHolidayCalendar") -> "JointCalendar":
+        flat = []
+        for calendar in calendars:
+            flat.extend(calendar.calendars if isinstance(calendar, JointCalendar) else [calendar])
+        return cls(tuple(dict.fromkeys(flat)))
+
+    @property
+    def name(self) -> str:
+        return "+".join(c.name for c in self.calendars)
+
+    def holidays_in(self, year: int) -> FrozenSet[date]:
+        return frozenset().union(*(c.holidays_in(year) for c in self.calendars))
+
+    def holiday_names(self, year: int) -> Dict[date, str]:
+        names: Dict[date, str] = {}
+        for calendar in self.calendars:
+            for day, name in calendar.holiday_names(year).items():
+                names[day] = f"{names[day]} / {name}" if day in names else name
+        return names
+
+    def is_holiday(self, day: date) -> bool:
+        return any(c.is_holiday(day) for c in self.calendars)
+
+    def __or__(self, other: "AnyHolidayCalendar") -> "JointCalendar":
+        return JointCalendar.of(self, other)
+
+
+AnyHolidayCalendar = Union[HolidayCalendar, JointCalendar]
+
+
+# ==================== Market Calendars ====================
+
+def _us_rules(observance: Observance) -> Tuple[HolidayRule, ...]:
+    return (
+        FixedDate("New Year's Day", observance, month=1, day=1),
+        NthWeekday("Martin Luther King Jr. Day", start_year=1986, month=1, weekday=0, n=3),
+        NthWeekday("Washington's Birthday", month=2, weekday=0, n=3),
+        NthWeekday("Memorial Day", month=5, weekday=0, n=-1),
+        FixedDate("Juneteenth", observance, start_year=2021, month=6, day=19),
+        FixedDate("Independence Day", observance, month=7, day=4),
+        NthWeekday("Labor Day", month=9, weekday=0, n=1),
+        NthWeekday("Columbus Day", month=10, weekday=0, n=2),
+        FixedDate("Veterans Day", observance, month=11, day=11),
+        NthWeekday("Thanksgiving Day", month=11, weekday=3, n=4),
+        FixedDate("Christmas Day", observance, month=12, day=25),
+    )
+
+
+US_FEDERAL = HolidayCalendar("US", _us_rules(Observance.NEAREST_WEEKDAY))
+
+# Federal Reserve Banks close on the Monday after a Sunday holiday but stay
+# open on the Friday before a Saturday one
+NY_FED = HolidayCalendar("NYFED", _us_rules(Observance.SUNDAY_TO_MONDAY))
+
+TARGET2 = HolidayCalendar("TARGET2", (
+    FixedDate("New Year's Day", month=1, day=1),
+    EasterOffset("Good Friday", days=-2),
+    EasterOffset("Easter Monday", days=1),
+    FixedDate("Labour Day", month=5, day=1),
+    FixedDate("Christmas Day", month=12, day=25),
+    FixedDate("Boxing Day", month=12, day=26),
+))
+
+UK = HolidayCalendar("UK", (
+    FixedDate("New Year's Day", Observance.NEXT_WEEKDAY, month=1, day=1),
+    EasterOffset("Good Friday", days=-2),
+    EasterOffset("Easter Monday", days=1),
+    NthWeekday("Early May Bank Holiday", except_years=(1995, 2020), month=5, weekday=0, n=1),
+    NthWeekday("Spring Bank Holiday", except_years=(2002, 2012, 2022), month=5, weekday=0, n=-1),
+    NthWeekday("Summer Bank Holiday", month=8, weekday=0, n=-1),
+    FixedDate("Christmas Day", Observance.NEXT_WEEKDAY, month=12, day=25),
+    FixedDate("Boxing Day", Observance.NEXT_WEEKDAY, month=12, day=26),
+    OneOff("VE Day 50th Anniversary", on=date(1995, 5, 8)),
+    OneOff("Spring Bank Holiday", on=date(2002, 6, 4)),
+    OneOff("Golden Jubilee", on=date(2002, 6, 3)),
+    OneOff("Royal Wedding", on=date(2011, 4, 29)),
+    OneOff("Spring Bank Holiday", on=date(2012, 6, 4)),
+    OneOff("Diamond Jubilee", on=date(2012, 6, 5)),
+    OneOff("VE Day 75th Anniversary", on=date(2020, 5, 8)),
+    OneOff("Spring Bank Holiday", on=date(2022, 6, 2)),
+    OneOff("Platinum Jubilee", on=date(2022, 6, 3)),
+    OneOff("State Funeral of Queen Elizabeth II", on=date(2022, 9, 19)),
+    OneOff("Coronation of King Charles III", on=date(2023, 5, 8)),
+))
+
+MARKET_CALENDARS: Dict[str, HolidayCalendar] = {
+    calendar.name: calendar for calendar in (US_FEDERAL, NY_FED, TARGET2, UK)
+}
+
+
+def get_holiday_calendar(*markets: Union[str, AnyHolidayCalendar]) -> AnyHolidayCalendar:
+    """
+    Holiday calendar for one or more markets ("US", "NYFED", "TARGET2", "UK").
+
+    Several markets give a JointCalendar over their union.
+    """
+    if not markets:
+        raise ValueError("At least one market is required")
+    calendars = []
+    for market in markets:
+        if isinstance(market, str):
+            key = market.upper()
+            if key not in MARKET_CALENDARS:
+                raise ValueError(
+                    f"Unknown market calendar: {market}. Known: {', '.join(MARKET_CALENDARS)}"
+                )
+            calendars.append(MARKET_CALENDARS[key])
+        else:
+            calendars.append(market)
+    if len(calendars) == 1:
+        return calendars[0]
+    return JointCalendar.of(*calendars)
@@ -368,8 +368,9 @@ class OpenResponsesIntegration:
     def _verify_option_price(self, args: Dict[str, Any]) -> VerifiedToolCall:
         """Compute Black-Scholes option price — delegates to DerivativesGuard.
         
-        Single source of truth: uses the same mpmath-based implementation
-        as self.derivatives to ensure deterministic consistency across paths.
+        Single source of truth: prices with self.derivatives, which screens in
+        float64 and escalates to mpmath only when the float error bound cannot
+        settle the result, so both paths report the same price.
         """
         S = args.get("spot_price", 100)
         K = args.get("strike_price", 100)
@@ -388,7 +389,8 @@ class OpenResponsesIntegration:
                 retry_message="Provide strictly positive inputs for Black-Scholes pricing.",
             )
         
-        # Delegate to self.derivatives — single source of truth (mpmath)
+        # Delegate to self.derivatives: float64 screen, escalated to mpmath when its
+        # error bound is not decisive (tier recorded in metadata["precision_tier"])
         bs_result = self.derivatives.verify_black_scholes(
             spot_price=S,
             strike_price=K,
@@ -405,7 +407,8 @@ class OpenResponsesIntegration:
             llm_output=str(args),
             verified=False,  # Computed, not verified against LLM claim
             computed_value=bs_result.computed_price,
-            formula="Black-Scholes: C = S·N(d₁) - K·e^(-rT)·N(d₂)"
+            formula="Black-Scholes: C = S·N(d₁) - K·e^(-rT)·N(d₂)",
+            metadata={"precision_tier": bs_result.precision_tier}
         )
         self.audit_log.log(receipt)
         
@@ -4,16 +4,22 @@ Ensures payment messages are verified before checkout proceeds
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from enum import Enum
+import re
 
 from ..compliance_guard import ComplianceGuard
-from ..message_guard import MessageGuard, MessageType
+from ..message_guard import ISODocument, MessageGuard, MessageType
 from ..query_guard import QueryGuard
 from ..cross_guard import CrossGuard
+from ..sanctions import SanctionsList, compile_sanctions_list
 from ..models.receipt import VerificationReceipt, ReceiptGenerator, VerificationEngine, AuditLog
 
 
+# Party name elements, for XML that does not parse (prefix and attributes allowed)
+_NAME_ELEMENT = re.compile(r"<(?:\w+:)?(Nm|DbtrNm|CdtrNm)(?:\s[^>]*)?>([^<]+)</(?:\w+:)?\1>")
+
+
 class UCPAction(Enum):
     """UCP transaction actions"""
     INITIATE_CHECKOUT = "initiate_checkout"
@@ -177,8 +183,8 @@ class UCPIntegration:
     
     def verify_iso20022_payment(
         self,
-        xml_message: str,
-        sanctions_list: List[str] = None
+        xml_message: Union[str, ISODocument],
+        sanctions_list: Optional[SanctionsList] = None
     ) -> PaymentVerificationResult:
         """
         Verify an ISO 20022 payment message with sanctions screening.
@@ -189,22 +195,24 @@ class UCPIntegration:
         3. Business rule validation
         
         Args:
-            xml_message: ISO 20022 XML (pacs.008, pain.001, etc.)
-            sanctions_list: Optional list of sanctioned entities
+            xml_message: ISO 20022 XML (pacs.008, pain.001, etc.), or an ISODocument
+                parsed from it (the message is parsed once and shared by every check)
+            sanctions_list: Optional sanctioned entity names (or a compiled SanctionsAutomaton / SanctionsStore)
             
         Returns:
             PaymentVerificationResult
         """
         violations = []
         receipts = []
+        document = xml_message if isinstance(xml_message, ISODocument) else ISODocument.parse(xml_message)
         
         # Validate XML structure
-        msg_result = self.message.verify_iso20022_xml(xml_message, MessageType.PACS_008)
+        msg_result = self.message.verify_iso20022_xml(document, MessageType.PACS_008)
         
         receipt1 = ReceiptGenerator.create_receipt(
             guard_name="UCP.verify_iso20022_structure",
             engine=VerificationEngine.XML_SCHEMA,
-            llm_output=xml_message[:100],
+            llm_output=document.xml[:100],
             verified=msg_result.valid,
             violations=msg_result.errors
         )
@@ -216,32 +224,46 @@ class UCPIntegration:
         
         # Sanctions screening if list provided
         if sanctions_list:
-            # Extract entities from XML
-            import re
+            # Extract entities from the indexed name elements; a message that does
+            # not parse is still screened, by scanning its text for name elements
             entities = []
+            if document.well_formed:
+                for name_element in ("Nm", "DbtrNm", "CdtrNm"):
+                    entities.extend(document.texts(name_element))
+            else:
+                entities = [m.group(2).strip() for m in _NAME_ELEMENT.finditer(document.xml)]
+                entities = [e for e in entities if e]
             
-            # Look for name elements
-            name_patterns = [r'<Nm>([^<]+)</Nm>', r'<DbtrNm>([^<]+)</DbtrNm>', 
-                           r'<CdtrNm>([^<]+)</CdtrNm>']
-            for pattern in name_patterns:
-                matches = re.findall(pattern, xml_message)
-                entities.extend(matches)
-            
-            # Check each entity
+            # Check each entity against the compiled list (one pass per entity)
+            automaton = compile_sanctions_list(sanctions_list)
+            hit = False
             for entity in entities:
-                for sanctioned in sanctions_list:
-                    if sanctioned.lower() in entity.lower():
-                        violations.append(f"SANCTIONS HIT: {entity} matches {sanctioned}")
-                        
-                        receipt2 = ReceiptGenerator.create_receipt(
-                            guard_name="UCP.sanctions_screening",
-                            engine=VerificationEngine.REGEX,
-                            llm_output=entity,
-                            verified=False,
-                            violations=[f"Entity matches sanctioned: {sanctioned}"]
-                        )
-                        receipts.append(receipt2)
-                        self.audit_log.log(receipt2)
+                for sanctioned in automaton.screen(entity):
+                    hit = True
+                    violations.append(f"SANCTIONS HIT: {entity} matches {sanctioned}")
+                    
+                    receipt2 = ReceiptGenerator.create_receipt(
+                        guard_name="UCP.sanctions_screening",
+                        engine=VerificationEngine.REGEX,
+                        llm_output=entity,
+                        verified=False,
+                        violations=[f"Entity matches sanctioned: {sanctioned}"],
+                        metadata={"sanctions_list_version": automaton.version}
+                    )
+                    receipts.append(receipt2)
+                    self.audit_log.log(receipt2)
+            
+            # Only a screening that covered at least one name is receipted as clear
+            if entities and not hit:
+                receipt2 = ReceiptGenerator.create_receipt(
+                    guard_name="UCP.sanctions_screening",
+                    engine=VerificationEngine.REGEX,
+                    llm_output=", ".join(entities),
+                    verified=True,
+                    metadata={"sanctions_list_version": automaton.version}
+                )
+                receipts.append(receipt2)
+                self.audit_log.log(receipt2)
         
         # Determine status
         if any("SANCTIONS" in v for v in violations):
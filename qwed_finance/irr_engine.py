@@ -0,0 +1,468 @@
+"""
+IRR Engine - Bounded-time polynomial root finding for Internal Rate of Return
+
+NPV(r) = Σ CFt / (1+r)^t is a polynomial in the discount factor x = 1/(1+r):
+
+    p(x) = Σ CFt · x^t
+
+Every IRR above -100% is a positive real root of p. Roots are isolated
+exactly with a Sturm sequence over integer coefficients (no floating point),
+then refined by exact rational bisection. When the polynomial is too large
+for the degree or work budget, the engine falls back to the eigenvalues of
+the companion matrix (NumPy) and reports that a numeric path was used.
+"""
+
+from dataclasses import dataclass, field
+from fractions import Fraction
+from math import gcd
+from typing import List, Optional, Sequence, Tuple
+import time
+
+import numpy as np
+
+
+class _BudgetExceeded(Exception):
+    """Raised internally when the exact path runs past its work budget."""
+
+
+class _WorkBudget:
+    """
+    Deterministic cost counter for the exact path.
+
+    Work is charged in 64-bit word operations of the big-integer arithmetic,
+    before each step runs, so whether a series is solved exactly depends
+    only on its cash flows, never on machine load.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.spent = 0
+
+    def charge(self, words: int) -> None:
+        self.spent += words
+        if self.spent > self.limit:
+            raise _BudgetExceeded()
+
+
+@dataclass
+class IRRSolution:
+    """All IRRs above -100% for a cash-flow series"""
+    roots: List[float]                       # Ascending, as decimal rates
+    method: str                              # "STURM" (exact) or "COMPANION" (numeric)
+    exact: bool
+    degree: int
+    elapsed_ms: float = 0.0
+    budget_exceeded: Optional[str] = None    # "degree", "work" or None
+    work: int = 0                            # Word operations spent on the exact path
+    sign_changes: int = 0                    # Descartes bound on the number of IRRs
+    notes: List[str] = field(default_factory=list)
+
+
+@dataclass
+class IRRCertificate:
+    """Sign-change proof that an IRR lies in [lower, upper]"""
+    proven: bool                             # NPV vanishes or changes sign on the bracket
+    ambiguous: bool                          # Descartes' rule allows more than one IRR
+    lower: Fraction
+    upper: Fraction
+    npv_signs: Tuple[int, int]
+    sign_changes: int
+
+
+class IRRSolver:
+    """
+    Finds every real IRR above -100% in bounded time.
+
+    Exact path: Sturm sequence root isolation on the integer polynomial p(x),
+    used while degree <= max_degree and the work budget holds.
+    Numeric path: companion-matrix eigenvalues, polished with Newton steps.
+    """
+
+    def __init__(
+        self,
+        max_degree: int = 720,
+        max_work: int = 120_000_000,
+        rate_tolerance: float = 1e-12
+    ):
+        """
+        Initialize the IRR solver.
+
+        Args:
+            max_degree: Largest polynomial degree solved on the exact path
+            max_work: Word operations allowed on the exact path before falling
+                back (deterministic, unlike a wall-clock budget)
+            rate_tolerance: Width to which each exact root is refined
+        """
+        self.max_degree = max_degree
+        self.max_work = max_work
+        self.rate_tolerance = rate_tolerance
+
+    def solve(self, cashflows: Sequence[float]) -> IRRSolution:
+        """
+        Find all IRRs of a cash-flow series.
+
+        Args:
+            cashflows: Cash flows CF0, CF1, ..., CFn (one per period)
+
+        Returns:
+            IRRSolution listing every root above -100%
+        """
+        start = time.perf_counter()
+        coeffs = self.integer_coefficients(cashflows)
+        sign_changes = self.sign_changes(coeffs)
+
+        # Drop x^k factors (leading zero cash flows) and trailing zeros
+        while coeffs and coeffs[0] == 0:
+            coeffs.pop(0)
+        while coeffs and coeffs[-1] == 0:
+            coeffs.pop()
+        degree = max(len(coeffs) - 1, 0)
+
+        if degree == 0 or sign_changes == 0:
+            return IRRSolution(
+                roots=[],
+                method="STURM",
+                exact=True,
+                degree=degree,
+                elapsed_ms=(time.perf_counter() - start) * 1000,
+                sign_changes=sign_changes
+            )
+
+        budget_exceeded = None
+        if degree > self.max_degree:
+            budget_exceeded = "degree"
+        else:
+            work = _WorkBudget(self.max_work)
+            try:
+                roots = self._solve_sturm(coeffs, work)
+                return IRRSolution(
+                    roots=roots,
+                    method="STURM",
+                    exact=True,
+                    degree=degree,
+                    elapsed_ms=(time.perf_counter() - start) * 1000,
+                    sign_changes=sign_changes,
+                    work=work.spent
+                )
+            except _BudgetExceeded:
+                budget_exceeded = "work"
+
+        roots = self._solve_companion(coeffs)
+        return IRRSolution(
+            roots=roots,
+            method="COMPANION",
+            exact=False,
+            degree=degree,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            budget_exceeded=budget_exceeded,
+            sign_changes=sign_changes,
+            notes=[f"{budget_exceeded} budget exceeded: numeric companion-matrix roots"]
+        )
+
+    # ==================== Exact helpers ====================
+
+    @staticmethod
+    def integer_coefficients(cashflows: Sequence[float]) -> List[int]:
+        """Scale cash flows to integers (ascending powers of x), exactly."""
+        fracs = [Fraction(str(cf)) for cf in cashflows]
+        denom = 1
+        for f in fracs:
+            denom = denom * f.denominator // gcd(denom, f.denominator)
+        return [int(f * denom) for f in fracs]
+
+    @staticmethod
+    def sign_changes(coeffs: Sequence) -> int:
+        """Descartes' rule of signs: upper bound on the number of IRRs above -100%."""
+        changes = 0
+        last = 0
+        for c in coeffs:
+            if c == 0:
+                continue
+            sign = 1 if c > 0 else -1
+            if last and sign != last:
+                changes += 1
+            last = sign
+        return changes
+
+    def certify(
+        self,
+        cashflows: Sequence[float],
+        rate: Fraction,
+        tolerance: Fraction
+    ) -> IRRCertificate:
+        """
+        Check a claimed IRR by sign change instead of solving.
+
+        If NPV(rate - tolerance) and NPV(rate + tolerance) differ in sign (or
+        either is zero), a root lies in the bracket — an O(n) exact proof.
+        With at most one sign change in the cash flows (Descartes), that root
+        is the only IRR; otherwise the claim is flagged as ambiguous.
+
+        Args:
+            cashflows: Cash flows CF0, CF1, ..., CFn
+            rate: Claimed IRR as an exact rational
+            tolerance: Half-width of the bracket
+
+        Returns:
+            IRRCertificate
+        """
+        coeffs = self.integer_coefficients(cashflows)
+        changes = self.sign_changes(coeffs)
+        lower = rate - tolerance
+        upper = rate + tolerance
+
+        if upper <= -1:
+            signs = (0, 0)
+            proven = False
+        else:
+            if lower <= -1:
+                # Bracket runs past -100%: use the limit as r -> -1+, which is
+                # the sign of the last nonzero cash flow
+                last = next((c for c in reversed(coeffs) if c), 0)
+                s_lo = (last > 0) - (last < 0)
+                lower = Fraction(-1)
+            else:
+                s_lo = _eval_sign(coeffs, 1 + lower)
+            s_hi = _eval_sign(coeffs, 1 + upper)
+            signs = (s_lo, s_hi)
+            proven = changes > 0 and (s_lo == 0 or s_hi == 0 or s_lo != s_hi)
+
+        return IRRCertificate(
+            proven=proven,
+            ambiguous=changes > 1,
+            lower=lower,
+            upper=upper,
+            npv_signs=signs,
+            sign_changes=changes
+        )
+
+    def _solve_sturm(self, coeffs: List[int], work: _WorkBudget) -> List[float]:
+        """Isolate and refine every positive root of p(x) exactly."""
+        poly = _primitive(list(reversed(coeffs)))  # Descending powers
+        sequence = _sturm_sequence(poly, work)
+
+        # The last Sturm polynomial is gcd(p, p'); divide it out so every
+        # isolated root is simple and refinement by sign change works.
+        if len(sequence[-1]) > 1:
+            work.charge(len(poly) * (_words(poly) + _words(sequence[-1])))
+            poly = _primitive(_exact_quotient(poly, sequence[-1]))
+            sequence = _sturm_sequence(poly, work)
+
+        # Cauchy bound: every root satisfies |x| < 1 + max|ai / an|
+        lead = abs(poly[0])
+        upper = Fraction(1) + Fraction(max(abs(c) for c in poly[1:]), lead)
+        lower = Fraction(0)
+
+        count = _variations_at_zero(sequence) - _variations_at_infinity(sequence)
+        intervals = []
+        stack = [(lower, upper, count)]
+        while stack:
+            lo, hi, n = stack.pop()
+            if n == 0:
+                continue
+            if n == 1:
+                intervals.append((lo, hi))
+                continue
+            # Never split on a root, so every interval end keeps a nonzero sign
+            mid = (lo + hi) / 2
+            step = 3
+            while _eval_sign_charged(poly, mid, work) == 0:
+                mid = lo + (hi - lo) / step
+                step += 1
+            v_lo = _variations(sequence, lo, work) if lo else _variations_at_zero(sequence)
+            v_mid = _variations(sequence, mid, work)
+            v_hi = _variations(sequence, hi, work)
+            stack.append((lo, mid, v_lo - v_mid))
+            stack.append((mid, hi, v_mid - v_hi))
+
+        roots = []
+        for lo, hi in intervals:
+            x = self._refine(poly, lo, hi, work)
+            roots.append(float(1 / x - 1))
+        return sorted(roots)
+
+    def _refine(self, poly: List[int], lo: Fraction, hi: Fraction, work: _WorkBudget) -> Fraction:
+        """Exact bisection of an isolating interval (lo, hi]."""
+        s_hi = _eval_sign_charged(poly, hi, work)
+        if s_hi == 0:
+            return hi
+        if lo == 0:
+            # Pull the open end off zero so x -> r stays finite
+            lo = hi / 2
+            while _eval_sign_charged(poly, lo, work) == s_hi:
+                hi = lo
+                lo = lo / 2
+        while hi - lo > self.rate_tolerance * lo * lo:
+            # dr = dx / x² — refine until the rate interval is below tolerance
+            mid = (lo + hi) / 2
+            s_mid = _eval_sign_charged(poly, mid, work)
+            if s_mid == 0:
+                return mid
+            if s_mid == s_hi:
+                hi = mid
+            else:
+                lo = mid
+        return (lo + hi) / 2
+
+    # ==================== Numeric fallback ====================
+
+    def _solve_companion(self, coeffs: List[int]) -> List[float]:
+        """Positive real roots via companion-matrix eigenvalues."""
+        scale = max(abs(c) for c in coeffs)
+        descending = np.array([c / scale for c in reversed(coeffs)], dtype=float)
+        candidates = np.roots(descending)
+
+        t = np.arange(len(coeffs), dtype=float)
+        cf = np.array(coeffs, dtype=float) / scale
+        roots: List[float] = []
+        for z in candidates:
+            if z.real <= 0 or abs(z.imag) > 1e-7 * max(1.0, abs(z.real)):
+                continue
+            r = 1.0 / z.real - 1.0
+            # Newton polish on NPV(r) directly
+            for _ in range(5):
+                disc = (1.0 + r) ** -t
+                npv = float(np.dot(cf, disc))
+                dnpv = float(np.dot(-t * cf, disc)) / (1.0 + r)
+                if dnpv == 0.0:
+                    break
+                step = npv / dnpv
+                if not np.isfinite(step) or r - step <= -1.0:
+                    break
+                r -= step
+                if abs(step) < 1e-15:
+                    break
+            if all(abs(r - existing) > 1e-9 for existing in roots):
+                roots.append(float(r))
+        return sorted(roots)
+
+
+# ==================== Integer polynomial arithmetic ====================
+# Polynomials are lists of Python ints in descending powers.
+
+def _primitive(poly: List[int]) -> List[int]:
+    """Strip leading zeros and divide out the (positive) content."""
+    while len(poly) > 1 and poly[0] == 0:
+        poly = poly[1:]
+    content = 0
+    for c in poly:
+        content = gcd(content, c)
+    if content > 1:
+        poly = [c // content for c in poly]
+    return poly
+
+
+def _derivative(poly: List[int]) -> List[int]:
+    degree = len(poly) - 1
+    return [c * (degree - i) for i, c in enumerate(poly[:-1])]
+
+
+def _pseudo_remainder(a: List[int], b: List[int]) -> List[int]:
+    """
+    Remainder of a by b scaled by a positive constant (|lc(b)|^k).
+
+    Positive scaling keeps the signs a Sturm sequence depends on.
+    """
+    lead = b[0]
+    scale = abs(lead)
+    sgn = 1 if lead > 0 else -1
+    r = list(a)
+    db = len(b) - 1
+    while len(r) - 1 >= db and any(r):
+        coef = r[0]
+        r = [scale * c for c in r]
+        for i, bc in enumerate(b):
+            r[i] -= sgn * coef * bc
+        r = r[1:]
+        while len(r) > 1 and r[0] == 0:
+            r = r[1:]
+    return r
+
+
+def _sturm_sequence(poly: List[int], work: _WorkBudget) -> List[List[int]]:
+    """Primitive Sturm sequence p0 = p, p1 = p', p(k+1) = -rem(p(k-1), p(k))."""
+    sequence = [poly, _primitive(_derivative(poly))]
+    words = [_words(p) for p in sequence]
+    while len(sequence[-1]) > 1:
+        a, b = sequence[-2], sequence[-1]
+        # Elimination step k scales the len(a) - k remaining coefficients by
+        # lc(b), growing each by one coefficient of b
+        a_size, b_size = words[-2] / len(a), words[-1] / len(b)
+        work.charge(int(sum(
+            (len(a) - k + len(b)) * (a_size + (k + 1) * b_size) * b_size
+            for k in range(len(a) - len(b) + 1)
+        )))
+        rem = _pseudo_remainder(a, b)
+        if not any(rem):
+            break
+        # Dividing out the content takes a gcd per coefficient
+        rem_words = _words(rem)
+        work.charge(int(rem_words * rem_words / len(rem)))
+        sequence.append(_primitive([-c for c in rem]))
+        words.append(_words(sequence[-1]))
+    return sequence
+
+
+def _exact_quotient(a: List[int], b: List[int]) -> List[int]:
+    """Exact polynomial division a / b (b divides a), returned with integer coefficients."""
+    rem = [Fraction(c) for c in a]
+    quotient = []
+    db = len(b) - 1
+    while len(rem) - 1 >= db:
+        coef = rem[0] / b[0]
+        quotient.append(coef)
+        for i, bc in enumerate(b):
+            rem[i] -= coef * bc
+        rem = rem[1:]
+    denom = 1
+    for q in quotient:
+        denom = denom * q.denominator // gcd(denom, q.denominator)
+    return [int(q * denom) for q in quotient]
+
+
+def _eval_sign(poly: List[int], x: Fraction) -> int:
+    """Exact sign of poly(x) for rational x, via integer Horner's rule."""
+    a, b = x.numerator, x.denominator
+    acc = 0
+    b_pow = 1
+    for c in poly:
+        acc = acc * a + c * b_pow
+        b_pow *= b
+    return (acc > 0) - (acc < 0)
+
+
+def _words(poly: List[int]) -> int:
+    """Size of a polynomial's coefficients in 64-bit words (at least one each)."""
+    return sum(c.bit_length() for c in poly) // 64 + len(poly)
+
+
+def _eval_sign_charged(poly: List[int], x: Fraction, work: _WorkBudget) -> int:
+    """_eval_sign, charged for its coefficients and the growth of the accumulator."""
+    n = len(poly)
+    x_words = (x.numerator.bit_length() + x.denominator.bit_length()) // 64 + 1
+    work.charge(_words(poly) + n * n * x_words // 2)
+    return _eval_sign(poly, x)
+
+
+def _count_variations(signs) -> int:
+    changes = 0
+    last = 0
+    for s in signs:
+        if s == 0:
+            continue
+        if last and s != last:
+            changes += 1
+        last = s
+    return changes
+
+
+def _variations(sequence: List[List[int]], x: Fraction, work: _WorkBudget) -> int:
+    return _count_variations(_eval_sign_charged(p, x, work) for p in sequence)
+
+
+def _variations_at_zero(sequence: List[List[int]]) -> int:
+    return _count_variations((p[-1] > 0) - (p[-1] < 0) for p in sequence)
+
+
+def _variations_at_infinity(sequence: List[List[int]]) -> int:
+    return _count_variations((p[0] > 0) - (p[0] < 0) for p in sequence)
@@ -4,9 +4,97 @@ Ensures LLM-generated banking messages are structurally correct
 """
 
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, BinaryIO, Iterable, Iterator, Set, TextIO, Tuple, Union
 from enum import Enum
+from xml.etree import ElementTree
+import codecs
+import os
 import re
+import time
+
+from .bank_identifiers import IdentifierVerdict, bic_verdict, iban_mod97, iban_verdict
+
+if TYPE_CHECKING:
+    from .xsd_registry import XSDRegistry
+
+
+# ISO 20022 ActiveCurrencyAndAmount: up to 18 digits, at most 5 after the point
+_ISO_AMOUNT = re.compile(r"^(?=[\d.]{1,19}$)\d+(\.\d{1,5})?$")
+_ISO_DECIMAL = re.compile(r"^\d{1,18}(\.\d+)?$")
+_ISO_CURRENCY = re.compile(r"^[A-Z]{3}$")
+
+
+# ISO 4217 currencies whose minor unit is not two digits
+CURRENCY_MINOR_UNITS: Dict[str, int] = {
+    "BIF": 0, "CLP": 0, "DJF": 0, "GNF": 0, "ISK": 0, "JPY": 0, "KMF": 0, "KRW": 0,
+    "PYG": 0, "RWF": 0, "UGX": 0, "UYI": 0, "VND": 0, "VUV": 0, "XAF": 0, "XOF": 0, "XPF": 0,
+    "BHD": 3, "IQD": 3, "JOD": 3, "KWD": 3, "LYD": 3, "OMR": 3, "TND": 3,
+    "CLF": 4, "UYW": 4,
+}
+
+
+def to_minor_units(amount: str, currency: str) -> int:
+    """
+    Exact integer amount in a currency's minor unit ("12.50" EUR -> 1250).
+    
+    Raises:
+        ValueError: If the amount is malformed or has more decimals than
+            the currency's minor unit allows
+    """
+    exponent = CURRENCY_MINOR_UNITS.get(currency, 2)
+    amount = amount.strip()
+    if not _ISO_AMOUNT.match(amount):
+        raise ValueError(f"invalid amount '{amount}'")
+    units = _scaled(amount, exponent)
+    if units is None:
+        raise ValueError(f"amount '{amount}' has more decimals than {currency} allows ({exponent})")
+    return units
+
+
+def _scaled(amount: str, exponent: int) -> Optional[int]:
+    """Integer amount * 10**exponent, or None if that is not a whole number"""
+    whole, _, fraction = amount.partition(".")
+    fraction = fraction.rstrip("0")
+    if len(fraction) > exponent:
+        return None
+    return int(whole) * 10 ** exponent + int(fraction.ljust(exponent, "0") or 0)
+
+
+def format_minor_units(units: int, currency: str) -> str:
+    """Decimal string for an amount in minor units (1250 EUR -> "12.50")"""
+    exponent = CURRENCY_MINOR_UNITS.get(currency, 2)
+    sign = "-" if units < 0 else ""
+    whole, fraction = divmod(abs(units), 10 ** exponent)
+    return f"{sign}{whole}.{fraction:0{exponent}d}" if exponent else f"{sign}{whole}"
+
+
+# Every ISO 20022 amount has at most 5 decimals, so CtrlSum (a sum across
+# currencies) is compared exactly at that scale
+_CTRL_SUM_SCALE = 5
+
+
+def _format_scaled(units: int) -> str:
+    whole, fraction = divmod(units, 10 ** _CTRL_SUM_SCALE)
+    text = f"{whole}.{fraction:0{_CTRL_SUM_SCALE}d}".rstrip("0")
+    return text + "0" * max(0, 2 - len(text.split(".")[1]))
+
+
+def _text(element) -> str:
+    return (element.text or "").strip() if element is not None else ""
+
+
+def _local(tag: str) -> str:
+    """Element name without its namespace"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _find(element, *path: str):
+    """First descendant along a path of local names (namespace-agnostic)"""
+    for name in path:
+        element = next((child for child in element if _local(child.tag) == name), None)
+        if element is None:
+            return None
+    return element
 
 
 class MessageType(Enum):
@@ -34,7 +122,317 @@ class MessageResult:
     errors: List[str]
     warnings: List[str]
     field_count: Optional[int] = None
+    entry_count: Optional[int] = None
+    details: Optional[dict] = None
+    
+
+@dataclass
+class StatementBalanceResult:
+    """Result of a camt.053 balance reconciliation"""
+    valid: bool
+    statement_count: int
+    entry_count: int
+    errors: List[str]
+    first_offending_entry: Optional[int] = None    # 1-based position among all entries
+    details: Optional[dict] = None
+
+
+@dataclass
+class _StatementTotals:
+    """Running state of one camt.053 statement while its entries stream past"""
+    statement_id: str = "?"
+    currency: Optional[str] = None
+    opening: Optional[int] = None
+    opening_code: Optional[str] = None
+    closing: Optional[int] = None
+    controls: Optional[Dict[str, int]] = None
+    entries: int = 0
+    credit_entries: int = 0
+    debit_entries: int = 0
+    credits: int = 0
+    debits: int = 0
+    booked_net: int = 0
+
+
+@dataclass
+class BatchControlResult:
+    """Result of a payment batch control-sum verification"""
+    valid: bool
+    message_type: str
+    transaction_count: int
+    errors: List[str]
+    currency_totals: Dict[str, str]
+    elapsed_seconds: float
+    transactions_per_second: float
+    first_offending_transaction: Optional[int] = None    # 1-based position in the file
+
+
+# TxsSummry control names, keyed like the running totals they are checked against
+_CONTROL_NAMES = {
+    "entries": "NbOfNtries", "sum": "Sum",
+    "credit_entries": "credit NbOfNtries", "credits": "credit Sum",
+    "debit_entries": "debit NbOfNtries", "debits": "debit Sum",
+    "net": "TtlNetNtry",
+}
+
+
+# ==================== SWIFT MT (FIN) Field Rules ====================
+
+_MT_FIELD = re.compile(r"^:(\d{2}[A-Z]?):", re.M)
+# A top-level {id:...} block; blocks 3 and 5 nest one level of {tag:...}
+_FIN_BLOCK = re.compile(r"\{([^{}:]*):([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}")
+_FIN_BRACES = re.compile(r"[{}]")
+_FIN_BASIC_HEADER = re.compile(r"^[FAL]\d{2}[A-Z0-9]{12}\d{10}$")
+_FIN_APP_HEADER = re.compile(r"^[IO](\d{3})")
+_FIN_BLOCK_ORDER = {"1": 1, "2": 2, "3": 3, "4": 4, "5": 5, "S": 6}
+_FIN_SEPARATORS = " \t\r\n$\x01\x03"
+_MAX_FIN_BLOCK = 1 << 16     # characters; far above any FIN block
+
+
+def _lines(count: int, width: int) -> str:
+    """count*width x: up to count lines of 1..width characters"""
+    return rf"[^\n]{{1,{width}}}(\n[^\n]{{1,{width}}}){{0,{count - 1}}}"
+
+
+_MT_REFERENCE = (r"(?!/)(?!.*//)[^\n]{1,16}(?<!/)", "16x, no leading, trailing or double '/'")
+_MT_BIC = r"[A-Z]{6}[A-Z0-9]{2}([A-Z0-9]{3})?"
+_MT_PARTY = r"((/[A-Z])?(/[^\n]{1,34})?\n)?"
+_MT_AMOUNT = r"\d{1,14},\d{0,13}"
+_MT_BALANCE = (rf"[CD]\d{{6}}[A-Z]{{3}}{_MT_AMOUNT}", "D/C mark + YYMMDD + currency + amount")
+
+# Field formats (SWIFT notation in the descriptions), shared by every MT type
+_MT_FIELD_FORMATS: Dict[str, Tuple[str, str]] = {
+    "20": _MT_REFERENCE,
+    "21": _MT_REFERENCE,
+    "13C": (r"/[A-Z0-9]{8}/\d{4}[+-]\d{4}", "/8c/4!n1!x4!n"),
+    "23B": (r"[A-Z0-9]{4}", "4!c"),
+    "23E": (r"[A-Z0-9]{4}(/[^\n]{1,30})?", "4!c[/30x]"),
+    "25": (r"[^\n]{1,35}", "35x"),
+    "25P": (rf"[^\n]{{1,35}}\n{_MT_BIC}", "35x + BIC"),
+    "26T": (r"[A-Z0-9]{3}", "3!c"),
+    "28C": (r"\d{1,5}(/\d{1,5})?", "5n[/5n]"),
+    "32A": (r"\d{6} *[A-Z]{3} *[\d,.][\d,. ]*", "YYMMDDCCY + Amount"),
+    "33B": (rf"[A-Z]{{3}}{_MT_AMOUNT}", "currency + amount"),
+    "36": (r"\d{1,11},\d{0,10}", "12d"),
+    "50A": (rf"(/[^\n]{{1,34}}\n)?{_MT_BIC}", "[/34x] + BIC"),
+    "50F": (_lines(5, 35), "35x + 4*35x"),
+    "50K": (rf"(/[^\n]{{1,34}}\n)?{_lines(4, 35)}", "[/34x] + 4*35x"),
+    "59": (rf"(/[^\n]{{1,34}}\n)?{_lines(4, 35)}", "[/34x] + 4*35x"),
+    "59A": (rf"(/[^\n]{{1,34}}\n)?{_MT_BIC}", "[/34x] + BIC"),
+    "59F": (rf"(/[^\n]{{1,34}}\n)?{_lines(4, 35)}", "[/34x] + 4*35x"),
+    "60F": _MT_BALANCE, "60M": _MT_BALANCE, "62F": _MT_BALANCE, "62M": _MT_BALANCE,
+    "64": _MT_BALANCE, "65": _MT_BALANCE,
+    "61": (
+        rf"\d{{6}}(\d{{4}})?(RC|RD|C|D)[A-Z]?{_MT_AMOUNT}[SNF][A-Z0-9]{{3}}[^\n]{{1,16}}?(//[^\n]{{1,16}})?(\n[^\n]{{1,34}})?",
+        "YYMMDD[MMDD] + D/C mark + amount + type + reference",
+    ),
+    "70": (_lines(4, 35), "4*35x"),
+    "71A": (r"BEN|OUR|SHA", "BEN, OUR or SHA"),
+    "71F": (rf"[A-Z]{{3}}{_MT_AMOUNT}", "currency + amount"),
+    "71G": (rf"[A-Z]{{3}}{_MT_AMOUNT}", "currency + amount"),
+    "72": (_lines(6, 35), "6*35x"),
+    "77B": (_lines(3, 35), "3*35x"),
+    "86": (_lines(6, 65), "6*65x"),
+}
+for _tag in ("51A", "52A", "53A", "54A", "55A", "56A", "57A", "58A"):
+    _MT_FIELD_FORMATS[_tag] = (rf"{_MT_PARTY}{_MT_BIC}", "[/1!a][/34x] + BIC")
+for _tag in ("52D", "53D", "54D", "55D", "56D", "57D", "58D"):
+    _MT_FIELD_FORMATS[_tag] = (rf"{_MT_PARTY}{_lines(4, 35)}", "[/1!a][/34x] + 4*35x")
+
+_MT_FIELD_RULES: Dict[str, Tuple["re.Pattern[str]", str]] = {
+    tag: (re.compile(pattern), description) for tag, (pattern, description) in _MT_FIELD_FORMATS.items()
+}
+
+# Fields defined for each message type (others draw a warning)
+_MT_DEFINED_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "MT103": (
+        "20", "13C", "23B", "23E", "26T", "32A", "33B", "36", "50A", "50F", "50K", "51A",
+        "52A", "52D", "53A", "53B", "53D", "54A", "54B", "54D", "55A", "55B", "55D",
+        "56A", "56C", "56D", "57A", "57B", "57C", "57D", "59", "59A", "59F",
+        "70", "71A", "71F", "71G", "72", "77B", "77T",
+    ),
+    "MT202": (
+        "20", "21", "13C", "32A", "52A", "52D", "53A", "53B", "53D", "54A", "54B", "54D",
+        "56A", "56D", "57A", "57B", "57D", "58A", "58D", "72",
+    ),
+    "MT940": ("20", "21", "25", "25P", "28C", "60F", "60M", "61", "86", "62F", "62M", "64", "65"),
+    "MT950": ("20", "25", "28C", "60F", "60M", "61", "62F", "62M", "64"),
+}
+
+
+@dataclass
+class _MtValidator:
+    """Compiled field rules of one SWIFT MT message type"""
+    required: List[Tuple[str, str]]     # (tag, name); a trailing lower-case "a" accepts any option letter
+    rules: Dict[str, Tuple["re.Pattern[str]", str]]
+    defined: Optional[Set[str]] = None  # None: any field may appear
+
+    def __post_init__(self):
+        self._exact = {tag for tag, _ in self.required if not tag.endswith("a")}
+        self._numbers = {tag[:2] for tag, _ in self.required if tag.endswith("a")}
+
+    def check(self, message_type: str, fields: List[Tuple[str, str]]) -> Tuple[List[str], List[str]]:
+        """Errors and warnings for a message's fields, in message order"""
+        errors: List[str] = []
+        warnings: List[str] = []
+        present = {tag for tag, _ in fields}
+        numbers = {tag[:2] for tag in present}
+        if not (self._exact <= present and self._numbers <= numbers):
+            for tag, name in self.required:
+                if (tag[:2] not in numbers) if tag.endswith("a") else (tag not in present):
+                    errors.append(f"Missing required field {tag}: {name}")
+        rules, defined = self.rules, self.defined
+        for tag, value in fields:
+            rule = rules.get(tag)
+            if rule is not None:
+                if not rule[0].fullmatch(value):
+                    errors.append(f"Field {tag} has invalid format (expected: {rule[1]})")
+            elif defined is not None and tag not in defined:
+                warnings.append(f"Field {tag} is not defined for {message_type}")
+        return errors, warnings
+
+
+def _fin_block_open(text: str, start: int) -> bool:
+    """Whether the block opening at start is unclosed but still well nested"""
+    depth = 0
+    for brace in _FIN_BRACES.finditer(text, start):
+        depth += 1 if brace.group() == "{" else -1
+        if depth == 0 or depth > 2:
+            return False
+    return True
+
+
+def _compile_mt_validator(required: Dict[str, str], message_type: Optional[str] = None) -> _MtValidator:
+    defined = _MT_DEFINED_FIELDS.get(message_type) if message_type else None
+    rules = _MT_FIELD_RULES if defined is None else {t: _MT_FIELD_RULES[t] for t in defined if t in _MT_FIELD_RULES}
+    return _MtValidator(list(required.items()), rules, set(defined) if defined else None)
+
+
+# ==================== Parsed ISO 20022 Documents ====================
+
+_ISO_NAMESPACE = re.compile(r"urn:iso:std:iso:20022:tech:xsd:([a-z]{4}\.\d{3})")
+
+
+def _parse_xml(data: bytes):
+    """Root element of an XML document (lxml when available, else ElementTree)"""
+    try:
+        from lxml import etree
+    except ImportError:
+        return ElementTree.fromstring(data)
+    # Entities are not expanded and nothing is fetched: a message has no business declaring any
+    parser = etree.XMLParser(resolve_entities=False, no_network=True)
+    return etree.fromstring(data, parser)
+
+
+class ISODocument:
+    """
+    An ISO 20022 message parsed once and indexed for every guard that checks it.
+    
+    Elements are indexed by local name (namespace-agnostic) and by path of
+    local names below the root, e.g. "FIToFICstmrCdtTrf/GrpHdr/MsgId", so a
+    check downstream is a dictionary lookup rather than another scan of the
+    XML. MessageGuard, CrossGuard and UCPIntegration accept a document
+    wherever they accept the XML string.
+    """
+    
+    def __init__(self, xml: str, root=None, error: Optional[str] = None):
+        """
+        Index an already parsed message (see parse()).
+        
+        Args:
+            xml: The message text
+            root: Root element, or None if the text is not well-formed
+            error: Parser error for a message that is not well-formed
+        """
+        self.xml = xml
+        self.root = root
+        self.error = error
+        self.namespace: Optional[str] = None
+        self._tags: Dict[str, List[Any]] = {}
+        self._paths: Dict[str, List[Any]] = {}
+        self._attributes: Dict[str, List[str]] = {}
+        if root is not None:
+            self.namespace = root.tag[1:].split("}", 1)[0] if root.tag.startswith("{") else None
+            self._index(root)
+    
+    @classmethod
+    def parse(cls, xml: Union[str, bytes]) -> "ISODocument":
+        """
+        Parse a message; one that is not well-formed gives a document with no root.
+        
+        Args:
+            xml: XML text or bytes
+            
+        Returns:
+            ISODocument (check well_formed before relying on lookups)
+        """
+        data = xml.encode() if isinstance(xml, str) else xml
+        text = xml if isinstance(xml, str) else xml.decode("utf-8", "replace")
+        try:
+            return cls(text, _parse_xml(data))
+        except (SyntaxError, ValueError) as e:
+            # ElementTree.ParseError and lxml's XMLSyntaxError both derive from SyntaxError
+            return cls(text, None, str(e) or type(e).__name__)
+    
+    def _index(self, root) -> None:
+        stack = [(child, "") for child in reversed(list(root))]
+        self._tags[_local(root.tag)] = [root]
+        while stack:
+            element, prefix = stack.pop()
+            if not isinstance(element.tag, str):
+                continue    # comments and processing instructions
+            tag = _local(element.tag)
+            path = f"{prefix}{tag}"
+            self._tags.setdefault(tag, []).append(element)
+            self._paths.setdefault(path, []).append(element)
+            for name, value in element.attrib.items():
+                self._attributes.setdefault(name, []).append(value)
+            stack.extend((child, f"{path}/") for child in reversed(list(element)))
     
+    @property
+    def well_formed(self) -> bool:
+        return self.root is not None
+    
+    @property
+    def message_type(self) -> Optional[str]:
+        """Message identifier from the namespace, e.g. "pacs.008" """
+        match = _ISO_NAMESPACE.match(self.namespace or "")
+        return match.group(1) if match else None
+    
+    @property
+    def element_count(self) -> int:
+        return sum(len(elements) for elements in self._tags.values())
+    
+    def findall(self, key: str) -> List[Any]:
+        """Elements with a local name, or at a path below the root if key contains "/" """
+        return (self._paths if "/" in key else self._tags).get(key, [])
+    
+    def find(self, key: str):
+        """First element for a key (see findall), or None"""
+        elements = self.findall(key)
+        return elements[0] if elements else None
+    
+    def has(self, key: str) -> bool:
+        return bool(self.findall(key))
+    
+    def text(self, key: str) -> Optional[str]:
+        """Stripped text of the first element for a key, or None if there is none"""
+        element = self.find(key)
+        return _text(element) if element is not None else None
+    
+    def texts(self, key: str) -> List[str]:
+        """Stripped, non-empty texts of every element for a key, in document order"""
+        return [t for t in (_text(e) for e in self.findall(key)) if t]
+    
+    def attribute(self, key: str, name: str) -> Optional[str]:
+        """Attribute of the first element for a key, or None"""
+        element = self.find(key)
+        return element.get(name) if element is not None else None
+    
+    def attribute_values(self, name: str) -> List[str]:
+        """Every value of an attribute (e.g. "Ccy") below the root, in document order"""
+        return self._attributes.get(name, [])
+
 
 class MessageGuard:
     """
@@ -45,13 +443,13 @@ class MessageGuard:
     def __init__(self):
         self._lxml_available = self._check_lxml()
         
-        # Required fields for SWIFT MT messages
+        # Required fields for SWIFT MT messages ("50a": field 50 in any option)
         self.mt103_required_fields = {
             "20": "Transaction Reference",
             "23B": "Bank Operation Code",
             "32A": "Value Date/Currency/Amount",
-            "50K": "Ordering Customer",
-            "59": "Beneficiary Customer",
+            "50a": "Ordering Customer",
+            "59a": "Beneficiary Customer",
             "71A": "Details of Charges"
         }
         
@@ -59,7 +457,58 @@ class MessageGuard:
             "20": "Transaction Reference",
             "21": "Related Reference",
             "32A": "Value Date/Currency/Amount",
-            "58A": "Beneficiary Institution"
+            "58a": "Beneficiary Institution"
+        }
+        
+        self.mt940_required_fields = {
+            "20": "Transaction Reference",
+            "25a": "Account Identification",
+            "28C": "Statement Number/Sequence Number",
+            "60a": "Opening Balance",
+            "62a": "Closing Balance"
+        }
+        
+        # Compiled once; MT950 shares MT940's required fields
+        self.mt_validators = {
+            SwiftMtType.MT103.value: _compile_mt_validator(self.mt103_required_fields, "MT103"),
+            SwiftMtType.MT202.value: _compile_mt_validator(self.mt202_required_fields, "MT202"),
+            SwiftMtType.MT940.value: _compile_mt_validator(self.mt940_required_fields, "MT940"),
+            SwiftMtType.MT950.value: _compile_mt_validator(self.mt940_required_fields, "MT950"),
+        }
+        self._mt_generic_validator = _compile_mt_validator({"20": "Transaction Reference"})
+        
+        # Required elements for ISO 20022 messages
+        self.iso20022_required_elements = {
+            MessageType.PACS_008: [
+                "GrpHdr",           # Group Header
+                "MsgId",            # Message ID
+                "CreDtTm",          # Creation DateTime
+                "NbOfTxs",          # Number of Transactions
+                "CdtTrfTxInf",      # Credit Transfer Info
+                "IntrBkSttlmAmt",   # Interbank Settlement Amount
+                "DbtrAgt",          # Debtor Agent
+                "CdtrAgt",          # Creditor Agent
+            ],
+            MessageType.CAMT_053: [
+                "GrpHdr",
+                "Stmt",             # Statement
+                "Acct",             # Account
+                "Bal",              # Balance
+            ],
+            MessageType.PAIN_001: [
+                "GrpHdr",
+                "MsgId",
+                "CreDtTm",
+                "PmtInf",           # Payment Information
+                "PmtMtd",           # Payment Method
+            ],
+        }
+        
+        # Repeating element checked (then freed) one at a time when streaming
+        self.iso20022_entry_elements = {
+            MessageType.PACS_008: "CdtTrfTxInf",
+            MessageType.CAMT_053: "Ntry",
+            MessageType.PAIN_001: "CdtTrfTxInf",
         }
     
     def _check_lxml(self) -> bool:
@@ -74,24 +523,25 @@ class MessageGuard:
     
     def verify_iso20022_xml(
         self,
-        xml_string: str,
+        xml_string: Union[str, ISODocument],
         msg_type: MessageType = MessageType.PACS_008
     ) -> MessageResult:
         """
         Verify ISO 20022 XML message structure.
         
         Args:
-            xml_string: The XML message to validate
+            xml_string: The XML message to validate, or an ISODocument parsed from it
             msg_type: Expected message type
             
         Returns:
             MessageResult with validation status
         """
+        document = xml_string if isinstance(xml_string, ISODocument) else ISODocument.parse(xml_string)
         errors = []
         warnings = []
         
         # Basic XML well-formedness check
-        if not self._is_well_formed_xml(xml_string):
+        if not document.well_formed:
             return MessageResult(
                 valid=False,
                 message_type=msg_type.value,
@@ -100,102 +550,657 @@ class MessageGuard:
             )
         
         # Check for required namespaces
-        if "urn:iso:std:iso:20022" not in xml_string:
+        if "urn:iso:std:iso:20022" not in (document.namespace or ""):
             warnings.append("Missing ISO 20022 namespace declaration")
         
         # Message-specific validation
         if msg_type == MessageType.PACS_008:
-            errors.extend(self._validate_pacs008(xml_string))
+            errors.extend(self._validate_pacs008(document))
         elif msg_type == MessageType.CAMT_053:
-            errors.extend(self._validate_camt053(xml_string))
+            errors.extend(self._validate_camt053(document))
         elif msg_type == MessageType.PAIN_001:
-            errors.extend(self._validate_pain001(xml_string))
+            errors.extend(self._validate_pain001(document))
         
         return MessageResult(
             valid=len(errors) == 0,
             message_type=msg_type.value,
             errors=errors,
             warnings=warnings,
-            field_count=xml_string.count("<")
+            field_count=document.element_count
         )
     
-    def _is_well_formed_xml(self, xml_string: str) -> bool:
-        """Check if XML is well-formed"""
-        if self._lxml_available:
-            try:
-                from lxml import etree
-                etree.fromstring(xml_string.encode())
-                return True
-            except:
-                return False
-        else:
-            # Fallback: basic bracket matching
-            return xml_string.count("<") == xml_string.count(">")
-    
-    def _validate_pacs008(self, xml: str) -> List[str]:
+    def _validate_pacs008(self, document: ISODocument) -> List[str]:
         """Validate pacs.008 Customer Credit Transfer"""
         errors = []
         
-        # Required elements for pacs.008
-        required = [
-            "GrpHdr",           # Group Header
-            "MsgId",            # Message ID
-            "CreDtTm",          # Creation DateTime
-            "NbOfTxs",          # Number of Transactions
-            "CdtTrfTxInf",      # Credit Transfer Info
-            "IntrBkSttlmAmt",   # Interbank Settlement Amount
-            "DbtrAgt",          # Debtor Agent
-            "CdtrAgt",          # Creditor Agent
-        ]
+        required = self.iso20022_required_elements[MessageType.PACS_008]
         
         for element in required:
-            if f"<{element}" not in xml and f"<{element}>" not in xml:
+            if not document.has(element):
                 errors.append(f"Missing required element: {element}")
         
-        # Validate amount format
-        if "Ccy=" in xml:
-            # Check currency code is 3 uppercase letters
-            ccy_match = re.search(r'Ccy="([A-Z]{3})"', xml)
-            if not ccy_match:
-                errors.append("Invalid currency code format (must be 3 uppercase letters)")
+        # Validate amount format: every currency code is 3 uppercase letters
+        if any(not _ISO_CURRENCY.match(ccy) for ccy in document.attribute_values("Ccy")):
+            errors.append("Invalid currency code format (must be 3 uppercase letters)")
         
         return errors
     
-    def _validate_camt053(self, xml: str) -> List[str]:
+    def _validate_camt053(self, document: ISODocument) -> List[str]:
         """Validate camt.053 Bank Statement"""
         errors = []
         
-        required = [
-            "GrpHdr",
-            "Stmt",             # Statement
-            "Acct",             # Account
-            "Bal",              # Balance
-        ]
+        required = self.iso20022_required_elements[MessageType.CAMT_053]
         
         for element in required:
-            if f"<{element}" not in xml:
+            if not document.has(element):
                 errors.append(f"Missing required element: {element}")
         
         return errors
     
-    def _validate_pain001(self, xml: str) -> List[str]:
+    def _validate_pain001(self, document: ISODocument) -> List[str]:
         """Validate pain.001 Customer Payment Initiation"""
         errors = []
         
-        required = [
-            "GrpHdr",
-            "MsgId",
-            "CreDtTm",
-            "PmtInf",           # Payment Information
-            "PmtMtd",           # Payment Method
-        ]
+        required = self.iso20022_required_elements[MessageType.PAIN_001]
         
         for element in required:
-            if f"<{element}" not in xml:
+            if not document.has(element):
                 errors.append(f"Missing required element: {element}")
         
         return errors
     
+    def verify_iso20022_schema(
+        self,
+        xml_string: Union[str, ISODocument],
+        registry: "XSDRegistry",
+        msg_type: Optional[MessageType] = None
+    ) -> MessageResult:
+        """
+        Verify an ISO 20022 message against its official XSD.
+        
+        Args:
+            xml_string: The XML message, or an ISODocument parsed from it
+            registry: XSDRegistry holding the compiled schemas
+            msg_type: Expected message type (default: from the namespace,
+                which also selects the exact schema version)
+            
+        Returns:
+            MessageResult; details holds the schema version and the
+            compile and validation times in seconds
+        """
+        result = registry.validate(xml_string, msg_type.value if msg_type else None)
+        return MessageResult(
+            valid=result.valid,
+            message_type=result.message_type[:8],
+            errors=result.errors,
+            warnings=[],
+            details={
+                "schema": result.message_type,
+                "compile_seconds": result.compile_seconds,
+                "validation_seconds": result.validation_seconds,
+                "cached": result.cached,
+            }
+        )
+    
+    # ==================== Streaming ISO 20022 Validation ====================
+    
+    def verify_iso20022_stream(
+        self,
+        source: Union[str, "os.PathLike[str]", BinaryIO],
+        msg_type: MessageType = MessageType.CAMT_053,
+        max_errors: int = 100
+    ) -> MessageResult:
+        """
+        Verify an ISO 20022 message incrementally, without loading it whole.
+        
+        Required elements are ticked off as they arrive and each entry
+        (Ntry in camt.053, CdtTrfTxInf in pacs.008/pain.001) is checked as
+        soon as it is complete, then freed, so memory stays bounded however
+        many entries a statement holds.
+        
+        Args:
+            source: File path or binary file-like object
+            msg_type: Expected message type
+            max_errors: Errors kept in the result; further ones are only counted
+            
+        Returns:
+            MessageResult with validation status, element and entry counts
+        """
+        errors: List[str] = []
+        warnings: List[str] = []
+        dropped = 0
+        seen: Set[str] = set()
+        elements = entries = 0
+        entry_tag = self.iso20022_entry_elements.get(msg_type)
+        
+        def report(message: str) -> None:
+            nonlocal dropped
+            if len(errors) < max_errors:
+                errors.append(message)
+            else:
+                dropped += 1
+        
+        try:
+            for tag, element, parent in self._stream_elements(source, {entry_tag} if entry_tag else set()):
+                elements += 1
+                seen.add(tag)
+                if parent is None and "urn:iso:std:iso:20022" not in element.tag:
+                    warnings.append("Missing ISO 20022 namespace declaration")
+                if tag == entry_tag:
+                    entries += 1
+                    for error in self._validate_stream_entry(msg_type, element):
+                        report(f"{entry_tag} #{entries}: {error}")
+        except SyntaxError as e:
+            # ElementTree.ParseError and lxml's XMLSyntaxError both derive from SyntaxError
+            report(f"XML is not well-formed: {e}")
+        
+        for element in self.iso20022_required_elements.get(msg_type, []):
+            if element not in seen:
+                report(f"Missing required element: {element}")
+        if dropped:
+            errors.append(f"{dropped} further errors not shown")
+        
+        return MessageResult(
+            valid=len(errors) == 0,
+            message_type=msg_type.value,
+            errors=errors,
+            warnings=warnings,
+            field_count=elements,
+            entry_count=entries
+        )
+    
+    def _iterparse(self, source: Union[str, BinaryIO]) -> Iterator[Tuple[str, Any]]:
+        """Start/end events from lxml when available, else ElementTree"""
+        if self._lxml_available:
+            from lxml import etree
+            # Entities are not expanded: a message has no business declaring any
+            return etree.iterparse(source, events=("start", "end"), resolve_entities=False)
+        return ElementTree.iterparse(source, events=("start", "end"))
+    
+    def _stream_elements(
+        self,
+        source: Union[str, "os.PathLike[str]", BinaryIO],
+        keep: Set[str]
+    ) -> Iterator[Tuple[str, Any, Optional[str]]]:
+        """
+        Completed elements of a streamed document, in document order.
+        
+        Yields (local name, element, parent local name) at each element's
+        end. Elements named in keep arrive with their whole subtree; every
+        other element is detached from its parent once yielded (unless it
+        sits inside a kept one), so the tree never grows beyond the open
+        path plus the entry being built.
+        """
+        if isinstance(source, os.PathLike):
+            source = os.fspath(source)
+        path: List[Any] = []
+        kept = 0
+        # Qualified tags repeat on every entry; strip each namespace once
+        names: Dict[str, str] = {}
+        for event, element in self._iterparse(source):
+            tag = names.get(element.tag)
+            if tag is None:
+                tag = _local(element.tag)
+                if len(names) < 1024:
+                    names[element.tag] = tag
+            if event == "start":
+                path.append((element, tag))
+                if tag in keep:
+                    kept += 1
+                continue
+            path.pop()
+            yield tag, element, path[-1][1] if path else None
+            if tag in keep:
+                kept -= 1
+            if not kept and path:
+                path[-1][0].remove(element)
+    
+    def _validate_stream_entry(self, msg_type: MessageType, entry) -> List[str]:
+        """Entry-level rules for one completed entry subtree"""
+        errors = []
+        if msg_type == MessageType.CAMT_053:
+            errors.extend(self._validate_amount(_find(entry, "Amt"), "Amt"))
+            indicator = _find(entry, "CdtDbtInd")
+            if indicator is None or (indicator.text or "").strip() not in ("CRDT", "DBIT"):
+                errors.append("CdtDbtInd must be CRDT or DBIT")
+            if _find(entry, "Sts") is None:
+                errors.append("Missing required element: Sts")
+        elif msg_type == MessageType.PACS_008:
+            errors.extend(self._validate_amount(_find(entry, "IntrBkSttlmAmt"), "IntrBkSttlmAmt"))
+            if _find(entry, "PmtId") is None:
+                errors.append("Missing required element: PmtId")
+        elif msg_type == MessageType.PAIN_001:
+            errors.extend(self._validate_amount(_find(entry, "Amt", "InstdAmt"), "Amt/InstdAmt"))
+            if _find(entry, "PmtId") is None:
+                errors.append("Missing required element: PmtId")
+        return errors
+    
+    def _validate_amount(self, amount, name: str) -> List[str]:
+        """ISO 20022 amount element: Ccy attribute and a non-negative decimal value"""
+        if amount is None:
+            return [f"Missing required element: {name}"]
+        errors = []
+        if not _ISO_CURRENCY.match(amount.get("Ccy", "")):
+            errors.append(f"{name} has invalid currency code format (must be 3 uppercase letters)")
+        if not _ISO_AMOUNT.match((amount.text or "").strip()):
+            errors.append(f"{name} has invalid amount '{(amount.text or '').strip()}'")
+        return errors
+    
+    # ==================== Statement Reconciliation ====================
+    
+    def verify_camt053_balances(
+        self,
+        source: Union[str, "os.PathLike[str]", BinaryIO],
+        max_errors: int = 100
+    ) -> StatementBalanceResult:
+        """
+        Reconcile camt.053 statements: opening balance + entries = closing balance.
+        
+        One streaming pass over the file. Entry amounts are accumulated in
+        exact integer minor units of the statement currency, so no rounding
+        can hide a difference. Per statement it checks:
+        - opening (OPBD, else PRCD) + booked credits - booked debits = closing (CLBD)
+        - TxsSummry controls: NbOfNtries and Sum in total and per side, and
+          the net entry amount
+        
+        An entry that is malformed, in the wrong currency, or pushes a
+        running count or sum past its control is the offending entry; its
+        position is reported. Memory does not grow with the number of entries.
+        
+        Args:
+            source: File path or binary file-like object
+            max_errors: Errors kept in the result; further ones are only counted
+            
+        Returns:
+            StatementBalanceResult with per-statement and per-currency totals in details
+        """
+        errors: List[str] = []
+        dropped = 0
+        first_offending: Optional[int] = None
+        statements: List[dict] = []
+        currency_totals: Dict[str, Dict[str, int]] = {}
+        position = 0
+        totals = _StatementTotals()
+        
+        def report(message: str, entry: Optional[int] = None) -> None:
+            nonlocal dropped, first_offending
+            if entry is not None and first_offending is None:
+                first_offending = entry
+            if len(errors) < max_errors:
+                errors.append(message)
+            else:
+                dropped += 1
+        
+        try:
+            for tag, element, parent in self._stream_elements(source, {"Ntry", "Bal", "TxsSummry"}):
+                if parent == "Stmt" and tag == "Id":
+                    totals.statement_id = _text(element)
+                elif parent == "Acct" and tag == "Ccy":
+                    totals.currency = totals.currency or _text(element)
+                elif tag == "Bal":
+                    error = self._read_balance(totals, element)
+                    if error:
+                        report(f"Stmt {totals.statement_id}: {error}")
+                elif tag == "TxsSummry":
+                    error = self._read_controls(totals, element)
+                    if error:
+                        report(f"Stmt {totals.statement_id}: {error}")
+                elif tag == "Ntry":
+                    position += 1
+                    label = f"Stmt {totals.statement_id} Ntry #{totals.entries + 1}"
+                    for error in self._add_entry(totals, element):
+                        report(f"{label}: {error}", position)
+                elif tag == "Stmt":
+                    for error in self._close_statement(totals):
+                        report(f"Stmt {totals.statement_id}: {error}")
+                    statements.append(self._statement_details(totals))
+                    if totals.currency:
+                        summary = currency_totals.setdefault(totals.currency, {"credits": 0, "debits": 0, "entries": 0})
+                        summary["credits"] += totals.credits
+                        summary["debits"] += totals.debits
+                        summary["entries"] += totals.entries
+                    totals = _StatementTotals()
+        except SyntaxError as e:
+            report(f"XML is not well-formed: {e}")
+        
+        if not statements and not errors:
+            report("Missing required element: Stmt")
+        if dropped:
+            errors.append(f"{dropped} further errors not shown")
+        
+        return StatementBalanceResult(
+            valid=len(errors) == 0,
+            statement_count=len(statements),
+            entry_count=position,
+            errors=errors,
+            first_offending_entry=first_offending,
+            details={
+                "statements": statements,
+                "currencies": {
+                    ccy: {
+                        "credits": format_minor_units(t["credits"], ccy),
+                        "debits": format_minor_units(t["debits"], ccy),
+                        "entries": t["entries"],
+                    }
+                    for ccy, t in currency_totals.items()
+                },
+            }
+        )
+    
+    def _signed_amount(self, amount, indicator, currency: Optional[str]) -> Tuple[str, int]:
+        """(currency, signed minor units) of an Amt element with its CdtDbtInd"""
+        if amount is None:
+            raise ValueError("missing Amt")
+        ccy = amount.get("Ccy", "")
+        if not _ISO_CURRENCY.match(ccy):
+            raise ValueError(f"invalid currency code '{ccy}'")
+        if currency and ccy != currency:
+            raise ValueError(f"currency {ccy} differs from statement currency {currency}")
+        return ccy, self._signed(to_minor_units(_text(amount), ccy), indicator)
+    
+    def _signed(self, units: int, indicator) -> int:
+        side = _text(indicator)
+        if side not in ("CRDT", "DBIT"):
+            raise ValueError(f"CdtDbtInd must be CRDT or DBIT, got '{side}'")
+        return units if side == "CRDT" else -units
+    
+    def _read_balance(self, totals: _StatementTotals, balance) -> Optional[str]:
+        code = _text(_find(balance, "Tp", "CdOrPrtry", "Cd"))
+        if code not in ("OPBD", "PRCD", "CLBD"):
+            return None
+        try:
+            ccy, units = self._signed_amount(_find(balance, "Amt"), _find(balance, "CdtDbtInd"), totals.currency)
+        except ValueError as e:
+            return f"{code} balance: {e}"
+        totals.currency = ccy
+        if code == "CLBD":
+            totals.closing = units
+        elif totals.opening is None or code == "OPBD":
+            totals.opening, totals.opening_code = units, code
+        return None
+    
+    def _read_controls(self, totals: _StatementTotals, summary) -> Optional[str]:
+        if totals.currency is None:
+            return "TxsSummry before any balance or account currency"
+        controls: Dict[str, int] = {}
+        fields = {
+            "entries": ("TtlNtries", "NbOfNtries"),
+            "sum": ("TtlNtries", "Sum"),
+            "credit_entries": ("TtlCdtNtries", "NbOfNtries"),
+            "credits": ("TtlCdtNtries", "Sum"),
+            "debit_entries": ("TtlDbtNtries", "NbOfNtries"),
+            "debits": ("TtlDbtNtries", "Sum"),
+        }
+        try:
+            for key, path in fields.items():
+                value = _find(summary, *path)
+                if value is not None:
+                    text = _text(value)
+                    controls[key] = int(text) if key.endswith("entries") else to_minor_units(text, totals.currency)
+            net = _find(summary, "TtlNtries", "TtlNetNtry")
+            if net is not None:
+                # A plain decimal in the statement currency, signed by its own indicator
+                units = to_minor_units(_text(_find(net, "Amt")), totals.currency)
+                controls["net"] = self._signed(units, _find(net, "CdtDbtInd"))
+        except ValueError as e:
+            return f"TxsSummry: {e}"
+        totals.controls = controls
+        return None
+    
+    def _add_entry(self, totals: _StatementTotals, entry) -> List[str]:
+        try:
+            ccy, units = self._signed_amount(_find(entry, "Amt"), _find(entry, "CdtDbtInd"), totals.currency)
+        except ValueError as e:
+            totals.entries += 1
+            return [str(e)]
+        totals.currency = ccy
+        totals.entries += 1
+        if units >= 0:
+            totals.credit_entries += 1
+            totals.credits += units
+        else:
+            totals.debit_entries += 1
+            totals.debits -= units
+        status = _find(entry, "Sts")
+        if status is not None and len(status):
+            status = _find(status, "Cd")
+        # Pending and information-only entries do not move the booked balance
+        if _text(status) in ("", "BOOK"):
+            totals.booked_net += units
+        
+        errors = []
+        controls = totals.controls or {}
+        running = {
+            "entries": totals.entries, "sum": totals.credits + totals.debits,
+            "credit_entries": totals.credit_entries, "credits": totals.credits,
+            "debit_entries": totals.debit_entries, "debits": totals.debits,
+        }
+        step = {"entries": 1, "sum": abs(units)}
+        step.update({"credit_entries": 1, "credits": units} if units >= 0 else {"debit_entries": 1, "debits": -units})
+        for key, delta in step.items():
+            # Report only the entry that first crosses the control
+            if key in controls and running[key] > controls[key] >= running[key] - delta:
+                limit = self._format_control(key, controls[key], totals.currency)
+                errors.append(f"running {_CONTROL_NAMES[key]} exceeds control {limit}")
+        return errors
+    
+    def _format_control(self, key: str, value: int, currency: Optional[str]) -> str:
+        return str(value) if key.endswith("entries") else format_minor_units(value, currency or "")
+    
+    def _close_statement(self, totals: _StatementTotals) -> List[str]:
+        errors = []
+        ccy = totals.currency or ""
+        if totals.opening is None:
+            errors.append("Missing opening balance (OPBD or PRCD)")
+        if totals.closing is None:
+            errors.append("Missing closing balance (CLBD)")
+        if totals.opening is not None and totals.closing is not None:
+            computed = totals.opening + totals.booked_net
+            if computed != totals.closing:
+                errors.append(
+                    f"Closing balance {format_minor_units(totals.closing, ccy)} {ccy} != opening "
+                    f"{format_minor_units(totals.opening, ccy)} + booked entries "
+                    f"{format_minor_units(totals.booked_net, ccy)} = {format_minor_units(computed, ccy)}"
+                )
+        actual = {
+            "entries": totals.entries, "sum": totals.credits + totals.debits,
+            "credit_entries": totals.credit_entries, "credits": totals.credits,
+            "debit_entries": totals.debit_entries, "debits": totals.debits,
+            "net": totals.credits - totals.debits,
+        }
+        for key, control in (totals.controls or {}).items():
+            # Overshoots were already pinned on the entry that crossed the control
+            if actual[key] < control or (key == "net" and actual[key] != control):
+                errors.append(
+                    f"{_CONTROL_NAMES[key]} control {self._format_control(key, control, ccy)} "
+                    f"!= entries {self._format_control(key, actual[key], ccy)}"
+                )
+        return errors
+    
+    def _statement_details(self, totals: _StatementTotals) -> dict:
+        ccy = totals.currency or ""
+
+        def amount(units: Optional[int]) -> Optional[str]:
+            return None if units is None else format_minor_units(units, ccy)
+
+        return {
+            "statement_id": totals.statement_id,
+            "currency": totals.currency,
+            "opening": amount(totals.opening),
+            "opening_code": totals.opening_code,
+            "closing": amount(totals.closing),
+            "computed_closing": amount(None if totals.opening is None else totals.opening + totals.booked_net),
+            "entries": totals.entries,
+            "credits": amount(totals.credits),
+            "debits": amount(totals.debits),
+        }
+    
+    # ==================== Payment Batch Controls ====================
+    
+    def verify_payment_batch(
+        self,
+        source: Union[str, "os.PathLike[str]", BinaryIO],
+        msg_type: MessageType = MessageType.PACS_008,
+        max_errors: int = 100
+    ) -> BatchControlResult:
+        """
+        Verify NbOfTxs and CtrlSum of a pacs.008 or pain.001 batch against its transactions.
+        
+        One streaming pass: each CdtTrfTxInf amount (IntrBkSttlmAmt in
+        pacs.008, Amt/InstdAmt or Amt/EqvtAmt/Amt in pain.001) is added to
+        its currency's total in integer minor units as it is parsed. At the
+        end the totals are checked against the group header, against each
+        pain.001 PmtInf block, and against TtlIntrBkSttlmAmt in pacs.008.
+        
+        CtrlSum adds amounts regardless of currency, so it is compared at
+        the 5-decimal scale every ISO 20022 amount fits in exactly.
+        
+        Args:
+            source: File path or binary file-like object
+            msg_type: MessageType.PACS_008 or MessageType.PAIN_001
+            max_errors: Errors kept in the result; further ones are only counted
+            
+        Returns:
+            BatchControlResult with per-currency totals and parse throughput
+        """
+        if msg_type not in (MessageType.PACS_008, MessageType.PAIN_001):
+            raise ValueError(f"Batch controls apply to pacs.008 and pain.001, not {msg_type.value}")
+        
+        errors: List[str] = []
+        dropped = 0
+        first_offending: Optional[int] = None
+        totals: Dict[str, int] = {}
+        group: Optional[Dict[str, Any]] = None
+        block: Dict[str, Any] = {"count": 0, "scaled": 0}
+        count = 0
+        scaled_sum = 0          # all amounts at _CTRL_SUM_SCALE decimals
+        
+        def report(message: str, transaction: Optional[int] = None) -> None:
+            nonlocal dropped, first_offending
+            if transaction is not None and first_offending is None:
+                first_offending = transaction
+            if len(errors) < max_errors:
+                errors.append(message)
+            else:
+                dropped += 1
+        
+        started = time.perf_counter()
+        try:
+            for tag, element, parent in self._stream_elements(source, {"CdtTrfTxInf", "GrpHdr"}):
+                if tag == "CdtTrfTxInf":
+                    count += 1
+                    block["count"] += 1
+                    try:
+                        ccy, units = self._transaction_amount(msg_type, element)
+                    except ValueError as e:
+                        report(f"CdtTrfTxInf #{count}: {e}", count)
+                        continue
+                    totals[ccy] = totals.get(ccy, 0) + units
+                    scaled = units * 10 ** (_CTRL_SUM_SCALE - CURRENCY_MINOR_UNITS.get(ccy, 2))
+                    scaled_sum += scaled
+                    block["scaled"] += scaled
+                elif tag == "GrpHdr":
+                    count_text = _find(element, "NbOfTxs")
+                    ctrl_sum = _find(element, "CtrlSum")
+                    if count_text is None:
+                        report("GrpHdr: Missing required element: NbOfTxs")
+                    group = self._batch_controls(
+                        None if count_text is None else _text(count_text),
+                        None if ctrl_sum is None else _text(ctrl_sum),
+                        report,
+                        "GrpHdr"
+                    )
+                    total = _find(element, "TtlIntrBkSttlmAmt")
+                    if total is not None:
+                        try:
+                            group["total"] = (total.get("Ccy", ""), to_minor_units(_text(total), total.get("Ccy", "")))
+                        except ValueError as e:
+                            report(f"GrpHdr: TtlIntrBkSttlmAmt {e}")
+                elif parent == "PmtInf" and tag in ("PmtInfId", "NbOfTxs", "CtrlSum"):
+                    block[tag] = _text(element)
+                elif tag == "PmtInf":
+                    label = f"PmtInf {block.get('PmtInfId', '?')}"
+                    controls = self._batch_controls(block.get("NbOfTxs"), block.get("CtrlSum"), report, label)
+                    for error in self._compare_controls(controls, block["count"], block["scaled"], label):
+                        report(error)
+                    block = {"count": 0, "scaled": 0}
+        except SyntaxError as e:
+            report(f"XML is not well-formed: {e}")
+        elapsed = time.perf_counter() - started
+        
+        if group is None:
+            report("Missing required element: GrpHdr")
+            group = {}
+        for error in self._compare_controls(group, count, scaled_sum, "GrpHdr"):
+            report(error)
+        if "total" in group:
+            ccy, expected = group["total"]
+            actual = totals.get(ccy, 0)
+            if set(totals) - {ccy}:
+                report(f"GrpHdr: TtlIntrBkSttlmAmt is in {ccy} but transactions settle in {', '.join(sorted(totals))}")
+            elif actual != expected:
+                report(
+                    f"GrpHdr: TtlIntrBkSttlmAmt {format_minor_units(expected, ccy)} {ccy} "
+                    f"!= transactions {format_minor_units(actual, ccy)} {ccy}"
+                )
+        if dropped:
+            errors.append(f"{dropped} further errors not shown")
+        
+        return BatchControlResult(
+            valid=len(errors) == 0,
+            message_type=msg_type.value,
+            transaction_count=count,
+            errors=errors,
+            currency_totals={ccy: format_minor_units(units, ccy) for ccy, units in sorted(totals.items())},
+            elapsed_seconds=elapsed,
+            transactions_per_second=count / elapsed if elapsed > 0 else 0.0,
+            first_offending_transaction=first_offending
+        )
+    
+    def _transaction_amount(self, msg_type: MessageType, transaction) -> Tuple[str, int]:
+        if msg_type == MessageType.PACS_008:
+            amount, name = _find(transaction, "IntrBkSttlmAmt"), "IntrBkSttlmAmt"
+        else:
+            amount, name = _find(transaction, "Amt", "InstdAmt"), "Amt/InstdAmt"
+            if amount is None:
+                amount, name = _find(transaction, "Amt", "EqvtAmt", "Amt"), "Amt/EqvtAmt/Amt"
+        if amount is None:
+            raise ValueError(f"Missing required element: {name}")
+        ccy = amount.get("Ccy", "")
+        if not _ISO_CURRENCY.match(ccy):
+            raise ValueError(f"{name} has invalid currency code '{ccy}'")
+        return ccy, to_minor_units(_text(amount), ccy)
+    
+    def _batch_controls(
+        self,
+        count: Optional[str],
+        ctrl_sum: Optional[str],
+        report,
+        label: str
+    ) -> Dict[str, Any]:
+        """Parsed NbOfTxs/CtrlSum of a GrpHdr or PmtInf block (absent ones are left out)"""
+        controls: Dict[str, Any] = {}
+        if count is not None:
+            if count.isdigit():
+                controls["count"] = int(count)
+            else:
+                report(f"{label}: NbOfTxs '{count}' is not a number")
+        if ctrl_sum is not None:
+            scaled = _scaled(ctrl_sum, _CTRL_SUM_SCALE) if _ISO_DECIMAL.match(ctrl_sum) else None
+            if scaled is None:
+                report(f"{label}: CtrlSum '{ctrl_sum}' is not a valid amount sum")
+            else:
+                controls["ctrl_sum"] = (ctrl_sum, scaled)
+        return controls
+    
+    def _compare_controls(self, controls: Dict[str, Any], count: int, scaled_sum: int, label: str) -> List[str]:
+        errors = []
+        if "count" in controls and controls["count"] != count:
+            errors.append(f"{label}: NbOfTxs {controls['count']} != {count} transactions")
+        if "ctrl_sum" in controls and controls["ctrl_sum"][1] != scaled_sum:
+            errors.append(f"{label}: CtrlSum {controls['ctrl_sum'][0]} != transactions {_format_scaled(scaled_sum)}")
+        return errors
+    
     # ==================== SWIFT MT Validation ====================
     
     def verify_swift_mt(
@@ -206,6 +1211,9 @@ class MessageGuard:
         """
         Verify legacy SWIFT MT message format.
         
+        Accepts a FIN message with its {1:}{2:}...{4:...-} blocks or just
+        the text block fields; multi-line field values are supported.
+        
         Args:
             mt_string: The MT message to validate
             mt_type: Expected message type (MT103, MT202, etc.)
@@ -213,62 +1221,204 @@ class MessageGuard:
         Returns:
             MessageResult with validation status
         """
-        errors = []
-        warnings = []
+        text = mt_string.strip()
+        if not text.startswith("{"):
+            return self._check_mt_message({"4": text}, [], mt_type, framed=False)
         
-        # Parse fields from MT message
-        fields = self._parse_mt_fields(mt_string)
+        messages = list(self._fin_messages([text]))
+        _, blocks, problems = messages[0]
+        result = self._check_mt_message(blocks, problems, mt_type)
+        if len(messages) > 1:
+            result.warnings.append(f"{len(messages)} messages found, only the first was validated")
+        return result
+    
+    def verify_swift_mt_stream(
+        self,
+        source: Union[str, "os.PathLike[str]", BinaryIO, TextIO],
+        mt_type: Optional[SwiftMtType] = None,
+        chunk_size: int = 1 << 16
+    ) -> Iterator[MessageResult]:
+        """
+        Verify every message of a SWIFT MT (FIN) file, one at a time.
         
-        # Get required fields for this message type
-        if mt_type == SwiftMtType.MT103:
-            required = self.mt103_required_fields
-        elif mt_type == SwiftMtType.MT202:
-            required = self.mt202_required_fields
-        else:
-            required = {"20": "Transaction Reference"}  # Minimal
+        The file is read in chunks and split into messages by their block
+        structure, so memory stays bounded by the largest single message.
+        Each message is validated against its type from block 2, using the
+        compiled field rules shared by all MT types.
         
-        # Check required fields
-        for field_tag, field_name in required.items():
-            if field_tag not in fields:
-                errors.append(f"Missing required field {field_tag}: {field_name}")
+        Args:
+            source: File path, or binary or text file-like object
+            mt_type: Expected type of every message (None: any type)
+            chunk_size: Characters read at a time
+            
+        Yields:
+            MessageResult per message, in file order; details holds its
+            1-based position, character offset and field 20 reference
+        """
+        for position, (offset, blocks, problems) in enumerate(
+            self._fin_messages(self._read_chunks(source, chunk_size)), 1
+        ):
+            result = self._check_mt_message(blocks, problems, mt_type)
+            result.details["position"] = position
+            result.details["offset"] = offset
+            yield result
+    
+    def _read_chunks(self, source, chunk_size: int) -> Iterator[str]:
+        """Decoded text of a path or file object, chunk_size at a time"""
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                yield from self._read_chunks(f, chunk_size)
+            return
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        yield decoder.decode(b"", final=True)
+    
+    def _fin_messages(self, chunks: Iterable[str]) -> Iterator[Tuple[int, Dict[str, str], List[str]]]:
+        """
+        Split FIN text into messages.
         
-        # Validate field formats
-        if "32A" in fields:
-            # Format: YYMMDDCCY######.## (Date + Currency + Amount)
-            if not self._validate_32a_field(fields["32A"]):
-                errors.append("Field 32A has invalid format (expected: YYMMDDCCY + Amount)")
+        Top-level {id:...} blocks are matched whole (blocks 3 and 5 nest one
+        level); a block id not after the previous one starts a new message.
+        Whitespace, "$" and SOH/ETX between messages are skipped.
+        
+        Yields:
+            (character offset, block contents by id, framing errors) per message
+        """
+        blocks: Dict[str, str] = {}
+        problems: List[str] = []
+        start = rank = 0
+        base = 0        # absolute offset of buffer[0]
+        buffer = ""
         
-        if "20" in fields:
-            # Transaction reference: max 16 characters
-            if len(fields["20"]) > 16:
-                errors.append("Field 20 exceeds maximum length of 16 characters")
+        def gap(text: str) -> None:
+            if text.strip(_FIN_SEPARATORS) and problems[-1:] != ["Unexpected text between blocks"]:
+                problems.append("Unexpected text between blocks")
         
+        for chunk in chunks:
+            buffer += chunk
+            consumed = 0
+            waiting = len(buffer)   # start of a block still open at the end of the chunk
+            for match in _FIN_BLOCK.finditer(buffer):
+                opening = buffer.find("{", consumed, match.start())
+                if opening >= 0 and _fin_block_open(buffer, opening):
+                    # The match is nested in a block the next chunk completes
+                    waiting = opening
+                    break
+                if match.start() > consumed:
+                    gap(buffer[consumed:match.start()])
+                consumed = match.end()
+                block_id, content = match.groups()
+                order = _FIN_BLOCK_ORDER.get(block_id)
+                if order is None:
+                    problems.append(f"Unknown block '{{{block_id[:8]}'")
+                    continue
+                if blocks and order <= rank:
+                    yield start, blocks, problems
+                    blocks, problems = {}, []
+                if not blocks:
+                    start = base + match.start()
+                blocks[block_id] = content
+                rank = order
+            else:
+                opening = buffer.find("{", consumed)
+                if opening >= 0 and _fin_block_open(buffer, opening):
+                    waiting = opening
+            
+            if len(buffer) - waiting > _MAX_FIN_BLOCK:
+                problems.append(f"Block '{buffer[waiting:waiting + 3]}' is malformed or exceeds {_MAX_FIN_BLOCK} characters")
+                waiting = len(buffer)
+            gap(buffer[consumed:waiting])
+            buffer = buffer[waiting:]
+            base += waiting
+        
+        if buffer:
+            problems.append(f"Unterminated block '{buffer[:3]}'")
+        if blocks or problems:
+            yield start, blocks, problems
+    
+    def _check_mt_message(
+        self,
+        blocks: Dict[str, str],
+        problems: List[str],
+        expected: Optional[SwiftMtType],
+        framed: bool = True
+    ) -> MessageResult:
+        """Validate one message's headers and text block against its compiled rules"""
+        errors = list(problems)
+        warnings: List[str] = []
+        message_type = expected.value if expected else None
+        
+        if framed:
+            if "1" not in blocks:
+                warnings.append("Missing block 1 (basic header)")
+            elif not _FIN_BASIC_HEADER.match(blocks["1"]):
+                errors.append("Block 1 (basic header) has invalid format")
+            header = _FIN_APP_HEADER.match(blocks.get("2", ""))
+            if "2" not in blocks:
+                warnings.append("Missing block 2 (application header)")
+            elif header is None:
+                errors.append("Block 2 (application header) has invalid format")
+            else:
+                declared = f"MT{header.group(1)}"
+                if expected and declared != expected.value:
+                    errors.append(f"Block 2 declares {declared}, expected {expected.value}")
+                message_type = declared
+        message_type = message_type or "MT"
+        
+        fields: List[Tuple[str, str]] = []
+        if "4" not in blocks:
+            errors.append("Missing block 4 (text block)")
+        else:
+            fields, text_errors = self._split_mt_fields(blocks["4"], framed)
+            errors.extend(text_errors)
+        
+        validator = self.mt_validators.get(message_type, self._mt_generic_validator)
+        if validator is self._mt_generic_validator and message_type != "MT":
+            warnings.append(f"No field rules for {message_type}; checked field formats only")
+        field_errors, field_warnings = validator.check(message_type, fields)
+        errors.extend(field_errors)
+        warnings.extend(field_warnings)
+        
+        reference = next((value for tag, value in fields if tag == "20"), None)
         return MessageResult(
             valid=len(errors) == 0,
-            message_type=mt_type.value,
+            message_type=message_type,
             errors=errors,
             warnings=warnings,
-            field_count=len(fields)
+            field_count=len(fields),
+            details={"reference": reference}
         )
     
-    def _parse_mt_fields(self, mt_string: str) -> Dict[str, str]:
-        """Parse SWIFT MT message into field dictionary"""
-        fields = {}
-        
-        # SWIFT MT format: :20:value or :32A:YYMMDDCCY######
-        pattern = r':(\d{2}[A-Z]?):([^\r\n:]+)'
-        matches = re.findall(pattern, mt_string)
-        
-        for tag, value in matches:
-            fields[tag] = value.strip()
+    def _split_mt_fields(self, text: str, framed: bool = True) -> Tuple[List[Tuple[str, str]], List[str]]:
+        """
+        (tag, value) pairs of a text block, in order; repeated tags are kept.
         
-        return fields
+        A field runs until the next line starting with ":tag:", so
+        multi-line values keep their line breaks (as "\n").
+        """
+        errors: List[str] = []
+        body = text.replace("\r\n", "\n").rstrip()
+        if body.endswith("\n-") or body == "-":
+            body = body[:-1]
+        elif framed:
+            errors.append("Block 4 (text block) must end with '-'")
+        parts = _MT_FIELD.split(body)
+        if parts[0].strip():
+            errors.append("Block 4 (text block) has text before its first field")
+        fields = [(parts[i], parts[i + 1].strip()) for i in range(1, len(parts), 2)]
+        return fields, errors
     
-    def _validate_32a_field(self, value: str) -> bool:
-        """Validate Field 32A: Value Date/Currency/Amount"""
-        # Format: YYMMDDCCY######.## (e.g., 260118USD1000,00)
-        pattern = r'^\d{6}[A-Z]{3}[\d,\.]+$'
-        return bool(re.match(pattern, value.replace(" ", "")))
+    def _parse_mt_fields(self, mt_string: str) -> Dict[str, str]:
+        """Parse SWIFT MT message into field dictionary"""
+        text = mt_string.strip()
+        if text.startswith("{"):
+            blocks = next(self._fin_messages([text]), (0, {}, []))[1]
+            text = blocks.get("4", "")
+        return dict(self._split_mt_fields(text, framed=False)[0])
     
     # ==================== BIC/IBAN Validation ====================
     
@@ -278,9 +1428,7 @@ class MessageGuard:
         
         BIC format: 4 letters (bank) + 2 letters (country) + 2 alphanumeric (location) + optional 3 (branch)
         """
-        # BIC regex: 4 letters + 2 letters + 2 alphanum + optional 3 alphanum
-        pattern = r'^[A-Z]{4}[A-Z]{2}[A-Z0-9]{2}([A-Z0-9]{3})?$'
-        is_valid = bool(re.match(pattern, bic.upper()))
+        is_valid = bic_verdict(bic) == IdentifierVerdict.VALID
         
         verified = (llm_says_valid == is_valid)
         
@@ -299,22 +1447,18 @@ class MessageGuard:
         """
         Verify IBAN (International Bank Account Number) format and checksum.
         
-        IBAN: 2 letters (country) + 2 digits (check) + up to 30 alphanumeric (BBAN)
+        IBAN: 2 letters (country) + 2 check digits + BBAN, with the length and
+        BBAN structure registered for the country, and a MOD 97 checksum of 1
         """
-        iban_clean = iban.replace(" ", "").upper()
-        
-        # Basic format check
-        if not re.match(r'^[A-Z]{2}\d{2}[A-Z0-9]{1,30}$', iban_clean):
-            is_valid = False
-        else:
-            # Checksum validation (MOD 97)
-            is_valid = self._validate_iban_checksum(iban_clean)
+        verdict = iban_verdict(iban)
+        is_valid = verdict == IdentifierVerdict.VALID
         
         verified = (llm_says_valid == is_valid)
         
         errors = []
         if not verified:
-            errors.append(f"IBAN '{iban}' is {'valid' if is_valid else 'invalid'}, but LLM said {'valid' if llm_says_valid else 'invalid'}")
+            reason = "" if is_valid else f" ({verdict.name.lower().replace('_', ' ')})"
+            errors.append(f"IBAN '{iban}' is {'valid' if is_valid else 'invalid'}{reason}, but LLM said {'valid' if llm_says_valid else 'invalid'}")
         
         return MessageResult(
             valid=verified,
@@ -325,16 +1469,4 @@ class MessageGuard:
     
     def _validate_iban_checksum(self, iban: str) -> bool:
         """Validate IBAN using MOD 97 checksum"""
-        # Rearrange: move first 4 chars to end
-        rearranged = iban[4:] + iban[:4]
-        
-        # Convert letters to numbers (A=10, B=11, ..., Z=35)
-        numeric = ""
-        for char in rearranged:
-            if char.isalpha():
-                numeric += str(ord(char) - ord('A') + 10)
-            else:
-                numeric += char
-        
-        # Check if mod 97 == 1
-        return int(numeric) % 97 == 1
+        return iban_mod97(iban) == 1
@@ -0,0 +1,686 @@
+"""
+Sanctions - Compiled sanctions-list screening
+Aho-Corasick automaton over normalized names, shared by every guard
+
+A sanctions list is compiled once per list version into a multi-pattern
+automaton; screening a text then takes one pass over its characters,
+however many names the list holds. A q-gram blocked fuzzy index catches
+typos and transliterations the exact automaton misses.
+"""
+
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import unicodedata
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .sanctions_store import SanctionsStore
+
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def normalize_name(text: str) -> str:
+    """
+    Canonical form used for matching names.
+
+    Accents are stripped, case is folded and every run of punctuation or
+    whitespace becomes a single space ("Al-Qa'ida" → "al qa ida").
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _SEPARATORS.sub(" ", stripped.casefold()).strip()
+
+
+def _list_digest(normalized_names: Iterable[str]) -> str:
+    """Version stamp derived from the list contents"""
+    digest = hashlib.sha256("\x00".join(sorted(normalized_names)).encode("utf-8"))
+    return f"sha256:{digest.hexdigest()[:16]}"
+
+
+def _code(text: str) -> int:
+    """Stable 64-bit code of a string (the same in every process, unlike hash())"""
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _pack(strings: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """UTF-8 blob and offsets holding a list of strings in two flat arrays"""
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], dtype=np.int64, out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8).copy(), offsets
+
+
+def _unpack(blob: np.ndarray, offsets: np.ndarray, i: int) -> str:
+    return blob[offsets[i]:offsets[i + 1]].tobytes().decode("utf-8")
+
+
+def _write_json(path: str, payload: dict) -> None:
+    """Replace a JSON file atomically, so readers see the old or the new one"""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp, path)
+
+
+@dataclass(frozen=True)
+class SanctionsMatch:
+    """A listed name found in a screened text (offsets into the normalized text)"""
+    name: str
+    start: int
+    end: int
+
+
+class SanctionsAutomaton:
+    """
+    Aho-Corasick automaton over a normalized sanctions list.
+
+    Transitions are kept in one dict keyed by (state << 21 | codepoint), so a
+    list of tens of thousands of names costs one entry per trie edge rather
+    than one dict per state. Failure links are resolved at build time and
+    each state carries every listed name that ends there, so search is a
+    single left-to-right pass over the text.
+
+    Use compile_sanctions_list() to obtain instances: automata are cached
+    per list version and shared by CrossGuard and UCPIntegration.
+    """
+
+    def __init__(self, names: Iterable[str], version: Optional[str] = None):
+        """
+        Compile a sanctions list.
+
+        Args:
+            names: Sanctioned entity names
+            version: List version stamp (defaults to a digest of the names)
+        """
+        self.names: Tuple[str, ...] = tuple(names)
+        self._patterns: Dict[str, List[str]] = {}
+        for name in self.names:
+            key = normalize_name(name)
+            if key:
+                self._patterns.setdefault(key, []).append(name)
+        self.version = version or self._digest()
+        self._goto: Dict[int, int] = {}
+        self._fail: List[int] = [0]
+        self._output: Dict[int, Tuple[str, ...]] = {}
+        self._build()
+        # Reverse containment (text inside a listed name) is one C-level scan
+        self._joined = "\x00" + "\x00".join(self._patterns) + "\x00"
+
+    def _digest(self) -> str:
+        return _list_digest(self._patterns)
+
+    def _build(self) -> None:
+        goto = self._goto
+        for pattern in self._patterns:
+            state = 0
+            for ch in pattern:
+                key = state << 21 | ord(ch)
+                nxt = goto.get(key)
+                if nxt is None:
+                    nxt = len(self._fail)
+                    goto[key] = nxt
+                    self._fail.append(0)
+                state = nxt
+            self._output[state] = (pattern,)
+
+        # Breadth-first: a state's failure link is settled before its children's
+        children: Dict[int, List[Tuple[int, int]]] = {}
+        for key, nxt in goto.items():
+            children.setdefault(key >> 21, []).append((key & 0x1FFFFF, nxt))
+        queue = deque(nxt for _, nxt in children.get(0, ()))
+        while queue:
+            state = queue.popleft()
+            for code, nxt in children.get(state, ()):
+                fail = self._fail[state]
+                while fail and (fail << 21 | code) not in goto:
+                    fail = self._fail[fail]
+                self._fail[nxt] = goto.get(fail << 21 | code, 0)
+                inherited = self._output.get(self._fail[nxt])
+                if inherited:
+                    self._output[nxt] = self._output.get(nxt, ()) + inherited
+                queue.append(nxt)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def state_count(self) -> int:
+        return len(self._fail)
+
+    def search(self, text: str) -> List[SanctionsMatch]:
+        """
+        Every listed name occurring in the text, in order of their end offset.
+
+        Args:
+            text: Free text or an entity name (normalized before matching)
+
+        Returns:
+            One SanctionsMatch per occurrence (original listed spelling)
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        matches = []
+        state = 0
+        for i, ch in enumerate(normalize_name(text)):
+            code = ord(ch)
+            while state and (state << 21 | code) not in goto:
+                state = fail[state]
+            state = goto.get(state << 21 | code, 0)
+            for pattern in output.get(state, ()):
+                for name in self._patterns[pattern]:
+                    matches.append(SanctionsMatch(name, i + 1 - len(pattern), i + 1))
+        return matches
+
+    def screen(self, entity: str, bidirectional: bool = False) -> List[str]:
+        """
+        Listed names an entity hits, without duplicates.
+
+        Args:
+            entity: Entity name to screen
+            bidirectional: Also hit when the entity is contained in a listed
+                name (e.g. a name truncated to fit a SWIFT field)
+
+        Returns:
+            Matched listed names (empty if the entity is clear)
+        """
+        hits = list(dict.fromkeys(m.name for m in self.search(entity)))
+        if bidirectional and not hits:
+            key = normalize_name(entity)
+            position = self._joined.find(key) if key else -1
+            if position >= 0:
+                start = self._joined.rfind("\x00", 0, position) + 1
+                end = self._joined.find("\x00", position)
+                hits.extend(self._patterns[self._joined[start:end]])
+        return hits
+
+
+SanctionsList = Union[Sequence[str], SanctionsAutomaton, "SanctionsStore"]
+
+
+# ==================== Shared Automata ====================
+
+_CACHE_SIZE = 8
+_automata: "OrderedDict[tuple, SanctionsAutomaton]" = OrderedDict()
+_automata_lock = threading.Lock()
+
+
+def compile_sanctions_list(
+    sanctions_list: SanctionsList,
+    version: Optional[str] = None
+) -> SanctionsAutomaton:
+    """
+    Shared automaton for a sanctions list, compiled once per list version.
+
+    An unversioned list is looked up by its contents, so a list changed in
+    place is always recompiled; the lookup costs a pass over every name. On
+    hot paths pass the compiled automaton, a SanctionsStore, or a version
+    stamp instead.
+
+    Args:
+        sanctions_list: Sanctioned names, an already compiled automaton, or
+            a SanctionsStore (its automaton for the current version)
+        version: List version stamp; when given it is the cache key, so a
+            new version of the list must carry a new stamp
+
+    Returns:
+        SanctionsAutomaton (the same instance for the same list)
+    """
+    from .sanctions_store import SanctionsStore
+
+    if isinstance(sanctions_list, SanctionsAutomaton):
+        return sanctions_list
+    if isinstance(sanctions_list, SanctionsStore):
+        return sanctions_list.automaton
+    key = ("version", version) if version is not None else ("names", tuple(sanctions_list))
+    with _automata_lock:
+        automaton = _automata.get(key)
+        if automaton is not None:
+            _automata.move_to_end(key)
+            return automaton
+    automaton = SanctionsAutomaton(sanctions_list, version)
+    with _automata_lock:
+        _automata[key] = automaton
+        _automata.move_to_end(key)
+        while len(_automata) > _CACHE_SIZE:
+            _automata.popitem(last=False)
+    return automaton
+
+
+# ==================== Fuzzy Matching ====================
+
+class MatchAlgorithm(Enum):
+    """Similarity used to score fuzzy name candidates"""
+    LEVENSHTEIN = "levenshtein"      # 1 - edits / longer length
+    JARO_WINKLER = "jaro_winkler"
+
+
+@dataclass(frozen=True)
+class FuzzyMatch:
+    """A listed name close to a screened entity"""
+    name: str
+    score: float
+    algorithm: str
+
+
+def bounded_levenshtein(a: str, b: str, max_distance: int) -> int:
+    """
+    Edit distance between two strings, computed only within a band.
+
+    Returns:
+        The distance if it is at most max_distance, else max_distance + 1
+    """
+    big = max_distance + 1
+    la, lb = len(a), len(b)
+    if abs(la - lb) > max_distance:
+        return big
+    prev = [j if j <= max_distance else big for j in range(lb + 1)]
+    for i in range(1, la + 1):
+        lo, hi = max(1, i - max_distance), min(lb, i + max_distance)
+        cur = [big] * (lb + 1)
+        cur[0] = i if i <= max_distance else big
+        row_min = cur[0]
+        ca = a[i - 1]
+        for j in range(lo, hi + 1):
+            v = prev[j - 1] if ca == b[j - 1] else prev[j - 1] + 1
+            if prev[j] + 1 < v:
+                v = prev[j] + 1
+            if cur[j - 1] + 1 < v:
+                v = cur[j - 1] + 1
+            cur[j] = v if v < big else big
+            if v < row_min:
+                row_min = v
+        if row_min > max_distance:
+            return big
+        prev = cur
+    return prev[lb]
+
+
+def jaro_winkler(a: str, b: str, prefix_scale: float = 0.1) -> float:
+    """Jaro-Winkler similarity (common prefix of up to 4 characters boosted)."""
+    if a == b:
+        return 1.0
+    la, lb = len(a), len(b)
+    if not la or not lb:
+        return 0.0
+    window = max(max(la, lb) // 2 - 1, 0)
+    a_matched = [False] * la
+    b_matched = [False] * lb
+    matches = 0
+    for i, ch in enumerate(a):
+        for j in range(max(0, i - window), min(i + window + 1, lb)):
+            if not b_matched[j] and b[j] == ch:
+                a_matched[i] = b_matched[j] = True
+                matches += 1
+                break
+    if not matches:
+        return 0.0
+    transpositions = 0
+    j = 0
+    for i in range(la):
+        if a_matched[i]:
+            while not b_matched[j]:
+                j += 1
+            if a[i] != b[j]:
+                transpositions += 1
+            j += 1
+    jaro = (matches / la + matches / lb + (matches - transpositions / 2) / matches) / 3
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * prefix_scale * (1 - jaro)
+
+
+class FuzzyNameIndex:
+    """
+    Fuzzy name-matching index over a sanctions list.
+    
+    Names are blocked on padded character q-grams stored as one CSR
+    posting array (each repeat of a q-gram is a distinct key, so gram sets
+    count like multisets), and each name keeps a folded character
+    histogram. A query narrows the list in NumPy before any string is
+    scored in Python:
+    
+    1. Prefix filter: only the rarest posting lists of the query's q-grams
+       generate candidates (see _candidates).
+    2. Histogram bound: the character histograms bound the edit distance
+       from below and the Jaro-Winkler score from above.
+    3. Count filter: the remaining q-grams are counted for the survivors.
+    
+    For Levenshtein every step is lossless, so every name within the
+    threshold is scored with a banded edit distance. Jaro-Winkler tolerates
+    more than edit distance does, so its candidates are blocked as for an
+    edit similarity 0.1 below the threshold (never below 0.7) and only the
+    max_candidates sharing the most q-grams are scored; that blocking is
+    heuristic, not lossless.
+    """
+    
+    _BUCKETS = 32
+    _JW_BLOCKING = 0.1      # Jaro-Winkler blocks at edit similarity threshold - 0.1
+    _FORMAT = 1
+    _ARRAYS = (
+        "key_bytes", "key_offsets", "name_bytes", "name_offsets", "key_names",
+        "key_codes", "key_order", "lengths", "histograms", "gram_codes", "offsets", "postings",
+    )
+    
+    def __init__(
+        self,
+        names: Iterable[str],
+        threshold: float = 0.85,
+        algorithm: MatchAlgorithm = MatchAlgorithm.LEVENSHTEIN,
+        q: int = 3,
+        max_candidates: int = 16,
+        version: Optional[str] = None
+    ):
+        """
+        Build the index.
+        
+        Args:
+            names: Sanctioned entity names
+            threshold: Minimum similarity for a match (0.7 to 1.0)
+            algorithm: Similarity used to score candidates
+            q: q-gram length for blocking
+            max_candidates: Jaro-Winkler candidates scored per query
+            version: List version stamp (defaults to a digest of the names)
+        """
+        if q < 2:
+            raise ValueError(f"q must be >= 2, got {q}")
+        self._configure(threshold, algorithm, max_candidates)
+        self.q = q
+        
+        patterns: Dict[str, List[str]] = {}
+        for name in names:
+            key = normalize_name(name)
+            if key:
+                patterns.setdefault(key, []).append(name)
+        keys = list(patterns)
+        self.version = version or _list_digest(patterns)
+        
+        self._key_bytes, self._key_offsets = _pack(keys)
+        self._name_bytes, self._name_offsets = _pack([n for key in keys for n in patterns[key]])
+        self._key_names = np.zeros(len(keys) + 1, dtype=np.int64)
+        np.cumsum([len(patterns[key]) for key in keys], dtype=np.int64, out=self._key_names[1:])
+        key_codes = np.fromiter((_code(key) for key in keys), dtype=np.uint64, count=len(keys))
+        self._key_order = np.argsort(key_codes, kind="stable")
+        self._key_codes = key_codes[self._key_order]
+        self._lengths = np.fromiter((len(k) for k in keys), dtype=np.int64, count=len(keys))
+        
+        codes = np.frombuffer("".join(keys).encode("utf-32-le"), dtype=np.uint32)
+        owner = np.repeat(np.arange(len(keys), dtype=np.int64), self._lengths)
+        self._histograms = np.bincount(
+            owner * self._BUCKETS + codes % self._BUCKETS,
+            minlength=len(keys) * self._BUCKETS
+        ).astype(np.int16).reshape(len(keys), self._BUCKETS)
+        
+        gram_ids: Dict[str, int] = {}
+        gram_column: List[int] = []
+        name_column: List[int] = []
+        for i, key in enumerate(keys):
+            for gram in self._grams(key):
+                gram_column.append(gram_ids.setdefault(gram, len(gram_ids)))
+                name_column.append(i)
+        # Posting lists are ordered by gram code, so a query finds its lists
+        # by binary search instead of through a per-process dictionary
+        gram_codes = np.fromiter((_code(g) for g in gram_ids), dtype=np.uint64, count=len(gram_ids))
+        rank = np.empty(len(gram_ids), dtype=np.int64)
+        rank[np.argsort(gram_codes, kind="stable")] = np.arange(len(gram_ids))
+        grams = rank[np.asarray(gram_column, dtype=np.int64)]
+        order = np.argsort(grams, kind="stable")
+        self._gram_codes = np.sort(gram_codes)
+        self._postings = np.asarray(name_column, dtype=np.int32)[order]
+        self._offsets = np.zeros(len(gram_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(grams, minlength=len(gram_ids)), out=self._offsets[1:])
+    
+    def _configure(self, threshold: float, algorithm: MatchAlgorithm, max_candidates: int) -> None:
+        if not 0.7 <= threshold <= 1.0:
+            raise ValueError(f"threshold must be in [0.7, 1.0], got {threshold}")
+        self.threshold = threshold
+        self.algorithm = algorithm
+        self.max_candidates = max_candidates
+    
+    # ==================== Persistence ====================
+    
+    def save(self, directory: str) -> None:
+        """
+        Write the index as one .npy file per array plus an index.json header.
+        
+        The header is written last, so a directory without one is incomplete.
+        Matching parameters (threshold, algorithm) are not part of the file;
+        the same arrays serve any of them.
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name in self._ARRAYS:
+            np.save(os.path.join(directory, f"{name}.npy"), getattr(self, f"_{name}"))
+        header = {"format": self._FORMAT, "q": self.q, "version": self.version, "names": len(self)}
+        _write_json(os.path.join(directory, "index.json"), header)
+    
+    @classmethod
+    def load(
+        cls,
+        directory: str,
+        threshold: float = 0.85,
+        algorithm: MatchAlgorithm = MatchAlgorithm.LEVENSHTEIN,
+        max_candidates: int = 16,
+        mmap: bool = True
+    ) -> "FuzzyNameIndex":
+        """
+        Open a saved index.
+        
+        Args:
+            directory: Directory written by save()
+            threshold: Minimum similarity for a match (0.7 to 1.0)
+            algorithm: Similarity used to score candidates
+            max_candidates: Jaro-Winkler candidates scored per query
+            mmap: Map the arrays read-only instead of reading them, so
+                processes opening the same files share one copy in the page cache
+            
+        Returns:
+            FuzzyNameIndex backed by the saved arrays
+        """
+        with open(os.path.join(directory, "index.json"), encoding="utf-8") as f:
+            header = json.load(f)
+        if header.get("format") != cls._FORMAT:
+            raise ValueError(f"Unsupported sanctions index format: {header.get('format')}")
+        index = cls.__new__(cls)
+        index._configure(threshold, algorithm, max_candidates)
+        index.q = header["q"]
+        index.version = header["version"]
+        for name in cls._ARRAYS:
+            path = os.path.join(directory, f"{name}.npy")
+            setattr(index, f"_{name}", np.load(path, mmap_mode="r" if mmap else None))
+        return index
+    
+    # ==================== Lookup ====================
+    
+    def __len__(self) -> int:
+        return len(self._name_offsets) - 1
+    
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Listed names, grouped by normalized spelling"""
+        return tuple(_unpack(self._name_bytes, self._name_offsets, i) for i in range(len(self)))
+    
+    def _key(self, i: int) -> str:
+        return _unpack(self._key_bytes, self._key_offsets, i)
+    
+    def _names_of(self, i: int) -> List[str]:
+        start, stop = int(self._key_names[i]), int(self._key_names[i + 1])
+        return [_unpack(self._name_bytes, self._name_offsets, j) for j in range(start, stop)]
+    
+    def _find(self, key: str) -> Optional[int]:
+        """Index of a normalized spelling, if listed"""
+        code = np.uint64(_code(key))
+        lo = int(np.searchsorted(self._key_codes, code))
+        while lo < len(self._key_codes) and self._key_codes[lo] == code:
+            i = int(self._key_order[lo])
+            if self._key(i) == key:
+                return i
+            lo += 1
+        return None
+    
+    def _grams(self, key: str) -> List[str]:
+        # Repeats of a q-gram are numbered, so gram sets count like multisets
+        padded = "\x02" * (self.q - 1) + key + "\x03" * (self.q - 1)
+        seen: Dict[str, int] = {}
+        grams = []
+        for i in range(len(padded) - self.q + 1):
+            gram = padded[i:i + self.q]
+            n = seen.get(gram, 0)
+            seen[gram] = n + 1
+            grams.append(f"{gram}\x00{n}")
+        return grams
+    
+    def _histogram(self, key: str) -> np.ndarray:
+        codes = np.frombuffer(key.encode("utf-32-le"), dtype=np.uint32)
+        return np.bincount(codes % self._BUCKETS, minlength=self._BUCKETS).astype(np.int16)
+    
+    def _min_shared(self, la: int, slack: float) -> int:
+        """
+        Fewest q-grams a key of length la shares with any name in reach.
+        
+        The count required at longer length L is L + q - 1 - q*floor(slack*L).
+        It falls as L grows whenever q*slack > 1, so the minimum is taken over
+        every L the length bound admits, not at the key length alone.
+        """
+        q = self.q
+        if slack >= 1.0:
+            return 1
+        longest = math.floor(la / (1.0 - slack) + 1e-9)
+        required = min(
+            length + q - 1 - q * math.floor(slack * length + 1e-9)
+            for length in range(la, max(la, longest) + 1)
+        )
+        return max(1, required)
+    
+    def _candidates(self, key: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Names that survive blocking and the histogram and count filters.
+        
+        A name within edit budget k of the key shares at least
+        max(len) + q - 1 - q*k of its q-grams. With T the smallest such
+        count over all name lengths, any qualifying name shares one of the
+        key's G - T + 1 rarest q-grams, so only those posting lists generate
+        candidates. The remaining q-grams are counted for the survivors
+        alone, rarest first, by binary search in their sorted posting lists;
+        names that can no longer reach their count are dropped between lists.
+        
+        Returns:
+            (candidate name indices, q-grams shared with the key)
+        """
+        levenshtein = self.algorithm == MatchAlgorithm.LEVENSHTEIN
+        q, la = self.q, len(key)
+        slack = 1.0 - (self.threshold if levenshtein else max(0.7, self.threshold - self._JW_BLOCKING))
+        min_shared = self._min_shared(la, slack)
+        
+        if not len(self._gram_codes):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        grams = self._grams(key)
+        codes = np.fromiter((_code(g) for g in grams), dtype=np.uint64, count=len(grams))
+        found = np.minimum(np.searchsorted(self._gram_codes, codes), len(self._gram_codes) - 1)
+        offsets, postings = self._offsets, self._postings
+        ids = found.tolist()
+        sizes = np.where(self._gram_codes[found] == codes, offsets[found + 1] - offsets[found], 0).tolist()
+        order = sorted(range(len(ids)), key=sizes.__getitem__)
+        n_prefix = len(ids) - min_shared + 1
+        parts = [postings[offsets[ids[i]]:offsets[ids[i] + 1]] for i in order[:n_prefix] if sizes[i]]
+        if not parts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        hits = np.concatenate(parts)
+        
+        # Length bound first: it needs no per-name data beyond the length
+        hit_lengths = self._lengths[hits]
+        hits = hits[np.abs(hit_lengths - la) <= np.floor(slack * np.maximum(hit_lengths, la) + 1e-9)]
+        if len(hits) * 16 < len(self._lengths):
+            candidates, shared = np.unique(hits, return_counts=True)
+        else:
+            counts = np.bincount(hits, minlength=len(self._lengths))
+            candidates = np.flatnonzero(counts)
+            shared = counts[candidates]
+        
+        # Each edit changes at most one character on each side, so the
+        # larger one-sided histogram surplus bounds the distance from below
+        lengths = self._lengths[candidates]
+        difference = np.abs(self._histograms[candidates] - self._histogram(key)).sum(axis=1, dtype=np.int64)
+        longest = np.maximum(lengths, la)
+        budget = np.floor(slack * longest + 1e-9).astype(np.int64)
+        keep = (difference + np.abs(lengths - la)) // 2 <= budget
+        if not levenshtein:
+            # Jaro matches pair equal characters, so they cannot exceed the common histogram
+            common = (la + lengths - difference) // 2
+            jaro_max = (common / la + common / lengths + 1.0) / 3.0
+            keep &= jaro_max + 0.4 * (1.0 - jaro_max) >= self.threshold - 1e-12
+        required = longest + q - 1 - q * budget
+        
+        rest = order[n_prefix:]
+        keep &= shared + len(rest) >= required
+        for n, i in enumerate(rest):
+            candidates, shared, required = candidates[keep], shared[keep], required[keep]
+            if not len(candidates):
+                return candidates, shared
+            if sizes[i]:
+                posting = postings[offsets[ids[i]]:offsets[ids[i] + 1]]
+                found = np.minimum(np.searchsorted(posting, candidates), len(posting) - 1)
+                shared += posting[found] == candidates
+            keep = shared + (len(rest) - n - 1) >= required
+        return candidates[keep], shared[keep]
+    
+    def matches(self, entity: str, limit: int = 5) -> List[FuzzyMatch]:
+        """
+        Listed names similar to an entity, best first.
+        
+        Args:
+            entity: Entity name to screen
+            limit: Maximum number of matches returned
+            
+        Returns:
+            FuzzyMatch per listed spelling scoring at least the threshold
+        """
+        key = normalize_name(entity)
+        if not key:
+            return []
+        # Exact spellings rank first, so they settle small limits without scoring
+        listed = self._find(key)
+        exact = self._names_of(listed) if listed is not None else []
+        if len(exact) >= limit:
+            return [FuzzyMatch(name, 1.0, self.algorithm.value) for name in exact[:limit]]
+        
+        candidates, shared = self._candidates(key)
+        scored: List[Tuple[float, int]] = []
+        if self.algorithm == MatchAlgorithm.LEVENSHTEIN:
+            for i in candidates.tolist():
+                other = self._key(i)
+                longest = max(len(key), len(other))
+                budget = int((1.0 - self.threshold) * longest + 1e-9)
+                distance = bounded_levenshtein(key, other, budget)
+                if distance <= budget:
+                    scored.append((1.0 - distance / longest, i))
+        else:
+            if len(candidates) > self.max_candidates:
+                candidates = candidates[np.argpartition(-shared, self.max_candidates - 1)[:self.max_candidates]]
+            for i in candidates.tolist():
+                scored.append((jaro_winkler(key, self._key(i)), i))
+        
+        scored = [(score, i) for score, i in scored if score >= self.threshold - 1e-12]
+        scored.sort(key=lambda item: (-item[0], self._key(item[1])))
+        found: List[FuzzyMatch] = []
+        for score, i in scored:
+            for name in self._names_of(i):
+                if len(found) == limit:
+                    return found
+                found.append(FuzzyMatch(name, round(score, 6), self.algorithm.value))
+        return found
+    
+    def best_match(self, entity: str) -> Optional[FuzzyMatch]:
+        """The closest listed name at or above the threshold, if any"""
+        found = self.matches(entity, limit=1)
+        return found[0] if found else None
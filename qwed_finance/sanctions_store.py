@@ -0,0 +1,275 @@
+"""
+Sanctions Store - Persistent compiled sanctions list
+Memory-mapped base index plus a small delta segment for daily updates
+
+A store is a directory:
+
+    MANIFEST.json      current version, segments and removed names
+    base-<gen>/        FuzzyNameIndex arrays for the full list
+    delta-<gen>/       names added since the base was built
+
+Worker processes open the store read-only and map the segment arrays, so
+the operating system keeps a single copy of them in the page cache however
+many processes screen against it. A daily delta rebuilds only the delta
+segment and swaps the manifest atomically; compact() folds everything back
+into a new base once the delta has grown. One writer at a time.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+import json
+import os
+import re
+import shutil
+
+from .sanctions import (
+    FuzzyMatch, FuzzyNameIndex, MatchAlgorithm, SanctionsAutomaton,
+    _write_json, normalize_name,
+)
+
+
+_SEGMENT = re.compile(r"^(base|delta)-\d+$")
+
+
+class SanctionsStore:
+    """
+    On-disk sanctions list shared read-only by worker processes.
+
+    Screens like a FuzzyNameIndex (matches, best_match) and like a
+    SanctionsAutomaton (screen), and can be passed wherever a sanctions
+    list is accepted. The version stamp of the current manifest is what
+    guards record in their receipts.
+    """
+
+    MANIFEST = "MANIFEST.json"
+    _FORMAT = 1
+
+    def __init__(
+        self,
+        path: str,
+        threshold: float = 0.85,
+        algorithm: MatchAlgorithm = MatchAlgorithm.LEVENSHTEIN,
+        max_candidates: int = 16
+    ):
+        """
+        Open an existing store.
+
+        Args:
+            path: Store directory (see create())
+            threshold: Minimum similarity for a fuzzy match (0.7 to 1.0)
+            algorithm: Similarity used to score fuzzy candidates
+            max_candidates: Jaro-Winkler candidates scored per query
+        """
+        self.path = path
+        self.threshold = threshold
+        self.algorithm = algorithm
+        self.max_candidates = max_candidates
+        self._generation: Optional[int] = None
+        self.refresh()
+
+    @classmethod
+    def create(
+        cls,
+        path: str,
+        names: Iterable[str],
+        version: str,
+        q: int = 3,
+        **options
+    ) -> "SanctionsStore":
+        """
+        Compile a full sanctions list into a new store.
+
+        Args:
+            path: Store directory (created if missing, must not hold a store)
+            names: Sanctioned entity names
+            version: List version stamp
+            q: q-gram length for blocking
+            **options: Matching parameters passed to the constructor
+
+        Returns:
+            SanctionsStore opened on the new directory
+        """
+        if os.path.exists(os.path.join(path, cls.MANIFEST)):
+            raise ValueError(f"A sanctions store already exists at {path}")
+        os.makedirs(path, exist_ok=True)
+        base = FuzzyNameIndex(names, q=q, version=version)
+        base.save(os.path.join(path, "base-1"))
+        _write_json(os.path.join(path, cls.MANIFEST), {
+            "format": cls._FORMAT,
+            "version": version,
+            "generation": 1,
+            "base": "base-1",
+            "delta": None,
+            "removed": [],
+            "names": len(base),
+        })
+        return cls(path, **options)
+
+    def refresh(self) -> bool:
+        """
+        Pick up the current manifest, mapping new segments if it changed.
+
+        Returns:
+            True if the store moved to a new version
+        """
+        manifest_path = os.path.join(self.path, self.MANIFEST)
+        if not os.path.exists(manifest_path):
+            raise ValueError(f"No sanctions store at {self.path}")
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format") != self._FORMAT:
+            raise ValueError(f"Unsupported sanctions store format: {manifest.get('format')}")
+        if manifest["generation"] == self._generation:
+            return False
+
+        self._base = self._load(manifest["base"])
+        self._delta = self._load(manifest["delta"]) if manifest["delta"] else None
+        self._removed = frozenset(manifest["removed"])
+        self._manifest = manifest
+        self._generation = manifest["generation"]
+        self._automaton: Optional[SanctionsAutomaton] = None
+        self.version: str = manifest["version"]
+        return True
+
+    def _load(self, segment: str) -> FuzzyNameIndex:
+        return FuzzyNameIndex.load(
+            os.path.join(self.path, segment),
+            threshold=self.threshold,
+            algorithm=self.algorithm,
+            max_candidates=self.max_candidates
+        )
+
+    # ==================== Updates ====================
+
+    def apply_delta(
+        self,
+        added: Iterable[str] = (),
+        removed: Iterable[str] = (),
+        version: Optional[str] = None
+    ) -> None:
+        """
+        Apply a list update without rebuilding the base segment.
+
+        Added names go into the delta segment, which is rebuilt on its own;
+        names removed from the base are recorded in the manifest and
+        filtered out of results. Re-adding a removed base name reinstates it.
+
+        Args:
+            added: Names added to the list
+            removed: Names removed from the list
+            version: Version stamp of the updated list (must be new)
+        """
+        self.refresh()
+        if not version or version == self.version:
+            raise ValueError(f"A delta needs a new version stamp (current: {self.version})")
+        added = list(dict.fromkeys(added))
+        removed = set(removed)
+        if removed.intersection(added):
+            raise ValueError(f"Names both added and removed: {sorted(removed.intersection(added))}")
+
+        base_names = set(self._base.names)
+        tombstones = set(self._removed) | (removed & base_names)
+        delta_names = [n for n in (self._delta.names if self._delta else ()) if n not in removed]
+        for name in added:
+            if name in base_names:
+                tombstones.discard(name)
+            elif name not in delta_names:
+                delta_names.append(name)
+
+        generation = self._generation + 1
+        delta = None
+        if delta_names:
+            delta = f"delta-{generation}"
+            FuzzyNameIndex(delta_names, q=self._base.q, version=version).save(os.path.join(self.path, delta))
+        live_base = sum(1 for n in self._base.names if n not in tombstones)
+        self._publish({
+            "format": self._FORMAT,
+            "version": version,
+            "generation": generation,
+            "base": self._manifest["base"],
+            "delta": delta,
+            "removed": sorted(tombstones),
+            "names": live_base + len(delta_names),
+        })
+
+    def compact(self, version: Optional[str] = None) -> None:
+        """
+        Rebuild the base segment from the current list and drop the delta.
+
+        Args:
+            version: Version stamp for the compacted list (defaults to the current one)
+        """
+        self.refresh()
+        names = self.names
+        generation = self._generation + 1
+        base = f"base-{generation}"
+        FuzzyNameIndex(names, q=self._base.q, version=version or self.version).save(
+            os.path.join(self.path, base)
+        )
+        self._publish({
+            "format": self._FORMAT,
+            "version": version or self.version,
+            "generation": generation,
+            "base": base,
+            "delta": None,
+            "removed": [],
+            "names": len(names),
+        })
+
+    def _publish(self, manifest: dict) -> None:
+        """Swap in a new manifest and delete segments no reader can still be opening"""
+        previous = self._manifest
+        _write_json(os.path.join(self.path, self.MANIFEST), manifest)
+        # Segments of the previous manifest stay, for readers that read it just before the swap;
+        # already-mapped files of older ones remain valid for their holders on POSIX
+        keep = {previous["base"], previous["delta"], manifest["base"], manifest["delta"]}
+        for entry in os.listdir(self.path):
+            if _SEGMENT.match(entry) and entry not in keep:
+                shutil.rmtree(os.path.join(self.path, entry), ignore_errors=True)
+        self.refresh()
+
+    # ==================== Screening ====================
+
+    def __len__(self) -> int:
+        return self._manifest["names"]
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Names currently on the list"""
+        base = tuple(n for n in self._base.names if n not in self._removed)
+        return base + (self._delta.names if self._delta else ())
+
+    @property
+    def automaton(self) -> SanctionsAutomaton:
+        """Exact-match automaton for the current version, compiled on first use"""
+        if self._automaton is None:
+            self._automaton = SanctionsAutomaton(self.names, self.version)
+        return self._automaton
+
+    def screen(self, entity: str, bidirectional: bool = False) -> List[str]:
+        """Listed names contained in the entity (see SanctionsAutomaton.screen)"""
+        return self.automaton.screen(entity, bidirectional)
+
+    def matches(self, entity: str, limit: int = 5) -> List[FuzzyMatch]:
+        """
+        Listed names similar to an entity, best first.
+
+        Args:
+            entity: Entity name to screen
+            limit: Maximum number of matches returned
+
+        Returns:
+            FuzzyMatch per listed spelling scoring at least the threshold
+        """
+        found = [
+            m for m in self._base.matches(entity, limit + len(self._removed))
+            if m.name not in self._removed
+        ]
+        if self._delta is not None:
+            found.extend(self._delta.matches(entity, limit))
+        found.sort(key=lambda m: (-m.score, normalize_name(m.name)))
+        return found[:limit]
+
+    def best_match(self, entity: str) -> Optional[FuzzyMatch]:
+        """The closest listed name at or above the threshold, if any"""
+        found = self.matches(entity, limit=1)
+        return found[0] if found else None
@@ -0,0 +1,212 @@
+"""
+XSD Registry - Full ISO 20022 schema validation
+Official XSDs compiled once per process, on first use
+
+Compiling an ISO 20022 XSD takes far longer than validating a message
+against it, so a registry only lists the schema files it is given and
+compiles a message type's schema the first time a document of that type
+is validated. Compiled schemas are shared by every registry in the process
+(keyed by file and modification time) and each result reports how long
+compilation and validation took, so the cost can be budgeted.
+
+Requires lxml (pip install lxml).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+import os
+import re
+import threading
+import time
+
+from .message_guard import ISODocument
+
+
+# "pacs.008.001.08" from a file name or an ISO 20022 namespace
+_MESSAGE_ID = re.compile(r"([a-z]{4}\.\d{3}\.\d{3}\.\d{2})")
+
+
+@dataclass
+class SchemaValidationResult:
+    """Result of validating a document against its compiled XSD"""
+    valid: bool
+    message_type: str               # full identifier, e.g. "pacs.008.001.08"
+    errors: List[str]
+    compile_seconds: float          # time spent compiling for this call (0.0 when cached)
+    validation_seconds: float
+    cached: bool
+
+
+@dataclass
+class _CompiledSchema:
+    schema: Any                     # lxml.etree.XMLSchema
+    compile_seconds: float
+    lock: threading.Lock            # a schema's error log belongs to its last validation
+
+
+# ==================== Shared Compiled Schemas ====================
+
+_compiled: Dict[Tuple[str, int, int], _CompiledSchema] = {}
+_compiled_lock = threading.Lock()
+# One lock per schema being compiled: concurrent first uses of a schema wait
+# for a single compilation, without blocking other schemas or cache hits
+_compiling: Dict[Tuple[str, int, int], threading.Lock] = {}
+
+
+def _compile(path: str) -> Tuple[_CompiledSchema, bool]:
+    """
+    Compiled schema for an XSD file, compiling it if this process has not yet.
+
+    Returns:
+        (compiled schema, whether it came from the cache)
+    """
+    stat = os.stat(path)
+    key = (os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
+    with _compiled_lock:
+        compiled = _compiled.get(key)
+        if compiled is not None:
+            return compiled, True
+        key_lock = _compiling.setdefault(key, threading.Lock())
+    with key_lock:
+        compiled = _compiled.get(key)
+        if compiled is not None:
+            return compiled, True
+        try:
+            try:
+                from lxml import etree
+            except ImportError:
+                raise ImportError("XSD validation requires lxml (pip install lxml)") from None
+            start = time.perf_counter()
+            parser = etree.XMLParser(resolve_entities=False, no_network=True)
+            schema = etree.XMLSchema(etree.parse(path, parser))
+            compiled = _CompiledSchema(schema, time.perf_counter() - start, threading.Lock())
+        finally:
+            # Waiters retry on failure; on success they find the published schema
+            with _compiled_lock:
+                if compiled is not None:
+                    _compiled[key] = compiled
+                _compiling.pop(key, None)
+        return compiled, False
+
+
+class XSDRegistry:
+    """
+    ISO 20022 XSDs from a local directory, compiled lazily and cached.
+
+    Files are matched to message types by the identifier in their name
+    (e.g. pacs.008.001.08.xsd). A short name such as "pacs.008" resolves
+    to the highest version present.
+    """
+
+    def __init__(self, schema_dir: str):
+        """
+        List the schemas in a directory (nothing is compiled yet).
+
+        Args:
+            schema_dir: Directory holding the official .xsd files
+        """
+        if not os.path.isdir(schema_dir):
+            raise ValueError(f"No schema directory at {schema_dir}")
+        self.schema_dir = schema_dir
+        self._files: Dict[str, str] = {}
+        for entry in sorted(os.listdir(schema_dir)):
+            match = _MESSAGE_ID.search(entry)
+            if match and entry.endswith(".xsd"):
+                self._files[match.group(1)] = os.path.join(schema_dir, entry)
+
+    @property
+    def message_types(self) -> List[str]:
+        """Full identifiers of the available schemas"""
+        return sorted(self._files)
+
+    def resolve(self, message_type: str) -> str:
+        """
+        Full identifier for a message type ("pacs.008" -> "pacs.008.001.08").
+
+        Raises:
+            ValueError: If no schema in the directory covers the type
+        """
+        if message_type in self._files:
+            return message_type
+        versions = [m for m in self._files if m.startswith(message_type + ".")]
+        if not versions:
+            raise ValueError(f"No XSD for {message_type} in {self.schema_dir}")
+        return max(versions)
+
+    def compile(self, message_type: str) -> float:
+        """
+        Compile a message type's schema ahead of first use.
+
+        Returns:
+            Seconds it took to compile (the original cost if already compiled)
+        """
+        compiled, _ = _compile(self._files[self.resolve(message_type)])
+        return compiled.compile_seconds
+
+    def compile_times(self) -> Dict[str, float]:
+        """Compile seconds of the schemas compiled so far in this process"""
+        times = {}
+        for message_type, path in self._files.items():
+            stat = os.stat(path)
+            compiled = _compiled.get((os.path.realpath(path), stat.st_mtime_ns, stat.st_size))
+            if compiled is not None:
+                times[message_type] = compiled.compile_seconds
+        return times
+
+    # ==================== Validation ====================
+
+    def validate(
+        self,
+        document: Union[str, bytes, ISODocument],
+        message_type: Optional[str] = None,
+        max_errors: int = 100
+    ) -> SchemaValidationResult:
+        """
+        Validate a message against the XSD of its type.
+
+        Args:
+            document: XML text or bytes, or an ISODocument parsed from it
+            message_type: Message type, full or short (default: from the
+                document's ISO 20022 namespace)
+            max_errors: Schema errors kept in the result
+
+        Returns:
+            SchemaValidationResult with errors and compile/validation timings
+        """
+        if not isinstance(document, ISODocument):
+            document = ISODocument.parse(document)
+        if message_type is None:
+            match = _MESSAGE_ID.search(document.namespace or "")
+            if match is None:
+                raise ValueError("Document has no ISO 20022 namespace; pass message_type")
+            message_type = match.group(1)
+        message_type = self.resolve(message_type)
+
+        compiled, cached = _compile(self._files[message_type])
+        compile_seconds = 0.0 if cached else compiled.compile_seconds
+        if not document.well_formed:
+            return SchemaValidationResult(
+                valid=False,
+                message_type=message_type,
+                errors=[f"XML is not well-formed: {document.error}"],
+                compile_seconds=compile_seconds,
+                validation_seconds=0.0,
+                cached=cached
+            )
+
+        with compiled.lock:
+            start = time.perf_counter()
+            valid = compiled.schema.validate(document.root)
+            validation_seconds = time.perf_counter() - start
+            log = list(compiled.schema.error_log)
+        errors = [f"line {e.line}: {e.message}" for e in log[:max_errors]]
+        if len(log) > max_errors:
+            errors.append(f"{len(log) - max_errors} further errors not shown")
+        return SchemaValidationResult(
+            valid=valid,
+            message_type=message_type,
+            errors=errors,
+            compile_seconds=compile_seconds,
+            validation_seconds=validation_seconds,
+            cached=cached
+        )
@@ -0,0 +1,121 @@
+"""
+Tests for bulk IBAN/BIC validation and the MessageGuard identifier checks.
+"""
+
+import io
+import random
+
+from qwed_finance import (
+    IBAN_REGISTRY, IdentifierVerdict, MessageGuard,
+    stream_bic_verdicts, stream_iban_verdicts, validate_bics, validate_ibans,
+)
+from qwed_finance.bank_identifiers import bic_verdict, iban_mod97, iban_verdict
+
+
+def random_iban(rng, country):
+    """A well-formed IBAN for a country, with correct check digits"""
+    length, bban_format = IBAN_REGISTRY[country]
+    alphabets = {"n": "0123456789", "a": "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "c": "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"}
+    bban = ""
+    count = ""
+    for char in bban_format:
+        if char.isdigit():
+            count += char
+        else:
+            bban += "".join(rng.choice(alphabets[char]) for _ in range(int(count)))
+            count = ""
+    check = 98 - iban_mod97(country + "00" + bban)
+    return f"{country}{check:02d}{bban}"
+
+
+class TestBankIdentifiers:
+    """Test IBAN/BIC verdicts, single and bulk"""
+
+    def setup_method(self):
+        self.rng = random.Random(21)
+
+    def test_known_ibans(self):
+        """Published example IBANs are valid, with or without spaces"""
+        for iban in ["DE89370400440532013000", "GB82WEST12345698765432", "fr14 2004 1010 0505 0001 3m02 606",
+                     "NO9386011117947", "MT84MALT011000012345MTLCAST001S"]:
+            assert iban_verdict(iban) == IdentifierVerdict.VALID, iban
+
+    def test_iban_verdicts(self):
+        """The first failed check is reported"""
+        cases = {
+            "DE89-370400440532013000": IdentifierVerdict.INVALID_CHARACTERS,
+            "D189370400440532013000": IdentifierVerdict.INVALID_CHARACTERS,
+            "QQ89370400440532013000": IdentifierVerdict.UNKNOWN_COUNTRY,
+            "DE8937040044053201300": IdentifierVerdict.WRONG_LENGTH,
+            "DE89370400440532013000" * 2: IdentifierVerdict.WRONG_LENGTH,
+            "GB82W3ST12345698765432": IdentifierVerdict.INVALID_BBAN,
+            "DE88370400440532013000": IdentifierVerdict.INVALID_CHECKSUM,
+            "DE89370400440532013001": IdentifierVerdict.INVALID_CHECKSUM,
+        }
+        for iban, expected in cases.items():
+            assert iban_verdict(iban) == expected, iban
+        result = validate_ibans(list(cases))
+        assert [result.verdict(i) for i in range(len(result))] == list(cases.values())
+
+    def test_registry_formats(self):
+        """A generated IBAN for every registered country passes in bulk"""
+        ibans = [random_iban(self.rng, country) for country in sorted(IBAN_REGISTRY) for _ in range(5)]
+        result = validate_ibans(ibans)
+        assert len(result) == len(ibans)
+        assert result.all_valid
+
+    def test_bulk_agrees_with_single(self):
+        """Vectorized verdicts match iban_verdict on mutated inputs"""
+        ibans = []
+        for _ in range(3000):
+            iban = list(random_iban(self.rng, self.rng.choice(sorted(IBAN_REGISTRY))))
+            mutation = self.rng.randrange(5)
+            position = self.rng.randrange(len(iban))
+            if mutation == 0:
+                iban[position] = self.rng.choice("0123456789AZ")
+            elif mutation == 1:
+                del iban[position]
+            elif mutation == 2:
+                iban.insert(position, self.rng.choice("7X é"))
+            elif mutation == 3:
+                iban = iban[2:] + iban[:2]
+            ibans.append("".join(iban))
+        ibans += ["", "DE", "de89 3704 0044 0532 0130 00", "DE89370400440532013000\x00", "DE89\n3704"]
+
+        result = validate_ibans(ibans)
+
+        assert [result.verdict(i) for i in range(len(ibans))] == [iban_verdict(i) for i in ibans]
+        assert result.failed_rows == [i for i, iban in enumerate(ibans) if iban_verdict(iban) != IdentifierVerdict.VALID]
+
+    def test_stream_from_file(self, tmp_path):
+        """Files are read one chunk at a time, blank lines skipped, in order"""
+        ibans = [random_iban(self.rng, "NL") for _ in range(100)]
+        ibans[57] = "NL00" + ibans[57][4:]
+        path = tmp_path / "ibans.txt"
+        path.write_text("\n".join(ibans[:50]) + "\n\n" + "\n".join(ibans[50:]) + "\n")
+
+        chunks = list(stream_iban_verdicts(str(path), chunk_size=16))
+
+        assert max(len(chunk) for chunk in chunks) <= 16
+        assert [i for chunk in chunks for i in chunk.identifiers] == ibans
+        failed = [i for chunk in chunks for i, v in zip(chunk.identifiers, chunk.verdicts) if v]
+        assert failed == [ibans[57]]
+
+    def test_bics(self):
+        """BICs: 8 or 11 characters, letters for bank and country"""
+        bics = ["DEUTDEFF", "deut de ff 500", "NEDSZAJJXXX", "DEUTDEF", "1EUTDEFF", "DEUTDEFFXX", "DEUTDEFF50é"]
+        result = validate_bics(bics)
+        assert [result.verdict(i) for i in range(len(bics))] == [bic_verdict(b) for b in bics]
+        assert result.failed_rows == [3, 4, 5, 6]
+
+        chunks = list(stream_bic_verdicts(io.StringIO("\n".join(bics)), chunk_size=3))
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+
+    def test_message_guard_reason(self):
+        """MessageGuard reports why an IBAN is invalid"""
+        guard = MessageGuard()
+        assert guard.verify_iban("DE89370400440532013000", llm_says_valid=True).valid
+        result = guard.verify_iban("DE8937040044053201300", llm_says_valid=True)
+        assert not result.valid
+        assert "wrong length" in result.errors[0]
+        assert guard.verify_bic("DEUTDEFF", llm_says_valid=True).valid
@@ -0,0 +1,234 @@
+"""
+Tests for BondGuard YTM solver and bond analytics.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from qwed_finance import BondGuard
+from qwed_finance.bond_guard import DayCountConvention
+from qwed_finance.calendar_guard import StubType
+
+
+class TestYTMSolver:
+    """Closed-form, bracket-safeguarded Newton YTM solver"""
+
+    def setup_method(self):
+        self.guard = BondGuard()
+
+    def test_par_bond_yield_equals_coupon(self):
+        """A bond priced at par yields its coupon rate"""
+        result = self.guard.verify_ytm(1000, 0.06, 1000, 30, "6.00%")
+        assert result.verified is True
+        assert result.computed_value == "6.0000%"
+
+    def test_reports_iterations_and_residual(self):
+        """Iteration count and final residual are reported in details"""
+        result = self.guard.verify_ytm(1000, 0.05, 950, 10, "5.66%")
+        assert 0 < result.details["iterations"] < self.guard.max_iterations
+        assert Decimal(result.details["residual"]) < Decimal("1E-10")
+
+    def test_long_monthly_bond_converges(self):
+        """30-year monthly-pay bond converges in a handful of iterations"""
+        result = self.guard.verify_ytm(1000, 0.04, 700, 30, "6.22%", frequency=12)
+        assert result.verified is True
+        assert result.details["periods"] == 360
+        assert result.details["iterations"] <= 10
+
+    def test_zero_coupon_bond(self):
+        """Zero-coupon bond: (1000/500)^(1/20) - 1 per half-year"""
+        result = self.guard.verify_ytm(1000, 0.0, 500, 10, "7.053%")
+        assert result.verified is True
+
+    def test_poor_initial_guess_still_converges(self):
+        """Deep-discount distressed debt: Newton is kept inside the bracket"""
+        ytm, iterations, residual = self.guard._solve_ytm_with_stats(
+            Decimal("1000"), Decimal("10"), Decimal("50"), 40, 2
+        )
+        assert Decimal("0.0001") < ytm < Decimal("10")
+        assert residual < Decimal("1E-10")
+
+    def test_closed_form_matches_cash_flow_sum(self):
+        """Annuity closed form equals the explicit discounted sum"""
+        fv, coupon, ytm, n = Decimal("1000"), Decimal("25"), Decimal("0.06"), 20
+        price, _ = self.guard._price_at_yield(fv, coupon, n, Decimal("2"), ytm)
+        explicit = sum(coupon / (1 + ytm / 2) ** t for t in range(1, n + 1))
+        explicit += fv / (1 + ytm / 2) ** n
+        assert abs(price - explicit) < Decimal("1E-40")
+
+
+    def test_exhausted_iterations_report_evaluated_yield(self):
+        """Out of iterations, the residual is that of the yield returned"""
+        guard = BondGuard(max_iterations=2)
+        args = (Decimal("1000"), Decimal("25"), Decimal("950"), 20, 2)
+        ytm, iterations, residual = guard._solve_ytm_with_stats(*args)
+        assert iterations == 2
+        price, _ = guard._price_at_yield(args[0], args[1], args[3], Decimal(2), ytm)
+        assert abs(price - args[2]) == residual
+
+
+class TestPortfolio:
+    """Vectorized whole-book verification"""
+
+    def setup_method(self):
+        self.guard = BondGuard()
+
+    def test_portfolio_matches_per_bond_methods(self):
+        """Vectorized analytics agree with verify_ytm/duration/convexity"""
+        face = [1000, 1000, 1000]
+        coupons = [0.05, 0.06, 0.04]
+        years = [10, 30, 30]
+        prices = [950, 1000, 700]
+        result = self.guard.verify_portfolio(face, coupons, years, prices=prices)
+
+        for i in range(3):
+            ytm = self.guard.verify_ytm(face[i], coupons[i], prices[i], years[i], "5%")
+            assert f"{result.ytm[i] * 100:.4f}%" == ytm.computed_value
+            duration = self.guard.verify_duration(
+                face[i], coupons[i], float(result.ytm[i]), years[i], "1"
+            )
+            assert f"{result.macaulay_duration[i]:.4f} years" == duration.computed_value
+
+    def test_portfolio_verdicts(self):
+        """Per-bond verdicts for each kind of claim"""
+        result = self.guard.verify_portfolio(
+            face_values=[1000, 1000],
+            coupon_rates=[0.05, 0.05],
+            years_to_maturity=[10, 10],
+            ytms=[0.06, 0.06],
+            llm_duration=[7.8950, 9.0],
+            llm_convexity=[71.79, 75.0],
+        )
+        assert list(result.duration_verified) == [True, False]
+        assert list(result.convexity_verified) == [True, False]
+        assert result.ytm_verified is None
+        assert list(result.failed_bonds) == [1]
+        assert result.stats["bonds"] == 2
+
+    def test_portfolio_reports_timing(self):
+        """Aggregate timing stats are returned"""
+        result = self.guard.verify_portfolio(
+            np.full(1000, 1000.0),
+            np.full(1000, 0.05),
+            np.full(1000, 10.0),
+            prices=np.full(1000, 950.0),
+            llm_ytm=np.full(1000, 0.0566),
+        )
+        assert result.verified.all()
+        for key in ("solve_ms", "analytics_ms", "elapsed_ms", "bonds_per_second"):
+            assert key in result.stats
+
+    def test_portfolio_requires_prices_for_ytm_claims(self):
+        """YTM claims cannot be checked without market prices"""
+        with pytest.raises(ValueError):
+            self.guard.verify_portfolio(
+                [1000], [0.05], [10], ytms=[0.06], llm_ytm=[0.06]
+            )
+
+
+class TestDiscountTableCache:
+    """Shared LRU of per-bond discount tables"""
+
+    def setup_method(self):
+        self.guard = BondGuard(cache_size=2)
+
+    def test_price_duration_convexity_share_one_table(self):
+        """Asking three questions about one bond builds its table once"""
+        assert self.guard.verify_price(1000, 0.05, 0.05, 10, "$1,000.00").verified
+        assert self.guard.verify_duration(1000, 0.05, 0.05, 10, "7.99").verified
+        assert self.guard.verify_convexity(1000, 0.05, 0.05, 10, "73.63").verified
+        info = self.guard.cache_info()
+        assert info["misses"] == 1
+        assert info["hits"] == 2
+        assert info["size"] == 1
+
+    def test_cached_results_match_uncached(self):
+        """Cache hits return the same values as a fresh computation"""
+        uncached = BondGuard(cache_size=0)
+        for _ in range(2):
+            a = self.guard.verify_duration(1000, 0.06, 0.045, 7, "6.0")
+            b = uncached.verify_duration(1000, 0.06, 0.045, 7, "6.0")
+            assert a.computed_value == b.computed_value
+            assert a.details == b.details
+        assert uncached.cache_info()["size"] == 0
+
+    def test_lru_eviction(self):
+        """The least recently used table is evicted at capacity"""
+        self.guard.verify_price(1000, 0.05, 0.04, 5, "0")
+        self.guard.verify_price(1000, 0.05, 0.05, 5, "0")
+        self.guard.verify_price(1000, 0.05, 0.04, 5, "0")   # refresh first
+        self.guard.verify_price(1000, 0.05, 0.06, 5, "0")   # evicts 5%
+        assert self.guard.cache_info()["size"] == 2
+        self.guard.verify_price(1000, 0.05, 0.04, 5, "0")
+        assert self.guard.cache_info()["hits"] == 2
+        self.guard.verify_price(1000, 0.05, 0.05, 5, "0")
+        assert self.guard.cache_info()["misses"] == 4
+
+    def test_ytm_and_portfolio_leave_cache_to_rechecks(self):
+        """Newton trial yields never enter the cache; portfolio rechecks share it"""
+        self.guard.verify_ytm(1000, 0.05, 950, 10, "5.66%")
+        book = self.guard.verify_portfolio([1000], [0.05], [10], ytms=[0.05], llm_convexity=[73.63])
+        assert self.guard.cache_info()["size"] == 0
+        
+        # A claim on the 0.05-year tolerance edge is rechecked through verify_duration
+        edge = round(float(book.macaulay_duration[0]), 4) + 0.05
+        result = self.guard.verify_portfolio([1000], [0.05], [10], ytms=[0.05], llm_duration=[edge])
+        assert result.rechecked[0]
+        self.guard.verify_duration(1000, 0.05, 0.05, 10, "7.99")
+        assert self.guard.cache_info() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 2}
+
+    def test_price_mismatch_detected(self):
+        """A wrong price claim fails with the dollar difference"""
+        result = self.guard.verify_price(1000, 0.05, 0.06, 10, "$1,000.00")
+        assert result.verified is False
+        assert result.computed_value == "$925.61"
+
+    def test_clear_cache_and_invalid_size(self):
+        """clear_cache resets counters; negative sizes are rejected"""
+        self.guard.verify_price(1000, 0.05, 0.05, 10, "1000")
+        self.guard.clear_cache()
+        assert self.guard.cache_info() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 2}
+        with pytest.raises(ValueError):
+            BondGuard(cache_size=-1)
+
+
+class TestScheduleAccrual:
+    """Accrued interest and dirty price from generated coupon schedules"""
+
+    def setup_method(self):
+        self.guard = BondGuard()
+
+    def test_actual_actual_regular_period(self):
+        """ACT/ACT accrues actual days over the actual coupon period"""
+        result = self.guard.verify_accrued_interest_on_date(
+            1000, 0.05, date(2024, 2, 15), date(2034, 2, 15), date(2024, 5, 15), "$12.36"
+        )
+        assert result.verified
+        assert result.details["next_coupon"] == "2024-08-15"
+        assert result.details["stub"] is None
+
+    def test_thirty_360_dirty_price(self):
+        """30/360 accrual feeds the dirty price check"""
+        result = self.guard.verify_dirty_price_on_date(
+            1000, 0.06, date(2024, 2, 15), date(2034, 2, 15), date(2024, 5, 15),
+            985.50, "$1,000.50", day_count=DayCountConvention.THIRTY_360
+        )
+        assert result.verified
+        assert result.details["accrued_interest"] == "$15.00"
+
+    def test_short_front_stub_uses_notional_period(self):
+        """A short first coupon accrues against its notional regular period"""
+        result = self.guard.verify_accrued_interest_on_date(
+            1000, 0.05, date(2024, 3, 10), date(2029, 2, 15), date(2024, 4, 10), "$4.26"
+        )
+        # 31 days over the notional 2024-02-15 → 2024-08-15 period (182 days)
+        assert result.verified
+        assert result.details["stub"] == StubType.SHORT_FRONT.value
+
+    def test_quarterly_frequency(self):
+        """Non semi-annual coupons are no longer assumed semi-annual"""
+        result = self.guard.verify_accrued_interest(1000, 0.08, 45, 90, "$10.00", frequency=4)
+        assert result.verified
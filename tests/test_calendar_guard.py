@@ -0,0 +1,307 @@
+"""
+Tests for CalendarGuard business-day calendars and day counts.
+"""
+
+from datetime import date, timedelta
+import random
+
+import numpy as np
+import pytest
+
+from qwed_finance import CalendarGuard, DayCountConvention
+from qwed_finance.calendar_guard import (
+    RollConvention, StubType, _coupon_schedule, compiled_calendar, coupon_schedule,
+)
+from qwed_finance.holiday_rules import (
+    NY_FED, TARGET2, UK, US_FEDERAL, FixedDate, HolidayCalendar, HolidayRule, NthWeekday,
+    Observance, easter_sunday, get_holiday_calendar,
+)
+
+
+class TestBusinessDayCalendar:
+    """Compiled bitmap/cumulative business-day index"""
+
+    def setup_method(self):
+        self.guard = CalendarGuard()
+        self.holidays = np.array(
+            sorted(d for year in range(2015, 2040) for d in US_FEDERAL.holidays_in(year)),
+            dtype="datetime64[D]"
+        )
+
+    def test_weekend_and_holiday(self):
+        """Weekends and holidays are not business days"""
+        assert self.guard.verify_business_day(date(2025, 7, 4), False).verified
+        assert self.guard.verify_business_day(date(2025, 7, 5), False).verified
+        assert self.guard.verify_business_day(date(2025, 7, 7), True).verified
+        assert "holiday" in self.guard.verify_business_day(date(2025, 7, 4), True).proof
+
+    def test_next_and_previous(self):
+        """Rolling skips holidays and weekends in both directions"""
+        assert self.guard.get_next_business_day(date(2025, 7, 4)) == date(2025, 7, 7)
+        assert self.guard.get_previous_business_day(date(2025, 7, 4)) == date(2025, 7, 3)
+        assert self.guard.get_next_business_day(date(2025, 7, 7)) == date(2025, 7, 7)
+
+    def test_add_business_days(self):
+        """T+2 across a holiday weekend, and moving backwards"""
+        assert self.guard.add_business_days(date(2025, 7, 3), 2) == date(2025, 7, 8)
+        assert self.guard.add_business_days(date(2025, 7, 5), 1) == date(2025, 7, 7)
+        assert self.guard.add_business_days(date(2025, 7, 7), -1) == date(2025, 7, 3)
+        assert self.guard.add_business_days(date(2025, 7, 5), 0) == date(2025, 7, 7)
+
+    def test_count_business_days(self):
+        """Counting is half-open and antisymmetric"""
+        assert self.guard.count_business_days(date(2025, 7, 1), date(2025, 7, 8)) == 4
+        assert self.guard.count_business_days(date(2025, 7, 8), date(2025, 7, 1)) == -4
+        assert self.guard.verify_business_day_count(date(2025, 7, 1), date(2025, 7, 8), 4).verified
+
+    def test_matches_numpy_busday(self):
+        """Offsets and counts agree with numpy's busday functions"""
+        rng = np.random.default_rng(3)
+        starts = np.datetime64("2022-01-01") + rng.integers(0, 3000, 500)
+        for start, span, n in zip(starts, rng.integers(0, 900, 500), rng.integers(-400, 400, 500)):
+            d = start.astype(date)
+            end = (start + span).astype(date)
+            assert self.guard.count_business_days(d, end) == np.busday_count(
+                start, start + span, holidays=self.holidays
+            )
+            roll = "preceding" if n > 0 else "following"
+            expected = np.busday_offset(start, n, roll=roll, holidays=self.holidays).astype(date)
+            assert self.guard.add_business_days(d, int(n)) == expected
+
+    def test_range_extends_on_demand(self):
+        """Dates far outside the compiled years extend the index"""
+        calendar = compiled_calendar([date(2025, 12, 25)])
+        expected = np.busday_offset("2025-01-01", 20000, roll="preceding", holidays=["2025-12-25"])
+        assert calendar.add_business_days(date(2025, 1, 1), 20000) == expected.astype(date)
+        first, last = calendar.compiled_years
+        assert first <= 2024 and last >= 2101
+
+    def test_calendars_shared_across_guards(self):
+        """Guards with the same holiday set share one compiled calendar"""
+        other = CalendarGuard()
+        assert other.business_calendar() is self.guard.business_calendar()
+        custom = CalendarGuard([date(2025, 3, 3)])
+        assert custom.business_calendar() is not self.guard.business_calendar()
+        assert not custom.business_calendar(use_us_holidays=False).is_business_day(date(2025, 3, 3))
+
+    def test_holidays_added_later(self):
+        """Changes to guard.holidays after construction are picked up"""
+        self.guard.holidays.add(date(2026, 3, 4))
+        result = self.guard.verify_business_day(date(2026, 3, 4), True)
+        assert not result.verified
+        assert "holiday" in result.proof
+        assert self.guard.get_next_business_day(date(2026, 3, 4)) == date(2026, 3, 5)
+
+        self.guard.holidays.discard(date(2026, 3, 4))
+        assert self.guard.verify_business_day(date(2026, 3, 4), True).verified
+
+
+class TestHolidayRules:
+    """Rule-based market calendars compiled per year"""
+
+    def test_floating_us_holidays(self):
+        """MLK, Memorial Day and Thanksgiving land on the right weekdays"""
+        holidays = US_FEDERAL.holiday_names(2025)
+        assert holidays[date(2025, 1, 20)] == "Martin Luther King Jr. Day"
+        assert holidays[date(2025, 5, 26)] == "Memorial Day"
+        assert holidays[date(2025, 11, 27)] == "Thanksgiving Day"
+        assert len(holidays) == 11
+
+    def test_us_observed_shifts(self):
+        """Saturday holidays move to Friday, even across the year end"""
+        assert date(2026, 7, 3) in US_FEDERAL.holidays_in(2026)       # Jul 4 is a Saturday
+        assert date(2021, 12, 31) in US_FEDERAL.holidays_in(2021)     # Jan 1 2022 is a Saturday
+        assert date(2022, 1, 1) not in US_FEDERAL.holidays_in(2022)
+
+    def test_fed_does_not_observe_saturdays(self):
+        """The NY Fed stays open on the Friday before a Saturday holiday"""
+        assert date(2026, 7, 3) not in NY_FED.holidays_in(2026)
+        assert date(2023, 1, 2) in NY_FED.holidays_in(2023)          # Jan 1 2023 is a Sunday
+
+    def test_target2_and_easter(self):
+        """TARGET2 closes on Good Friday and Easter Monday, without shifting"""
+        assert easter_sunday(2025) == date(2025, 4, 20)
+        assert TARGET2.holidays_in(2025) == {
+            date(2025, 1, 1), date(2025, 4, 18), date(2025, 4, 21),
+            date(2025, 5, 1), date(2025, 12, 25), date(2025, 12, 26),
+        }
+
+    def test_uk_substitute_days(self):
+        """A Sunday Christmas is substituted after a Monday Boxing Day"""
+        december = {d for d in UK.holidays_in(2022) if d.month == 12}
+        assert december == {date(2022, 12, 26), date(2022, 12, 27)}
+        assert date(2022, 9, 19) in UK.holidays_in(2022)              # one-off
+        assert date(2022, 5, 30) not in UK.holidays_in(2022)          # moved spring holiday
+
+    def test_joint_calendar(self):
+        """A joint calendar closes whenever any member market closes"""
+        joint = get_holiday_calendar("UK", "TARGET2")
+        assert joint.name == "UK+TARGET2"
+        assert joint.holidays_in(2025) == UK.holidays_in(2025) | TARGET2.holidays_in(2025)
+        guard = CalendarGuard(markets=("UK", "TARGET2"))
+        assert not guard.business_calendar().is_business_day(date(2025, 5, 1))   # TARGET2 only
+        assert not guard.business_calendar().is_business_day(date(2025, 8, 25))  # UK only
+        with pytest.raises(ValueError):
+            get_holiday_calendar("MARS")
+
+    def test_custom_rules(self):
+        """Calendars can be declared from rules and feed the business-day index"""
+        calendar = HolidayCalendar("XX", (
+            FixedDate("Founders Day", Observance.NEXT_WEEKDAY, month=3, day=14),
+            NthWeekday("Harvest Day", month=10, weekday=4, n=-1),
+        ))
+        business = compiled_calendar(rules=calendar)
+        assert not business.is_business_day(date(2026, 3, 16))        # Mar 14 2026 is a Saturday
+        with pytest.raises(TypeError):
+            HolidayRule("Abstract")                                   # rules must define actual_date
+        assert not business.is_business_day(date(2026, 10, 30))
+        assert business.is_holiday(date(2026, 10, 30))
+
+    def test_years_compiled_once_per_calendar(self):
+        """Each calendar keeps its own compiled years, keyed by year"""
+        rules = (FixedDate("Founders Day", Observance.NEXT_WEEKDAY, month=3, day=14),)
+        calendar, twin = HolidayCalendar("XX", rules), HolidayCalendar("XX", rules)
+        assert calendar.is_holiday(date(2026, 3, 16))
+        compiled = calendar._years[2026]
+        assert calendar.holiday_names(2026) == {date(2026, 3, 16): "Founders Day"}
+        assert calendar._years[2026] is compiled and len(calendar._years) == 1
+        assert twin == calendar and twin._years == {}
+
+    def test_guard_uses_rule_calendar(self):
+        """The default guard treats floating US holidays as non-business days"""
+        guard = CalendarGuard()
+        assert guard.verify_business_day(date(2025, 11, 27), False).verified
+        assert guard.get_next_business_day(date(2025, 11, 27)) == date(2025, 11, 28)
+        assert date(2025, 1, 20) in guard.default_us_holidays
+
+
+class TestVectorizedDayCounts:
+    """Batch day counts and year fractions over datetime64 arrays"""
+
+    def setup_method(self):
+        self.guard = CalendarGuard()
+        rng = random.Random(7)
+        self.starts = [date(2000, 1, 1) + timedelta(days=rng.randrange(10000)) for _ in range(2000)]
+        self.ends = [s + timedelta(days=rng.randrange(-400, 2000)) for s in self.starts]
+        # Month-end and leap-day edges for the 30/360 rules
+        self.starts += [date(2024, 1, 31), date(2024, 3, 30), date(2024, 2, 29), date(2023, 12, 31)]
+        self.ends += [date(2024, 3, 31), date(2024, 5, 31), date(2028, 2, 29), date(2024, 1, 1)]
+
+    def test_bit_identical_to_scalar(self):
+        """Every convention matches the scalar path exactly"""
+        starts = np.array(self.starts, dtype="datetime64[D]")
+        ends = np.array(self.ends, dtype="datetime64[D]")
+        for convention in DayCountConvention:
+            days = self.guard.day_counts(starts, ends, convention)
+            fractions = self.guard.year_fractions(starts, ends, convention)
+            assert days.tolist() == [
+                self.guard._calculate_days(s, e, convention) for s, e in zip(self.starts, self.ends)
+            ]
+            assert fractions.tolist() == [
+                self.guard._year_fraction(s, e, convention) for s, e in zip(self.starts, self.ends)
+            ]
+
+    def test_actual_actual_isda_split(self):
+        """ACT/ACT splits a period at year ends and weights each year by its length"""
+        fraction = self.guard.year_fractions(
+            np.array(["2023-11-01"], dtype="datetime64[D]"),
+            np.array(["2025-03-01"], dtype="datetime64[D]"),
+            DayCountConvention.ACTUAL_ACTUAL,
+        )[0]
+        assert fraction == pytest.approx(61 / 365 + 1 + 59 / 365)
+        result = self.guard.verify_day_count_fraction(
+            date(2023, 11, 1), date(2024, 5, 1), 61 / 365 + 121 / 366,
+            DayCountConvention.ACTUAL_ACTUAL, tolerance=1e-12
+        )
+        assert result.verified
+
+    def test_thirty_360_eu_uses_360_basis(self):
+        """30E/360 fractions are days over 360"""
+        result = self.guard.verify_day_count_fraction(
+            date(2024, 1, 31), date(2024, 7, 31), 0.5, DayCountConvention.THIRTY_360_EU
+        )
+        assert result.verified
+        assert result.day_count_fraction.startswith("180/360")
+
+    def test_batch_verification(self):
+        """Batch verdicts agree with the scalar verifier and report failing rows"""
+        claims = np.array([0.5, 0.25, 1.0])
+        result = self.guard.verify_day_count_fraction_batch(
+            [date(2024, 1, 15), date(2024, 1, 15), date(2024, 1, 15)],
+            date(2024, 7, 15), claims, DayCountConvention.THIRTY_360
+        )
+        assert len(result) == 3
+        assert result.verified.tolist() == [True, False, False]
+        assert result.failed_rows.tolist() == [1, 2]
+        assert result.computed_days.tolist() == [180, 180, 180]
+
+    def test_rejects_mismatched_inputs(self):
+        """Length mismatches and missing dates fail closed"""
+        with pytest.raises(ValueError):
+            self.guard.day_counts([date(2024, 1, 1)], [date(2024, 2, 1), date(2024, 3, 1)])
+        with pytest.raises(ValueError):
+            self.guard.year_fractions(np.array(["NaT"], dtype="datetime64[D]"), date(2024, 1, 1))
+        with pytest.raises(ValueError):
+            self.guard.verify_day_count_fraction_batch([date(2024, 1, 1)], date(2024, 2, 1), [0.1, 0.2])
+
+
+class TestCouponSchedule:
+    """Coupon schedules with stubs, roll conventions and memoization"""
+
+    def setup_method(self):
+        self.guard = CalendarGuard()
+
+    def test_regular_schedule(self):
+        """A regular semi-annual schedule has no stub and one payment per period"""
+        schedule = self.guard.coupon_schedule(date(2024, 2, 15), date(2029, 2, 15))
+        assert len(schedule) == 10
+        assert not schedule.has_stub
+        assert schedule.accrual_dates[:3] == (date(2024, 2, 15), date(2024, 8, 15), date(2025, 2, 15))
+        # Sat 2025-02-15, then Presidents' Day → Tuesday
+        assert schedule.payment_dates[1] == date(2025, 2, 18)
+
+    def test_front_stubs(self):
+        """Short front stubs start at issue; long front stubs absorb the first coupon"""
+        short = coupon_schedule(date(2024, 3, 10), date(2026, 2, 15), 2, StubType.SHORT_FRONT)
+        long = coupon_schedule(date(2024, 3, 10), date(2026, 2, 15), 2, StubType.LONG_FRONT)
+        assert short.accrual_dates[:2] == (date(2024, 3, 10), date(2024, 8, 15))
+        assert long.accrual_dates[:2] == (date(2024, 3, 10), date(2025, 2, 15))
+        assert short.notional_dates[0] == date(2024, 2, 15)
+        assert short.has_stub and long.has_stub
+
+    def test_back_stub_and_end_of_month(self):
+        """Back stubs roll forward from issue; month-end anchors stay on month ends"""
+        schedule = coupon_schedule(
+            date(2024, 1, 31), date(2025, 5, 31), 4, StubType.SHORT_BACK, end_of_month=True
+        )
+        assert schedule.accrual_dates == (
+            date(2024, 1, 31), date(2024, 4, 30), date(2024, 7, 31), date(2024, 10, 31),
+            date(2025, 1, 31), date(2025, 4, 30), date(2025, 5, 31),
+        )
+
+    def test_roll_conventions(self):
+        """Modified following stays within the month; preceding rolls back"""
+        business = compiled_calendar()
+        month_end = date(2026, 5, 31)                    # Sunday
+        assert business.adjust(month_end, RollConvention.FOLLOWING) == date(2026, 6, 1)
+        assert business.adjust(month_end, RollConvention.MODIFIED_FOLLOWING) == date(2026, 5, 29)
+        assert business.adjust(month_end, RollConvention.PRECEDING) == date(2026, 5, 29)
+        assert business.adjust(month_end, RollConvention.UNADJUSTED) == month_end
+
+    def test_schedules_are_memoized(self):
+        """The same terms return the same schedule without regenerating it"""
+        first = self.guard.coupon_schedule(date(2023, 6, 1), date(2033, 6, 1))
+        misses = _coupon_schedule.cache_info().misses
+        again = CalendarGuard().coupon_schedule(date(2023, 6, 1), date(2033, 6, 1))
+        assert again is first
+        assert _coupon_schedule.cache_info().misses == misses
+
+    def test_invalid_terms(self):
+        """Bad frequencies, inverted dates and out-of-range settlements fail closed"""
+        with pytest.raises(ValueError):
+            coupon_schedule(date(2024, 1, 1), date(2030, 1, 1), frequency=5)
+        with pytest.raises(ValueError):
+            coupon_schedule(date(2030, 1, 1), date(2024, 1, 1))
+        schedule = coupon_schedule(date(2024, 1, 1), date(2030, 1, 1))
+        with pytest.raises(ValueError):
+            schedule.period_index(date(2030, 1, 1))
@@ -0,0 +1,284 @@
+"""
+Tests for DerivativesGuard precision tiers and Black-Scholes verification.
+"""
+
+from decimal import Decimal
+import math
+
+import numpy as np
+import pytest
+
+from qwed_finance import DerivativesGuard, OptionType
+from qwed_finance.derivatives_guard import _ERFC_REL_ERR, _U, _erfc
+
+
+class TestPrecisionTiers:
+    """Float64 fast path with mpmath escalation"""
+
+    def setup_method(self):
+        self.guard = DerivativesGuard()
+        self.reference = DerivativesGuard(fast_path=False)
+
+    def test_clear_verdict_decided_in_float(self):
+        """A claim far from the tolerance edge is settled by the float tier"""
+        result = self.guard.verify_black_scholes(100, 100, 1.0, 0.05, 0.20, OptionType.CALL, "$10.45")
+        assert result.verified is True
+        assert result.precision_tier == "FLOAT64"
+        assert float(result.details["error_bound"]) < 1e-10
+
+    def test_fast_path_disabled_uses_mpmath(self):
+        """fast_path=False always prices in mpmath"""
+        result = self.reference.verify_black_scholes(100, 100, 1.0, 0.05, 0.20, OptionType.CALL, "$10.45")
+        assert result.precision_tier == "MPMATH"
+        assert result.details is None
+
+    def test_tolerance_edge_escalates(self):
+        """A claim exactly on the 1% boundary is escalated to mpmath"""
+        exact = self.reference.verify_black_scholes(100, 100, 1.0, 0.05, 0.20, OptionType.CALL, "0")
+        # Reproduce the full-precision price and sit exactly on the threshold
+        price = Decimal("10.4505835721856")
+        claim = str(price * Decimal("1.01"))
+        result = self.guard.verify_black_scholes(100, 100, 1.0, 0.05, 0.20, OptionType.CALL, claim)
+        assert exact.computed_price == "$10.45"
+        assert result.precision_tier == "MPMATH"
+        assert result.details["escalated"] is True
+
+    @pytest.mark.parametrize("strike,expiry,vol,option_type,claim", [
+        (100, 1.0, 0.20, OptionType.CALL, "$10.45"),
+        (105, 0.25, 0.20, OptionType.CALL, "$2.48"),
+        (95, 0.5, 0.25, OptionType.PUT, "$3.00"),
+        (150, 0.1, 0.15, OptionType.CALL, "$0.00"),
+        (60, 2.0, 0.90, OptionType.PUT, "$9.99"),
+    ])
+    def test_tiers_agree(self, strike, expiry, vol, option_type, claim):
+        """Both tiers return identical verdicts and output strings"""
+        fast = self.guard.verify_black_scholes(100, strike, expiry, 0.05, vol, option_type, claim)
+        slow = self.reference.verify_black_scholes(100, strike, expiry, 0.05, vol, option_type, claim)
+        assert fast.verified == slow.verified
+        assert fast.computed_price == slow.computed_price
+        assert fast.difference == slow.difference
+        assert fast.greeks == slow.greeks
+
+    def test_invalid_inputs_fall_back_to_mpmath(self):
+        """Inputs outside the float domain keep the mpmath behaviour"""
+        with pytest.raises(Exception):
+            self.guard.verify_black_scholes(100, 100, 0.0, 0.05, 0.20, OptionType.CALL, "$1")
+
+
+class TestLazyGreeks:
+    """Greeks computed on demand from shared contract terms"""
+
+    def setup_method(self):
+        self.guard = DerivativesGuard()
+
+    def test_price_check_skips_greeks(self):
+        """A price-only check never evaluates the Greeks"""
+        result = self.guard.verify_black_scholes(100, 100, 1.0, 0.05, 0.20, OptionType.CALL, "$10.45")
+        assert result.greeks.computed is False
+        assert result.terms is None
+        assert self.guard.cache_info()["misses"] == 0
+
+    def test_greeks_evaluated_on_access(self):
+        """Reading a Greek evaluates and memoizes the whole set"""
+        result = self.guard.verify_black_scholes(100, 100, 1.0, 0.05, 0.20, OptionType.CALL, "$10.45")
+        assert result.greeks["delta"] == "0.6368"
+        assert result.greeks.computed is True
+        assert result.terms is not None
+        assert dict(result.greeks) == {
+            "delta": "0.6368", "gamma": "0.018762", "theta": "-0.0176",
+            "vega": "0.3752", "rho": "0.5323",
+        }
+
+    def test_delta_reuses_contract_terms(self):
+        """verify_delta on a priced contract hits the terms cache"""
+        result = self.guard.verify_black_scholes(100, 105, 0.25, 0.05, 0.20, OptionType.PUT, "$5.00")
+        _ = result.greeks["gamma"]
+        delta = self.guard.verify_delta(100, 105, 0.25, 0.05, 0.20, OptionType.PUT, -0.63)
+        assert delta.terms is result.terms
+        assert self.guard.cache_info() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 256}
+        assert delta.computed_price == result.greeks["delta"]
+
+    def test_call_and_put_share_terms(self):
+        """Both option types on one contract share a single cache entry"""
+        call = self.guard.verify_black_scholes(100, 100, 1.0, 0.05, 0.20, OptionType.CALL, "$10.45")
+        put = self.guard.verify_black_scholes(100, 100, 1.0, 0.05, 0.20, OptionType.PUT, "$5.57")
+        assert Decimal(call.greeks["delta"]) - Decimal(put.greeks["delta"]) == 1
+        assert call.terms is put.terms
+
+    def test_cache_disabled(self):
+        """cache_size=0 still computes Greeks without retaining terms"""
+        guard = DerivativesGuard(cache_size=0)
+        result = guard.verify_black_scholes(100, 100, 1.0, 0.05, 0.20, OptionType.CALL, "$10.45")
+        assert result.greeks["vega"] == "0.3752"
+        assert guard.cache_info()["size"] == 0
+        with pytest.raises(ValueError):
+            DerivativesGuard(cache_size=-1)
+
+
+class TestOptionChain:
+    """Vectorized chain verification grouped by expiry"""
+
+    def setup_method(self):
+        self.guard = DerivativesGuard()
+        self.curve = {0.25: 0.04, 1.0: 0.05}
+        self.strikes, self.expiries, self.vols, self.types, self.prices = [], [], [], [], []
+        for expiry, rate in self.curve.items():
+            for strike in (90, 100, 110):
+                for option_type in (OptionType.CALL, OptionType.PUT):
+                    result = self.guard.verify_black_scholes(
+                        100, strike, expiry, rate, 0.25, option_type, "0"
+                    )
+                    self.strikes.append(strike)
+                    self.expiries.append(expiry)
+                    self.vols.append(0.25)
+                    self.types.append(option_type)
+                    self.prices.append(result.computed_price)
+
+    def test_correct_chain_verifies(self):
+        """A chain of correctly rounded prices passes prices and parity"""
+        result = self.guard.verify_chain(
+            100, self.curve, self.strikes, self.expiries, self.vols, self.types, self.prices
+        )
+        assert result.all_verified
+        assert len(result) == 12
+        assert result.stats["expiries"] == 2
+        assert result.stats["parity_pairs"] == 6
+
+    def test_matches_scalar_verdicts(self):
+        """Every contract gets the verdict verify_black_scholes would give"""
+        claims = [f"{float(p[1:]) * f:.4f}" for p, f in zip(self.prices, [1.0, 1.02, 0.98, 1.0099] * 3)]
+        result = self.guard.verify_chain(
+            100, self.curve, self.strikes, self.expiries, self.vols, self.types, claims
+        )
+        for i, claim in enumerate(claims):
+            scalar = self.guard.verify_black_scholes(
+                100, self.strikes[i], self.expiries[i], self.curve[self.expiries[i]],
+                0.25, self.types[i], claim
+            )
+            assert result.verified[i] == scalar.verified
+
+    def test_tolerance_edge_is_rechecked(self):
+        """A claim on the tolerance boundary is decided by the scalar path"""
+        price = float(self.guard.verify_chain(
+            100, 0.05, [100], [1.0], [0.2], ["call"], [0]
+        ).computed_prices[0])
+        result = self.guard.verify_chain(100, 0.05, [100], [1.0], [0.2], ["call"], [price * 1.01])
+        assert result.rechecked[0]
+
+    def test_parity_violation_detected(self):
+        """A mispriced put breaks parity with its matched call"""
+        prices = list(self.prices)
+        prices[1] = f"${float(prices[1][1:]) + 0.50:.2f}"
+        result = self.guard.verify_chain(
+            100, self.curve, self.strikes, self.expiries, self.vols, self.types, prices
+        )
+        assert result.failed_pairs.tolist() == [[0, 1]]
+        assert result.parity_differences[0] == pytest.approx(0.50, abs=0.01)
+
+    def test_callable_curve_and_array_inputs(self):
+        """The curve may be a callable and the columns numpy arrays"""
+        result = self.guard.verify_chain(
+            100, lambda t: self.curve[t], np.array(self.strikes), np.array(self.expiries),
+            np.array(self.vols), self.types, self.prices
+        )
+        assert result.all_verified
+
+    def test_invalid_inputs_rejected(self):
+        """Missing curve points and non-positive inputs fail closed"""
+        with pytest.raises(ValueError):
+            self.guard.verify_chain(100, {1.0: 0.05}, [100], [0.5], [0.2], ["call"], [5])
+        with pytest.raises(ValueError):
+            self.guard.verify_chain(100, 0.05, [100], [0.0], [0.2], ["call"], [5])
+        with pytest.raises(ValueError):
+            self.guard.verify_chain(100, 0.05, [100, 105], [1.0], [0.2], ["call"], [5])
+
+    def test_unusable_llm_prices_fail(self):
+        """NaN, infinite or unparseable LLM prices mark their rows unverified"""
+        result = self.guard.verify_chain(
+            100, 0.05, [100, 100, 100, 100], [1, 1, 1, 1], [0.2] * 4,
+            ["call", "put", "call", "put"], [float("nan"), "$5.57", "abc", float("inf")]
+        )
+        assert result.verified.tolist() == [False, True, False, False]
+        assert not result.rechecked[[0, 2, 3]].any()
+        assert not result.parity_verified.any()
+
+    def test_vectorized_erfc_within_bound(self):
+        """The array erfc used by the chain stays within its stated relative error"""
+        x = np.concatenate([np.linspace(-6, 26, 20001), [0.0, -0.0, 0.5, 1.0, 8.0, np.inf, -np.inf]])
+        expected = np.array([math.erfc(v) for v in x])
+        actual = _erfc(x)
+        assert actual.dtype == np.float64
+        # math.erfc is itself good to a few ulps
+        assert (np.abs(actual - expected) <= (_ERFC_REL_ERR + 8 * _U) * expected).all()
+
+
+class TestImpliedVol:
+    """Implied-vol verification by bracketing and vectorized solving"""
+
+    def setup_method(self):
+        self.guard = DerivativesGuard()
+        # ATM 1Y call at 20% vol prices at 10.4505835721856
+        self.price = 10.4505835721856
+
+    def test_correct_vol_verifies(self):
+        """The vol that produced the price is accepted"""
+        result = self.guard.verify_implied_vol(100, 100, 1.0, 0.05, OptionType.CALL, self.price, "20%")
+        assert result.verified is True
+        assert result.computed_price == "IV in [19.90%, 20.10%]"
+
+    def test_vol_outside_tolerance_rejected(self):
+        """A vol off by more than the tolerance is rejected with the solved vol"""
+        result = self.guard.verify_implied_vol(100, 100, 1.0, 0.05, OptionType.CALL, self.price, 0.215)
+        assert result.verified is False
+        assert result.computed_price == "20.00%"
+        assert result.difference == "1.50 vol points"
+
+    def test_put_vol_verifies(self):
+        """Puts are verified against the put price"""
+        put = self.guard.verify_black_scholes(100, 110, 0.5, 0.03, 0.35, OptionType.PUT, "0")
+        price = float(put.computed_price[1:])
+        result = self.guard.verify_implied_vol(100, 110, 0.5, 0.03, OptionType.PUT, price, "35%", tolerance=0.005)
+        assert result.verified is True
+
+    def test_price_outside_arbitrage_bounds(self):
+        """A call priced above spot has no implied vol"""
+        result = self.guard.verify_implied_vol(100, 100, 1.0, 0.05, OptionType.CALL, 101.0, "20%")
+        assert result.verified is False
+        assert result.computed_price == "No implied vol"
+
+    def test_batch_recovers_surface(self):
+        """The batch solver recovers the vols used to price a surface"""
+        rng = np.random.default_rng(7)
+        n = 2000
+        strikes = rng.uniform(70, 130, n)
+        expiries = rng.choice([0.1, 0.25, 0.5, 1.0, 2.0], n)
+        vols = rng.uniform(0.1, 0.6, n)
+        is_call = rng.integers(0, 2, n).astype(bool)
+        prices, _ = self.guard._black_scholes_float_vectorized(
+            100.0, strikes, expiries, np.full(n, 0.03), vols, is_call,
+            np.sqrt(expiries), np.exp(-0.03 * expiries)
+        )
+        types = ["call" if c else "put" for c in is_call]
+        result = self.guard.verify_implied_vol_batch(100, 0.03, strikes, expiries, types, prices, vols)
+        solved = np.isfinite(result.implied_vols)
+        assert solved.sum() >= n - 10
+        errors = np.abs(result.implied_vols[solved] - vols[solved])
+        assert (errors <= result.error_bounds[solved] + 1e-12).all()
+        assert np.median(errors) < 1e-12
+        assert result.verified[solved].all()
+        assert result.iterations < 20
+
+    def test_batch_matches_scalar(self):
+        """Batch verdicts agree with verify_implied_vol, including edge claims"""
+        strikes = [90, 100, 110, 100]
+        expiries = [0.5, 1.0, 0.25, 1.0]
+        types = [OptionType.CALL, OptionType.CALL, OptionType.PUT, OptionType.PUT]
+        prices = [14.0, self.price, 11.5, 5.6]
+        claims = ["30%", "20.1%", "25%", "0.1995"]
+        result = self.guard.verify_implied_vol_batch(100, 0.05, strikes, expiries, types, prices, claims)
+        for i in range(4):
+            scalar = self.guard.verify_implied_vol(
+                100, strikes[i], expiries[i], 0.05, types[i], prices[i], claims[i]
+            )
+            assert result.verified[i] == scalar.verified
+        assert result.stats["quotes"] == 4
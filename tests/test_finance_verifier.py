@@ -2,6 +2,7 @@
 Tests for QWED-Finance FinanceVerifier
 """
 
+import numpy as np
 import pytest
 from qwed_finance import FinanceVerifier
 
@@ -169,20 +170,200 @@ class TestIRRVerification:
         # Simple cashflows should use symbolic solver
         assert result.verification_mode in ["SYMBOLIC", "HEURISTIC"]
     
-    def test_irr_newton_raphson_fallback(self):
-        """Test IRR fallback when SymPy unavailable (mock scenario)"""
-        verifier = FinanceVerifier()
-        # Force SymPy unavailable to trigger fallback
-        verifier._sympy_available = False
+    def test_irr_numeric_fallback_on_degree_budget(self):
+        """Test IRR reports HEURISTIC when the degree budget forces the numeric path"""
+        verifier = FinanceVerifier(irr_max_degree=2)
         
         result = verifier.verify_irr(
             cashflows=[-1000, 300, 400, 400, 300],
-            llm_output="14.49%"
+            llm_output="14.90%"
         )
         
-        # Should use Newton-Raphson and report HEURISTIC
+        # Degree 4 > budget 2: companion-matrix roots, reported as HEURISTIC
         assert result.verification_mode == "HEURISTIC"
-        assert result.computed_value is not None
+        assert result.details["budget_exceeded"] == "degree"
+        assert result.verified is True
+    
+    def test_irr_long_monthly_series(self):
+        """Test 30-year monthly cash flows are solved exactly in bounded time"""
+        # $200,000 mortgage at 6% → $1,199.10/month, monthly IRR 0.5%
+        cashflows = [-200000] + [1199.10] * 360
+        result = self.verifier.verify_irr(cashflows, "0.5%")
+        assert result.verified is True
+        assert result.verification_mode == "SYMBOLIC"
+        assert result.details["degree"] == 360
+    
+    def test_irr_exact_path_is_deterministic(self):
+        """Test exact vs numeric is decided by counted work, not by wall-clock time"""
+        # 40-year monthly series: exact, and charged the same work every run
+        cashflows = [-200000] + [1100.65] * 480
+        first = self.verifier.verify_irr(cashflows, "0.5%")
+        second = self.verifier.verify_irr(cashflows, "0.5%")
+        assert first.verification_mode == "SYMBOLIC"
+        assert first.details["work"] == second.details["work"] > 0
+        
+        # The same series over a smaller work budget takes the numeric path
+        tight = FinanceVerifier(irr_max_work=first.details["work"] - 1)
+        result = tight.verify_irr(cashflows, "0.5%")
+        assert result.verification_mode == "HEURISTIC"
+        assert result.details["budget_exceeded"] == "work"
+    
+    def test_irr_multiple_roots_reported(self):
+        """Test every IRR above -100% is reported with the selection reason"""
+        # -100 + 230/(1+r) - 132/(1+r)^2 = 0 → r = 10% or 20%
+        result = self.verifier.verify_irr(
+            cashflows=[-100, 230, -132],
+            llm_output="20%"
+        )
+        assert result.verified is True
+        assert result.details["irr_roots"] == ["10.0000%", "20.0000%"]
+        assert result.details["selected_root"] == "20.0000%"
+        assert "2 IRRs" in result.details["selection_reason"]
+    
+    def test_irr_no_valid_root(self):
+        """Test cash flows with no sign change have no IRR"""
+        result = self.verifier.verify_irr(
+            cashflows=[100, 200, 300],
+            llm_output="10%"
+        )
+        assert result.verified is False
+        assert result.confidence == "COMPUTATION_FAILED"
+
+
+class TestIRRCertificate:
+    """Test certificate-based IRR verification (sign-change bracket)"""
+    
+    def setup_method(self):
+        self.verifier = FinanceVerifier()
+    
+    def test_certificate_proves_correct_claim(self):
+        """NPV changes sign across r ± tol, so the claim is proven"""
+        result = self.verifier.verify_irr(
+            cashflows=[-1000, 300, 400, 400, 300],
+            llm_output="14.90%",
+            mode="certificate"
+        )
+        assert result.verified is True
+        assert result.details["npv_signs"] == [1, -1]
+        assert "irr_roots" not in result.details  # Full solver never ran
+    
+    def test_certificate_rejects_wrong_claim(self):
+        """No sign change across the bracket means no IRR near the claim"""
+        result = self.verifier.verify_irr(
+            cashflows=[-1000, 300, 400, 400, 300],
+            llm_output="14.50%",
+            mode="certificate"
+        )
+        assert result.verified is False
+        assert result.difference is not None
+    
+    def test_certificate_falls_back_when_ambiguous(self):
+        """Two sign changes allow two IRRs: the full solver settles the claim"""
+        result = self.verifier.verify_irr(
+            cashflows=[-100, 230, -132],
+            llm_output="10%",
+            mode="certificate"
+        )
+        assert result.verified is True
+        assert result.details["ambiguous"] is True
+        assert result.details["irr_roots"] == ["10.0000%", "20.0000%"]
+    
+    def test_certificate_long_series(self):
+        """Certificate mode on a 360-period series"""
+        cashflows = [-200000] + [1199.10] * 360
+        result = self.verifier.verify_irr(cashflows, "0.5%", mode="certificate")
+        assert result.verified is True
+    
+    def test_unknown_mode_raises(self):
+        """Unknown modes are rejected, not silently defaulted"""
+        with pytest.raises(ValueError):
+            self.verifier.verify_irr([-1000, 1100], "10%", mode="fast")
+
+
+class TestBatchVerification:
+    """Test vectorized batch verification against the scalar methods"""
+    
+    def setup_method(self):
+        self.verifier = FinanceVerifier()
+    
+    def test_npv_batch_matches_scalar(self):
+        """Each row gets the same verdict as verify_npv"""
+        cashflows = [
+            [-1000, 300, 400, 400, 300],
+            [-1000, 300, 400, 400, 300],
+            [-1000, 500, 500, 500],      # Ragged row, zero-padded
+        ]
+        rates = [0.10, 0.10, 0.0]
+        llm = ["$108.74", "$500.00", "$500.00"]
+        result = self.verifier.verify_npv_batch(cashflows, rates, llm)
+        
+        scalar = [
+            self.verifier.verify_npv(cf, r, out).verified
+            for cf, r, out in zip(cashflows, rates, llm)
+        ]
+        assert list(result.verified) == scalar == [True, False, True]
+        assert list(result.failed_rows) == [1]
+        assert result.computed_values[0] == pytest.approx(108.74)
+    
+    def test_monthly_payment_batch_numpy_columns(self):
+        """NumPy columns in, columnar verdicts out"""
+        result = self.verifier.verify_monthly_payment_batch(
+            principals=np.array([200000.0, 200000.0, 12000.0]),
+            annual_rates=np.array([0.06, 0.06, 0.0]),
+            months=np.array([360, 360, 12]),
+            llm_outputs=np.array([1199.10, 1500.00, 1000.00])
+        )
+        assert list(result.verified) == [True, False, True]
+        assert result.differences[1] == pytest.approx(300.90)
+    
+    def test_one_cent_boundary_is_rechecked_exactly(self):
+        """A one-cent difference sits on the tolerance and goes to Decimal"""
+        result = self.verifier.verify_monthly_payment_batch(
+            [200000], [0.06], [360], ["$1,199.11"]
+        )
+        assert result.rechecked[0]
+        assert result.verified[0]
+        assert not self.verifier.verify_monthly_payment_batch(
+            [200000], [0.06], [360], ["$1,199.12"]
+        ).verified[0]
+    
+    def test_compound_interest_batch(self):
+        """Per-row compounding frequencies"""
+        result = self.verifier.verify_compound_interest_batch(
+            principals=[10000, 10000],
+            rates=[0.05, 0.05],
+            periods=[10, 10],
+            llm_outputs=["$16,288.95", "$16,470.09"],
+            compounding=["annual", "monthly"]
+        )
+        assert result.all_verified
+    
+    def test_fractional_periods_rechecked_on_same_formula(self):
+        """A rechecked row with fractional years uses the same exponent as the float screen"""
+        result = self.verifier.verify_compound_interest_batch([1000], [0.05], [2.5], ["$1,129.74"])
+        assert result.rechecked[0]
+        assert result.verified[0]
+        assert result.computed_values[0] == pytest.approx(1129.73)
+
+    def test_non_finite_llm_output_unverified(self):
+        """A "nan" answer fails its row without being parsed"""
+        result = self.verifier.verify_npv_batch([[-100, 60, 60]] * 2, [0.1, 0.1], ["$4.13", "nan"])
+        assert list(result.verified) == [True, False]
+        assert not result.rechecked[1]
+
+    def test_batch_rejects_unknown_compounding(self):
+        """Batch keeps the fail-closed frequency check"""
+        with pytest.raises(ValueError):
+            self.verifier.verify_compound_interest_batch(
+                [10000], [0.05], [10], [16288.95], compounding="weekly"
+            )
+    
+    def test_batch_length_mismatch_raises(self):
+        """Columns of different lengths are rejected"""
+        with pytest.raises(ValueError):
+            self.verifier.verify_monthly_payment_batch(
+                [200000, 100000], [0.06], [360, 360], [1199.10, 599.55]
+            )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,106 @@
+"""
+Tests for ISOGuard JSON schema validation.
+"""
+
+import json
+
+import pytest
+
+from qwed_finance.guards.iso_guard import ISOGuard
+
+
+def pacs008(**overrides):
+    message = {
+        "MsgId": "MSG123",
+        "CreDtTm": "2026-03-01T09:30:00Z",
+        "NbOfTxs": 1,
+        "TtlIntrBkSttlmAmt": {"amount": 1000.0, "currency": "EUR"},
+    }
+    message.update(overrides)
+    return message
+
+
+class TestISOGuard:
+    """Precompiled validators, full error reports and batch validation"""
+
+    def setup_method(self):
+        self.guard = ISOGuard()
+
+    def test_valid_pacs008(self):
+        """A well-formed pacs.008 passes"""
+        result = self.guard.verify_payment_message(pacs008())
+        assert result.verified
+        assert result.msg_type == "pacs.008"
+        assert result.errors == []
+
+    def test_all_errors_collected(self):
+        """Every violation is listed; the headline is the best match"""
+        result = self.guard.verify_payment_message(
+            pacs008(MsgId="bad id!", NbOfTxs=0, TtlIntrBkSttlmAmt={"amount": 5, "currency": "eur"})
+        )
+        assert not result.verified
+        assert result.error.startswith("Schema Violation: ")
+        assert len(result.errors) == 3
+        assert any(e.startswith("TtlIntrBkSttlmAmt/currency: ") for e in result.errors)
+
+        missing = self.guard.verify_payment_message({"MsgId": "M1"})
+        assert missing.errors[0].startswith("(root): ")
+
+    def test_date_time_enforced(self):
+        """CreDtTm must be a real ISO date-time"""
+        for value in ["2026-03-01T09:30:00", "2026-03-01T09:30:00.123+01:00"]:
+            assert self.guard.verify_payment_message(pacs008(CreDtTm=value)).verified, value
+        for value in ["yesterday", "2026-03-01", "2026-02-30T09:30:00Z", "2026-03-01T25:00:00Z"]:
+            result = self.guard.verify_payment_message(pacs008(CreDtTm=value))
+            assert not result.verified, value
+            assert result.path == ["CreDtTm"]
+
+    def test_batch(self):
+        """One result per message, in order, from one validator"""
+        results = self.guard.verify_payment_messages([pacs008(), pacs008(NbOfTxs="1"), pacs008(MsgId="M2")])
+        assert [r.verified for r in results] == [True, False, True]
+        assert len(self.guard._validators) == 1
+
+        validator = self.guard._validators["pacs.008"]
+        self.guard.verify_payment_message(pacs008())
+        assert self.guard._validators["pacs.008"] is validator
+
+    def test_bundled_schemas(self):
+        """pacs.009, pain.001 and camt.053 ship with the package and load on first use"""
+        assert self.guard.supported_types == ["camt.053", "pacs.008", "pacs.009", "pain.001"]
+        assert "pacs.009" not in self.guard._schemas
+
+        result = self.guard.verify_payment_message(
+            {"MsgId": "FI1", "CreDtTm": "2026-03-01T09:30:00Z", "NbOfTxs": 1, "SttlmMtd": "INDA",
+             "InstgAgt": {"BICFI": "DEUTDEFF"}},
+            "pacs.009"
+        )
+        assert result.verified, result.errors
+        assert not self.guard.verify_payment_message({"MsgId": "FI1"}, "pain.001").verified
+        assert not self.guard.verify_payment_message({"MsgId": "FI1"}, "camt.053").verified
+
+    def test_custom_schema_dir(self, tmp_path):
+        """Schemas in a custom directory add types and take precedence"""
+        (tmp_path / "pacs.002.json").write_text(json.dumps(
+            {"type": "object", "required": ["OrgnlMsgId"]}
+        ))
+        (tmp_path / "pacs.009.json").write_text(json.dumps({"type": "object", "required": ["MsgId"]}))
+        guard = ISOGuard(schema_dir=str(tmp_path))
+        assert "pacs.002" in guard.supported_types
+        assert guard.verify_payment_message({"OrgnlMsgId": "MSG123"}, "pacs.002").verified
+        assert not guard.verify_payment_message({}, "pacs.002").verified
+        assert guard.verify_payment_message({"MsgId": "FI1"}, "pacs.009").verified
+
+    def test_invalid_schema(self, tmp_path):
+        """A malformed schema file fails closed"""
+        (tmp_path / "pacs.004.json").write_text(json.dumps({"type": "no-such-type"}))
+        with pytest.raises(ValueError):
+            ISOGuard(schema_dir=str(tmp_path)).verify_payment_message({}, "pacs.004")
+
+    def test_unsupported_type(self):
+        """Unknown types are rejected, singly and in batch"""
+        result = self.guard.verify_payment_message(pacs008(), "mt103")
+        assert not result.verified
+        assert result.error == "Unsupported message type: mt103"
+        results = self.guard.verify_payment_messages([pacs008(), pacs008()], "../pacs.008")
+        assert [r.error for r in results] == ["Unsupported message type: ../pacs.008"] * 2
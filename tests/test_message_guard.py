@@ -0,0 +1,487 @@
+"""
+Tests for MessageGuard streaming ISO 20022 validation, camt.053 reconciliation,
+payment batch controls, SWIFT MT (FIN) files and parse-once documents.
+"""
+
+import io
+import tracemalloc
+
+import pytest
+
+from qwed_finance import CrossGuard, ISODocument, MessageGuard, MessageType, SwiftMtType
+from qwed_finance.integrations.ucp import UCPIntegration
+from qwed_finance.message_guard import format_minor_units, to_minor_units
+
+
+CAMT_HEADER = (
+    '<?xml version="1.0"?>'
+    '<Document xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.08"><BkToCstmrStmt>'
+    "<GrpHdr><MsgId>STMT-1</MsgId><CreDtTm>2026-10-18T09:00:00</CreDtTm></GrpHdr>"
+    "<Stmt><Id>S1</Id><Acct><Id><IBAN>DE89370400440532013000</IBAN></Id></Acct>"
+    '<Bal><Tp><CdOrPrtry><Cd>OPBD</Cd></CdOrPrtry></Tp><Amt Ccy="EUR">1000.00</Amt>'
+    "<CdtDbtInd>CRDT</CdtDbtInd></Bal>"
+)
+CAMT_FOOTER = "</Stmt></BkToCstmrStmt></Document>"
+
+
+def camt_entry(amount="10.00", ccy="EUR", indicator="CRDT"):
+    return (
+        f'<Ntry><Amt Ccy="{ccy}">{amount}</Amt><CdtDbtInd>{indicator}</CdtDbtInd>'
+        "<Sts><Cd>BOOK</Cd></Sts><NtryDtls><TxDtls><RmtInf><Ustrd>Invoice</Ustrd>"
+        "</RmtInf></TxDtls></NtryDtls></Ntry>"
+    )
+
+
+def camt053(entries):
+    return (CAMT_HEADER + "".join(entries) + CAMT_FOOTER).encode()
+
+
+class GeneratedStatement(io.RawIOBase):
+    """Statement produced on demand, so the test itself never holds it whole"""
+
+    def __init__(self, n_entries):
+        self._remaining = n_entries
+        self._buffer = CAMT_HEADER.encode()
+        self._done = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while len(self._buffer) < len(b) and not self._done:
+            if self._remaining:
+                self._remaining -= 1
+                self._buffer += camt_entry(f"{self._remaining}.25").encode()
+            else:
+                self._buffer += CAMT_FOOTER.encode()
+                self._done = True
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+class TestStreamingValidation:
+    """verify_iso20022_stream over files and file-like objects"""
+
+    def setup_method(self):
+        self.guard = MessageGuard()
+
+    def test_valid_statement_from_path(self, tmp_path):
+        """A well-formed statement read from disk passes with its entries counted"""
+        path = tmp_path / "camt053.xml"
+        path.write_bytes(camt053([camt_entry(), camt_entry("5.5", indicator="DBIT")]))
+        result = self.guard.verify_iso20022_stream(path)
+        assert result.valid, result.errors
+        assert result.entry_count == 2
+        assert result.warnings == []
+
+    def test_entry_errors_are_located(self):
+        """Entry rules report the offending entry's position"""
+        data = camt053([camt_entry(), camt_entry("12,50"), camt_entry(ccy="eur", indicator="X")])
+        result = self.guard.verify_iso20022_stream(io.BytesIO(data))
+        assert not result.valid
+        assert result.errors == [
+            "Ntry #2: Amt has invalid amount '12,50'",
+            "Ntry #3: Amt has invalid currency code format (must be 3 uppercase letters)",
+            "Ntry #3: CdtDbtInd must be CRDT or DBIT",
+        ]
+
+    def test_missing_required_element(self):
+        """Required statement elements are checked once the document ends"""
+        data = camt053([camt_entry()]).replace(b"<Bal>", b"<Blnc>").replace(b"</Bal>", b"</Blnc>")
+        result = self.guard.verify_iso20022_stream(io.BytesIO(data))
+        assert result.errors == ["Missing required element: Bal"]
+
+    def test_malformed_xml(self):
+        """A document cut off mid-entry is not well-formed"""
+        data = camt053([camt_entry()])[:-40]
+        result = self.guard.verify_iso20022_stream(io.BytesIO(data))
+        assert not result.valid
+        assert result.errors[0].startswith("XML is not well-formed")
+
+    def test_error_cap(self):
+        """Only max_errors errors are kept; the rest are counted"""
+        data = camt053([camt_entry("bad")] * 30)
+        result = self.guard.verify_iso20022_stream(io.BytesIO(data), max_errors=5)
+        assert len(result.errors) == 6
+        assert result.errors[-1] == "25 further errors not shown"
+
+    def test_pacs008_entries(self):
+        """pacs.008 transactions need a settlement amount and payment ID"""
+        data = (
+            b'<Document xmlns="urn:iso:std:iso:20022:tech:xsd:pacs.008.001.08"><FIToFICstmrCdtTrf>'
+            b"<GrpHdr><MsgId>M1</MsgId><CreDtTm>2026-10-18T09:00:00</CreDtTm><NbOfTxs>2</NbOfTxs></GrpHdr>"
+            b'<CdtTrfTxInf><PmtId><EndToEndId>E1</EndToEndId></PmtId><IntrBkSttlmAmt Ccy="USD">10.00'
+            b"</IntrBkSttlmAmt><DbtrAgt/><CdtrAgt/></CdtTrfTxInf>"
+            b"<CdtTrfTxInf><IntrBkSttlmAmt Ccy=\"USD\">-1</IntrBkSttlmAmt></CdtTrfTxInf>"
+            b"</FIToFICstmrCdtTrf></Document>"
+        )
+        result = self.guard.verify_iso20022_stream(io.BytesIO(data), MessageType.PACS_008)
+        assert result.errors == [
+            "CdtTrfTxInf #2: IntrBkSttlmAmt has invalid amount '-1'",
+            "CdtTrfTxInf #2: Missing required element: PmtId",
+        ]
+
+    def test_memory_is_bounded(self):
+        """Peak memory does not grow with the number of entries"""
+        peaks = []
+        for n in (500, 5000):
+            tracemalloc.start()
+            result = self.guard.verify_iso20022_stream(io.BufferedReader(GeneratedStatement(n)))
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            assert result.valid and result.entry_count == n
+        assert peaks[1] < peaks[0] * 1.5
+
+
+def balance(code, amount, ccy="EUR", indicator="CRDT"):
+    return (
+        f"<Bal><Tp><CdOrPrtry><Cd>{code}</Cd></CdOrPrtry></Tp><Amt Ccy=\"{ccy}\">{amount}</Amt>"
+        f"<CdtDbtInd>{indicator}</CdtDbtInd></Bal>"
+    )
+
+
+def statement(opening, closing, entries, ccy="EUR", summary="", stmt_id="S1"):
+    return (
+        f"<Stmt><Id>{stmt_id}</Id><Acct><Id><IBAN>DE89370400440532013000</IBAN></Id><Ccy>{ccy}</Ccy></Acct>"
+        + balance("OPBD", opening, ccy) + balance("CLBD", closing, ccy) + summary
+        + "".join(camt_entry(amount, ccy, side) for amount, side in entries)
+        + "</Stmt>"
+    )
+
+
+def camt053_statements(*statements):
+    return (
+        '<Document xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.08"><BkToCstmrStmt>'
+        "<GrpHdr><MsgId>STMT-1</MsgId></GrpHdr>" + "".join(statements) + "</BkToCstmrStmt></Document>"
+    ).encode()
+
+
+SUMMARY = (
+    "<TxsSummry><TtlNtries><NbOfNtries>2</NbOfNtries><Sum>40.10</Sum>"
+    "<TtlNetNtry><Amt>20.10</Amt><CdtDbtInd>CRDT</CdtDbtInd></TtlNetNtry></TtlNtries>"
+    "<TtlCdtNtries><NbOfNtries>1</NbOfNtries><Sum>30.10</Sum></TtlCdtNtries></TxsSummry>"
+)
+
+
+class TestStatementBalances:
+    """verify_camt053_balances: opening + entries = closing, in minor units"""
+
+    def setup_method(self):
+        self.guard = MessageGuard()
+        self.entries = [("30.10", "CRDT"), ("10", "DBIT")]
+
+    def test_minor_units(self):
+        """Amounts convert exactly, honouring each currency's minor unit"""
+        assert to_minor_units("12.5", "EUR") == 1250
+        assert to_minor_units("1500", "JPY") == 1500
+        assert to_minor_units("1.250", "KWD") == 1250
+        assert format_minor_units(-1250, "KWD") == "-1.250"
+        with pytest.raises(ValueError):
+            to_minor_units("1.5", "JPY")
+        with pytest.raises(ValueError):
+            to_minor_units("1e3", "EUR")
+
+    def test_balanced_statement(self):
+        """Opening plus booked entries equals closing, and the controls agree"""
+        data = camt053_statements(statement("100.00", "120.10", self.entries, summary=SUMMARY))
+        result = self.guard.verify_camt053_balances(io.BytesIO(data))
+        assert result.valid, result.errors
+        assert result.statement_count == 1 and result.entry_count == 2
+        assert result.details["statements"][0]["computed_closing"] == "120.10"
+        assert result.details["currencies"]["EUR"] == {"credits": "30.10", "debits": "10.00", "entries": 2}
+
+    def test_wrong_closing_balance(self):
+        """A closing balance off by one cent is caught exactly"""
+        data = camt053_statements(statement("100.00", "120.11", self.entries))
+        result = self.guard.verify_camt053_balances(io.BytesIO(data))
+        assert not result.valid
+        assert result.first_offending_entry is None
+        assert "Closing balance 120.11 EUR != opening 100.00 + booked entries 20.10 = 120.10" in result.errors[0]
+
+    def test_first_offending_entry(self):
+        """An entry past the NbOfNtries/Sum controls is pinned by position"""
+        entries = self.entries + [("0.01", "DBIT")]
+        data = camt053_statements(statement("100.00", "120.09", entries, summary=SUMMARY))
+        result = self.guard.verify_camt053_balances(io.BytesIO(data))
+        assert result.first_offending_entry == 3
+        assert result.errors[:2] == [
+            "Stmt S1 Ntry #3: running NbOfNtries exceeds control 2",
+            "Stmt S1 Ntry #3: running Sum exceeds control 40.10",
+        ]
+
+    def test_entry_in_other_currency(self):
+        """Entries must be in the statement currency"""
+        data = camt053_statements(
+            statement("100.00", "100.00", []),
+            statement("5000", "6500", [("1000", "CRDT"), ("500", "CRDT")], ccy="JPY", stmt_id="S2"),
+        ).replace(b'<Amt Ccy="JPY">500</Amt>', b'<Amt Ccy="USD">500</Amt>')
+        result = self.guard.verify_camt053_balances(io.BytesIO(data))
+        assert result.statement_count == 2
+        assert result.first_offending_entry == 2
+        assert result.errors[0] == "Stmt S2 Ntry #2: currency USD differs from statement currency JPY"
+
+    def test_pending_entries_excluded(self):
+        """Only booked entries move the booked closing balance"""
+        data = camt053_statements(statement("100.00", "130.10", self.entries))
+        data = data.replace(b"<Cd>BOOK</Cd></Sts>", b"<Cd>PDNG</Cd></Sts>", 2)
+        data = data.replace(b"<Cd>PDNG</Cd></Sts>", b"<Cd>BOOK</Cd></Sts>", 1)
+        result = self.guard.verify_camt053_balances(io.BytesIO(data))
+        assert result.valid, result.errors
+
+    def test_large_statement_streams(self):
+        """Thousands of entries reconcile in one pass"""
+        entries = [(f"{i}.01", "CRDT" if i % 3 else "DBIT") for i in range(3000)]
+        net = sum((1 if side == "CRDT" else -1) * to_minor_units(amount, "EUR") for amount, side in entries)
+        data = camt053_statements(statement("0.00", format_minor_units(net, "EUR"), entries))
+        result = self.guard.verify_camt053_balances(io.BytesIO(data))
+        assert result.valid, result.errors
+        assert result.entry_count == 3000
+
+
+def pacs008_batch(amounts, nb_of_txs=None, ctrl_sum=None, total=None):
+    header = f"<NbOfTxs>{len(amounts) if nb_of_txs is None else nb_of_txs}</NbOfTxs>"
+    if ctrl_sum is not None:
+        header += f"<CtrlSum>{ctrl_sum}</CtrlSum>"
+    if total is not None:
+        header += f'<TtlIntrBkSttlmAmt Ccy="{total[1]}">{total[0]}</TtlIntrBkSttlmAmt>'
+    transactions = "".join(
+        f'<CdtTrfTxInf><PmtId><EndToEndId>E{i}</EndToEndId></PmtId>'
+        f'<IntrBkSttlmAmt Ccy="{ccy}">{amount}</IntrBkSttlmAmt></CdtTrfTxInf>'
+        for i, (amount, ccy) in enumerate(amounts)
+    )
+    return (
+        '<Document xmlns="urn:iso:std:iso:20022:tech:xsd:pacs.008.001.08"><FIToFICstmrCdtTrf>'
+        f"<GrpHdr><MsgId>B1</MsgId>{header}</GrpHdr>{transactions}</FIToFICstmrCdtTrf></Document>"
+    ).encode()
+
+
+def pain001_block(block_id, amounts, nb_of_txs=None, ctrl_sum=None):
+    controls = f"<NbOfTxs>{len(amounts) if nb_of_txs is None else nb_of_txs}</NbOfTxs>"
+    if ctrl_sum is not None:
+        controls += f"<CtrlSum>{ctrl_sum}</CtrlSum>"
+    transactions = "".join(
+        f'<CdtTrfTxInf><PmtId><EndToEndId>E{i}</EndToEndId></PmtId>'
+        f'<Amt><InstdAmt Ccy="{ccy}">{amount}</InstdAmt></Amt></CdtTrfTxInf>'
+        for i, (amount, ccy) in enumerate(amounts)
+    )
+    return f"<PmtInf><PmtInfId>{block_id}</PmtInfId><PmtMtd>TRF</PmtMtd>{controls}{transactions}</PmtInf>"
+
+
+class TestPaymentBatch:
+    """verify_payment_batch: NbOfTxs and CtrlSum against the transactions"""
+
+    def setup_method(self):
+        self.guard = MessageGuard()
+
+    def test_balanced_pacs008(self):
+        """Header controls match the transactions"""
+        amounts = [("100.00", "EUR"), ("250.5", "EUR"), ("0.01", "EUR")]
+        data = pacs008_batch(amounts, ctrl_sum="350.51", total=("350.51", "EUR"))
+        result = self.guard.verify_payment_batch(io.BytesIO(data))
+        assert result.valid, result.errors
+        assert result.transaction_count == 3
+        assert result.currency_totals == {"EUR": "350.51"}
+        assert result.transactions_per_second > 0
+
+    def test_pacs008_mismatches(self):
+        """Wrong NbOfTxs, CtrlSum and settlement total are each reported"""
+        amounts = [("100.00", "EUR"), ("250.50", "EUR")]
+        data = pacs008_batch(amounts, nb_of_txs=3, ctrl_sum="350.51", total=("350.00", "EUR"))
+        result = self.guard.verify_payment_batch(io.BytesIO(data))
+        assert result.errors == [
+            "GrpHdr: NbOfTxs 3 != 2 transactions",
+            "GrpHdr: CtrlSum 350.51 != transactions 350.50",
+            "GrpHdr: TtlIntrBkSttlmAmt 350.00 EUR != transactions 350.50 EUR",
+        ]
+
+    def test_pain001_blocks_and_currencies(self):
+        """Each PmtInf is checked on its own; CtrlSum adds across currencies exactly"""
+        blocks = (
+            pain001_block("P1", [("1000", "JPY"), ("0.125", "KWD")], ctrl_sum="1000.125")
+            + pain001_block("P2", [("10.10", "EUR")], nb_of_txs=2, ctrl_sum="10.1")
+        )
+        data = (
+            '<Document xmlns="urn:iso:std:iso:20022:tech:xsd:pain.001.001.09"><CstmrCdtTrfInitn>'
+            f"<GrpHdr><MsgId>P</MsgId><NbOfTxs>3</NbOfTxs><CtrlSum>1010.225</CtrlSum></GrpHdr>{blocks}"
+            "</CstmrCdtTrfInitn></Document>"
+        ).encode()
+        result = self.guard.verify_payment_batch(io.BytesIO(data), MessageType.PAIN_001)
+        assert result.errors == ["PmtInf P2: NbOfTxs 2 != 1 transactions"]
+        assert result.currency_totals == {"EUR": "10.10", "JPY": "1000", "KWD": "0.125"}
+
+    def test_malformed_transaction(self):
+        """A transaction whose amount cannot be totalled is pinned by position"""
+        amounts = [("1.00", "EUR"), ("1.005", "EUR"), ("2", "EUR")]
+        result = self.guard.verify_payment_batch(io.BytesIO(pacs008_batch(amounts)))
+        assert result.first_offending_transaction == 2
+        assert result.errors == ["CdtTrfTxInf #2: amount '1.005' has more decimals than EUR allows (2)"]
+
+    def test_unsupported_message_type(self):
+        """Only pacs.008 and pain.001 carry batch controls"""
+        with pytest.raises(ValueError):
+            self.guard.verify_payment_batch(io.BytesIO(b"<Document/>"), MessageType.CAMT_053)
+
+
+def mt103(reference="REF1", charges="SHA", ordering=":50K:/12345678\r\nACME TRADING CO\r\n1 MAIN STREET"):
+    return (
+        "{1:F01BANKUS33AXXX0000000000}{2:I103BANKGB22XXXXN}{3:{108:MUR1}}{4:\r\n"
+        f":20:{reference}\r\n:23B:CRED\r\n:32A:260118USD1000,00\r\n{ordering}\r\n"
+        f":59:/GB29NWBK60161331926819\r\nBENEFICIARY LTD\r\n:71A:{charges}\r\n-}}{{5:{{CHK:0123456789AB}}}}"
+    )
+
+
+MT202 = (
+    "{1:F01BANKUS33AXXX0000000000}{2:I202BANKGB22XXXXN}{4:\n"
+    ":20:COVER1\n:21:REF1\n:32A:260118USD1000,00\n:58A:/123\nBANKGB22\n-}"
+)
+
+MT940 = (
+    "{1:F01BANKBEBBAXXX0000000000}{2:O9401200260118BANKDEFFAXXX00000000002601181200N}{4:\n"
+    ":20:STMT1\n:25:DE89370400440532013000\n:28C:1/1\n:60F:C260117EUR1000,00\n"
+    ":61:2601180118C100,00NTRFNONREF//B1\nTRANSFER\n:86:Invoice 1\nsecond line\n"
+    ":62F:C260118EUR1100,00\n-}"
+)
+
+
+class GeneratedFinFile(io.RawIOBase):
+    """MT103 file produced on demand"""
+
+    def __init__(self, n_messages):
+        self._remaining = n_messages
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while len(self._buffer) < len(b) and self._remaining:
+            self._remaining -= 1
+            self._buffer += (mt103(f"REF{self._remaining}") + "\r\n").encode()
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+class TestSwiftMtStream:
+    """FIN block parsing and verify_swift_mt_stream"""
+
+    def setup_method(self):
+        self.guard = MessageGuard()
+
+    def test_blocks_and_multiline_fields(self):
+        """Blocks are split and multi-line field values keep their lines"""
+        result = self.guard.verify_swift_mt(mt103())
+        assert result.valid, result.errors
+        assert result.field_count == 6
+        fields = self.guard._parse_mt_fields(mt103())
+        assert fields["50K"] == "/12345678\nACME TRADING CO\n1 MAIN STREET"
+        assert fields["59"] == "/GB29NWBK60161331926819\nBENEFICIARY LTD"
+
+    def test_text_block_only(self):
+        """Fields without FIN blocks are still accepted"""
+        result = self.guard.verify_swift_mt(":20:REF\n:23B:CRED\n:32A:260118USD5,\n:50F:/1\n1/NAME\n:59A:BANKGB22\n:71A:OUR")
+        assert result.valid, result.errors
+
+    def test_field_rules(self):
+        """Required fields and per-field formats are checked"""
+        result = self.guard.verify_swift_mt(mt103(reference="/BAD", charges="XYZ", ordering=":70:NOTE"))
+        assert not result.valid
+        assert "Missing required field 50a: Ordering Customer" in result.errors
+        assert any(e.startswith("Field 20 has invalid format") for e in result.errors)
+        assert any(e.startswith("Field 71A has invalid format") for e in result.errors)
+
+    def test_type_from_application_header(self):
+        """Block 2 selects the rules; a different expected type is an error"""
+        assert self.guard.verify_swift_mt(MT202, SwiftMtType.MT202).valid
+        result = self.guard.verify_swift_mt(MT202, SwiftMtType.MT103)
+        assert "Block 2 declares MT202, expected MT103" in result.errors
+
+    def test_mixed_file(self, tmp_path):
+        """Every message of a file gets its own verdict, whatever the chunking"""
+        path = tmp_path / "payments.fin"
+        path.write_text("$".join([mt103("A1"), MT202, MT940, mt103("A2", charges="XYZ")]) + "\r\n", newline="")
+
+        for chunk_size in (5, 1 << 16):
+            results = list(self.guard.verify_swift_mt_stream(str(path), chunk_size=chunk_size))
+            assert [r.message_type for r in results] == ["MT103", "MT202", "MT940", "MT103"]
+            assert [r.valid for r in results] == [True, True, True, False]
+            assert [r.details["reference"] for r in results] == ["A1", "COVER1", "STMT1", "A2"]
+            assert [r.details["position"] for r in results] == [1, 2, 3, 4]
+
+    def test_framing_errors(self):
+        """Stray text and unterminated blocks are reported on their message"""
+        data = "junk" + mt103("A1") + mt103("A2")[:-30]
+        results = list(self.guard.verify_swift_mt_stream(io.StringIO(data), chunk_size=64))
+        assert len(results) == 2
+        assert "Unexpected text between blocks" in results[0].errors
+        assert any(e.startswith("Unterminated block") for e in results[1].errors)
+
+    def test_large_file_streams(self):
+        """A large file is validated message by message in bounded memory"""
+        tracemalloc.start()
+        try:
+            count = sum(1 for r in self.guard.verify_swift_mt_stream(GeneratedFinFile(20000)) if r.valid)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert count == 20000
+        assert peak < 2_000_000
+
+
+PACS008_DOCUMENT = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<Document xmlns="urn:iso:std:iso:20022:tech:xsd:pacs.008.001.08"><FIToFICstmrCdtTrf>'
+    "<GrpHdr><MsgId>MSG-1</MsgId><CreDtTm>2026-10-18T09:00:00</CreDtTm><NbOfTxs>1</NbOfTxs></GrpHdr>"
+    '<CdtTrfTxInf><IntrBkSttlmAmt Ccy="EUR">2500.00</IntrBkSttlmAmt>'
+    "<Dbtr><Nm>Acme Trading Co</Nm></Dbtr><DbtrAgt><FinInstnId><BICFI>BANKDEFF</BICFI></FinInstnId></DbtrAgt>"
+    "<CdtrAgt><FinInstnId><BICFI>BANKGB22</BICFI></FinInstnId></CdtrAgt>"
+    "<Cdtr><Nm> Blocked Entity Ltd </Nm></Cdtr></CdtTrfTxInf>"
+    "</FIToFICstmrCdtTrf></Document>"
+)
+
+
+class TestISODocument:
+    """One parsed document shared by MessageGuard, CrossGuard and UCPIntegration"""
+
+    def setup_method(self):
+        self.document = ISODocument.parse(PACS008_DOCUMENT)
+
+    def test_index_lookups(self):
+        """Elements are found by local name and by path below the root"""
+        assert self.document.well_formed
+        assert self.document.message_type == "pacs.008"
+        assert self.document.text("MsgId") == "MSG-1"
+        assert self.document.text("FIToFICstmrCdtTrf/CdtTrfTxInf/Cdtr/Nm") == "Blocked Entity Ltd"
+        assert self.document.texts("Nm") == ["Acme Trading Co", "Blocked Entity Ltd"]
+        assert self.document.attribute("IntrBkSttlmAmt", "Ccy") == "EUR"
+        assert self.document.find("Missing") is None
+
+    def test_not_well_formed(self):
+        """A broken message parses to a document without a root"""
+        document = ISODocument.parse("<Document><GrpHdr></Document>")
+        assert not document.well_formed
+        assert document.error
+        assert MessageGuard().verify_iso20022_xml(document).errors == ["XML is not well-formed"]
+
+    def test_guards_share_one_parse(self, monkeypatch):
+        """Passing the document through every guard never parses the XML again"""
+        def fail(*args):
+            raise AssertionError("document parsed twice")
+        monkeypatch.setattr(ISODocument, "parse", fail)
+
+        assert MessageGuard().verify_iso20022_xml(self.document, MessageType.PACS_008).valid
+        rules = CrossGuard().verify_iso20022_with_rules(self.document, {"max_amount": 1000, "allowed_currencies": ["USD"]})
+        payment = UCPIntegration().verify_iso20022_payment(self.document, ["BLOCKED ENTITY"])
+
+        assert rules.guard_results["BusinessRule.max_amount"] is False
+        assert rules.guard_results["BusinessRule.currency"] is False
+        assert not payment.can_proceed
+        assert any("Blocked Entity Ltd" in v for v in payment.violations)
+
+    def test_strings_still_accepted(self):
+        """Guards given the XML text parse it once themselves"""
+        result = CrossGuard().verify_iso20022_with_rules(PACS008_DOCUMENT, {"max_amount": 10000})
+        assert result.passed, result.violations
@@ -120,6 +120,18 @@ class TestFinanceVerifierIRRParsing:
             "Old heuristic is still active! '1.5' was divided by 100."
         )
 
+    def test_malformed_rate_raises_value_error(self):
+        """A non-numeric claim raises ValueError, not decimal.InvalidOperation."""
+        with pytest.raises(ValueError, match="abc%"):
+            self.verifier.verify_irr(cashflows=[-100, 110], llm_output="abc%")
+
+    @pytest.mark.parametrize("claim", ["nan%", "Infinity%", "-inf", "sNaN"])
+    @pytest.mark.parametrize("mode", ["solve", "certificate"])
+    def test_non_finite_rate_raises_value_error(self, claim, mode):
+        """NaN and infinite claims are malformed in both modes, not a crash or a silent fail."""
+        with pytest.raises(ValueError, match="Cannot parse rate"):
+            self.verifier.verify_irr(cashflows=[-100, 110], llm_output=claim, mode=mode)
+
 
 class TestCrossGuardConsistency:
     """S-05: Both guards must interpret the same input identically."""
@@ -0,0 +1,328 @@
+"""
+Tests for the compiled sanctions-list automaton, the fuzzy name index and
+their use in ComplianceGuard/CrossGuard/UCP.
+"""
+
+import os
+import random
+
+import numpy as np
+import pytest
+
+from qwed_finance import ComplianceGuard, CrossGuard, SanctionsStore
+from qwed_finance.integrations import UCPIntegration
+from qwed_finance.integrations.ucp import PaymentStatus
+from qwed_finance.sanctions import (
+    FuzzyNameIndex, MatchAlgorithm, SanctionsAutomaton, bounded_levenshtein,
+    compile_sanctions_list, jaro_winkler, normalize_name,
+)
+
+
+def levenshtein(a, b):
+    """Unbounded reference edit distance"""
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[-1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+MT103 = (
+    "{1:F01BANKUS33AXXX0000000000}{2:I103BANKGB22XXXXN}{4:\n"
+    ":20:REF123\n"
+    ":23B:CRED\n"
+    ":32A:240115USD10000,00\n"
+    ":50K:ACME TRADING CO\n"
+    ":59:BLOCKED ENTITY LTD\n"
+    ":71A:SHA\n"
+    "-}"
+)
+
+PACS008 = (
+    "<Document><FIToFICstmrCdtTrf><CdtTrfTxInf>"
+    "<Dbtr><Nm>Acme Trading Co</Nm></Dbtr>"
+    "<Cdtr><Nm>Société Générale Blocked</Nm></Cdtr>"
+    "</CdtTrfTxInf></FIToFICstmrCdtTrf></Document>"
+)
+
+
+class TestSanctionsAutomaton:
+    """Aho-Corasick matching over normalized names"""
+
+    def setup_method(self):
+        self.automaton = SanctionsAutomaton(["SANCTIONED CORP", "Al-Qa'ida", "Société Générale Blocked"])
+
+    def test_normalization(self):
+        """Case, accents and punctuation do not affect matching"""
+        assert normalize_name("  Al-Qa'ida ") == "al qa ida"
+        assert self.automaton.screen("al qa ida network") == ["Al-Qa'ida"]
+        assert self.automaton.screen("SOCIETE GENERALE BLOCKED SA") == ["Société Générale Blocked"]
+
+    def test_search_offsets(self):
+        """Every occurrence is reported with offsets into the normalized text"""
+        matches = self.automaton.search("Sanctioned Corp and sanctioned-corp")
+        assert [(m.start, m.end) for m in matches] == [(0, 15), (20, 35)]
+        assert self.automaton.screen("Sanctioned Corp and sanctioned-corp") == ["SANCTIONED CORP"]
+
+    def test_bidirectional(self):
+        """Truncated entities hit only when screening in both directions"""
+        assert self.automaton.screen("SANCTIONED") == []
+        assert self.automaton.screen("SANCTIONED", bidirectional=True) == ["SANCTIONED CORP"]
+        assert self.automaton.screen("Clean Holdings", bidirectional=True) == []
+
+    def test_matches_naive_substring_scan(self):
+        """Results agree with comparing every name against the text"""
+        rng = random.Random(5)
+        words = ["".join(rng.choice("abcdeio") for _ in range(rng.randint(2, 5))) for _ in range(80)]
+        names = [" ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(400)]
+        automaton = SanctionsAutomaton(names)
+        for _ in range(300):
+            text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 6)))
+            expected = {n for n in names if normalize_name(n) in normalize_name(text)}
+            assert set(automaton.screen(text)) == expected
+
+    def test_compiled_once_per_version(self):
+        """The same list, or the same version stamp, reuses one automaton"""
+        names = ["ALPHA ONE", "BETA TWO"]
+        first = compile_sanctions_list(names)
+        assert compile_sanctions_list(list(names)) is first
+        assert compile_sanctions_list(first) is first
+        assert first.version.startswith("sha256:")
+        stamped = compile_sanctions_list(names, version="2026-10-18")
+        assert stamped.version == "2026-10-18"
+        assert compile_sanctions_list(["ignored"], version="2026-10-18") is stamped
+
+    def test_list_changed_in_place_is_recompiled(self):
+        """Replacing a name in a list already compiled never reuses the old automaton"""
+        names = ["ALPHA ONE", "BETA TWO", "GAMMA THREE"]
+        first = compile_sanctions_list(names)
+        names[1] = "Bad Bank Ltd"
+        assert compile_sanctions_list(names) is not first
+        assert compile_sanctions_list(names).screen("Bad Bank Ltd payment") == ["Bad Bank Ltd"]
+        assert CrossGuard()._check_sanctions("Bad Bank Ltd", names)
+
+
+class TestFuzzyNameIndex:
+    """Blocked fuzzy matching for typos and transliterations"""
+
+    def setup_method(self):
+        self.names = ["Mohammed Al-Rashid", "Kim Jong Trading Co", "Vladimir Petrov", "Blocked Entity Ltd"]
+        self.index = FuzzyNameIndex(self.names, threshold=0.85)
+
+    def test_bounded_levenshtein(self):
+        """The banded distance is exact within the bound and capped beyond it"""
+        rng = random.Random(3)
+        for _ in range(500):
+            a = "".join(rng.choice("abc") for _ in range(rng.randint(0, 9)))
+            b = "".join(rng.choice("abc") for _ in range(rng.randint(0, 9)))
+            k = rng.randint(0, 4)
+            assert bounded_levenshtein(a, b, k) == min(levenshtein(a, b), k + 1)
+
+    def test_jaro_winkler(self):
+        """Textbook Jaro-Winkler values"""
+        assert jaro_winkler("martha", "marhta") == pytest.approx(0.9611, abs=1e-4)
+        assert jaro_winkler("dwayne", "duane") == pytest.approx(0.84, abs=1e-4)
+        assert jaro_winkler("abc", "xyz") == 0.0
+
+    def test_typos_and_transliterations(self):
+        """Misspelled and transliterated names match their listed spelling"""
+        match = self.index.best_match("Muhammed Al Rashid")
+        assert match.name == "Mohammed Al-Rashid"
+        assert match.algorithm == "levenshtein"
+        assert 0.85 <= match.score < 1.0
+        assert self.index.best_match("Wladimir Petrov").name == "Vladimir Petrov"
+        assert self.index.best_match("BLOCKED ENTITY LTD").score == 1.0
+        assert self.index.best_match("Acme Holdings") is None
+
+    @pytest.mark.parametrize("q,threshold", [(3, 0.8), (2, 0.75), (5, 0.75), (4, 0.7)])
+    def test_levenshtein_is_lossless(self, q, threshold):
+        """Blocking never drops a name the full scan would match, for any q"""
+        rng = random.Random(9)
+        words = ["".join(rng.choice("aeiklmnorst") for _ in range(rng.randint(3, 7))) for _ in range(60)]
+        names = list({" ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(500)})
+        index = FuzzyNameIndex(names, threshold=threshold, q=q)
+        for _ in range(80):
+            text = list(rng.choice(names))
+            for _ in range(rng.randint(0, 4)):
+                position = rng.randrange(len(text))
+                edit = rng.randrange(3)
+                if edit == 0:
+                    text[position] = rng.choice("aeiklmnorst")
+                elif edit == 1 and len(text) > 1:
+                    del text[position]
+                else:
+                    text.insert(position, rng.choice("aeiklmnorst"))
+            query = "".join(text)
+            expected = {
+                n for n in names
+                if 1 - levenshtein(query, n) / max(len(query), len(n)) >= threshold - 1e-12
+            }
+            assert {m.name for m in index.matches(query, limit=len(names))} == expected
+
+    def test_long_grams_keep_longer_names(self):
+        """With q*slack > 1 a longer name can share fewer q-grams than one of the key's length"""
+        index = FuzzyNameIndex(["Petrovic"], threshold=0.75, q=5)
+        assert [m.name for m in index.matches("etrovi")] == ["Petrovic"]
+
+    def test_jaro_winkler_index(self):
+        """The Jaro-Winkler index scores its blocked candidates"""
+        index = FuzzyNameIndex(self.names, threshold=0.9, algorithm=MatchAlgorithm.JARO_WINKLER)
+        match = index.best_match("Vladimir Petrof")
+        assert match.name == "Vladimir Petrov"
+        assert match.algorithm == "jaro_winkler"
+        assert match.score == pytest.approx(jaro_winkler("vladimir petrof", "vladimir petrov"), abs=1e-6)
+
+    def test_invalid_parameters(self):
+        """Thresholds too loose to block on are rejected"""
+        with pytest.raises(ValueError):
+            FuzzyNameIndex(self.names, threshold=0.5)
+        with pytest.raises(ValueError):
+            FuzzyNameIndex(self.names, q=1)
+
+
+class TestSanctionsStore:
+    """Memory-mapped on-disk store with delta updates"""
+
+    def setup_method(self):
+        self.names = ["Mohammed Al-Rashid", "Kim Jong Trading Co", "Vladimir Petrov", "Blocked Entity Ltd"]
+
+    def test_saved_index_round_trip(self, tmp_path):
+        """A saved index maps its arrays read-only and matches like the original"""
+        index = FuzzyNameIndex(self.names, version="v1")
+        index.save(str(tmp_path))
+        loaded = FuzzyNameIndex.load(str(tmp_path))
+        assert isinstance(loaded._postings, np.memmap)
+        assert not loaded._postings.flags.writeable
+        assert loaded.version == "v1"
+        assert sorted(loaded.names) == sorted(self.names)
+        for query in ["Muhammed Al Rashid", "Wladimir Petrov", "Kim Jong Trading", "Acme"]:
+            assert loaded.matches(query) == index.matches(query)
+
+    def test_apply_delta(self, tmp_path):
+        """Adds and removals take effect without rebuilding the base segment"""
+        store = SanctionsStore.create(str(tmp_path), self.names, version="2026-10-17")
+        base = store._manifest["base"]
+        store.apply_delta(added=["Ivan Drago Holdings"], removed=["Vladimir Petrov"], version="2026-10-18")
+        assert store.version == "2026-10-18"
+        assert store._manifest["base"] == base
+        assert len(store) == 4
+        assert store.best_match("Ivan Drgo Holdings").name == "Ivan Drago Holdings"
+        assert store.best_match("Vladimir Petrov") is None
+        assert store.screen("VLADIMIR PETROV") == []
+        assert store.screen("IVAN DRAGO HOLDINGS LLC") == ["Ivan Drago Holdings"]
+
+        store.apply_delta(added=["Vladimir Petrov"], removed=["Ivan Drago Holdings"], version="2026-10-19")
+        assert sorted(store.names) == sorted(self.names)
+        assert sorted(os.listdir(tmp_path)) == sorted([base, "delta-2", "MANIFEST.json"])
+        with pytest.raises(ValueError):
+            store.apply_delta(added=["Someone"], version="2026-10-19")
+
+    def test_readers_refresh(self, tmp_path):
+        """Another process's handle moves to a new version on refresh"""
+        writer = SanctionsStore.create(str(tmp_path), self.names, version="v1")
+        reader = SanctionsStore(str(tmp_path))
+        writer.apply_delta(added=["Ivan Drago Holdings"], version="v2")
+        assert reader.version == "v1"
+        assert reader.refresh()
+        assert not reader.refresh()
+        assert reader.version == "v2"
+        assert reader.best_match("Ivan Drago Holdings").score == 1.0
+
+    def test_compact(self, tmp_path):
+        """Compaction folds the delta and removals into a new base"""
+        store = SanctionsStore.create(str(tmp_path), self.names, version="v1")
+        store.apply_delta(added=["Ivan Drago Holdings"], removed=["Kim Jong Trading Co"], version="v2")
+        expected = sorted(store.names)
+        store.compact()
+        assert store._manifest["delta"] is None
+        assert store._manifest["removed"] == []
+        assert sorted(store.names) == expected
+        assert store.version == "v2"
+
+    def test_missing_store(self, tmp_path):
+        """Opening a directory without a manifest fails"""
+        with pytest.raises(ValueError):
+            SanctionsStore(str(tmp_path))
+
+
+class TestGuardScreening:
+    """CrossGuard and UCPIntegration share the compiled automaton"""
+
+    def test_cross_guard_hit(self):
+        """A listed beneficiary blocks the SWIFT message and stamps the list version"""
+        result = CrossGuard().verify_swift_with_sanctions(MT103, ["SANCTIONED CORP", "BLOCKED ENTITY"])
+        assert not result.passed
+        assert result.guard_results["ComplianceGuard.sanctions"] is False
+        metadata = result.receipts[-1].metadata
+        assert metadata["matched_names"] == ["BLOCKED ENTITY"]
+        assert metadata["sanctions_list_version"] == compile_sanctions_list(
+            ["SANCTIONED CORP", "BLOCKED ENTITY"]
+        ).version
+
+    def test_cross_guard_clear(self):
+        """Unlisted parties pass the sanctions check"""
+        result = CrossGuard().verify_swift_with_sanctions(MT103, ["SANCTIONED CORP"])
+        assert result.guard_results["ComplianceGuard.sanctions"] is True
+
+    def test_no_clear_receipt_without_entities(self):
+        """A screening with nothing to screen issues no verified sanctions receipt"""
+        result = CrossGuard().verify_swift_with_sanctions("{4:\n:20:REF123\n-}", ["SANCTIONED CORP"])
+        assert not [r for r in result.receipts if r.guard_name == "ComplianceGuard.sanctions_check"]
+
+        payment = UCPIntegration().verify_iso20022_payment("<Document/>", ["SANCTIONED CORP"])
+        assert not [r for r in payment.receipts if r.guard_name == "UCP.sanctions_screening"]
+
+    def test_ucp_hit(self):
+        """UCP screening blocks on accent-insensitive matches"""
+        automaton = compile_sanctions_list(["Societe Generale Blocked"])
+        result = UCPIntegration().verify_iso20022_payment(PACS008, automaton)
+        assert not result.can_proceed
+        assert any("SANCTIONS HIT" in v for v in result.violations)
+
+    def test_ucp_screens_malformed_xml(self):
+        """Names in XML that does not parse are still screened"""
+        xml = PACS008.replace("Acme Trading Co", "Acme & Sons").replace(
+            "Société Générale Blocked", "Bad Bank Ltd"
+        )
+        result = UCPIntegration().verify_iso20022_payment(xml, ["Bad Bank Ltd"])
+        assert result.status == PaymentStatus.BLOCKED
+        assert any("SANCTIONS HIT: Bad Bank Ltd" in v for v in result.violations)
+
+    def test_cross_guard_fuzzy_hit(self):
+        """A misspelled beneficiary is caught by the fuzzy index and scored in the receipt"""
+        index = FuzzyNameIndex(["BLOKED ENTITY LTD"], version="2026-10-18")
+        result = CrossGuard().verify_swift_with_sanctions(MT103, ["SANCTIONED CORP"], fuzzy_index=index)
+        assert result.guard_results["ComplianceGuard.sanctions"] is False
+        metadata = result.receipts[-1].metadata
+        assert metadata["matched_name"] == "BLOKED ENTITY LTD"
+        assert metadata["algorithm"] == "levenshtein"
+        assert metadata["score"] >= 0.85
+        assert metadata["sanctions_list_version"] == "2026-10-18"
+
+    def test_compliance_guard_screening(self):
+        """Approving a fuzzy match is a violation, with the match recorded"""
+        index = FuzzyNameIndex(["Vladimir Petrov"])
+        result = ComplianceGuard().verify_sanctions_screening("Wladimir Petrov", index, llm_approved=True)
+        assert not result.compliant
+        assert result.rule_violated == "OFAC_SANCTIONS_VIOLATION"
+        assert result.details["matched_name"] == "Vladimir Petrov"
+        assert result.details["algorithm"] == "levenshtein"
+        assert result.details["sanctions_list_version"] == index.version
+        clear = ComplianceGuard().verify_sanctions_screening("Acme Holdings", index, llm_approved=True)
+        assert clear.compliant
+        assert clear.details["matched_name"] is None
+
+    def test_store_version_in_every_receipt(self, tmp_path):
+        """Clear and fuzzy-hit screenings both carry the store version"""
+        store = SanctionsStore.create(str(tmp_path), ["SANCTIONED CORP"], version="2026-10-17")
+        clear = CrossGuard().verify_swift_with_sanctions(MT103, store)
+        assert clear.passed
+        assert clear.receipts[-1].metadata["sanctions_list_version"] == "2026-10-17"
+
+        store.apply_delta(added=["BLOKED ENTITY LTD"], version="2026-10-18")
+        blocked = CrossGuard().verify_swift_with_sanctions(MT103, store)
+        assert blocked.guard_results["ComplianceGuard.sanctions"] is False
+        assert blocked.receipts[-1].metadata["matched_name"] == "BLOKED ENTITY LTD"
+        assert blocked.receipts[-1].metadata["sanctions_list_version"] == "2026-10-18"
@@ -0,0 +1,145 @@
+"""
+Tests for the compiled XSD schema registry.
+"""
+
+import os
+import threading
+
+import pytest
+
+from qwed_finance import ISODocument, MessageGuard, MessageType, XSDRegistry
+from qwed_finance import xsd_registry
+
+
+NAMESPACE = "urn:iso:std:iso:20022:tech:xsd:pacs.008.001.08"
+
+# A cut-down pacs.008 schema: enough structure to exercise real XSD checks
+PACS008_XSD = f"""<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns="{NAMESPACE}"
+           targetNamespace="{NAMESPACE}" elementFormDefault="qualified">
+  <xs:element name="Document">
+    <xs:complexType><xs:sequence>
+      <xs:element name="FIToFICstmrCdtTrf">
+        <xs:complexType><xs:sequence>
+          <xs:element name="GrpHdr">
+            <xs:complexType><xs:sequence>
+              <xs:element name="MsgId" type="Max35Text"/>
+              <xs:element name="NbOfTxs" type="xs:positiveInteger"/>
+            </xs:sequence></xs:complexType>
+          </xs:element>
+          <xs:element name="CdtTrfTxInf" maxOccurs="unbounded">
+            <xs:complexType><xs:sequence>
+              <xs:element name="IntrBkSttlmAmt">
+                <xs:complexType><xs:simpleContent>
+                  <xs:extension base="xs:decimal">
+                    <xs:attribute name="Ccy" type="CurrencyCode" use="required"/>
+                  </xs:extension>
+                </xs:simpleContent></xs:complexType>
+              </xs:element>
+            </xs:sequence></xs:complexType>
+          </xs:element>
+        </xs:sequence></xs:complexType>
+      </xs:element>
+    </xs:sequence></xs:complexType>
+  </xs:element>
+  <xs:simpleType name="Max35Text">
+    <xs:restriction base="xs:string"><xs:minLength value="1"/><xs:maxLength value="35"/></xs:restriction>
+  </xs:simpleType>
+  <xs:simpleType name="CurrencyCode">
+    <xs:restriction base="xs:string"><xs:pattern value="[A-Z]{{3}}"/></xs:restriction>
+  </xs:simpleType>
+</xs:schema>
+"""
+
+
+def pacs008(msg_id="MSG-1", count="1", currency="EUR"):
+    return (
+        f'<Document xmlns="{NAMESPACE}"><FIToFICstmrCdtTrf>'
+        f"<GrpHdr><MsgId>{msg_id}</MsgId><NbOfTxs>{count}</NbOfTxs></GrpHdr>"
+        f'<CdtTrfTxInf><IntrBkSttlmAmt Ccy="{currency}">10.00</IntrBkSttlmAmt></CdtTrfTxInf>'
+        "</FIToFICstmrCdtTrf></Document>"
+    )
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    (tmp_path / "pacs.008.001.08.xsd").write_text(PACS008_XSD)
+    (tmp_path / "README.txt").write_text("not a schema")
+    return tmp_path
+
+
+class TestXSDRegistry:
+    """Lazy compilation, caching and validation against official-style XSDs"""
+
+    def test_lists_without_compiling(self, schema_dir):
+        """Schemas are discovered by file name; short names resolve to the latest version"""
+        (schema_dir / "pacs.008.001.02.xsd").write_text(PACS008_XSD)
+        registry = XSDRegistry(str(schema_dir))
+        assert registry.message_types == ["pacs.008.001.02", "pacs.008.001.08"]
+        assert registry.resolve("pacs.008") == "pacs.008.001.08"
+        with pytest.raises(ValueError):
+            registry.resolve("camt.053")
+
+    def test_missing_directory(self, tmp_path):
+        """A registry needs an existing directory"""
+        with pytest.raises(ValueError):
+            XSDRegistry(str(tmp_path / "missing"))
+
+    def test_compiles_once(self, schema_dir):
+        """The first validation compiles; later ones (any registry) reuse it"""
+        pytest.importorskip("lxml")
+        first = XSDRegistry(str(schema_dir)).validate(pacs008())
+        second = XSDRegistry(str(schema_dir)).validate(pacs008("MSG-2"))
+
+        assert first.valid and second.valid
+        assert first.message_type == "pacs.008.001.08"
+        assert second.cached
+        assert second.compile_seconds == 0.0
+        assert second.validation_seconds >= 0.0
+        assert "pacs.008.001.08" in XSDRegistry(str(schema_dir)).compile_times()
+
+    def test_compile_does_not_block_other_schemas(self, schema_dir):
+        """A schema being compiled only holds up users of that schema"""
+        pytest.importorskip("lxml")
+        (schema_dir / "pacs.008.001.02.xsd").write_text(PACS008_XSD)
+        registry = XSDRegistry(str(schema_dir))
+        registry.compile("pacs.008.001.08")
+
+        # Pretend another thread is part-way through compiling 001.02
+        path = os.path.join(str(schema_dir), "pacs.008.001.02.xsd")
+        stat = os.stat(path)
+        key = (os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
+        in_progress = threading.Lock()
+        in_progress.acquire()
+        xsd_registry._compiling[key] = in_progress
+
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(registry.validate(pacs008(), "pacs.008.001.02")))
+        waiter.start()
+        assert registry.validate(pacs008(), "pacs.008.001.08").valid    # not blocked
+        waiter.join(0.2)
+        assert waiter.is_alive() and not results
+
+        in_progress.release()
+        waiter.join(5)
+        assert results and results[0].valid
+
+    def test_schema_errors(self, schema_dir):
+        """Type and facet violations are reported with their line"""
+        pytest.importorskip("lxml")
+        registry = XSDRegistry(str(schema_dir))
+        result = registry.validate(pacs008(msg_id="X" * 40, count="0", currency="eur"), "pacs.008")
+        assert not result.valid
+        assert len(result.errors) == 3
+        assert all(e.startswith("line ") for e in result.errors)
+
+    def test_message_guard_uses_registry(self, schema_dir):
+        """MessageGuard reports schema errors and timings from a shared document"""
+        pytest.importorskip("lxml")
+        registry = XSDRegistry(str(schema_dir))
+        document = ISODocument.parse(pacs008())
+        result = MessageGuard().verify_iso20022_schema(document, registry, MessageType.PACS_008)
+        assert result.valid, result.errors
+        assert result.message_type == "pacs.008"
+        assert result.details["schema"] == "pacs.008.001.08"
+        assert set(result.details) >= {"compile_seconds", "validation_seconds", "cached"}